@@ -21,6 +21,7 @@ from airweave.core.source_connection_service import source_connection_service
 from airweave.core.source_connection_service_helpers import source_connection_helpers
 from airweave.core.sync_service import sync_service
 from airweave.core.temporal_service import temporal_service
+from airweave.search.profile import search_profiles
 
 router = TrailingSlashRouter()
 
@@ -167,7 +168,10 @@ async def delete(
         # Continue with deletion even if Qdrant deletion fails
 
     # Delete the collection - CASCADE will handle all child objects
-    return await crud.collection.remove(db, id=db_obj.id, ctx=ctx)
+    collection = await crud.collection.remove(db, id=db_obj.id, ctx=ctx)
+    # The readable ID can be reused by a new collection
+    await search_profiles.invalidate(ctx.organization.id, readable_id)
+    return collection
 
 
 @router.post(
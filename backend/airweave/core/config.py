@@ -41,6 +41,8 @@ class Settings(BaseSettings):
         REDIS_DB (int): The Redis database number.
         QDRANT_HOST (str): The Qdrant host.
         QDRANT_PORT (int): The Qdrant port.
+        QDRANT_PREFER_GRPC (bool): Whether pooled Qdrant clients use the gRPC transport.
+        QDRANT_GRPC_PORT (int): The Qdrant gRPC port.
         TEXT2VEC_INFERENCE_URL (str): The URL for text2vec-transformers inference service.
         OPENAI_API_KEY (Optional[str]): The OpenAI API key.
         MISTRAL_API_KEY (Optional[str]): The Mistral AI API key.
@@ -52,9 +54,32 @@ class Settings(BaseSettings):
         TEMPORAL_ENABLED (bool): Whether Temporal is enabled.
         SYNC_MAX_WORKERS (int): The maximum number of workers for sync tasks.
         SYNC_THREAD_POOL_SIZE (int): The size of the thread pool for sync tasks.
+        SYNC_PROCESS_POOL_ENABLED (bool): Run CPU-bound sync work (chunking, sparse
+            embedding, local conversion) in a process pool instead of threads
+        SYNC_PROCESS_POOL_SIZE (int): Worker processes in the pool (0 = one per CPU).
+            Each worker lazily loads its own chunker/BM25 models, so memory grows with
+            the worker count.
         WEB_FETCHER_MAX_CONCURRENT (int): Max concurrent web scraping requests
         OPENAI_MAX_CONCURRENT (int): Max concurrent OpenAI API requests
         CTTI_MAX_CONCURRENT (int): Max concurrent CTTI (ClinicalTrials.gov) requests
+        SYNC_ENCOUNTERED_IDS_EXACT (bool): Track encountered entity IDs as exact strings
+            instead of 128-bit hashes (more memory, no collision risk)
+        EMBEDDING_CACHE_ENABLED (bool): Whether dense embeddings are cached by content hash
+        EMBEDDING_CACHE_REDIS_ENABLED (bool): Whether the shared Redis cache tier is used.
+            Off by default: a 3072-dim vector is ~16KB in Redis (base64 float32), so one
+            million chunks is ~16GB for the TTL. Size Redis before enabling.
+        EMBEDDING_CACHE_LOCAL_MAX_ENTRIES (int): Max vectors in the per-process LRU tier
+        EMBEDDING_CACHE_TTL_SECONDS (int): TTL for embedding entries in Redis
+        QUERY_EMBEDDING_CACHE_ENABLED (bool): Whether search query embeddings are cached
+        QUERY_EMBEDDING_CACHE_LOCAL_MAX_ENTRIES (int): Max query vectors in the per-process LRU
+        QUERY_EMBEDDING_CACHE_TTL_SECONDS (int): TTL for query embedding entries in Redis
+        MISTRAL_OCR_BATCH_WINDOW_SECONDS (float): Max time an OCR document waits to be
+            coalesced with documents from other conversions into one batch job
+        MISTRAL_OCR_BATCH_MAX_DOCUMENTS (int): Max documents per coalesced OCR batch job
+        OCR_CACHE_ENABLED (bool): Whether OCR results are cached by file content hash
+        OCR_CACHE_REDIS_ENABLED (bool): Whether the shared Redis OCR cache tier is used
+        OCR_CACHE_LOCAL_MAX_ENTRIES (int): Max documents in the per-process OCR LRU tier
+        OCR_CACHE_TTL_SECONDS (int): TTL for OCR result entries in Redis
         STRIPE_DEVELOPER_MONTHLY: str = ""
         STRIPE_PRO_MONTHLY: str = ""
         STRIPE_TEAM_MONTHLY: str = ""
@@ -118,6 +143,8 @@ class Settings(BaseSettings):
 
     QDRANT_HOST: Optional[str] = None
     QDRANT_PORT: Optional[int] = None
+    QDRANT_PREFER_GRPC: bool = False  # Some setups don't expose gRPC
+    QDRANT_GRPC_PORT: int = 6334
     TEXT2VEC_INFERENCE_URL: str = "http://localhost:9878"
 
     OPENAI_API_KEY: Optional[str] = None
@@ -172,9 +199,33 @@ class Settings(BaseSettings):
     # Sync configuration
     SYNC_MAX_WORKERS: int = 100
     SYNC_THREAD_POOL_SIZE: int = 100
+    SYNC_PROCESS_POOL_ENABLED: bool = False  # Opt-in until per-worker memory is measured
+    SYNC_PROCESS_POOL_SIZE: int = 2  # 0 = one worker process per CPU
     WEB_FETCHER_MAX_CONCURRENT: int = 10  # Max concurrent web scraping requests
     OPENAI_MAX_CONCURRENT: int = 20  # Max concurrent OpenAI API requests
     CTTI_MAX_CONCURRENT: int = 3  # Max concurrent CTTI (ClinicalTrials.gov) requests
+    SYNC_ENCOUNTERED_IDS_EXACT: bool = False  # Exact (string) dedup instead of 128-bit hashes
+
+    # Embedding cache (content-addressed, keyed by model + sha256 of text)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_REDIS_ENABLED: bool = False  # ~16KB per 3072-dim vector in Redis
+    EMBEDDING_CACHE_LOCAL_MAX_ENTRIES: int = 4096  # ~12KB per 3072-dim vector
+    EMBEDDING_CACHE_TTL_SECONDS: int = 24 * 3600  # 1 day
+
+    # Search query embedding cache (dense + BM25, keyed by model + normalized query)
+    QUERY_EMBEDDING_CACHE_ENABLED: bool = True
+    QUERY_EMBEDDING_CACHE_LOCAL_MAX_ENTRIES: int = 2048  # per vector kind
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: int = 7 * 24 * 3600  # 7 days
+
+    # Mistral OCR batch jobs (coalesced across pipeline workers and syncs in the pod)
+    MISTRAL_OCR_BATCH_WINDOW_SECONDS: float = 2.0
+    MISTRAL_OCR_BATCH_MAX_DOCUMENTS: int = 200
+
+    # OCR result cache (content-addressed, keyed by OCR model + sha256 of file bytes)
+    OCR_CACHE_ENABLED: bool = True
+    OCR_CACHE_REDIS_ENABLED: bool = True
+    OCR_CACHE_LOCAL_MAX_ENTRIES: int = 256  # markdown per document
+    OCR_CACHE_TTL_SECONDS: int = 90 * 24 * 3600  # 90 days
 
     API_REQUEST_BODY_SIZE_LIMIT: int = 10 * 1024 * 1024  # 10MB default
     API_REQUEST_TIMEOUT_SECONDS: int = 60
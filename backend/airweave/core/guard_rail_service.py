@@ -34,6 +34,12 @@ class GuardRailService:
 
     # Cache TTL - refresh usage data after this duration
     USAGE_CACHE_TTL = timedelta(seconds=30)  # Refresh every 30 seconds
+    BILLING_STATUS_CACHE_TTL = timedelta(seconds=30)  # Refresh billing status as often
+
+    # Units pre-authorized per lease for hot loops (see QuotaLease)
+    LEASE_BLOCK_SIZES = {
+        ActionType.ENTITIES: 100,
+    }
 
     # Billing status restrictions - which actions are blocked for each billing status
     BILLING_STATUS_RESTRICTIONS = {
@@ -98,12 +104,20 @@ class GuardRailService:
         self.usage_limit: Optional[UsageLimit] = None
         self.usage_fetched_at: Optional[datetime] = None
         self._has_billing: Optional[bool] = None  # Cache whether org has billing
+        self._billing_status: Optional[BillingPeriodStatus] = None
+        self._billing_status_fetched_at: Optional[datetime] = None
         # Track pending increments in memory (team_members not included - it's counted dynamically)
         self.pending_increments = {
             ActionType.ENTITIES: 0,
             ActionType.QUERIES: 0,
             ActionType.SOURCE_CONNECTIONS: 0,
         }
+        # Units pre-authorized by outstanding leases (count toward usage until settled)
+        self.leased = {
+            ActionType.ENTITIES: 0,
+            ActionType.QUERIES: 0,
+            ActionType.SOURCE_CONNECTIONS: 0,
+        }
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
 
@@ -172,49 +186,16 @@ class GuardRailService:
                 )
                 return True
 
-            # First check billing status
-            billing_status = await self._get_billing_status()
-            restricted_actions = self.BILLING_STATUS_RESTRICTIONS.get(billing_status, set())
-
-            # If action is restricted due to billing status, raise exception
-            if action_type in restricted_actions:
-                self.logger.warning(
-                    f"Action {action_type.value} blocked due to "
-                    f"billing status: {billing_status.value}"
-                )
-                raise PaymentRequiredException(
-                    action_type=action_type.value,
-                    payment_status=billing_status.value,
-                )
+            await self._check_billing_status(action_type)
 
             # Special handling for team members - count from UserOrganization table
             if action_type == ActionType.TEAM_MEMBERS:
                 return await self._check_team_members_allowed(amount)
 
-            # Check if we need to refresh usage (TTL expired or never fetched)
-            should_refresh = (
-                self.usage is None
-                or self.usage_fetched_at is None
-                or datetime.utcnow() - self.usage_fetched_at > self.USAGE_CACHE_TTL
-            )
-
-            if should_refresh:
-                self.usage = await self._get_usage()
-                self.usage_fetched_at = datetime.utcnow()
-
-            # Lazy load usage limit if not already loaded
-            if self.usage_limit is None:
-                self.usage_limit = await self._infer_usage_limit()
+            await self._refresh_usage_if_stale()
 
-            # Get current value from usage plus pending increments
-            current_value = getattr(self.usage, action_type.value, 0) if self.usage else 0
-            pending = self.pending_increments.get(action_type, 0)
-            total_usage = current_value + pending
-
-            # Get the limit for this action type
-            # Map action type to the corresponding max_ field in UsageLimit
-            limit_field = f"max_{action_type.value}"
-            limit = getattr(self.usage_limit, limit_field, None) if self.usage_limit else None
+            total_usage = self._total_usage(action_type)
+            limit = await self._get_limit(action_type)
 
             # If no limit (None), it's unlimited - always allowed
             if limit is None:
@@ -240,6 +221,106 @@ class GuardRailService:
 
             return True
 
+    async def acquire_lease(self, action_type: ActionType, amount: int, release: int = 0) -> int:
+        """Pre-authorize up to `amount` units of an action with a single check.
+
+        Hot loops (one check per streamed entity) use this via QuotaLease instead of calling
+        is_allowed per unit. Leased units count toward usage for other checks on this
+        service until they are released or settled on flush.
+
+        Args:
+            action_type: The type of action to lease
+            amount: Number of units requested
+            release: Units of the caller's previous lease to settle first
+
+        Returns:
+            Number of units granted (at least 1; fewer than requested near the limit)
+
+        Raises:
+            PaymentRequiredException: If action is blocked due to billing status
+            UsageLimitExceededException: If no quota is left for even one unit
+        """
+        async with self._lock:
+            self.leased[action_type] = max(0, self.leased.get(action_type, 0) - release)
+
+            if not self._should_enforce_usage_limits() or not await self._check_has_billing():
+                return amount
+
+            await self._check_billing_status(action_type)
+            await self._refresh_usage_if_stale()
+
+            limit = await self._get_limit(action_type)
+            if limit is None:
+                return amount
+
+            total_usage = self._total_usage(action_type)
+            headroom = limit - total_usage
+            if headroom < 1:
+                self.logger.warning(
+                    f"Usage limit exceeded for {action_type.value}: "
+                    f"current={total_usage}, limit={limit}"
+                )
+                raise UsageLimitExceededException(
+                    action_type=action_type.value,
+                    limit=limit,
+                    current_usage=total_usage,
+                )
+
+            granted = min(amount, headroom)
+            self.leased[action_type] = self.leased.get(action_type, 0) + granted
+            self.logger.debug(
+                f"Leased {granted} {action_type.value} (usage={total_usage}, limit={limit})"
+            )
+            return granted
+
+    async def release_lease(self, action_type: ActionType, amount: int) -> None:
+        """Return leased units that will not be used."""
+        async with self._lock:
+            self.leased[action_type] = max(0, self.leased.get(action_type, 0) - amount)
+
+    async def _check_billing_status(self, action_type: ActionType) -> None:
+        """Raise if the action is restricted by the (cached) billing status."""
+        billing_status = await self._get_billing_status_cached()
+        restricted_actions = self.BILLING_STATUS_RESTRICTIONS.get(billing_status, set())
+
+        # If action is restricted due to billing status, raise exception
+        if action_type in restricted_actions:
+            self.logger.warning(
+                f"Action {action_type.value} blocked due to billing status: {billing_status.value}"
+            )
+            raise PaymentRequiredException(
+                action_type=action_type.value,
+                payment_status=billing_status.value,
+            )
+
+    async def _refresh_usage_if_stale(self) -> None:
+        """Refresh usage from the database if the TTL expired or it was never fetched."""
+        should_refresh = (
+            self.usage is None
+            or self.usage_fetched_at is None
+            or datetime.utcnow() - self.usage_fetched_at > self.USAGE_CACHE_TTL
+        )
+
+        if should_refresh:
+            self.usage = await self._get_usage()
+            self.usage_fetched_at = datetime.utcnow()
+
+    def _total_usage(self, action_type: ActionType) -> int:
+        """Current usage plus pending increments and outstanding leases."""
+        current_value = getattr(self.usage, action_type.value, 0) if self.usage else 0
+        pending = self.pending_increments.get(action_type, 0)
+        leased = self.leased.get(action_type, 0)
+        return current_value + pending + leased
+
+    async def _get_limit(self, action_type: ActionType) -> Optional[int]:
+        """Limit for the action type from the (lazily inferred) usage limit; None = unlimited."""
+        if self.usage_limit is None:
+            self.usage_limit = await self._infer_usage_limit()
+
+        # Map action type to the corresponding max_ field in UsageLimit
+        limit_field = f"max_{action_type.value}"
+        return getattr(self.usage_limit, limit_field, None) if self.usage_limit else None
+
     async def increment(self, action_type: ActionType, amount: int = 1) -> None:
         """Increment the usage for the action.
 
@@ -382,6 +463,11 @@ class GuardRailService:
         """
         self.logger.info("Flushing all pending usage increments before termination")
         try:
+            # Settle outstanding leases: units actually used are reported via increments
+            async with self._lock:
+                for action_type in self.leased:
+                    self.leased[action_type] = 0
+
             # Use the public flush method which handles locking
             await self._flush_usage(action_type=None)
             self.logger.info("Successfully flushed all pending usage increments")
@@ -421,6 +507,17 @@ class GuardRailService:
                 self.logger.info("No usage record found for current billing period")
                 return None
 
+    async def _get_billing_status_cached(self) -> BillingPeriodStatus:
+        """Get billing status, re-reading the billing period at most every TTL."""
+        if (
+            self._billing_status is None
+            or self._billing_status_fetched_at is None
+            or datetime.utcnow() - self._billing_status_fetched_at > self.BILLING_STATUS_CACHE_TTL
+        ):
+            self._billing_status = await self._get_billing_status()
+            self._billing_status_fetched_at = datetime.utcnow()
+        return self._billing_status
+
     async def _get_billing_status(self) -> BillingPeriodStatus:
         """Get billing status from the current billing period.
 
@@ -594,3 +691,59 @@ class GuardRailService:
             max_source_connections=limits.get("max_source_connections"),
             max_team_members=limits.get("max_team_members"),
         )
+
+
+class QuotaLease:
+    """Block-wise quota check for hot loops.
+
+    Instead of one guard rail check (lock + billing/usage lookups) per unit, a lease
+    pre-authorizes a block of units with one check and consumes it locally; the next
+    block is requested (and the previous one settled) when it runs out.
+
+    Usage:
+        lease = QuotaLease(guard_rail, ActionType.ENTITIES)
+        async for entity in stream:
+            await lease.consume()  # raises like is_allowed() once quota is exhausted
+    """
+
+    def __init__(
+        self,
+        guard_rail: GuardRailService,
+        action_type: ActionType,
+        block_size: Optional[int] = None,
+    ):
+        """Initialize the lease.
+
+        Args:
+            guard_rail: The guard rail service to lease from
+            action_type: The type of action being consumed
+            block_size: Units requested per lease (defaults to LEASE_BLOCK_SIZES)
+        """
+        self.guard_rail = guard_rail
+        self.action_type = action_type
+        self.block_size = block_size or guard_rail.LEASE_BLOCK_SIZES.get(action_type, 1)
+        self._granted = 0
+        self._remaining = 0
+
+    async def consume(self, amount: int = 1) -> None:
+        """Consume units, leasing a new block when the current one is used up.
+
+        Raises:
+            PaymentRequiredException: If action is blocked due to billing status
+            UsageLimitExceededException: If the quota is exhausted
+        """
+        if self._remaining < amount:
+            self._granted = await self.guard_rail.acquire_lease(
+                self.action_type,
+                max(self.block_size, amount),
+                release=self._granted,
+            )
+            self._remaining = self._granted
+            if self._remaining < amount:
+                # Near the limit the request does not fit in what is left: hand the partial
+                # lease back and let the regular check decide (and raise)
+                await self.guard_rail.release_lease(self.action_type, self._granted)
+                self._granted = self._remaining = 0
+                await self.guard_rail.is_allowed(self.action_type, amount)
+                return
+        self._remaining -= amount
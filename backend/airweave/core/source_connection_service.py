@@ -36,6 +36,7 @@ from airweave.schemas.source_connection import (
     SourceConnectionListItem,
     SourceConnectionUpdate,
 )
+from airweave.search.profile import search_profiles
 
 
 class SourceConnectionService:
@@ -364,6 +365,9 @@ class SourceConnectionService:
                 detail=f"Unsupported authentication method: {auth_method.value}",
             )
 
+        # Sources of the collection changed
+        await search_profiles.invalidate(ctx.organization.id, obj_in.readable_collection_id)
+
         # Track analytics
         business_events.track_source_connection_created(
             ctx=ctx,
@@ -545,6 +549,10 @@ class SourceConnectionService:
 
         # Delete the source connection
         await crud.source_connection.remove(db, id=id, ctx=ctx)
+        if source_conn.readable_collection_id:
+            await search_profiles.invalidate(
+                ctx.organization.id, source_conn.readable_collection_id
+            )
 
         return response
 
@@ -48,6 +48,7 @@ from airweave.schemas.source_connection import (
     AuthenticationMethod,
     SourceConnectionJob,
 )
+from airweave.search.temporal_bounds import temporal_bounds_cache
 
 
 class SourceConnectionHelpers:
@@ -949,6 +950,7 @@ class SourceConnectionHelpers:
                 )
                 await destination.delete_by_sync_id(source_conn.sync_id)
                 ctx.logger.info(f"Deleted data for sync {source_conn.sync_id}")
+                await temporal_bounds_cache.invalidate(collection.id)
         except Exception as e:
             ctx.logger.error(f"Error cleaning up destination data: {e}")
 
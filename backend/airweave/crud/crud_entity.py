@@ -4,8 +4,9 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import func, select, update
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import Row, String, and_, any_, bindparam, column, delete, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.api.context import ApiContext
@@ -157,15 +158,38 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         if not entity_requests:
             return {}
 
-        # Build OR conditions for each (entity_id, entity_definition_id) pair
-        from sqlalchemy import and_, or_
-
-        conditions = [
-            and_(Entity.entity_id == eid, Entity.entity_definition_id == def_id)
-            for eid, def_id in entity_requests
-        ]
+        # Deduplicate while preserving order (same entity can appear twice in a batch)
+        unique_requests = list(dict.fromkeys(entity_requests))
+        entity_ids = [eid for eid, _ in unique_requests]
+        definition_ids = [def_id for _, def_id in unique_requests]
+
+        # Join against unnest(entity_ids[], definition_ids[]) instead of one OR branch per
+        # pair: the statement has two array parameters regardless of batch size (stable,
+        # cacheable SQL) and Postgres can probe the (sync_id, entity_id, entity_definition_id)
+        # unique index once per key.
+        keys = (
+            func.unnest(
+                bindparam("entity_ids", entity_ids, type_=ARRAY(String)),
+                bindparam("definition_ids", definition_ids, type_=ARRAY(PG_UUID(as_uuid=True))),
+            )
+            .table_valued(
+                column("entity_id", String),
+                column("entity_definition_id", PG_UUID(as_uuid=True)),
+            )
+            .render_derived(name="keys")
+        )
 
-        stmt = select(Entity).where(Entity.sync_id == sync_id, or_(*conditions))
+        stmt = (
+            select(Entity)
+            .join(
+                keys,
+                and_(
+                    Entity.entity_id == keys.c.entity_id,
+                    Entity.entity_definition_id == keys.c.entity_definition_id,
+                ),
+            )
+            .where(Entity.sync_id == sync_id)
+        )
 
         result = await db.execute(stmt)
         rows = list(result.unique().scalars().all())
@@ -265,22 +289,135 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         db: AsyncSession,
         *,
         rows: list[tuple[UUID, str]],
+        sync_job_id: UUID,
     ) -> None:
-        """Bulk update the 'hash' field for many entities.
+        """Bulk update the 'hash' field for many entities in a single statement.
+
+        Joins the entity table against unnest(ids, hashes) so the whole batch is one
+        round trip. Rows are sorted by primary key so concurrent workers lock
+        overlapping rows in the same order instead of deadlocking.
 
         Args:
             db: The async database session.
             rows: list of tuples (entity_db_id, new_hash)
+            sync_job_id: The sync job that produced the new hashes
         """
         if not rows:
             return
-        for entity_db_id, new_hash in rows:
-            stmt = (
-                update(Entity)
-                .where(Entity.id == entity_db_id)
-                .values(hash=new_hash, modified_at=datetime.now(timezone.utc).replace(tzinfo=None))
+
+        # Last hash wins for duplicate ids, then order by primary key
+        ordered = sorted(dict(rows).items())
+
+        values = (
+            func.unnest(
+                bindparam(
+                    "ids",
+                    [entity_db_id for entity_db_id, _ in ordered],
+                    type_=ARRAY(PG_UUID(as_uuid=True)),
+                ),
+                bindparam("hashes", [new_hash for _, new_hash in ordered], type_=ARRAY(String)),
+            )
+            .table_valued(column("id", PG_UUID(as_uuid=True)), column("hash", String))
+            .render_derived(name="new_values")
+        )
+
+        stmt = (
+            update(Entity)
+            .where(Entity.id == values.c.id)
+            .values(
+                hash=values.c.hash,
+                sync_job_id=sync_job_id,
+                modified_at=datetime.now(timezone.utc).replace(tzinfo=None),
             )
-            await db.execute(stmt)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+
+    async def bulk_update_sync_job_id(
+        self,
+        db: AsyncSession,
+        *,
+        sync_id: UUID,
+        entity_ids: list[str],
+        sync_job_id: UUID,
+    ) -> None:
+        """Stamp existing entities with the sync job that encountered them.
+
+        Orphan cleanup removes every entity of the sync whose sync_job_id is not the current
+        job, so each entity the source yields must be stamped (inserts and updates are
+        stamped by bulk_create / bulk_update_hash; this covers unchanged entities).
+        Rows are matched on entity_id alone, whatever their entity_definition_id (which may
+        be NULL or differ from the current class mapping), so an entity the source still
+        yields is never treated as an orphan. IDs without a stored row are ignored.
+
+        Args:
+            db: The async database session.
+            sync_id: The sync ID to filter by
+            entity_ids: Entity IDs encountered by the current sync job
+            sync_job_id: The current sync job ID
+        """
+        if not entity_ids:
+            return
+
+        # Sorted so concurrent workers lock overlapping rows in the same order
+        unique_ids = sorted(set(entity_ids))
+
+        stmt = (
+            update(Entity)
+            .where(
+                Entity.sync_id == sync_id,
+                Entity.entity_id == any_(bindparam("entity_ids", unique_ids, type_=ARRAY(String))),
+                Entity.sync_job_id != sync_job_id,
+            )
+            .values(sync_job_id=sync_job_id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(stmt)
+
+    async def bulk_remove_outdated(
+        self,
+        db: AsyncSession,
+        *,
+        sync_id: UUID,
+        sync_job_id: UUID,
+        organization_id: UUID,
+        limit: int,
+        after_id: Optional[UUID] = None,
+    ) -> list[Row]:
+        """Delete one keyset page of entities not stamped by the current sync job.
+
+        Pages are taken in primary-key order starting after `after_id`, so repeated calls
+        walk the sync's outdated rows without loading them all. The caller controls the
+        transaction, so the delete can be rolled back if downstream cleanup fails.
+
+        Args:
+            db: The async database session.
+            sync_id: The sync ID to clean up
+            sync_job_id: The current sync job ID (rows stamped with it are kept)
+            organization_id: Organization owning the sync
+            limit: Maximum number of rows to delete
+            after_id: Primary key of the last row of the previous page
+
+        Returns:
+            Deleted rows as (id, entity_id, entity_definition_id), ordered by id
+        """
+        page = select(Entity.id).where(
+            Entity.sync_id == sync_id,
+            Entity.organization_id == organization_id,
+            Entity.sync_job_id != sync_job_id,
+        )
+        if after_id is not None:
+            page = page.where(Entity.id > after_id)
+        page = page.order_by(Entity.id).limit(limit).with_for_update()
+
+        stmt = (
+            delete(Entity)
+            .where(Entity.id.in_(page.scalar_subquery()))
+            .returning(Entity.id, Entity.entity_id, Entity.entity_definition_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        return sorted(result.all(), key=lambda row: row.id)
 
     async def update_job_id(
         self,
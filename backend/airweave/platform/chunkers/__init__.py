@@ -2,6 +2,7 @@
 
 from airweave.platform.chunkers._base import BaseChunker
 from airweave.platform.chunkers.code import CodeChunker
+from airweave.platform.chunkers.language_detection import CodeLanguageDetector
 from airweave.platform.chunkers.semantic import SemanticChunker
 
-__all__ = ["BaseChunker", "CodeChunker", "SemanticChunker"]
+__all__ = ["BaseChunker", "CodeChunker", "CodeLanguageDetector", "SemanticChunker"]
@@ -1,10 +1,10 @@
 """Code chunker using AST-based parsing with SentenceChunker safety net."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from airweave.core.logging import logger
 from airweave.platform.chunkers._base import BaseChunker
-from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.async_helpers import run_in_process_pool
 from airweave.platform.sync.exceptions import SyncFailureError
 
 
@@ -16,7 +16,10 @@ class CodeChunker(BaseChunker):
     2. SentenceChunker: Safety net to split any chunks exceeding token limit
 
     The chunker is shared across all syncs in the pod to avoid reloading
-    the Magika language detection model for every sync job.
+    models for every sync job. Batches are chunked in the CPU process pool, where each
+    worker process holds its own singleton with one Chonkie CodeChunker (and tree-sitter
+    parser) per language. Languages detected upstream by CodeLanguageDetector are passed
+    in, so Chonkie only falls back to its own Magika detection for undetected texts.
 
     Note: Even with AST-based splitting, single large AST nodes (massive functions
     without children) can exceed chunk_size, so we use SentenceChunker as safety net.
@@ -27,6 +30,7 @@ class CodeChunker(BaseChunker):
     CHUNK_SIZE = 2048  # Target chunk size (can be exceeded by large AST nodes)
     OVERLAP_TOKENS = 128  # Token overlap for safety net
     TOKENIZER = "cl100k_base"  # For accurate OpenAI token counting
+    AUTO_LANGUAGE = "auto"  # Chonkie's Magika-based detection (texts without a language)
 
     # Singleton instance
     _instance: Optional["CodeChunker"] = None
@@ -43,7 +47,7 @@ class CodeChunker(BaseChunker):
         if self._initialized:
             return
 
-        self._code_chunker = None  # Lazy init
+        self._code_chunkers: Dict[str, Any] = {}  # language → Chonkie CodeChunker (lazy)
         self._sentence_chunker = None  # Lazy init (safety net)
         self._tiktoken_tokenizer = None  # Lazy init
         self._initialized = True
@@ -56,31 +60,22 @@ class CodeChunker(BaseChunker):
     def _ensure_chunkers(self):
         """Lazy initialization of chunker models.
 
-        Initializes CodeChunker (AST parsing) + SentenceChunker (safety net).
+        Initializes the tokenizer + SentenceChunker (safety net). Per-language
+        CodeChunkers are created on first use by _get_code_chunker().
 
         Raises:
             SyncFailureError: If model loading fails (infrastructure error)
         """
-        if self._code_chunker is not None:
+        if self._sentence_chunker is not None:
             return
 
         try:
             import tiktoken
-            from chonkie import CodeChunker as ChonkieCodeChunker
             from chonkie import SentenceChunker
 
             # Initialize tiktoken tokenizer for accurate OpenAI token counting
             self._tiktoken_tokenizer = tiktoken.get_encoding(self.TOKENIZER)
 
-            # Initialize Chonkie's CodeChunker with auto language detection
-            # Uses Magika (Google's ML-based language detector) to identify language
-            self._code_chunker = ChonkieCodeChunker(
-                language="auto",  # Auto-detect using Magika
-                tokenizer=self._tiktoken_tokenizer,
-                chunk_size=self.CHUNK_SIZE,
-                include_nodes=False,
-            )
-
             # Initialize SentenceChunker for safety net
             # Needed because large functions/classes without children can exceed CHUNK_SIZE
             self._sentence_chunker = SentenceChunker(
@@ -91,23 +86,58 @@ class CodeChunker(BaseChunker):
             )
 
             logger.info(
-                f"Loaded CodeChunker (auto-detect, target: {self.CHUNK_SIZE}) + "
+                f"Loaded CodeChunker (target: {self.CHUNK_SIZE}) + "
                 f"SentenceChunker safety net (hard_limit: {self.MAX_TOKENS_PER_CHUNK})"
             )
 
         except Exception as e:
             raise SyncFailureError(f"Failed to initialize CodeChunker: {e}")
 
-    async def chunk_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+    def _get_code_chunker(self, language: str):
+        """Get (or create) the cached Chonkie CodeChunker for a language.
+
+        Args:
+            language: tree-sitter language name, or AUTO_LANGUAGE for Magika detection
+
+        Raises:
+            SyncFailureError: If the chunker cannot be created
+        """
+        code_chunker = self._code_chunkers.get(language)
+        if code_chunker is not None:
+            return code_chunker
+
+        try:
+            from chonkie import CodeChunker as ChonkieCodeChunker
+
+            # One chunker per language: the tree-sitter parser is built once and reused
+            code_chunker = ChonkieCodeChunker(
+                language=language,
+                tokenizer=self._tiktoken_tokenizer,
+                chunk_size=self.CHUNK_SIZE,
+                include_nodes=False,
+            )
+        except Exception as e:
+            raise SyncFailureError(f"Failed to initialize CodeChunker for {language}: {e}")
+
+        self._code_chunkers[language] = code_chunker
+        logger.debug(f"Loaded CodeChunker for language '{language}'")
+        return code_chunker
+
+    async def chunk_batch(
+        self, texts: List[str], languages: Optional[Sequence[Optional[str]]] = None
+    ) -> List[List[Dict[str, Any]]]:
         """Chunk a batch of code texts with two-stage approach.
 
         Stage 1: CodeChunker chunks at AST boundaries (functions, classes)
         Stage 2: SentenceChunker splits any chunks exceeding MAX_TOKENS_PER_CHUNK
 
-        Uses run_in_thread_pool because Chonkie is synchronous (avoids blocking event loop).
+        Runs in the CPU process pool because Chonkie is synchronous and holds the GIL
+        (avoids blocking the event loop and scales with cores).
 
         Args:
             texts: List of code textual representations to chunk
+            languages: Detected tree-sitter language per text (from CodeLanguageDetector);
+                texts without one are detected by Chonkie (Magika)
 
         Returns:
             List of chunk lists (one per input text), where each chunk is a dict
@@ -115,17 +145,14 @@ class CodeChunker(BaseChunker):
         Raises:
             SyncFailureError: If model initialization or batch processing fails
         """
-        self._ensure_chunkers()
-
-        # Stage 1: AST-based code chunking
-        try:
-            code_results = await run_in_thread_pool(self._code_chunker.chunk_batch, texts)
-        except Exception as e:
-            # CodeChunker failure = sync failure (not entity-level)
-            raise SyncFailureError(f"CodeChunker batch processing failed: {e}")
+        if languages is not None and len(languages) != len(texts):
+            raise SyncFailureError(
+                f"PROGRAMMING ERROR: Got {len(languages)} languages for {len(texts)} texts"
+            )
 
-        # Stage 2: Safety net (batched for efficiency)
-        final_results = await run_in_thread_pool(self._apply_safety_net_batched, code_results)
+        final_results = await run_in_process_pool(
+            _chunk_batch_in_worker, texts, list(languages) if languages is not None else None
+        )
 
         # Validate all chunks meet requirements
         for doc_chunks in final_results:
@@ -143,13 +170,46 @@ class CodeChunker(BaseChunker):
 
         return final_results
 
+    def _chunk_batch_sync(
+        self, texts: List[str], languages: Optional[List[Optional[str]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Run both chunking stages synchronously (in a pool worker).
+
+        Raises:
+            SyncFailureError: If model initialization or batch processing fails
+        """
+        self._ensure_chunkers()
+
+        # Group texts by language so each group goes through its language's chunker
+        positions_by_language: Dict[str, List[int]] = {}
+        for i in range(len(texts)):
+            language = (languages[i] if languages is not None else None) or self.AUTO_LANGUAGE
+            positions_by_language.setdefault(language, []).append(i)
+
+        # Stage 1: AST-based code chunking
+        code_results: List[List[Any]] = [[] for _ in texts]
+        for language, positions in positions_by_language.items():
+            code_chunker = self._get_code_chunker(language)
+            try:
+                group_results = code_chunker.chunk_batch([texts[i] for i in positions])
+            except Exception as e:
+                # CodeChunker failure = sync failure (not entity-level)
+                raise SyncFailureError(f"CodeChunker batch processing failed: {e}")
+            for i, chunks in zip(positions, group_results, strict=True):
+                code_results[i] = chunks
+
+        # Stage 2: Safety net (batched for efficiency)
+        return self._apply_safety_net_batched(code_results)
+
     def _apply_safety_net_batched(
         self, code_results: List[List[Any]]
     ) -> List[List[Dict[str, Any]]]:
         """Split oversized chunks using batched sentence chunking.
 
         Same implementation as SemanticChunker - collects oversized chunks,
-        batch processes them, then reconstructs results.
+        batch processes them, then reconstructs results. Chonkie's CodeChunker and
+        SentenceChunker count tokens with the tiktoken tokenizer, so their token_count
+        is already the cl100k_base count and is passed through without re-encoding.
 
         Args:
             code_results: Chunks from CodeChunker
@@ -159,44 +219,34 @@ class CodeChunker(BaseChunker):
         """
         # Collect oversized chunks with position mapping
         oversized_texts = []
-        oversized_map = {}  # position in oversized_texts → (doc_idx, chunk_idx)
+        oversized_map = {}  # (doc_idx, chunk_idx) → position in oversized_texts
 
         for doc_idx, chunks in enumerate(code_results):
             for chunk_idx, chunk in enumerate(chunks):
                 if chunk.token_count > self.MAX_TOKENS_PER_CHUNK:
-                    pos = len(oversized_texts)
+                    oversized_map[(doc_idx, chunk_idx)] = len(oversized_texts)
                     oversized_texts.append(chunk.text)
-                    oversized_map[pos] = (doc_idx, chunk_idx)
 
         # Batch process all oversized chunks with SentenceChunker
-        split_results_by_position = {}
+        split_results = []
         if oversized_texts:
             logger.debug(
                 f"Safety net: splitting {len(oversized_texts)} oversized code chunks "
                 f"exceeding {self.MAX_TOKENS_PER_CHUNK} tokens"
             )
             split_results = self._sentence_chunker.chunk_batch(oversized_texts)
-            split_results_by_position = dict(enumerate(split_results))
 
-        # Reconstruct final results
+        # Reconstruct final results (single pass, O(1) lookup per chunk)
         final_results = []
         for doc_idx, chunks in enumerate(code_results):
             final_chunks = []
             for chunk_idx, chunk in enumerate(chunks):
                 # Check if this chunk was oversized
-                oversized_pos = next(
-                    (
-                        pos
-                        for pos, (d_idx, c_idx) in oversized_map.items()
-                        if d_idx == doc_idx and c_idx == chunk_idx
-                    ),
-                    None,
-                )
+                oversized_pos = oversized_map.get((doc_idx, chunk_idx))
 
                 if oversized_pos is not None:
                     # Replace with split sub-chunks
-                    split_chunks = split_results_by_position[oversized_pos]
-                    for sub_chunk in split_chunks:
+                    for sub_chunk in split_results[oversized_pos]:
                         final_chunks.append(self._convert_chunk(sub_chunk))
                 else:
                     # Keep original chunk
@@ -227,3 +277,10 @@ class CodeChunker(BaseChunker):
             "end_index": chunk.end_index,
             "token_count": chunk.token_count,
         }
+
+
+def _chunk_batch_in_worker(
+    texts: List[str], languages: Optional[List[Optional[str]]] = None
+) -> List[List[Dict[str, Any]]]:
+    """Process pool entry point: chunk with this process's CodeChunker singleton."""
+    return CodeChunker()._chunk_batch_sync(texts, languages)
@@ -0,0 +1,200 @@
+"""Code language detection shared by the pipeline and the code chunker."""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from airweave.core.logging import logger
+from airweave.platform.utils.file_extensions import get_language_for_extension
+
+# Language names from file_extensions.LANGUAGE_MAP → tree-sitter-language-pack names.
+# Extensions that map here skip ML detection; anything else falls back to Magika.
+TREE_SITTER_LANGUAGES: Dict[str, str] = {
+    "HTML": "html",
+    "CSS": "css",
+    "SCSS": "scss",
+    "JavaScript": "javascript",
+    "JSX (JavaScript XML)": "javascript",
+    "TypeScript": "typescript",
+    "TSX (TypeScript XML)": "tsx",
+    "Vue": "vue",
+    "Svelte": "svelte",
+    "Python": "python",
+    "Ruby": "ruby",
+    "PHP": "php",
+    "Java": "java",
+    "C#": "csharp",
+    "Go": "go",
+    "Rust": "rust",
+    "Swift": "swift",
+    "Kotlin": "kotlin",
+    "Kotlin Script": "kotlin",
+    "Scala": "scala",
+    "C": "c",
+    "C++": "cpp",
+    "C/C++ Header": "cpp",
+    "C++ Header": "cpp",
+    "Objective-C": "objc",
+    "Julia": "julia",
+    "Elixir": "elixir",
+    "Elixir Script": "elixir",
+    "Erlang": "erlang",
+    "Clojure": "clojure",
+    "ClojureScript": "clojure",
+    "Groovy": "groovy",
+    "Dart": "dart",
+    "Haskell": "haskell",
+    "OCaml": "ocaml",
+    "F#": "fsharp",
+    "Zig": "zig",
+    "Lua": "lua",
+    "Perl": "perl",
+    "R": "r",
+    "Shell": "bash",
+    "Bash": "bash",
+    "Zsh": "bash",
+    "PowerShell": "powershell",
+    "JSON": "json",
+    "YAML": "yaml",
+    "TOML": "toml",
+    "XML": "xml",
+    "Markdown": "markdown",
+    "Terraform": "hcl",
+    "HCL": "hcl",
+    "Dockerfile": "dockerfile",
+    "SQL": "sql",
+    "GraphQL": "graphql",
+    "Protocol Buffers": "proto",
+    "CMake": "cmake",
+    "Scheme": "scheme",
+    "Racket": "racket",
+    "Elm": "elm",
+}
+
+
+class CodeLanguageDetector:
+    """Singleton language detector with cached tree-sitter parser lookups.
+
+    Detection order for each file:
+    1. File extension (via get_language_for_extension), when it maps to a tree-sitter
+       language with an available parser - no model inference
+    2. Magika (Google's ML-based detector) on the raw text, same as Chonkie's
+       language="auto" mode
+
+    The Magika model is loaded once per process and tree-sitter parser lookups are
+    cached per language (including misses), so large repository syncs pay the model
+    load once instead of once per batch. Detected languages are passed to the
+    CodeChunker so Chonkie does not run detection again.
+    """
+
+    # Singleton instance
+    _instance: Optional["CodeLanguageDetector"] = None
+
+    def __new__(cls):
+        """Singleton pattern - one instance per process."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize once per process (Magika loads lazily on first ML detection)."""
+        if self._initialized:
+            return
+
+        self._magika = None  # Lazy init
+        self._magika_lock = threading.Lock()
+        self._parsers: Dict[str, Any] = {}  # language → parser (None if unsupported)
+        self._parsers_lock = threading.Lock()
+        self._initialized = True
+
+    def get_parser(self, language: str) -> Optional[Any]:
+        """Get the cached tree-sitter parser for a language.
+
+        Args:
+            language: tree-sitter-language-pack language name
+
+        Returns:
+            Parser, or None if tree-sitter does not support the language
+
+        Raises:
+            ImportError: If tree-sitter-language-pack is not installed
+        """
+        if language in self._parsers:
+            return self._parsers[language]
+
+        from tree_sitter_language_pack import get_parser
+
+        with self._parsers_lock:
+            if language not in self._parsers:
+                try:
+                    self._parsers[language] = get_parser(language)
+                except LookupError:
+                    self._parsers[language] = None
+        return self._parsers[language]
+
+    def is_supported(self, language: str) -> bool:
+        """Check whether tree-sitter can parse a language (cached)."""
+        return self.get_parser(language) is not None
+
+    def detect(self, text: str, path: Optional[str] = None) -> str:
+        """Detect the language of a code file.
+
+        Args:
+            text: Raw code (textual representation)
+            path: File path or name, used for the extension fast path
+
+        Returns:
+            Detected language name (tree-sitter name on the fast path, Magika label
+            otherwise); check is_supported() before chunking with it
+
+        Raises:
+            ImportError: If Magika or tree-sitter-language-pack is not installed
+        """
+        if path:
+            language = TREE_SITTER_LANGUAGES.get(
+                get_language_for_extension(Path(path).suffix.lower())
+            )
+            if language and self.is_supported(language):
+                return language
+
+        result = self._get_magika().identify_bytes(text.encode("utf-8"))
+        return result.output.label.lower()
+
+    def detect_batch(
+        self, texts: List[str], paths: Optional[Sequence[Optional[str]]] = None
+    ) -> List[Optional[str]]:
+        """Detect languages for a batch of code files (blocking - run in a thread pool).
+
+        Args:
+            texts: Raw code per file
+            paths: File path or name per file (optional)
+
+        Returns:
+            Detected language per file, or None where detection failed
+
+        Raises:
+            ImportError: If Magika or tree-sitter-language-pack is not installed
+        """
+        paths = paths if paths is not None else [None] * len(texts)
+        languages: List[Optional[str]] = []
+        for text, path in zip(texts, paths, strict=True):
+            try:
+                languages.append(self.detect(text, path))
+            except ImportError:
+                raise
+            except Exception as e:
+                logger.warning(f"Language detection failed for {path or '<unknown>'}: {e}")
+                languages.append(None)
+        return languages
+
+    def _get_magika(self):
+        """Load the Magika model once per process."""
+        if self._magika is None:
+            with self._magika_lock:
+                if self._magika is None:
+                    from magika import Magika
+
+                    self._magika = Magika()
+                    logger.debug("Loaded Magika language detection model")
+        return self._magika
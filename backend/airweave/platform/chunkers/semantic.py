@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from airweave.core.logging import logger
 from airweave.platform.chunkers._base import BaseChunker
-from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.async_helpers import run_in_process_pool
 from airweave.platform.sync.exceptions import SyncFailureError
 
 
@@ -16,7 +16,8 @@ class SemanticChunker(BaseChunker):
     2. TokenChunker fallback: Force-splits any oversized chunks at token boundaries
 
     The chunker is shared across all syncs in the pod to avoid reloading
-    the embedding model for every sync job.
+    the embedding model for every sync job. Batches are chunked in the CPU process
+    pool, where each worker process holds its own singleton (and loaded model).
     """
 
     # Configuration constants
@@ -153,7 +154,9 @@ class SemanticChunker(BaseChunker):
         Stage 1.5: Recount tokens with tiktoken cl100k_base (OpenAI compatibility)
         Stage 2: TokenChunker force-splits any oversized chunks at token boundaries (hard limit)
 
-        Uses run_in_thread_pool because Chonkie is synchronous (avoids blocking event loop).
+        Runs in the CPU process pool because Chonkie is synchronous and holds the GIL
+        (avoids blocking the event loop and scales with cores). Only texts and chunk
+        dicts cross the process boundary.
 
         Args:
             texts: List of textual representations to chunk
@@ -164,23 +167,7 @@ class SemanticChunker(BaseChunker):
         Raises:
             SyncFailureError: If model initialization or batch processing fails
         """
-        self._ensure_chunkers()
-
-        # Stage 1: Semantic chunking (finds topic boundaries via embedding similarity)
-        try:
-            semantic_results = await run_in_thread_pool(self._semantic_chunker.chunk_batch, texts)
-        except Exception as e:
-            raise SyncFailureError(f"SemanticChunker batch processing failed: {e}")
-
-        # Stage 1.5: Recount tokens with tiktoken (semantic chunker uses its own tokenizer)
-        semantic_results_with_tiktoken = await run_in_thread_pool(
-            self._recount_tokens_with_tiktoken, semantic_results
-        )
-
-        # Stage 2: Safety net (batched for efficiency, uses tiktoken counts)
-        final_results = await run_in_thread_pool(
-            self._apply_safety_net_batched, semantic_results_with_tiktoken
-        )
+        final_results = await run_in_process_pool(_chunk_batch_in_worker, texts)
 
         # Validate all chunks meet requirements
         for doc_chunks in final_results:
@@ -199,11 +186,35 @@ class SemanticChunker(BaseChunker):
 
         return final_results
 
+    def _chunk_batch_sync(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Run all chunking stages synchronously (in a pool worker).
+
+        Raises:
+            SyncFailureError: If model initialization or batch processing fails
+        """
+        self._ensure_chunkers()
+
+        # Stage 1: Semantic chunking (finds topic boundaries via embedding similarity)
+        try:
+            semantic_results = self._semantic_chunker.chunk_batch(texts)
+        except Exception as e:
+            raise SyncFailureError(f"SemanticChunker batch processing failed: {e}")
+
+        # Stage 1.5: Recount tokens with tiktoken (semantic chunker uses its own tokenizer)
+        semantic_results_with_tiktoken = self._recount_tokens_with_tiktoken(semantic_results)
+
+        # Stage 2: Safety net (batched for efficiency, uses tiktoken counts)
+        return self._apply_safety_net_batched(semantic_results_with_tiktoken)
+
     def _recount_tokens_with_tiktoken(self, semantic_results: List[List[Any]]) -> List[List[Any]]:
         """Recount all chunks with tiktoken cl100k_base for OpenAI compatibility.
 
         SemanticChunker uses its own tokenizer internally, so we recount
         with tiktoken to get accurate token counts for OpenAI embedding API.
+        All chunks of the batch are encoded in one encode_batch call (tiktoken
+        tokenizes in native threads). These counts are the only cl100k_base
+        counts computed for semantic chunks: the safety net, the dense embedder's
+        request packing and the pipeline's chunk statistics all reuse them.
 
         Args:
             semantic_results: Chunks from SemanticChunker with its own token counts
@@ -211,10 +222,13 @@ class SemanticChunker(BaseChunker):
         Returns:
             Same chunks but with token_count field updated to tiktoken counts
         """
-        for chunks in semantic_results:
-            for chunk in chunks:
-                # Recount with tiktoken
-                chunk.token_count = len(self._tiktoken_tokenizer.encode(chunk.text))
+        all_chunks = [chunk for chunks in semantic_results for chunk in chunks]
+        if not all_chunks:
+            return semantic_results
+
+        encoded = self._tiktoken_tokenizer.encode_batch([chunk.text for chunk in all_chunks])
+        for chunk, tokens in zip(all_chunks, encoded, strict=True):
+            chunk.token_count = len(tokens)
 
         return semantic_results
 
@@ -246,8 +260,8 @@ class SemanticChunker(BaseChunker):
             ]
 
             oversized_map = {
-                0: (0, 1),  # Position 0 in oversized_texts → doc_idx=0, chunk_idx=1
-                1: (2, 0),  # Position 1 in oversized_texts → doc_idx=2, chunk_idx=0
+                (0, 1): 0,  # doc_idx=0, chunk_idx=1 → position 0 in oversized_texts
+                (2, 0): 1,  # doc_idx=2, chunk_idx=0 → position 1 in oversized_texts
             }
 
             # STEP 2: TokenChunker fallback (hard limit enforcement)
@@ -263,12 +277,7 @@ class SemanticChunker(BaseChunker):
                 Chunk(text="...", token_count=5000)]
             ]
 
-            split_results_by_pos = {
-                0: [Chunk(...), Chunk(...)],  # 2 sub-chunks
-                1: [Chunk(...), Chunk(...)]   # 2 sub-chunks
-            }
-
-            # STEP 3: Reconstruct final results
+            # STEP 3: Reconstruct final results in one pass (O(1) lookup per chunk)
             final_results = [
                 # Document 0: chunk 0 (OK), chunk 1 (REPLACED with 2 sub-chunks), chunk 2 (OK)
                 [
@@ -299,18 +308,17 @@ class SemanticChunker(BaseChunker):
         """
         # Collect oversized chunks with position mapping
         oversized_texts = []
-        oversized_map = {}  # position in oversized_texts → (doc_idx, chunk_idx)
+        oversized_map = {}  # (doc_idx, chunk_idx) → position in oversized_texts
 
         for doc_idx, chunks in enumerate(semantic_results):
             for chunk_idx, chunk in enumerate(chunks):
                 if chunk.token_count > self.MAX_TOKENS_PER_CHUNK:
-                    pos = len(oversized_texts)
+                    oversized_map[(doc_idx, chunk_idx)] = len(oversized_texts)
                     oversized_texts.append(chunk.text)
-                    oversized_map[pos] = (doc_idx, chunk_idx)
 
         # Batch process all oversized chunks with TokenChunker fallback
         # TokenChunker enforces hard limit in one pass (no recursion needed)
-        split_results_by_position = {}
+        split_results = []
         if oversized_texts:
             logger.debug(
                 f"Safety net: splitting {len(oversized_texts)} chunks "
@@ -321,27 +329,17 @@ class SemanticChunker(BaseChunker):
             # GUARANTEED to produce chunks ≤ MAX_TOKENS_PER_CHUNK in one pass
             split_results = self._token_chunker.chunk_batch(oversized_texts)
 
-            split_results_by_position = dict(enumerate(split_results))
-
-        # Reconstruct final results
+        # Reconstruct final results (single pass, O(1) lookup per chunk)
         final_results = []
         for doc_idx, chunks in enumerate(semantic_results):
             final_chunks = []
             for chunk_idx, chunk in enumerate(chunks):
                 # Check if this chunk was oversized
-                oversized_pos = next(
-                    (
-                        pos
-                        for pos, (d_idx, c_idx) in oversized_map.items()
-                        if d_idx == doc_idx and c_idx == chunk_idx
-                    ),
-                    None,
-                )
+                oversized_pos = oversized_map.get((doc_idx, chunk_idx))
 
                 if oversized_pos is not None:
-                    # Replace with split sub-chunks
-                    split_chunks = split_results_by_position[oversized_pos]
-                    for sub_chunk in split_chunks:
+                    # Replace with split sub-chunks (TokenChunker counts are cl100k_base)
+                    for sub_chunk in split_results[oversized_pos]:
                         final_chunks.append(self._convert_chunk(sub_chunk))
                 else:
                     # Keep original chunk
@@ -375,3 +373,8 @@ class SemanticChunker(BaseChunker):
             "end_index": chunk.end_index,
             "token_count": chunk.token_count,  # Already tiktoken count
         }
+
+
+def _chunk_batch_in_worker(texts: List[str]) -> List[List[Dict[str, Any]]]:
+    """Process pool entry point: chunk with this process's SemanticChunker singleton."""
+    return SemanticChunker()._chunk_batch_sync(texts)
@@ -3,24 +3,27 @@
 from .code_converter import CodeConverter
 from .html_converter import HtmlConverter
 from .mistral_converter import MistralConverter
+from .text_layer_converter import TextLayerConverter
 from .txt_converter import TxtConverter
 from .xlsx_converter import XlsxConverter
 
 # Singleton instances
 mistral_converter = MistralConverter()
+text_layer_converter = TextLayerConverter(ocr_converter=mistral_converter)  # OCR only if needed
 html_converter = HtmlConverter()
 xlsx_converter = XlsxConverter()  # Local openpyxl extraction (not Mistral)
 txt_converter = TxtConverter()
 code_converter = CodeConverter()
 
 # Aliases for backward compatibility
-pdf_converter = mistral_converter  # PDF uses Mistral OCR
-docx_converter = mistral_converter  # DOCX uses Mistral OCR
-pptx_converter = mistral_converter  # PPTX uses Mistral OCR
+pdf_converter = text_layer_converter  # PDF text layer, Mistral OCR for scanned pages
+docx_converter = text_layer_converter  # DOCX text, Mistral OCR for image-only documents
+pptx_converter = text_layer_converter  # PPTX text, Mistral OCR for image-only slides
 img_converter = mistral_converter  # Images use Mistral OCR
 
 __all__ = [
     "mistral_converter",
+    "text_layer_converter",
     "pdf_converter",
     "docx_converter",
     "img_converter",
@@ -5,7 +5,7 @@ from typing import Dict, List
 
 from airweave.core.logging import logger
 from airweave.platform.converters._base import BaseTextConverter
-from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.async_helpers import run_in_process_pool
 from airweave.platform.sync.exceptions import EntityProcessingError
 
 
@@ -25,7 +25,7 @@ class HtmlConverter(BaseTextConverter):
             EntityProcessingError: If html-to-markdown package not installed
         """
         try:
-            from html_to_markdown import convert
+            import html_to_markdown  # noqa: F401
         except ImportError:
             logger.error("html-to-markdown package not installed for HTML conversion")
             raise EntityProcessingError(
@@ -41,21 +41,7 @@ class HtmlConverter(BaseTextConverter):
         async def _convert_one(path: str):
             async with semaphore:
                 try:
-
-                    def _convert():
-                        # Read HTML file
-                        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                            html_content = f.read()
-
-                        if not html_content or not html_content.strip():
-                            return None
-
-                        # Convert to markdown using html-to-markdown (Rust-powered)
-                        markdown = convert(html_content)
-
-                        return markdown.strip() if markdown else None
-
-                    text = await run_in_thread_pool(_convert)
+                    text = await run_in_process_pool(_html_file_to_markdown, path)
 
                     if text:
                         results[path] = text
@@ -74,3 +60,20 @@ class HtmlConverter(BaseTextConverter):
         logger.info(f"HTML conversion complete: {successful}/{len(file_paths)} files successful")
 
         return results
+
+
+def _html_file_to_markdown(path: str) -> str | None:
+    """Convert one HTML file to markdown (runs in the CPU process pool)."""
+    from html_to_markdown import convert
+
+    # Read HTML file
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        html_content = f.read()
+
+    if not html_content or not html_content.strip():
+        return None
+
+    # Convert to markdown using html-to-markdown (Rust-powered)
+    markdown = convert(html_content)
+
+    return markdown.strip() if markdown else None
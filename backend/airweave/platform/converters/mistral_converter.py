@@ -6,11 +6,14 @@ import json
 import os
 import tempfile
 import time
-from typing import Dict, List
+import uuid
+from typing import Dict, List, Optional, Tuple
 
 from airweave.core.config import settings
 from airweave.core.logging import logger
 from airweave.platform.converters._base import BaseTextConverter
+from airweave.platform.converters.ocr_cache import OcrResultCache, hash_file
+from airweave.platform.converters.ocr_coalescer import OcrJobCoalescer
 from airweave.platform.rate_limiters import MistralRateLimiter
 from airweave.platform.sync.async_helpers import run_in_thread_pool
 from airweave.platform.sync.exceptions import EntityProcessingError, SyncFailureError
@@ -20,6 +23,14 @@ from airweave.platform.sync.exceptions import EntityProcessingError, SyncFailure
 # Mistral OCR file size limit
 MAX_FILE_SIZE_BYTES = 50_000_000  # 50MB Mistral limit
 
+# Mistral OCR model (also part of the OCR cache key)
+OCR_MODEL = "mistral-ocr-latest"
+
+# Batch job poll timeout: a base plus an allowance per document, since coalesced jobs
+# hold up to MISTRAL_OCR_BATCH_MAX_DOCUMENTS documents
+BATCH_JOB_TIMEOUT_SECONDS = 600
+BATCH_JOB_TIMEOUT_PER_DOCUMENT_SECONDS = 6
+
 
 # ==================== MISTRAL CONVERTER ====================
 
@@ -35,6 +46,13 @@ class MistralConverter(BaseTextConverter):
     - PDF: Split by pages using PyPDF2
     - DOCX: Split by paragraphs using python-docx
     - PPTX: Split by slides using python-pptx
+
+    Pod-wide batching and caching:
+    - Documents are keyed by the sha256 of their bytes; OCR results are cached
+      (local LRU + Redis), and identical documents converted concurrently share one
+      OCR request
+    - Uploaded documents from concurrent convert_batch calls (pipeline workers and
+      syncs) are coalesced into shared batch jobs by OcrJobCoalescer
     """
 
     # Supported formats
@@ -48,6 +66,14 @@ class MistralConverter(BaseTextConverter):
         self.rate_limiter = MistralRateLimiter()  # Singleton - shared across all converters in pod
         self._mistral_client = None
         self._mistral_initialized = False
+        self._cache = OcrResultCache() if settings.OCR_CACHE_ENABLED else None
+        self._coalescer = OcrJobCoalescer(
+            self._run_batch_job,
+            window_seconds=settings.MISTRAL_OCR_BATCH_WINDOW_SECONDS,
+            max_documents=settings.MISTRAL_OCR_BATCH_MAX_DOCUMENTS,
+        )
+        # content hash → result of an OCR request in progress (shared by duplicates)
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     def _ensure_mistral_client(self):
         """Ensure Mistral client is initialized (lazy initialization).
@@ -74,6 +100,10 @@ class MistralConverter(BaseTextConverter):
     async def convert_batch(self, file_paths: List[str]) -> Dict[str, str]:
         """Convert document files to markdown text using Mistral batch OCR API.
 
+        Documents already OCR'd (same bytes) are served from the OCR cache, and
+        duplicates - within this batch or in flight in another conversion - are
+        OCR'd once.
+
         Args:
             file_paths: List of document file paths to convert
 
@@ -83,6 +113,110 @@ class MistralConverter(BaseTextConverter):
         # Ensure Mistral client is initialized before processing
         self._ensure_mistral_client()
 
+        # Step 0: Hash file contents (unreadable files get None and fail in preparation)
+        content_hashes = await run_in_thread_pool(
+            lambda: {path: hash_file(path) for path in file_paths}
+        )
+
+        cached: Dict[str, str] = {}
+        if self._cache is not None:
+            cached = await self._cache.get_many(
+                OCR_MODEL, [h for h in content_hashes.values() if h is not None]
+            )
+
+        to_convert, owned, waiting = self._partition_by_cache(file_paths, content_hashes, cached)
+
+        logger.debug(
+            f"OCR batch: {len(file_paths)} files, {len(cached)} cached, "
+            f"{len(waiting)} in flight elsewhere, {len(to_convert)} to convert"
+        )
+
+        converted: Dict[str, Optional[str]] = {}
+        try:
+            if to_convert:
+                converted = await self._convert_uncached(to_convert)
+        finally:
+            # Release duplicates waiting on this call (None = failed, they skip the entity)
+            for content_hash, path in owned.items():
+                future = self._inflight.pop(content_hash)
+                if not future.done():
+                    future.set_result(converted.get(path))
+
+        if self._cache is not None:
+            await self._cache.set_many(
+                OCR_MODEL, {h: converted[p] for h, p in owned.items() if converted.get(p)}
+            )
+
+        # Shielded: a cancelled caller must not cancel the request other callers share
+        shared = {h: await asyncio.shield(future) for h, future in waiting.items()}
+
+        return self._assemble_results(file_paths, content_hashes, cached, owned, converted, shared)
+
+    def _partition_by_cache(
+        self,
+        file_paths: List[str],
+        content_hashes: Dict[str, Optional[str]],
+        cached: Dict[str, str],
+    ) -> Tuple[List[str], Dict[str, str], Dict[str, asyncio.Future]]:
+        """Split files into cached, OCR'd by this call, or in flight in another call.
+
+        The first path per unknown content hash is converted by this call, and an
+        in-flight future is registered for it so concurrent duplicates wait instead.
+
+        Returns:
+            Tuple of (paths to convert, content hash → path converted by this call,
+            content hash → another call's in-flight request)
+        """
+        loop = asyncio.get_running_loop()
+        to_convert: List[str] = []
+        owned: Dict[str, str] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        for path in file_paths:
+            content_hash = content_hashes[path]
+            if content_hash is None:
+                to_convert.append(path)
+            elif content_hash in cached or content_hash in owned or content_hash in waiting:
+                continue
+            elif content_hash in self._inflight:
+                waiting[content_hash] = self._inflight[content_hash]
+            else:
+                owned[content_hash] = path
+                self._inflight[content_hash] = loop.create_future()
+                to_convert.append(path)
+        return to_convert, owned, waiting
+
+    @staticmethod
+    def _assemble_results(
+        file_paths: List[str],
+        content_hashes: Dict[str, Optional[str]],
+        cached: Dict[str, str],
+        owned: Dict[str, str],
+        converted: Dict[str, Optional[str]],
+        shared: Dict[str, Optional[str]],
+    ) -> Dict[str, Optional[str]]:
+        """Map every input path to its markdown from the cache, this call or another call."""
+        final_results: Dict[str, Optional[str]] = {}
+        for path in file_paths:
+            content_hash = content_hashes[path]
+            if content_hash is None:
+                final_results[path] = converted.get(path)
+            elif content_hash in cached:
+                final_results[path] = cached[content_hash]
+            elif content_hash in owned:
+                final_results[path] = converted.get(owned[content_hash])
+            else:
+                final_results[path] = shared[content_hash]
+        return final_results
+
+    async def _convert_uncached(self, file_paths: List[str]) -> Dict[str, Optional[str]]:
+        """OCR documents through a (coalesced) Mistral batch job.
+
+        Args:
+            file_paths: Document file paths to convert
+
+        Returns:
+            Dict mapping file_path -> markdown text content (None if failed)
+        """
         try:
             # Step 1: Prepare files (split large ones)
             file_chunks_map = await self._prepare_and_split_files(file_paths)
@@ -95,17 +229,11 @@ class MistralConverter(BaseTextConverter):
             # Step 2: Upload all chunks to Mistral
             upload_map = await self._upload_chunks_to_mistral(file_chunks_map)
 
-            # Step 3: Create JSONL batch file with signed URLs
-            jsonl_path, custom_id_to_upload_key = await self._create_batch_jsonl(upload_map)
-
-            # Step 4: Submit batch job
-            job_id, batch_file_id = await self._submit_batch_job(jsonl_path)
-
-            # Step 5: Poll for completion
-            await self._poll_batch_job(job_id, timeout=600)
-
-            # Step 6: Download and parse results
-            upload_key_results = await self._download_batch_results(job_id, custom_id_to_upload_key)
+            # Steps 3-6: Batch job shared with concurrent conversions in the pod
+            try:
+                upload_key_results = await self._coalescer.submit(upload_map)
+            finally:
+                await self._cleanup_mistral_files(upload_map)
 
             # Step 7: Combine chunks back to original files
             final_results = await self._combine_chunk_results(
@@ -113,15 +241,8 @@ class MistralConverter(BaseTextConverter):
             )
 
             # Step 8: Cleanup
-            await self._cleanup_mistral_files(upload_map, batch_file_id)
             await self._cleanup_temp_chunks(file_chunks_map)
 
-            # Step 9: Delete JSONL
-            try:
-                os.unlink(jsonl_path)
-            except Exception:
-                pass
-
             return final_results
 
         except EntityProcessingError:
@@ -142,6 +263,37 @@ class MistralConverter(BaseTextConverter):
             logger.error(f"Mistral batch conversion failed: {e}")
             raise SyncFailureError(f"Mistral batch conversion failed: {e}")
 
+    async def _run_batch_job(self, upload_map: Dict[str, dict]) -> Dict[str, Optional[str]]:
+        """Run one Mistral batch OCR job (called by the coalescer).
+
+        Args:
+            upload_map: Dict of upload_key -> {'file_id', 'signed_url'}
+
+        Returns:
+            Dict mapping upload_key -> markdown content
+        """
+        # Step 3: Create JSONL batch file with signed URLs
+        jsonl_path, custom_id_to_upload_key = await self._create_batch_jsonl(upload_map)
+
+        # Step 4: Submit batch job
+        try:
+            job_id, batch_file_id = await self._submit_batch_job(jsonl_path)
+        finally:
+            try:
+                os.unlink(jsonl_path)
+            except Exception:
+                pass
+
+        try:
+            # Step 5: Poll for completion
+            per_document = BATCH_JOB_TIMEOUT_PER_DOCUMENT_SECONDS * len(upload_map)
+            await self._poll_batch_job(job_id, timeout=BATCH_JOB_TIMEOUT_SECONDS + per_document)
+
+            # Step 6: Download and parse results
+            return await self._download_batch_results(job_id, custom_id_to_upload_key)
+        finally:
+            await self._cleanup_mistral_files({}, batch_file_id)
+
     # ==================== FILE PREPARATION & SPLITTING ====================
 
     async def _prepare_and_split_files(self, file_paths: List[str]) -> Dict[str, List[str]]:
@@ -158,12 +310,15 @@ class MistralConverter(BaseTextConverter):
         """
         file_chunks_map = {}
 
+        # Keys must be unique across concurrent calls (their uploads share batch jobs)
+        call_id = uuid.uuid4().hex
+
         # Handle duplicate paths (same file multiple times in batch)
         for idx, path in enumerate(file_paths):
             try:
                 file_size = os.path.getsize(path)
                 # Create unique key for duplicate paths
-                unique_key = f"{path}__batch_idx_{idx}"
+                unique_key = f"{path}__batch_idx_{idx}_{call_id}"
 
                 # Get file extension
                 _, ext = os.path.splitext(path)
@@ -755,7 +910,7 @@ class MistralConverter(BaseTextConverter):
 
             # Create batch job
             job = self._mistral_client.batch.jobs.create(
-                input_files=[batch_data.id], model="mistral-ocr-latest", endpoint="/v1/ocr"
+                input_files=[batch_data.id], model=OCR_MODEL, endpoint="/v1/ocr"
             )
 
             logger.debug(f"Submitted batch job {job.id} (batch file: {batch_data.id})")
@@ -999,12 +1154,14 @@ class MistralConverter(BaseTextConverter):
 
     # ==================== CLEANUP ====================
 
-    async def _cleanup_mistral_files(self, upload_map: Dict[str, dict], batch_file_id: str):
+    async def _cleanup_mistral_files(
+        self, upload_map: Dict[str, dict], batch_file_id: Optional[str] = None
+    ):
         """Delete uploaded files from Mistral cloud (best effort).
 
         Args:
             upload_map: Dict of upload_key -> {'file_id', 'signed_url'}
-            batch_file_id: ID of uploaded batch JSONL file
+            batch_file_id: ID of uploaded batch JSONL file (if any)
         """
 
         async def _delete(file_id):
@@ -1017,7 +1174,8 @@ class MistralConverter(BaseTextConverter):
 
         # Collect all file IDs
         file_ids = [info["file_id"] for info in upload_map.values()]
-        file_ids.append(batch_file_id)
+        if batch_file_id:
+            file_ids.append(batch_file_id)
 
         await asyncio.gather(*[_delete(fid) for fid in file_ids], return_exceptions=True)
         logger.debug(f"Cleaned up {len(file_ids)} files from Mistral")
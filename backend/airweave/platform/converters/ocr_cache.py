@@ -0,0 +1,184 @@
+"""Content-addressed OCR result cache shared by converters in the pod.
+
+Entries are keyed by (OCR model, sha256 of the file bytes), so the same document
+attached to many emails, or re-synced unchanged, is OCR'd once and then served
+from cache across entities, syncs and pods.
+
+Two tiers:
+- Local LRU (per process): markdown strings, bounded by entry count
+- Redis (shared): zlib-compressed, base64-encoded markdown with TTL
+
+Cache failures never fail a sync - a broken tier is treated as a miss.
+"""
+
+import base64
+import hashlib
+import zlib
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+
+HASH_READ_SIZE = 1024 * 1024  # 1MB reads when hashing files
+
+
+def hash_file(path: str) -> Optional[str]:
+    """Compute the sha256 of a file's bytes (blocking - run in a thread pool).
+
+    Returns:
+        Hex digest, or None if the file cannot be read
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            while block := f.read(HASH_READ_SIZE):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class OcrResultCache:
+    """Two-tier (local LRU + Redis) cache for OCR markdown.
+
+    Usage:
+        cache = OcrResultCache()
+        cached = await cache.get_many(model, content_hashes)   # {content_hash: markdown}
+        await cache.set_many(model, {content_hash: markdown})
+    """
+
+    KEY_PREFIX = "ocr"
+
+    def __init__(
+        self,
+        max_local_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        use_redis: Optional[bool] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_local_entries: Max entries in the in-process LRU (0 disables local tier)
+            ttl_seconds: TTL for Redis entries
+            use_redis: Whether to use the shared Redis tier
+        """
+        self.max_local_entries = (
+            settings.OCR_CACHE_LOCAL_MAX_ENTRIES if max_local_entries is None else max_local_entries
+        )
+        self.ttl_seconds = settings.OCR_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.use_redis = settings.OCR_CACHE_REDIS_ENABLED if use_redis is None else use_redis
+
+        self._local: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------------------------
+    # Keys and encoding
+    # ------------------------------------------------------------------------------------
+
+    def make_key(self, model: str, content_hash: str) -> str:
+        """Build the cache key for a document's content hash."""
+        return f"{self.KEY_PREFIX}:{model}:{content_hash}"
+
+    @staticmethod
+    def encode(markdown: str) -> str:
+        """Compress markdown for the Redis tier."""
+        return base64.b64encode(zlib.compress(markdown.encode("utf-8"))).decode("ascii")
+
+    @staticmethod
+    def decode(value: str | bytes) -> str:
+        """Decompress a Redis value into markdown."""
+        return zlib.decompress(base64.b64decode(value)).decode("utf-8")
+
+    # ------------------------------------------------------------------------------------
+    # Local tier
+    # ------------------------------------------------------------------------------------
+
+    def _local_get(self, key: str) -> Optional[str]:
+        markdown = self._local.get(key)
+        if markdown is not None:
+            self._local.move_to_end(key)
+        return markdown
+
+    def _local_set(self, key: str, markdown: str) -> None:
+        if self.max_local_entries <= 0:
+            return
+        self._local[key] = markdown
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+    # ------------------------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------------------------
+
+    async def get_many(self, model: str, content_hashes: List[str]) -> Dict[str, str]:
+        """Look up cached OCR markdown for documents.
+
+        Args:
+            model: OCR model name (part of the key)
+            content_hashes: sha256 hex digests of the documents
+
+        Returns:
+            Mapping of content hash -> cached markdown (only hits are included)
+        """
+        unique_hashes = list(dict.fromkeys(content_hashes))
+        found: Dict[str, str] = {}
+        remote_hashes: List[str] = []
+        remote_keys: List[str] = []
+
+        for content_hash in unique_hashes:
+            key = self.make_key(model, content_hash)
+            markdown = self._local_get(key)
+            if markdown is not None:
+                found[content_hash] = markdown
+            else:
+                remote_hashes.append(content_hash)
+                remote_keys.append(key)
+
+        if remote_keys and self.use_redis:
+            try:
+                values = await redis_client.client.mget(remote_keys)
+                for content_hash, key, value in zip(
+                    remote_hashes, remote_keys, values, strict=True
+                ):
+                    if value is None:
+                        continue
+                    markdown = self.decode(value)
+                    found[content_hash] = markdown
+                    self._local_set(key, markdown)
+            except Exception as e:
+                logger.warning(f"OCR cache read failed, treating as miss: {e}")
+
+        self.hits += len(found)
+        self.misses += len(unique_hashes) - len(found)
+        return found
+
+    async def set_many(self, model: str, results: Dict[str, str]) -> None:
+        """Store OCR markdown in both tiers.
+
+        Args:
+            model: OCR model name (part of the key)
+            results: Mapping of content hash -> markdown
+        """
+        if not results:
+            return
+
+        redis_items: Dict[str, str] = {}
+        for content_hash, markdown in results.items():
+            key = self.make_key(model, content_hash)
+            self._local_set(key, markdown)
+            redis_items[key] = self.encode(markdown)
+
+        if not self.use_redis:
+            return
+
+        try:
+            pipe = redis_client.client.pipeline(transaction=False)
+            for key, value in redis_items.items():
+                pipe.setex(key, self.ttl_seconds, value)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"OCR cache write failed (non-fatal): {e}")
@@ -0,0 +1,148 @@
+"""Pod-wide coalescing of Mistral OCR requests into shared batch jobs."""
+
+import asyncio
+import itertools
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from airweave.core.logging import logger
+
+# Runs one batch job: upload_key -> {'file_id', 'signed_url'} in, upload_key -> markdown out
+BatchRunner = Callable[[Dict[str, dict]], Awaitable[Dict[str, Optional[str]]]]
+
+# Queued document: (upload info, caller's result future, caller id)
+_Entry = Tuple[dict, asyncio.Future, int]
+
+
+class OcrJobCoalescer:
+    """Merges uploaded documents from concurrent conversions into right-sized batch jobs.
+
+    Every Mistral batch job pays the job queue latency and the polling interval, so
+    many small converter sub-batches (from different pipeline workers and syncs) are
+    gathered here and submitted together:
+    - a job is submitted once max_documents are queued, or
+    - window_seconds after the first document was queued (latency deadline)
+
+    Each caller awaits only the results for its own documents. Callers may belong to
+    different syncs and organizations, so a shared job that fails (submit error, FAILED
+    status, poll timeout) is not blamed on all of them: each caller's documents are
+    rerun in a job of their own, and only that job's outcome reaches the caller.
+    """
+
+    def __init__(self, run_batch: BatchRunner, window_seconds: float, max_documents: int):
+        """Initialize the coalescer.
+
+        Args:
+            run_batch: Coroutine that runs one batch job for an upload map
+            window_seconds: Max time a queued document waits before its job is submitted
+            max_documents: Max documents per batch job (submits early when reached)
+        """
+        self.run_batch = run_batch
+        self.window_seconds = window_seconds
+        self.max_documents = max(1, max_documents)
+
+        self._pending: Dict[str, _Entry] = {}
+        self._callers = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._jobs: Set[asyncio.Task] = set()
+
+    async def submit(self, upload_map: Dict[str, dict]) -> Dict[str, Optional[str]]:
+        """Queue uploaded documents for OCR and wait for their results.
+
+        Args:
+            upload_map: Dict of upload_key -> {'file_id', 'signed_url'} (keys must be
+                unique across concurrent callers)
+
+        Returns:
+            Dict mapping upload_key -> markdown content (None if OCR failed)
+        """
+        if not upload_map:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        caller = next(self._callers)
+        futures: Dict[str, asyncio.Future] = {}
+        for upload_key, upload_info in upload_map.items():
+            future = loop.create_future()
+            self._pending[upload_key] = (upload_info, future, caller)
+            futures[upload_key] = future
+
+        if len(self._pending) >= self.max_documents:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+
+        results = await asyncio.gather(*futures.values())
+        return dict(zip(futures.keys(), results, strict=True))
+
+    def _flush(self) -> None:
+        """Submit everything queued, in jobs of at most max_documents."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending = list(self._pending.items())
+        self._pending = {}
+
+        for start in range(0, len(pending), self.max_documents):
+            batch = dict(pending[start : start + self.max_documents])
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._jobs.add(task)
+            task.add_done_callback(self._jobs.discard)
+
+    async def _run(self, batch: Dict[str, _Entry]) -> None:
+        """Run one batch job and resolve the callers' futures."""
+        # Skip documents whose callers are gone (cancelled while waiting)
+        live = {key: entry for key, entry in batch.items() if not entry[1].done()}
+        if not live:
+            return
+
+        callers: Dict[int, Dict[str, _Entry]] = {}
+        for key, entry in live.items():
+            callers.setdefault(entry[2], {})[key] = entry
+
+        logger.debug(
+            f"Submitting coalesced OCR batch job with {len(live)} documents "
+            f"from {len(callers)} conversions"
+        )
+        try:
+            await self._run_and_resolve(live)
+        except Exception as e:
+            if len(callers) == 1:
+                self._fail(live, e)
+                return
+            logger.warning(
+                f"Coalesced OCR batch job failed ({e}); rerunning its {len(callers)} "
+                f"conversions in separate jobs"
+            )
+            outcomes = await asyncio.gather(
+                *[self._run_and_resolve(entries) for entries in callers.values()],
+                return_exceptions=True,
+            )
+            for entries, outcome in zip(callers.values(), outcomes, strict=True):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                if isinstance(outcome, Exception):
+                    self._fail(entries, outcome)
+
+    async def _run_and_resolve(self, entries: Dict[str, _Entry]) -> None:
+        """Run a job for the entries and set their results (raises if the job fails)."""
+        try:
+            results = await self.run_batch({key: info for key, (info, _, _) in entries.items()})
+        except asyncio.CancelledError:
+            self._cancel(entries)
+            raise
+
+        for key, (_, future, _) in entries.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+    @staticmethod
+    def _fail(entries: Dict[str, _Entry], error: Exception) -> None:
+        for _, future, _ in entries.values():
+            if not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    def _cancel(entries: Dict[str, _Entry]) -> None:
+        for _, future, _ in entries.values():
+            future.cancel()
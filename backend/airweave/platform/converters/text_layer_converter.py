@@ -0,0 +1,405 @@
+"""Local text-layer extraction for PDF, DOCX and PPTX with OCR only where needed."""
+
+import asyncio
+import io
+import os
+import tempfile
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from airweave.core.logging import logger
+from airweave.platform.converters._base import BaseTextConverter
+from airweave.platform.sync.async_helpers import run_in_process_pool
+
+# ==================== CONFIGURATION (Module-Level Constants) ====================
+
+# A page/slide with images and fewer characters than this is treated as scanned or
+# image-only and sent to OCR
+MIN_TEXT_CHARS_PER_PAGE = 100
+
+# Pages whose extracted text is mostly unmapped glyphs (no ToUnicode map) need OCR too
+MAX_UNREADABLE_CHAR_RATIO = 0.1
+
+# When more pages than this need OCR, OCR the whole document in one request instead
+# of page by page
+MAX_OCR_PAGE_RATIO = 0.5
+
+# Slide images Mistral OCR accepts
+OCR_IMAGE_EXTENSIONS = {"jpg", "jpeg", "png"}
+
+
+# ==================== TEXT LAYER CONVERTER ====================
+
+
+class TextLayerConverter(BaseTextConverter):
+    """Converts born-digital documents from their text layer, with OCR fallback.
+
+    Most PDFs, DOCX and PPTX files carry a full text layer, so text is extracted
+    locally (PyPDF2, python-docx, python-pptx in the CPU process pool) and only the
+    parts that need it go to the OCR converter (Mistral):
+    - PDF: pages with images and little or unreadable text are OCR'd as single-page
+      PDFs; results are merged back in page order
+    - PPTX: pictures on slides with little text are OCR'd as images
+    - DOCX: image-only documents are OCR'd whole
+    - When most pages need OCR, or local extraction fails, the whole document is
+      sent to OCR (same as before)
+    """
+
+    SUPPORTED_FORMATS = {".pdf", ".docx", ".pptx"}
+
+    def __init__(self, ocr_converter: BaseTextConverter):
+        """Initialize converter.
+
+        Args:
+            ocr_converter: Converter used for pages/documents that need OCR
+        """
+        self.ocr_converter = ocr_converter
+
+    async def convert_batch(self, file_paths: List[str]) -> Dict[str, str]:
+        """Convert documents to markdown from their text layer, OCR'ing only where needed.
+
+        Args:
+            file_paths: List of PDF/DOCX/PPTX file paths to convert
+
+        Returns:
+            Dict mapping file_path -> markdown text content (None if failed)
+
+        Raises:
+            SyncFailureError: If the OCR converter hits an infrastructure failure
+        """
+        extractions: Dict[str, Optional[Dict[str, Any]]] = {}
+        semaphore = asyncio.Semaphore(10)  # Limit concurrent extractions
+
+        async def _extract_one(path: str):
+            async with semaphore:
+                try:
+                    extractions[path] = await run_in_process_pool(_extract_text_layer, path)
+                except Exception as e:
+                    logger.warning(
+                        f"Text layer extraction failed for {os.path.basename(path)}: {e} - "
+                        f"falling back to OCR"
+                    )
+                    extractions[path] = None
+
+        unique_paths = list(dict.fromkeys(file_paths))
+        await asyncio.gather(*[_extract_one(p) for p in unique_paths])
+
+        # Everything that needs OCR goes to the OCR converter in one batch (input order,
+        # not extraction completion order)
+        whole_documents = [
+            path
+            for path in unique_paths
+            if extractions[path] is None or extractions[path]["ocr_whole_document"]
+        ]
+        ocr_files = [
+            ocr_path
+            for path in unique_paths
+            if extractions[path] is not None and not extractions[path]["ocr_whole_document"]
+            for _, ocr_path in extractions[path]["ocr_files"]
+        ]
+
+        logger.debug(
+            f"Text layer conversion: {len(unique_paths)} documents, "
+            f"{len(whole_documents)} sent to OCR whole, {len(ocr_files)} pages/images to OCR"
+        )
+
+        try:
+            ocr_results: Dict[str, Optional[str]] = {}
+            if whole_documents or ocr_files:
+                ocr_results = await self.ocr_converter.convert_batch(whole_documents + ocr_files)
+        finally:
+            _remove_temp_files(ocr_files)
+
+        results: Dict[str, Optional[str]] = {}
+        for path in file_paths:
+            extraction = extractions[path]
+            if extraction is None or extraction["ocr_whole_document"]:
+                results[path] = ocr_results.get(path)
+            else:
+                results[path] = _merge_segments(extraction, ocr_results)
+
+            if not results[path]:
+                results[path] = None
+                logger.warning(f"Conversion produced no content for {os.path.basename(path)}")
+
+        return results
+
+
+def _merge_segments(extraction: Dict[str, Any], ocr_results: Dict[str, Optional[str]]) -> str:
+    """Merge local text and OCR output in page/slide order.
+
+    A page's OCR output replaces its local text; if OCR failed, the (sparse) local
+    text is kept.
+    """
+    ocr_by_segment: Dict[int, List[str]] = {}
+    for segment_idx, ocr_path in extraction["ocr_files"]:
+        markdown = ocr_results.get(ocr_path)
+        if markdown:
+            ocr_by_segment.setdefault(segment_idx, []).append(markdown)
+
+    parts = []
+    for segment_idx, text in enumerate(extraction["segments"]):
+        if segment_idx in ocr_by_segment:
+            ocr_text = "\n\n".join(ocr_by_segment[segment_idx])
+            # Slide pictures are OCR'd on their own: keep the slide's own text as well
+            text = f"{text}\n\n{ocr_text}" if extraction["keep_text"] and text else ocr_text
+        if text and text.strip():
+            parts.append(text.strip())
+    return "\n\n".join(parts)
+
+
+# ==================== LOCAL EXTRACTION (CPU PROCESS POOL) ====================
+
+
+def _extract_text_layer(path: str) -> Dict[str, Any]:
+    """Extract a document's text layer (runs in the CPU process pool).
+
+    Returns:
+        Dict with:
+        - segments: text per page/slide (single segment for DOCX)
+        - ocr_files: (segment index, temp file path) pairs to OCR
+        - ocr_whole_document: True if the whole document should be OCR'd instead
+        - keep_text: whether OCR output is appended to (vs replaces) segment text
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".pdf":
+        extraction = _extract_pdf(path)
+    elif ext == ".docx":
+        extraction = _extract_docx(path)
+    elif ext == ".pptx":
+        extraction = _extract_pptx(path)
+    else:
+        raise ValueError(f"Unsupported format for text layer extraction: {ext}")
+
+    # No text layer at all (e.g. text drawn as vector outlines): let OCR try the whole file
+    if not extraction["ocr_files"] and not any(s.strip() for s in extraction["segments"]):
+        return _whole_document(extraction["segments"])
+    return extraction
+
+
+def _needs_ocr(text: str, has_images: bool) -> bool:
+    """Whether a page/slide looks scanned or image-only."""
+    stripped = "".join(text.split())
+    if not stripped:
+        return has_images
+    unreadable = sum(1 for char in stripped if _is_unmapped_glyph(char))
+    if unreadable / len(stripped) > MAX_UNREADABLE_CHAR_RATIO:
+        return True
+    return has_images and len(stripped) < MIN_TEXT_CHARS_PER_PAGE
+
+
+def _is_unmapped_glyph(char: str) -> bool:
+    """Whether PyPDF2 output for a glyph is not real text.
+
+    Without a usable ToUnicode map PyPDF2 falls back to the raw character codes, which
+    come out as control or private-use characters, or as U+FFFD replacement characters.
+    """
+    return char == "\ufffd" or unicodedata.category(char) in ("Cc", "Co", "Cn")
+
+
+def _whole_document(segments: List[str]) -> Dict[str, Any]:
+    return {
+        "segments": segments,
+        "ocr_files": [],
+        "ocr_whole_document": True,
+        "keep_text": False,
+    }
+
+
+def _write_temp_file(data: bytes, suffix: str) -> str:
+    temp_fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    with os.fdopen(temp_fd, "wb") as temp_file:
+        temp_file.write(data)
+    return temp_path
+
+
+def _remove_temp_files(paths: List[str]) -> None:
+    for temp_path in paths:
+        try:
+            os.unlink(temp_path)
+        except Exception:
+            pass  # Best effort
+
+
+# ==================== PDF ====================
+
+
+def _pdf_page_has_images(page) -> bool:
+    """Check a page's resources for image XObjects (one level into form XObjects)."""
+
+    def _has_images(resources, depth: int) -> bool:
+        if resources is None or depth > 2:
+            return False
+        xobjects = resources.get_object().get("/XObject")
+        if xobjects is None:
+            return False
+        for xobject in xobjects.get_object().values():
+            xobject = xobject.get_object()
+            subtype = xobject.get("/Subtype")
+            if subtype == "/Image":
+                return True
+            if subtype == "/Form" and _has_images(xobject.get("/Resources"), depth + 1):
+                return True
+        return False
+
+    return _has_images(page.get("/Resources"), 0)
+
+
+def _extract_pdf(path: str) -> Dict[str, Any]:
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(path)
+    segments: List[str] = []
+    ocr_pages: List[int] = []
+
+    for page_idx, page in enumerate(reader.pages):
+        text = page.extract_text() or ""
+        segments.append(text)
+        if _needs_ocr(text, _pdf_page_has_images(page)):
+            ocr_pages.append(page_idx)
+
+    if not segments:
+        raise ValueError("PDF has no pages")
+
+    if len(ocr_pages) > MAX_OCR_PAGE_RATIO * len(segments):
+        return _whole_document(segments)
+
+    ocr_files: List[Tuple[int, str]] = []
+    try:
+        for page_idx in ocr_pages:
+            writer = PyPDF2.PdfWriter()
+            writer.add_page(reader.pages[page_idx])
+            page_pdf = io.BytesIO()
+            writer.write(page_pdf)
+            ocr_files.append((page_idx, _write_temp_file(page_pdf.getvalue(), ".pdf")))
+    except Exception:
+        # The caller falls back to OCR'ing the whole file and never sees these paths
+        _remove_temp_files([ocr_path for _, ocr_path in ocr_files])
+        raise
+
+    return {
+        "segments": segments,
+        "ocr_files": ocr_files,
+        "ocr_whole_document": False,
+        "keep_text": False,
+    }
+
+
+# ==================== DOCX ====================
+
+
+def _docx_table_to_markdown(table) -> str:
+    rows = [[cell.text.strip().replace("\n", " ") for cell in row.cells] for row in table.rows]
+    if not rows:
+        return ""
+    lines = ["| " + " | ".join(rows[0]) + " |", "| " + " | ".join(["---"] * len(rows[0])) + " |"]
+    for row in rows[1:]:
+        padded = row + [""] * (len(rows[0]) - len(row))
+        lines.append("| " + " | ".join(padded[: len(rows[0])]) + " |")
+    return "\n".join(lines)
+
+
+def _docx_paragraph_to_markdown(paragraph) -> str:
+    text = paragraph.text.strip()
+    if not text:
+        return ""
+    style = (paragraph.style.name if paragraph.style is not None else "") or ""
+    if style.startswith("Heading "):
+        level = style.removeprefix("Heading ").strip()
+        if level.isdigit():
+            return f"{'#' * min(int(level), 6)} {text}"
+    if style == "Title":
+        return f"# {text}"
+    if style.startswith("List"):
+        return f"- {text}"
+    return text
+
+
+def _extract_docx(path: str) -> Dict[str, Any]:
+    from docx import Document
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
+    doc = Document(path)
+    blocks: List[str] = []
+
+    # Body paragraphs and tables in document order
+    for child in doc.element.body.iterchildren():
+        tag = child.tag.rsplit("}", 1)[-1]
+        if tag == "p":
+            blocks.append(_docx_paragraph_to_markdown(Paragraph(child, doc)))
+        elif tag == "tbl":
+            blocks.append(_docx_table_to_markdown(Table(child, doc)))
+
+    text = "\n\n".join(block for block in blocks if block)
+    if _needs_ocr(text, has_images=len(doc.inline_shapes) > 0):
+        return _whole_document([text])
+
+    return {
+        "segments": [text],
+        "ocr_files": [],
+        "ocr_whole_document": False,
+        "keep_text": False,
+    }
+
+
+# ==================== PPTX ====================
+
+
+def _pptx_collect_shapes(shapes, texts: List[str], pictures: List[Any]) -> None:
+    """Collect text and pictures from slide shapes (recursing into groups)."""
+    from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+    for shape in shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            _pptx_collect_shapes(shape.shapes, texts, pictures)
+            continue
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            pictures.append(shape)
+        if getattr(shape, "has_text_frame", False) and shape.text_frame.text.strip():
+            texts.append(shape.text_frame.text.strip())
+        if getattr(shape, "has_table", False):
+            for row in shape.table.rows:
+                texts.append(" | ".join(cell.text.strip() for cell in row.cells))
+
+
+def _extract_pptx(path: str) -> Dict[str, Any]:
+    from pptx import Presentation
+
+    prs = Presentation(path)
+    segments: List[str] = []
+    ocr_slides: List[Tuple[int, List[Any]]] = []
+
+    for slide_idx, slide in enumerate(prs.slides):
+        texts: List[str] = []
+        pictures: List[Any] = []
+        _pptx_collect_shapes(slide.shapes, texts, pictures)
+        text = "\n".join(texts)
+        segments.append(text)
+        if _needs_ocr(text, has_images=bool(pictures)):
+            ocr_slides.append((slide_idx, pictures))
+
+    if not segments:
+        raise ValueError("PPTX has no slides")
+
+    if len(ocr_slides) > MAX_OCR_PAGE_RATIO * len(segments):
+        return _whole_document(segments)
+
+    ocr_files: List[Tuple[int, str]] = []
+    try:
+        for slide_idx, pictures in ocr_slides:
+            for picture in pictures:
+                image = picture.image
+                if image.ext.lower() in OCR_IMAGE_EXTENSIONS:
+                    ocr_files.append((slide_idx, _write_temp_file(image.blob, f".{image.ext}")))
+    except Exception:
+        # The caller falls back to OCR'ing the whole file and never sees these paths
+        _remove_temp_files([ocr_path for _, ocr_path in ocr_files])
+        raise
+
+    return {
+        "segments": segments,
+        "ocr_files": ocr_files,
+        "ocr_whole_document": False,
+        "keep_text": True,
+    }
@@ -11,7 +11,7 @@ import aiofiles
 
 from airweave.core.logging import logger
 from airweave.platform.converters._base import BaseTextConverter
-from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.async_helpers import run_in_process_pool, run_in_thread_pool
 from airweave.platform.sync.exceptions import EntityProcessingError
 
 
@@ -99,31 +99,7 @@ class TxtConverter(BaseTextConverter):
         Raises:
             EntityProcessingError: If CSV is empty
         """
-
-        def _read_and_convert():
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-
-            if not rows:
-                raise EntityProcessingError(f"CSV file {path} is empty")
-
-            # Create markdown table
-            md = []
-
-            # Header
-            md.append("| " + " | ".join(rows[0]) + " |")
-            md.append("|" + "|".join(["---"] * len(rows[0])) + "|")
-
-            # Data rows
-            for row in rows[1:]:
-                # Pad if row is shorter than header
-                padded = row + [""] * (len(rows[0]) - len(row))
-                md.append("| " + " | ".join(padded[: len(rows[0])]) + " |")
-
-            return "\n".join(md)
-
-        return await run_in_thread_pool(_read_and_convert)
+        return await run_in_process_pool(_csv_file_to_markdown, path)
 
     async def _convert_json(self, path: str) -> str:
         """Convert JSON to pretty-printed code fence.
@@ -177,3 +153,28 @@ class TxtConverter(BaseTextConverter):
             with open(path, "r", encoding="utf-8", errors="ignore") as f:
                 raw = f.read()
             return f"```xml\n{raw}\n```" if raw.strip() else None
+
+
+def _csv_file_to_markdown(path: str) -> str:
+    """Convert a CSV file to a markdown table (runs in the CPU process pool)."""
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        reader = csv.reader(f)
+        rows = list(reader)
+
+    if not rows:
+        raise EntityProcessingError(f"CSV file {path} is empty")
+
+    # Create markdown table
+    md = []
+
+    # Header
+    md.append("| " + " | ".join(rows[0]) + " |")
+    md.append("|" + "|".join(["---"] * len(rows[0])) + "|")
+
+    # Data rows
+    for row in rows[1:]:
+        # Pad if row is shorter than header
+        padded = row + [""] * (len(rows[0]) - len(row))
+        md.append("| " + " | ".join(padded[: len(rows[0])]) + " |")
+
+    return "\n".join(md)
@@ -5,6 +5,8 @@
 - Accepts either fastembed sparse objects (with `.as_object()`) OR a raw dict shaped like
   {"indices": [...], "values": [...]} for maximum compatibility.
 - Preserves the *improved* per-chunk deterministic UUIDv5 point IDs to avoid overwrites.
+- Optionally fuses multi-query searches server-side: one Query API request whose prefetch
+  array holds every query's dense/sparse vectors, fused with RRF or DBSF.
 """
 
 from __future__ import annotations
@@ -42,6 +44,7 @@ from airweave.platform.destinations.collection_strategy import (
     get_default_vector_size,
     get_physical_collection_name,
 )
+from airweave.platform.destinations.qdrant_registry import qdrant_client_registry
 from airweave.platform.entities._base import BaseEntity
 
 if TYPE_CHECKING:
@@ -49,6 +52,14 @@ if TYPE_CHECKING:
 
 KEYWORD_VECTOR_NAME = "bm25"
 
+# Per-index candidate depth for hybrid prefetches (unless overridden per request)
+DEFAULT_HYBRID_PREFETCH_LIMIT = 5000
+
+FUSION_QUERIES = {
+    "rrf": rest.FusionQuery(fusion=rest.Fusion.RRF),
+    "dbsf": rest.FusionQuery(fusion=rest.Fusion.DBSF),
+}
+
 
 @destination("Qdrant", "qdrant", auth_config_class=QdrantAuthConfig, supports_vector=True)
 class QdrantDestination(VectorDBDestination):
@@ -125,23 +136,14 @@ class QdrantDestination(VectorDBDestination):
         return instance
 
     async def connect_to_qdrant(self) -> None:
-        """Initialize the AsyncQdrantClient and verify connectivity."""
-        if self.client is not None:
-            return
-        try:
-            location = self.url or settings.qdrant_url
-
-            # Reverted to HTTP-only; broadest compatibility with qdrant-client versions.
-            self.client = AsyncQdrantClient(
-                url=location,
-                api_key=self.api_key,
-                timeout=120.0,  # float timeout (seconds) for connect/read/write
-                prefer_grpc=False,  # revert: some setups don't expose gRPC
-            )
+        """Fetch the process-wide pooled AsyncQdrantClient (created and pinged once).
 
-            # Ping
-            await self.client.get_collections()
-            self.logger.debug("Successfully connected to Qdrant service.")
+        Called before every operation rather than once per sync, so a client the
+        registry replaced after a connect failure is never reused.
+        """
+        location = self.url or settings.qdrant_url
+        try:
+            self.client = await qdrant_client_registry.get_client(self.url, self.api_key)
         except Exception as e:
             self.logger.error(f"Error connecting to Qdrant at {location}: {e}")
             self.client = None
@@ -157,33 +159,75 @@ class QdrantDestination(VectorDBDestination):
             raise ConnectionError(f"Failed to connect to Qdrant at {location}: {str(e)}") from e
 
     async def ensure_client_readiness(self) -> None:
-        """Ensure a connected client exists or raise a clear error."""
-        if self.client is None:
-            await self.connect_to_qdrant()
+        """Refresh the pooled client reference or raise a clear error."""
+        await self.connect_to_qdrant()
         if self.client is None:
             raise ConnectionError(
                 "Failed to establish connection to Qdrant. Is the service accessible?"
             )
 
     async def close_connection(self) -> None:
-        """Close the Qdrant client (drop the reference, let GC handle resources)."""
+        """Release the client reference (the pooled client stays open for reuse)."""
         if self.client:
-            self.logger.debug("Closing Qdrant client connection...")
+            self.logger.debug("Releasing Qdrant client connection...")
             self.client = None
 
+    @staticmethod
+    def _is_connect_error(error: BaseException) -> bool:
+        """Whether the error (or what it wraps) means the server could not be reached.
+
+        Read/write timeouts and HTTP error responses are not connect errors: the pool is
+        fine and evicting it would only hurt every other caller sharing it.
+        """
+        try:
+            import httpx
+        except Exception:  # pragma: no cover
+            return False
+        try:
+            import grpc
+
+            unavailable = grpc.StatusCode.UNAVAILABLE
+        except Exception:  # pragma: no cover
+            unavailable = None
+
+        seen = 0
+        while error is not None and seen < 5:
+            if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+                return True
+            code = getattr(error, "code", None)
+            if unavailable is not None and callable(code) and code() == unavailable:
+                return True
+            # ResponseHandlingException keeps the wrapped send error in .source
+            error = getattr(error, "source", None) or error.__cause__
+            seen += 1
+        return False
+
+    def _report_client_error(self, client: AsyncQdrantClient, error: Exception) -> None:
+        """Evict the pooled client if the error means it cannot reach the server."""
+        if self._is_connect_error(error):
+            qdrant_client_registry.invalidate(self.url, self.api_key, client)
+
     # ----------------------------------------------------------------------------------
     # Collection management
     # ----------------------------------------------------------------------------------
     async def collection_exists(self, collection_name: str) -> bool:
-        """Check whether a collection exists by name."""
+        """Check whether a collection exists by name (positive results are cached)."""
+        if qdrant_client_registry.collection_known(self.url, self.api_key, collection_name):
+            return True
+
         await self.ensure_client_readiness()
+        client = self.client
         try:
-            collections_response = await self.client.get_collections()
-            return any(c.name == collection_name for c in collections_response.collections)
+            exists = await client.collection_exists(collection_name)
         except Exception as e:
             self.logger.error(f"Error checking if collection exists: {e}")
+            self._report_client_error(client, e)
             raise
 
+        if exists:
+            qdrant_client_registry.remember_collection(self.url, self.api_key, collection_name)
+        return exists
+
     async def setup_collection(self, vector_size: int | None = None) -> None:
         """Set up physical Qdrant collection with multi-tenant support.
 
@@ -314,6 +358,7 @@ class QdrantDestination(VectorDBDestination):
             )
 
             self.logger.info(f"✓ Collection {self.collection_name} created successfully")
+            qdrant_client_registry.remember_collection(self.url, self.api_key, self.collection_name)
 
         except Exception as e:
             if "already exists" not in str(e):
@@ -342,9 +387,7 @@ class QdrantDestination(VectorDBDestination):
             raise ValueError(f"Entity {entity.entity_id} has no sync_id in system metadata")
 
         # Get entity data as dict, excluding vectors to avoid numpy serialization issues
-        data_object = entity.model_dump(
-            mode="json", exclude_none=True, exclude={"airweave_system_metadata": {"vectors"}}
-        )
+        data_object = entity.to_payload()
 
         # CRITICAL: Remove explicit None values from timestamps (Pydantic may include them)
         # This prevents Qdrant decay formula errors on documents without valid timestamps
@@ -393,8 +436,16 @@ class QdrantDestination(VectorDBDestination):
         )
 
     # --------- NEW: helpers to keep bulk_insert simple (fixes C901) -------------------
-    def _build_point_struct(self, entity: BaseEntity) -> rest.PointStruct:
-        """Convert a BaseEntity to a Qdrant PointStruct with tenant metadata."""
+    def _build_point_struct(
+        self, entity: BaseEntity, parent_payloads: Optional[dict[int, dict]] = None
+    ) -> rest.PointStruct:
+        """Convert a BaseEntity to a Qdrant PointStruct with tenant metadata.
+
+        Args:
+            entity: Chunk entity with vectors set
+            parent_payloads: Optional per-call cache so chunks of the same parent share
+                one serialization of the parent's fields
+        """
         # Validate required fields first
         if not entity.airweave_system_metadata:
             raise ValueError(f"Entity {entity.entity_id} has no system metadata")
@@ -404,9 +455,7 @@ class QdrantDestination(VectorDBDestination):
             raise ValueError(f"Entity {entity.entity_id} has no sync_id in system metadata")
 
         # Get entity data as dict, excluding vectors to avoid numpy serialization issues
-        entity_data = entity.model_dump(
-            mode="json", exclude_none=True, exclude={"airweave_system_metadata": {"vectors"}}
-        )
+        entity_data = entity.to_payload(parent_payloads)
 
         # CRITICAL: Remove explicit None values from timestamps (Pydantic may include them)
         # This prevents Qdrant decay formula errors on documents without valid timestamps
@@ -492,12 +541,14 @@ class QdrantDestination(VectorDBDestination):
                 await asyncio.sleep(0)
             return
 
+        await self.ensure_client_readiness()
+        client = self.client
         try:
             self.logger.debug(
                 f"[Qdrant] Upserting {len(points)} points to collection={self.collection_name}, "
                 f"collection_id={self.collection_id}, vector_size={self.vector_size}"
             )
-            op = await self.client.upsert(
+            op = await client.upsert(
                 collection_name=self.collection_name,
                 points=points,
                 wait=True,
@@ -505,6 +556,8 @@ class QdrantDestination(VectorDBDestination):
             if hasattr(op, "errors") and op.errors:
                 raise Exception(f"Errors during bulk insert: {op.errors}")
         except (*timeout_errors, *rhex) as e:  # type: ignore[misc]
+            # Retries below then run on a fresh client if this one cannot connect
+            self._report_client_error(client, e)
             n = len(points)
 
             # Extract underlying error if wrapped
@@ -557,7 +610,8 @@ class QdrantDestination(VectorDBDestination):
             )
             await self.setup_collection(self.vector_size)
 
-        point_structs = [self._build_point_struct(e) for e in entities]
+        parent_payloads: dict[int, dict] = {}
+        point_structs = [self._build_point_struct(e, parent_payloads) for e in entities]
 
         if not point_structs:
             self.logger.warning("No valid entities to insert")
@@ -775,6 +829,8 @@ class QdrantDestination(VectorDBDestination):
         sparse_vector: SparseEmbedding | dict | None,
         search_method: Literal["hybrid", "neural", "keyword"],
         decay_config: Optional[DecayConfig] = None,
+        prefetch_limit: Optional[int] = None,
+        hnsw_ef: Optional[int] = None,
     ) -> rest.QueryRequest:
         """Create a single QueryRequest consistent with the old method."""
         query_request_params: dict = {}
@@ -784,6 +840,7 @@ class QdrantDestination(VectorDBDestination):
                 "query": query_vector,
                 "using": DEFAULT_VECTOR_NAME,
                 "limit": limit,
+                **self._search_params(hnsw_ef),
             }
             query_request_params = self._prepare_index_search_request(
                 neural_params, decay_config, limit=limit
@@ -811,18 +868,15 @@ class QdrantDestination(VectorDBDestination):
                 sparse_vector.as_object() if hasattr(sparse_vector, "as_object") else sparse_vector
             )
 
-            prefetch_limit = 5000
-            if decay_config is not None:
-                try:
-                    weight = max(0.0, min(1.0, float(getattr(decay_config, "weight", 0.0) or 0.0)))
-                    if weight > 0.3:
-                        # Allow up to 10K for high temporal weight
-                        prefetch_limit = int(5000 * (1 + weight))
-                except Exception:
-                    pass
+            prefetch_limit = prefetch_limit or self._hybrid_prefetch_limit(decay_config)
 
             prefetch_params = [
-                {"query": query_vector, "using": DEFAULT_VECTOR_NAME, "limit": prefetch_limit},
+                {
+                    "query": query_vector,
+                    "using": DEFAULT_VECTOR_NAME,
+                    "limit": prefetch_limit,
+                    **self._search_params(hnsw_ef),
+                },
                 {
                     "query": rest.SparseVector(**obj),
                     "using": KEYWORD_VECTOR_NAME,
@@ -852,6 +906,92 @@ class QdrantDestination(VectorDBDestination):
 
         return rest.QueryRequest(**query_request_params)
 
+    @staticmethod
+    def _search_params(hnsw_ef: Optional[int]) -> dict:
+        """Dense index search params (HNSW `ef` trades recall against latency)."""
+        return {"params": rest.SearchParams(hnsw_ef=hnsw_ef)} if hnsw_ef else {}
+
+    @staticmethod
+    def _hybrid_prefetch_limit(decay_config: Optional[DecayConfig]) -> int:
+        """Default per-index candidate depth for hybrid search."""
+        prefetch_limit = DEFAULT_HYBRID_PREFETCH_LIMIT
+        if decay_config is not None:
+            try:
+                weight = max(0.0, min(1.0, float(getattr(decay_config, "weight", 0.0) or 0.0)))
+                if weight > 0.3:
+                    # Allow up to 10K for high temporal weight
+                    prefetch_limit = int(DEFAULT_HYBRID_PREFETCH_LIMIT * (1 + weight))
+            except Exception:
+                pass
+        return prefetch_limit
+
+    def _prepare_fused_query_request(
+        self,
+        query_vectors: list[list[float]],
+        limit: int,
+        offset: Optional[int],
+        sparse_vectors: list[SparseEmbedding] | list[dict] | None,
+        search_method: Literal["hybrid", "neural", "keyword"],
+        decay_config: Optional[DecayConfig],
+        fusion: Literal["rrf", "dbsf"],
+        prefetch_limit: Optional[int],
+        hnsw_ef: Optional[int],
+        query_filter: rest.Filter,
+    ) -> rest.QueryRequest:
+        """Create one QueryRequest fusing all queries server-side.
+
+        Every query contributes a prefetch per index it searches (dense and/or sparse);
+        all candidate lists are fused in one step, then optionally decayed.
+        """
+        if search_method == "hybrid":
+            prefetch_limit = prefetch_limit or self._hybrid_prefetch_limit(decay_config)
+        else:
+            # Each query contributes at least as many candidates as the page needs
+            prefetch_limit = prefetch_limit or limit + (offset or 0)
+
+        prefetches: list[rest.Prefetch] = []
+        for i, query_vector in enumerate(query_vectors):
+            if search_method in ("hybrid", "neural"):
+                prefetches.append(
+                    rest.Prefetch(
+                        query=query_vector,
+                        using=DEFAULT_VECTOR_NAME,
+                        limit=prefetch_limit,
+                        filter=query_filter,
+                        **self._search_params(hnsw_ef),
+                    )
+                )
+            if search_method in ("hybrid", "keyword"):
+                sparse_vector = sparse_vectors[i] if sparse_vectors else None
+                if not sparse_vector:
+                    raise ValueError(f"{search_method.capitalize()} search requires sparse vector")
+                obj = (
+                    sparse_vector.as_object()
+                    if hasattr(sparse_vector, "as_object")
+                    else sparse_vector
+                )
+                prefetches.append(
+                    rest.Prefetch(
+                        query=rest.SparseVector(**obj),
+                        using=KEYWORD_VECTOR_NAME,
+                        limit=prefetch_limit,
+                        filter=query_filter,
+                    )
+                )
+
+        if decay_config is None or getattr(decay_config, "weight", 0.0) <= 0.0:
+            query_request_params = {"prefetch": prefetches, "query": FUSION_QUERIES[fusion]}
+        else:
+            fused_prefetch = rest.Prefetch(
+                prefetch=prefetches,
+                query=FUSION_QUERIES[fusion],
+                limit=prefetch_limit,
+            )
+            decay_params = self._prepare_index_search_request(params={}, decay_config=decay_config)
+            query_request_params = {"prefetch": [fused_prefetch], "query": decay_params["query"]}
+
+        return rest.QueryRequest(**query_request_params, limit=limit, filter=query_filter)
+
     def _validate_bulk_search_inputs(
         self,
         query_vectors: list[list[float]],
@@ -872,12 +1012,14 @@ class QdrantDestination(VectorDBDestination):
         query_vectors: list[list[float]],
         limit: int,
         score_threshold: float | None,
-        with_payload: bool,
+        with_payload: bool | list[str],
         filter_conditions: list[dict] | None,
         sparse_vectors: list[SparseEmbedding] | list[dict] | None,
         search_method: Literal["hybrid", "neural", "keyword"],
         decay_config: Optional[DecayConfig],
         offset: Optional[int],
+        prefetch_limit: Optional[int] = None,
+        hnsw_ef: Optional[int] = None,
     ) -> list[rest.QueryRequest]:
         """Create per-query request objects with automatic tenant filtering."""
         requests: list[rest.QueryRequest] = []
@@ -889,42 +1031,59 @@ class QdrantDestination(VectorDBDestination):
                 sparse_vector=sv,
                 search_method=search_method,
                 decay_config=decay_config,
+                prefetch_limit=prefetch_limit,
+                hnsw_ef=hnsw_ef,
             )
 
-            # CRITICAL: Auto-inject tenant filter for multi-tenant isolation
-            # This ensures searches only return results from the correct collection
-            tenant_filter = rest.Filter(
-                must=[
-                    rest.FieldCondition(
-                        key="airweave_collection_id",
-                        match=rest.MatchValue(value=str(self.collection_id)),
-                    )
-                ]
+            req.filter = self._build_query_filter(
+                filter_conditions[i] if filter_conditions else None
             )
+            self._apply_request_options(req, score_threshold, with_payload, offset)
+            requests.append(req)
+        return requests
 
-            # Merge with user-provided filters
-            if filter_conditions and filter_conditions[i]:
-                user_filter = rest.Filter.model_validate(filter_conditions[i])
-                # Combine must conditions (tenant filter + user filters)
-                combined_must = tenant_filter.must + (user_filter.must or [])
-                req.filter = rest.Filter(
-                    must=combined_must,
-                    should=user_filter.should,
-                    must_not=user_filter.must_not,
+    def _build_query_filter(self, filter_condition: dict | None) -> rest.Filter:
+        """Combine the tenant filter with an optional user filter."""
+        # CRITICAL: Auto-inject tenant filter for multi-tenant isolation
+        # This ensures searches only return results from the correct collection
+        tenant_filter = rest.Filter(
+            must=[
+                rest.FieldCondition(
+                    key="airweave_collection_id",
+                    match=rest.MatchValue(value=str(self.collection_id)),
                 )
-            else:
-                req.filter = tenant_filter
+            ]
+        )
 
-            if offset and offset > 0:
-                req.offset = offset
-            if score_threshold is not None:
-                req.score_threshold = score_threshold
-            req.with_payload = with_payload
-            requests.append(req)
-        return requests
+        # Merge with user-provided filters
+        if not filter_condition:
+            return tenant_filter
+
+        user_filter = rest.Filter.model_validate(filter_condition)
+        # Combine must conditions (tenant filter + user filters)
+        combined_must = tenant_filter.must + (user_filter.must or [])
+        return rest.Filter(
+            must=combined_must,
+            should=user_filter.should,
+            must_not=user_filter.must_not,
+        )
+
+    @staticmethod
+    def _apply_request_options(
+        req: rest.QueryRequest,
+        score_threshold: float | None,
+        with_payload: bool | list[str],
+        offset: Optional[int],
+    ) -> None:
+        """Set pagination, threshold and payload options on a query request."""
+        if offset and offset > 0:
+            req.offset = offset
+        if score_threshold is not None:
+            req.score_threshold = score_threshold
+        req.with_payload = with_payload
 
     def _format_bulk_search_results(
-        self, batch_results: list, with_payload: bool
+        self, batch_results: list, with_payload: bool | list[str]
     ) -> list[list[dict]]:
         """Convert client batch results to a simple nested list of dicts."""
         all_results: list[list[dict]] = []
@@ -946,12 +1105,14 @@ class QdrantDestination(VectorDBDestination):
         query_vector: list[float],
         limit: int = 100,
         score_threshold: float | None = None,
-        with_payload: bool = True,
+        with_payload: bool | list[str] = True,
         filter: dict | None = None,
         decay_config: Optional[DecayConfig] = None,
         sparse_vector: SparseEmbedding | dict | None = None,
         search_method: Literal["hybrid", "neural", "keyword"] = "hybrid",
         offset: int = 0,
+        prefetch_limit: Optional[int] = None,
+        hnsw_ef: Optional[int] = None,
     ) -> list[dict]:
         """Search a single query vector; thin wrapper over `bulk_search`."""
         return await self.bulk_search(
@@ -964,6 +1125,8 @@ class QdrantDestination(VectorDBDestination):
             search_method=search_method,
             decay_config=decay_config,
             offset=offset,
+            prefetch_limit=prefetch_limit,
+            hnsw_ef=hnsw_ef,
         )
 
     async def bulk_search(
@@ -971,14 +1134,37 @@ class QdrantDestination(VectorDBDestination):
         query_vectors: list[list[float]],
         limit: int = 100,
         score_threshold: float | None = None,
-        with_payload: bool = True,
+        with_payload: bool | list[str] = True,
         filter_conditions: list[dict] | None = None,
         sparse_vectors: list[SparseEmbedding] | list[dict] | None = None,
         search_method: Literal["hybrid", "neural", "keyword"] = "hybrid",
         decay_config: Optional[DecayConfig] = None,
         offset: Optional[int] = None,
+        fusion: Optional[Literal["rrf", "dbsf"]] = None,
+        prefetch_limit: Optional[int] = None,
+        hnsw_ef: Optional[int] = None,
     ) -> list[dict]:
-        """Search multiple queries at once with neural/keyword/hybrid and optional decay."""
+        """Search multiple queries at once with neural/keyword/hybrid and optional decay.
+
+        Args:
+            query_vectors: Dense query vectors, one per query
+            limit: Maximum results per query (or in total when fused)
+            score_threshold: Minimum score for returned points
+            with_payload: Return payloads (True), nothing (False) or only these fields
+            filter_conditions: Optional Qdrant filter per query (same length as queries)
+            sparse_vectors: Optional BM25 sparse vector per query (keyword/hybrid search)
+            search_method: "hybrid", "neural" (dense only) or "keyword" (sparse only)
+            decay_config: Optional recency decay blended into the scores
+            offset: Number of results to skip (pagination)
+            fusion: Fuse all queries server-side into one ranked list (RRF or DBSF) with a
+                single Query API request. Requires the same filter for every query. Without
+                it, each query is searched separately and the results are concatenated.
+            prefetch_limit: Candidates fetched per query and index before fusion
+            hnsw_ef: HNSW `ef` for dense searches (higher = better recall, slower)
+
+        Returns:
+            Flat list of {"id", "score"} dicts (plus "payload" unless with_payload is False)
+        """
         await self.ensure_client_readiness()
         if not query_vectors:
             return []
@@ -1000,7 +1186,7 @@ class QdrantDestination(VectorDBDestination):
             f"queries={len(query_vectors)}, limit={limit}, "
             f"has_sparse={sparse_vectors is not None}, "
             f"decay_enabled={decay_config is not None}, "
-            f"decay_weight={weight}"
+            f"decay_weight={weight}, fusion={fusion}"
         )
 
         if decay_config:
@@ -1014,20 +1200,44 @@ class QdrantDestination(VectorDBDestination):
                 decay_scale,
             )
 
+        if fusion and filter_conditions and len({repr(f) for f in filter_conditions}) > 1:
+            raise ValueError("Server-side fusion requires the same filter for every query")
+
+        client = self.client
         try:
-            requests = await self._prepare_bulk_search_requests(
-                query_vectors=query_vectors,
-                limit=limit,
-                score_threshold=score_threshold,
-                with_payload=with_payload,
-                filter_conditions=filter_conditions or [None] * len(query_vectors),
-                sparse_vectors=sparse_vectors,
-                search_method=search_method,
-                decay_config=decay_config,
-                offset=offset,
-            )
+            if fusion:
+                request = self._prepare_fused_query_request(
+                    query_vectors=query_vectors,
+                    limit=limit,
+                    offset=offset,
+                    sparse_vectors=sparse_vectors,
+                    search_method=search_method,
+                    decay_config=decay_config,
+                    fusion=fusion,
+                    prefetch_limit=prefetch_limit,
+                    hnsw_ef=hnsw_ef,
+                    query_filter=self._build_query_filter(
+                        filter_conditions[0] if filter_conditions else None
+                    ),
+                )
+                self._apply_request_options(request, score_threshold, with_payload, offset)
+                requests = [request]
+            else:
+                requests = await self._prepare_bulk_search_requests(
+                    query_vectors=query_vectors,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    with_payload=with_payload,
+                    filter_conditions=filter_conditions or [None] * len(query_vectors),
+                    sparse_vectors=sparse_vectors,
+                    search_method=search_method,
+                    decay_config=decay_config,
+                    offset=offset,
+                    prefetch_limit=prefetch_limit,
+                    hnsw_ef=hnsw_ef,
+                )
 
-            batch_results = await self.client.query_batch_points(
+            batch_results = await client.query_batch_points(
                 collection_name=self.collection_name, requests=requests
             )
             formatted = self._format_bulk_search_results(batch_results, with_payload)
@@ -1052,8 +1262,40 @@ class QdrantDestination(VectorDBDestination):
 
         except Exception as e:
             self.logger.error(f"Error performing batch search with Qdrant: {e}")
+            self._report_client_error(client, e)
             raise
 
+    async def retrieve_payloads(
+        self, point_ids: list[str], with_payload: bool | list[str] = True
+    ) -> dict[str, dict]:
+        """Fetch payloads of points by ID (e.g. to hydrate projected search results).
+
+        Args:
+            point_ids: Qdrant point IDs
+            with_payload: True for full payloads, or the payload fields to fetch
+
+        Returns:
+            Mapping of point ID (as string) to payload; missing points are omitted
+        """
+        await self.ensure_client_readiness()
+        if not point_ids:
+            return {}
+
+        client = self.client
+        try:
+            points = await client.retrieve(
+                collection_name=self.collection_name,
+                ids=point_ids,
+                with_payload=with_payload,
+                with_vectors=False,
+            )
+        except Exception as e:
+            self.logger.error(f"Error retrieving payloads from Qdrant: {e}")
+            self._report_client_error(client, e)
+            raise
+
+        return {str(point.id): point.payload or {} for point in points}
+
     # ----------------------------------------------------------------------------------
     # Introspection
     # ----------------------------------------------------------------------------------
@@ -0,0 +1,151 @@
+"""Process-wide registry of pooled Qdrant clients.
+
+QdrantDestination.create() used to build a fresh AsyncQdrantClient (new HTTP connection
+pool, TCP/TLS handshake) and ping the server on every call - once per sync and once or
+twice per search request. The registry keeps one warmed client per (url, api_key,
+transport) and event loop, shared by all destinations in the process.
+
+Also caches which collections are known to exist, so hot paths (bulk_insert per batch)
+skip the existence round trip.
+
+Health tracking: callers report connect-level failures via invalidate(); the broken
+client is dropped from the registry (if it is still the pooled one) and the next
+get_client() builds and pings a new one. Dropped clients are never closed here: other
+callers may still be mid-request on them, so they are left to the garbage collector.
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+from qdrant_client import AsyncQdrantClient
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+_ClientKey = Tuple[str, Optional[str], bool]
+_LoopKey = Tuple[_ClientKey, asyncio.AbstractEventLoop]
+
+
+class _PooledClient:
+    """A shared client plus its health and collection-existence state."""
+
+    __slots__ = ("client", "created_at", "known_collections")
+
+    def __init__(self, client: AsyncQdrantClient):
+        self.client = client
+        self.created_at = time.monotonic()
+        self.known_collections: Dict[str, float] = {}  # name -> monotonic time confirmed
+
+
+class QdrantClientRegistry:
+    """Shares AsyncQdrantClient instances across syncs and search requests.
+
+    Clients and their creation locks are kept per event loop, since httpx/gRPC pools
+    and asyncio locks are bound to the loop they were created on.
+    """
+
+    CLIENT_TIMEOUT_SECONDS = 120.0
+    COLLECTION_EXISTS_TTL_SECONDS = 300.0
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._clients: Dict[_LoopKey, _PooledClient] = {}
+        self._locks: Dict[_LoopKey, asyncio.Lock] = {}
+
+    @staticmethod
+    def _key(url: Optional[str], api_key: Optional[str]) -> _LoopKey:
+        key = (url or settings.qdrant_url, api_key, settings.QDRANT_PREFER_GRPC)
+        return key, asyncio.get_running_loop()
+
+    def _prune_closed_loops(self) -> None:
+        """Forget clients and locks of event loops that have been closed."""
+        for loop_key in [k for k in self._locks if k[1].is_closed()]:
+            self._locks.pop(loop_key, None)
+            # Transports died with their loop; there is nothing left to close
+            self._clients.pop(loop_key, None)
+
+    async def get_client(
+        self, url: Optional[str] = None, api_key: Optional[str] = None
+    ) -> AsyncQdrantClient:
+        """Return this loop's shared client for (url, api_key), creating and pinging it once.
+
+        Raises:
+            Exception: Whatever the connectivity ping raised (client is not cached)
+        """
+        loop_key = self._key(url, api_key)
+        pooled = self._clients.get(loop_key)
+        if pooled is not None:
+            return pooled.client
+
+        lock = self._locks.get(loop_key)
+        if lock is None:
+            self._prune_closed_loops()
+            lock = self._locks[loop_key] = asyncio.Lock()
+
+        async with lock:
+            pooled = self._clients.get(loop_key)
+            if pooled is not None:
+                return pooled.client
+
+            (location, _, prefer_grpc), _ = loop_key
+            client = AsyncQdrantClient(
+                url=location,
+                api_key=api_key,
+                timeout=self.CLIENT_TIMEOUT_SECONDS,
+                prefer_grpc=prefer_grpc,
+                grpc_port=settings.QDRANT_GRPC_PORT,
+            )
+            try:
+                # Ping (also warms the connection pool)
+                await client.get_collections()
+            except BaseException:
+                # Never handed out, so nobody else can be using it
+                try:
+                    await client.close()
+                except Exception as e:
+                    logger.debug(f"Error closing unreachable Qdrant client: {e}")
+                raise
+
+            self._clients[loop_key] = _PooledClient(client)
+            logger.debug(f"Qdrant client pooled for {location} (grpc={prefer_grpc})")
+            return client
+
+    def invalidate(
+        self, url: Optional[str], api_key: Optional[str], client: AsyncQdrantClient
+    ) -> None:
+        """Drop this loop's pooled client for (url, api_key) after a connect failure.
+
+        Only evicts if the pooled client is the one that failed, so a late report from a
+        caller holding an already replaced client does not evict its healthy successor.
+        The dropped client is not closed, since concurrent callers may still be using it.
+        """
+        loop_key = self._key(url, api_key)
+        pooled = self._clients.get(loop_key)
+        if pooled is not None and pooled.client is client:
+            del self._clients[loop_key]
+            logger.warning(f"Qdrant client for {loop_key[0][0]} marked unhealthy")
+
+    def collection_known(
+        self, url: Optional[str], api_key: Optional[str], collection_name: str
+    ) -> bool:
+        """Whether the collection was confirmed to exist within the TTL."""
+        pooled = self._clients.get(self._key(url, api_key))
+        if pooled is None:
+            return False
+        confirmed_at = pooled.known_collections.get(collection_name)
+        return (
+            confirmed_at is not None
+            and time.monotonic() - confirmed_at < self.COLLECTION_EXISTS_TTL_SECONDS
+        )
+
+    def remember_collection(
+        self, url: Optional[str], api_key: Optional[str], collection_name: str
+    ) -> None:
+        """Record that the collection exists."""
+        pooled = self._clients.get(self._key(url, api_key))
+        if pooled is not None:
+            pooled.known_collections[collection_name] = time.monotonic()
+
+
+qdrant_client_registry = QdrantClientRegistry()
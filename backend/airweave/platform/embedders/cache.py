@@ -0,0 +1,207 @@
+"""Content-addressed embedding cache shared by embedders in the pod.
+
+Entries are keyed by (model name, sha256 of the text), so identical chunks
+(unchanged document pages, email signatures, templated tickets) are embedded
+once and then served from cache across entities, syncs and pods.
+
+Two tiers:
+- Local LRU (per process): packed float32 bytes, bounded by entry count
+- Redis (shared): base64-encoded float32 bytes with TTL
+
+SparseEmbeddingCache stores fastembed sparse vectors (BM25) the same way with
+a sparse codec.
+
+Cache failures never fail a sync - a broken tier is treated as a miss.
+"""
+
+import base64
+import hashlib
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+
+
+class EmbeddingCache:
+    """Two-tier (local LRU + Redis) cache for dense embedding vectors.
+
+    Usage:
+        cache = EmbeddingCache(namespace="dense")
+        cached = await cache.get_many(model, texts)   # {index: vector}
+        await cache.set_many(model, texts, vectors)
+    """
+
+    KEY_PREFIX = "embedding"
+
+    def __init__(
+        self,
+        namespace: str,
+        max_local_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        use_redis: Optional[bool] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            namespace: Key namespace (e.g. "dense") to separate vector kinds
+            max_local_entries: Max entries in the in-process LRU (0 disables local tier)
+            ttl_seconds: TTL for Redis entries
+            use_redis: Whether to use the shared Redis tier
+        """
+        self.namespace = namespace
+        self.max_local_entries = (
+            settings.EMBEDDING_CACHE_LOCAL_MAX_ENTRIES
+            if max_local_entries is None
+            else max_local_entries
+        )
+        self.ttl_seconds = (
+            settings.EMBEDDING_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+        self.use_redis = settings.EMBEDDING_CACHE_REDIS_ENABLED if use_redis is None else use_redis
+
+        self._local: "OrderedDict[str, bytes]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------------------------
+    # Keys and encoding
+    # ------------------------------------------------------------------------------------
+
+    def make_key(self, model: str, text: str) -> str:
+        """Build the content-addressed cache key for a text."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{self.namespace}:{model}:{digest}"
+
+    @staticmethod
+    def encode(vector: Sequence[float]) -> bytes:
+        """Pack a vector as float32 bytes (OpenAI vectors are float32 precision)."""
+        return array("f", vector).tobytes()
+
+    @staticmethod
+    def decode(data: bytes) -> List[float]:
+        """Unpack float32 bytes into a vector."""
+        values = array("f")
+        values.frombytes(data)
+        return values.tolist()
+
+    # ------------------------------------------------------------------------------------
+    # Local tier
+    # ------------------------------------------------------------------------------------
+
+    def _local_get(self, key: str) -> Optional[bytes]:
+        data = self._local.get(key)
+        if data is not None:
+            self._local.move_to_end(key)
+        return data
+
+    def _local_set(self, key: str, data: bytes) -> None:
+        if self.max_local_entries <= 0:
+            return
+        self._local[key] = data
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_local_entries:
+            self._local.popitem(last=False)
+
+    # ------------------------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------------------------
+
+    async def get_many(self, model: str, texts: List[str]) -> Dict[int, List[float]]:
+        """Look up cached vectors for texts.
+
+        Args:
+            model: Embedding model name (part of the key)
+            texts: Texts to look up
+
+        Returns:
+            Mapping of text index -> cached vector (only hits are included)
+        """
+        found: Dict[int, List[float]] = {}
+        remote_indices: List[int] = []
+        remote_keys: List[str] = []
+
+        for i, text in enumerate(texts):
+            key = self.make_key(model, text)
+            data = self._local_get(key)
+            if data is not None:
+                found[i] = self.decode(data)
+            else:
+                remote_indices.append(i)
+                remote_keys.append(key)
+
+        if remote_keys and self.use_redis:
+            try:
+                values = await redis_client.client.mget(remote_keys)
+                for i, key, value in zip(remote_indices, remote_keys, values, strict=True):
+                    if value is None:
+                        continue
+                    data = base64.b64decode(value)
+                    found[i] = self.decode(data)
+                    self._local_set(key, data)
+            except Exception as e:
+                logger.warning(f"Embedding cache read failed, treating as miss: {e}")
+
+        self.hits += len(found)
+        self.misses += len(texts) - len(found)
+        return found
+
+    async def set_many(self, model: str, texts: List[str], vectors: List[Sequence[float]]) -> None:
+        """Store vectors for texts in both tiers.
+
+        Args:
+            model: Embedding model name (part of the key)
+            texts: Texts that were embedded
+            vectors: Vectors for texts (same order and length)
+        """
+        if not texts:
+            return
+
+        redis_items: Dict[str, str] = {}
+        for text, vector in zip(texts, vectors, strict=True):
+            key = self.make_key(model, text)
+            data = self.encode(vector)
+            self._local_set(key, data)
+            redis_items[key] = base64.b64encode(data).decode("ascii")
+
+        if not self.use_redis:
+            return
+
+        try:
+            pipe = redis_client.client.pipeline(transaction=False)
+            for key, value in redis_items.items():
+                pipe.setex(key, self.ttl_seconds, value)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed (non-fatal): {e}")
+
+
+class SparseEmbeddingCache(EmbeddingCache):
+    """EmbeddingCache for fastembed sparse vectors.
+
+    Entries are packed as int64 indices followed by float64 values, so BM25 vectors
+    round-trip exactly.
+    """
+
+    @staticmethod
+    def encode(vector: Any) -> bytes:
+        """Pack a SparseEmbedding as int64 indices + float64 values."""
+        import numpy as np
+
+        indices = np.asarray(vector.indices, dtype=np.int64)
+        values = np.asarray(vector.values, dtype=np.float64)
+        return indices.tobytes() + values.tobytes()
+
+    @staticmethod
+    def decode(data: bytes) -> Any:
+        """Unpack bytes into a SparseEmbedding."""
+        import numpy as np
+        from fastembed import SparseEmbedding
+
+        size = len(data) // 16
+        return SparseEmbedding(
+            indices=np.frombuffer(data, dtype=np.int64, count=size).copy(),
+            values=np.frombuffer(data, dtype=np.float64, offset=size * 8).copy(),
+        )
@@ -1,11 +1,11 @@
 """Sparse embedder using fastembed BM25 for keyword search."""
 
 import asyncio
-from typing import List
+from typing import Any, List, Tuple
 
 from fastembed import SparseEmbedding, SparseTextEmbedding
 
-from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.async_helpers import run_in_process_pool, run_in_thread_pool
 from airweave.platform.sync.context import SyncContext
 from airweave.platform.sync.exceptions import SyncFailureError
 
@@ -16,21 +16,38 @@ class SparseEmbedder(BaseEmbedder):
     """Singleton sparse embedder using fastembed BM25 (local, no API).
 
     Uses Qdrant/bm25 model for keyword search.
-    Model runs locally, no network calls required.
+    Model runs locally, no network calls required. Large batches (sync) are embedded
+    in the CPU process pool; small ones (search queries) in the thread pool.
     """
 
     MODEL_NAME = "Qdrant/bm25"
 
+    # Batches smaller than this are not worth the process pool round trip
+    MIN_TEXTS_FOR_PROCESS_POOL = 32
+
     def __init__(self):
-        """Initialize sparse embedder (once per pod)."""
+        """Initialize sparse embedder (once per pod, model loads lazily on first use)."""
         if self._initialized:
             return
 
-        try:
-            self._model = SparseTextEmbedding(self.MODEL_NAME)
-            self._initialized = True
-        except Exception as e:
-            raise SyncFailureError(f"Failed to load sparse embedding model: {e}")
+        self._model = None
+        self._initialized = True
+
+    def _get_model(self) -> SparseTextEmbedding:
+        """Load the BM25 model on first use in this process."""
+        if self._model is None:
+            try:
+                self._model = SparseTextEmbedding(self.MODEL_NAME)
+            except Exception as e:
+                raise SyncFailureError(f"Failed to load sparse embedding model: {e}")
+        return self._model
+
+    def _embed_sync(self, texts: List[str]) -> List[SparseEmbedding]:
+        """Synchronous embedding (run in a pool)."""
+        embeddings = list(self._get_model().embed(texts))
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Got {len(embeddings)} embeddings for {len(texts)} texts")
+        return embeddings
 
     async def embed_many(
         self, texts: List[str], sync_context: SyncContext = None
@@ -38,7 +55,7 @@ class SparseEmbedder(BaseEmbedder):
         """Embed batch of texts for keyword search.
 
         Returns exactly len(texts) SparseEmbedding objects.
-        Fastembed is synchronous, so run in thread pool to avoid blocking event loop.
+        Fastembed is synchronous, so run in a pool to avoid blocking event loop.
 
         Args:
             texts: List of text strings to embed
@@ -73,15 +90,11 @@ class SparseEmbedder(BaseEmbedder):
             return all_embeddings
 
         try:
+            if len(texts) < self.MIN_TEXTS_FOR_PROCESS_POOL:
+                return await run_in_thread_pool(self._embed_sync, texts)
 
-            def _embed_sync():
-                """Synchronous embedding (run in thread pool)."""
-                embeddings = list(self._model.embed(texts))
-                if len(embeddings) != len(texts):
-                    raise ValueError(f"Got {len(embeddings)} embeddings for {len(texts)} texts")
-                return embeddings
-
-            return await run_in_thread_pool(_embed_sync)
+            arrays = await run_in_process_pool(_embed_in_worker, texts)
+            return [SparseEmbedding(values=values, indices=indices) for indices, values in arrays]
 
         except Exception as e:
             if sync_context and hasattr(sync_context, "logger"):
@@ -107,3 +120,11 @@ class SparseEmbedder(BaseEmbedder):
 
         embeddings = await self.embed_many([text])
         return embeddings[0]
+
+
+def _embed_in_worker(texts: List[str]) -> List[Tuple[Any, Any]]:
+    """Process pool entry point: embed with this process's model.
+
+    Returns (indices, values) numpy arrays, which pickle as raw buffers.
+    """
+    return [(e.indices, e.values) for e in SparseEmbedder()._embed_sync(texts)]
@@ -1,7 +1,7 @@
 """OpenAI dense embedder using text-embedding-3-large."""
 
 import asyncio
-from typing import List
+from typing import List, Optional, Tuple
 
 import tiktoken
 from openai import AsyncOpenAI
@@ -12,6 +12,7 @@ from airweave.platform.sync.context import SyncContext
 from airweave.platform.sync.exceptions import SyncFailureError
 
 from ._base import BaseEmbedder
+from .cache import EmbeddingCache
 
 
 class DenseEmbedder(BaseEmbedder):
@@ -20,8 +21,9 @@ class DenseEmbedder(BaseEmbedder):
     Features:
     - Singleton shared across all syncs in pod
     - Batch processing with OpenAI limits (2048 texts/request, 300K tokens/request)
-    - 5 concurrent requests max
+    - Token-aware request packing, 5 concurrent requests max (ordered reassembly)
     - Rate limiting with OpenAIRateLimiter singleton
+    - Content-addressed cache (model + sha256 of text) so unchanged chunks skip the API
     - Automatic retry on transient errors (via AsyncOpenAI client)
     - Fail-fast on any API errors (no silent failures)
     """
@@ -32,6 +34,8 @@ class DenseEmbedder(BaseEmbedder):
     MAX_BATCH_SIZE = 2048  # OpenAI limit per request
     MAX_TOKENS_PER_REQUEST = 300000  # OpenAI limit
     MAX_CONCURRENT_REQUESTS = 5
+    # Smaller than MAX_BATCH_SIZE so large batches spread across concurrent requests
+    MAX_TEXTS_PER_REQUEST = 200
 
     def __init__(self):
         """Initialize OpenAI embedder (once per pod)."""
@@ -47,10 +51,19 @@ class DenseEmbedder(BaseEmbedder):
             max_retries=2,
         )
         self._rate_limiter = OpenAIRateLimiter()  # Singleton
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
         self._tokenizer = tiktoken.get_encoding("cl100k_base")
+        self._cache = (
+            EmbeddingCache(namespace="dense") if settings.EMBEDDING_CACHE_ENABLED else None
+        )
         self._initialized = True
 
-    async def embed_many(self, texts: List[str], sync_context: SyncContext) -> List[List[float]]:
+    async def embed_many(
+        self,
+        texts: List[str],
+        sync_context: SyncContext,
+        token_counts: Optional[List[int]] = None,
+    ) -> List[List[float]]:
         """Embed batch of texts using OpenAI text-embedding-3-large.
 
         Returns exactly len(texts) vectors (3072-dim each).
@@ -59,6 +72,8 @@ class DenseEmbedder(BaseEmbedder):
         Args:
             texts: List of text strings to embed (must not be empty)
             sync_context: Sync context with logger
+            token_counts: Optional cl100k_base token count per text (e.g. from the
+                chunker); when given, texts are not re-tokenized for request packing
 
         Returns:
             List of 3072-dimensional embedding vectors
@@ -77,41 +92,85 @@ class DenseEmbedder(BaseEmbedder):
                     f"Textual representation must be set before embedding."
                 )
 
-        # Count tokens for the entire batch
-        total_tokens = sum(len(self._tokenizer.encode(text)) for text in texts)
+        if token_counts is not None and len(token_counts) != len(texts):
+            raise SyncFailureError(
+                f"PROGRAMMING ERROR: Got {len(token_counts)} token counts for {len(texts)} texts"
+            )
 
-        sync_context.logger.debug(f"Embedding {len(texts)} texts with {total_tokens} total tokens")
+        if self._cache is None:
+            return await self._embed_uncached(texts, sync_context, token_counts)
 
-        # Split into smaller batches to avoid blocking and allow heartbeats
-        # Max 200 texts per sub-batch to prevent long blocking periods
-        MAX_TEXTS_PER_SUBBATCH = 200
+        # Serve repeated chunks from the content-addressed cache
+        cached = await self._cache.get_many(self.MODEL_NAME, texts)
 
-        if len(texts) > MAX_TEXTS_PER_SUBBATCH:
-            sync_context.logger.debug(
-                f"Splitting {len(texts)} texts into sub-batches of {MAX_TEXTS_PER_SUBBATCH} "
-                f"to allow heartbeats and prevent Temporal timeout"
-            )
-            all_embeddings = []
-            for i in range(0, len(texts), MAX_TEXTS_PER_SUBBATCH):
-                sub_batch = texts[i : i + MAX_TEXTS_PER_SUBBATCH]
-                sub_embeddings = await self.embed_many(sub_batch, sync_context)
-                all_embeddings.extend(sub_embeddings)
-                # Yield control to event loop between sub-batches
-                await asyncio.sleep(0)
-            return all_embeddings
-
-        # Check if we need to split due to token limit
-        if total_tokens > self.MAX_TOKENS_PER_REQUEST:
-            sync_context.logger.debug(
-                f"Batch exceeds {self.MAX_TOKENS_PER_REQUEST} tokens, splitting in half"
+        # Embed each distinct missing text once (boilerplate often repeats within a batch)
+        missing_texts = list(dict.fromkeys(t for i, t in enumerate(texts) if i not in cached))
+
+        sync_context.logger.debug(
+            f"Embedding cache: {len(cached)} hits, {len(texts) - len(cached)} misses "
+            f"({len(missing_texts)} unique) for {len(texts)} texts"
+        )
+
+        fresh: dict[str, List[float]] = {}
+        if missing_texts:
+            missing_counts = None
+            if token_counts is not None:
+                count_by_text = dict(zip(texts, token_counts, strict=True))
+                missing_counts = [count_by_text[t] for t in missing_texts]
+            missing_embeddings = await self._embed_uncached(
+                missing_texts, sync_context, missing_counts
             )
-            mid = len(texts) // 2
-            first_half = await self.embed_many(texts[:mid], sync_context)
-            second_half = await self.embed_many(texts[mid:], sync_context)
-            return first_half + second_half
+            fresh = dict(zip(missing_texts, missing_embeddings, strict=True))
+            await self._cache.set_many(self.MODEL_NAME, missing_texts, missing_embeddings)
+
+        return [cached[i] if i in cached else fresh[text] for i, text in enumerate(texts)]
+
+    async def _embed_uncached(
+        self,
+        texts: List[str],
+        sync_context: SyncContext,
+        token_counts: Optional[List[int]] = None,
+    ) -> List[List[float]]:
+        """Embed texts via the OpenAI API with concurrent, token-aware requests.
+
+        Texts are tokenized once (unless token counts are passed in), packed into
+        requests that respect the OpenAI text/token limits, and dispatched
+        concurrently (bounded by MAX_CONCURRENT_REQUESTS and the pod-wide rate
+        limiter). Results are reassembled in input order.
+
+        Args:
+            texts: Non-empty, validated texts
+            sync_context: Sync context with logger
+            token_counts: Precomputed cl100k_base token count per text (optional)
+
+        Returns:
+            List of embedding vectors (same order as texts)
+        """
+        if token_counts is None:
+            token_counts = [len(tokens) for tokens in self._tokenizer.encode_batch(texts)]
+        requests = self._plan_requests(token_counts)
+
+        sync_context.logger.debug(
+            f"Embedding {len(texts)} texts with {sum(token_counts)} total tokens "
+            f"in {len(requests)} request(s)"
+        )
+
+        async def _run(start: int, end: int) -> List[List[float]]:
+            async with self._request_semaphore:
+                return await self._embed_batch(
+                    texts[start:end], sync_context, num_tokens=sum(token_counts[start:end])
+                )
+
+        tasks = [asyncio.create_task(_run(start, end)) for start, end in requests]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Fail fast: don't leave sibling requests running (and billing) after a failure
+            for task in tasks:
+                task.cancel()
+            raise
 
-        # Process single request with rate limiting
-        embeddings = await self._embed_batch(texts, sync_context)
+        embeddings = [vector for result in results for vector in result]
 
         # Validate result count matches input count
         if len(embeddings) != len(texts):
@@ -121,12 +180,44 @@ class DenseEmbedder(BaseEmbedder):
 
         return embeddings
 
-    async def _embed_batch(self, batch: List[str], sync_context: SyncContext) -> List[List[float]]:
+    def _plan_requests(self, token_counts: List[int]) -> List[Tuple[int, int]]:
+        """Greedily pack consecutive texts into requests within OpenAI limits.
+
+        Args:
+            token_counts: Token count per text (cl100k_base)
+
+        Returns:
+            List of (start, end) slices, one per API request, covering all texts in order
+        """
+        requests: List[Tuple[int, int]] = []
+        start = 0
+        request_tokens = 0
+
+        for i, tokens in enumerate(token_counts):
+            request_size = i - start
+            if request_size > 0 and (
+                request_size >= self.MAX_TEXTS_PER_REQUEST
+                or request_tokens + tokens > self.MAX_TOKENS_PER_REQUEST
+            ):
+                requests.append((start, i))
+                start = i
+                request_tokens = 0
+            request_tokens += tokens
+
+        if start < len(token_counts):
+            requests.append((start, len(token_counts)))
+
+        return requests
+
+    async def _embed_batch(
+        self, batch: List[str], sync_context: SyncContext, num_tokens: int = 0
+    ) -> List[List[float]]:
         """Embed single batch with rate limiting and error handling.
 
         Args:
             batch: List of texts to embed (must fit in one OpenAI request)
             sync_context: Sync context with logger
+            num_tokens: Tokens in the batch, charged against the TPM budget
 
         Returns:
             List of embedding vectors
@@ -136,7 +227,7 @@ class DenseEmbedder(BaseEmbedder):
         """
         try:
             # Rate limit (singleton shared across pod)
-            await self._rate_limiter.acquire()
+            await self._rate_limiter.acquire(tokens=num_tokens)
 
             # Call OpenAI API
             response = await self._client.embeddings.create(
@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 from uuid import UUID
 
 from fastembed import SparseEmbedding
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class Breadcrumb(BaseModel):
@@ -83,6 +83,108 @@ class BaseEntity(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # Fields that differ between a chunk entity and the parent it was created from
+    CHUNK_FIELDS: ClassVar[set[str]] = {
+        "entity_id",
+        "textual_representation",
+        "airweave_system_metadata",
+    }
+
+    # Parent entity of a chunk entity (None for regular entities)
+    _chunk_parent: Optional["BaseEntity"] = PrivateAttr(default=None)
+    # cl100k_base token count of a chunk entity's text, as computed by the chunker
+    _chunk_token_count: Optional[int] = PrivateAttr(default=None)
+
+    def create_chunk(
+        self, chunk_index: int, text: str, token_count: Optional[int] = None
+    ) -> "BaseEntity":
+        """Create a lightweight chunk entity that shares this entity's field values.
+
+        Only the chunk text, entity_id and system metadata are new objects; all other
+        fields (breadcrumbs, API fields, ...) are shared with this entity by reference
+        and must be treated as read-only.
+
+        Args:
+            chunk_index: Index of the chunk within this entity
+            text: Chunk text (becomes the chunk's textual_representation)
+            token_count: Token count of text from the chunker (reused by embedding)
+
+        Returns:
+            Chunk entity of the same type with chunk_index and original_entity_id set
+        """
+        metadata = self.airweave_system_metadata.model_copy(
+            update={"chunk_index": chunk_index, "original_entity_id": self.entity_id}
+        )
+        chunk = self.model_copy(
+            update={
+                "entity_id": f"{self.entity_id}__chunk_{chunk_index}",
+                "textual_representation": text,
+                "airweave_system_metadata": metadata,
+            }
+        )
+        chunk._chunk_parent = self
+        chunk._chunk_token_count = token_count
+        return chunk
+
+    @property
+    def chunk_token_count(self) -> Optional[int]:
+        """Token count of this chunk's text computed during chunking (None if unknown)."""
+        return self._chunk_token_count
+
+    def to_payload(
+        self,
+        parent_payloads: Optional[Dict[int, Dict[str, Any]]] = None,
+        *,
+        exclude_none: bool = True,
+        include_system_metadata: bool = True,
+    ) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict (vectors are never included).
+
+        Equivalent to model_dump(mode="json"), but for chunk entities the parent's
+        fields are serialized once and shared across all chunks of that parent via
+        `parent_payloads` (a cache owned by the caller, valid for one dump mode).
+
+        Args:
+            parent_payloads: Optional cache of serialized parent fields, keyed by id(parent)
+            exclude_none: Drop None values (as model_dump(exclude_none=True))
+            include_system_metadata: Include airweave_system_metadata (without vectors)
+
+        Returns:
+            Payload dict
+        """
+        parent = self._chunk_parent
+        if parent is None:
+            exclude: Any = (
+                {"airweave_system_metadata": {"vectors"}}
+                if include_system_metadata
+                else {"airweave_system_metadata"}
+            )
+            return self.model_dump(mode="json", exclude_none=exclude_none, exclude=exclude)
+
+        base = parent_payloads.get(id(parent)) if parent_payloads is not None else None
+        if base is None:
+            base = parent.model_dump(
+                mode="json", exclude_none=exclude_none, exclude=self.CHUNK_FIELDS
+            )
+            if parent_payloads is not None:
+                parent_payloads[id(parent)] = base
+
+        payload = dict(base)
+        payload["entity_id"] = self.entity_id
+        if self.textual_representation is not None or not exclude_none:
+            payload["textual_representation"] = self.textual_representation
+        if include_system_metadata and (
+            self.airweave_system_metadata is not None or not exclude_none
+        ):
+            payload["airweave_system_metadata"] = (
+                self.airweave_system_metadata.model_dump(
+                    mode="json", exclude_none=exclude_none, exclude={"vectors"}
+                )
+                if self.airweave_system_metadata is not None
+                else None
+            )
+        return payload
+
 
 class FileEntity(BaseEntity):
     """File entity schema."""
@@ -1,24 +1,77 @@
 """Base rate limiter for API clients."""
 
 import asyncio
+import os
+import socket
 import time
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional, Tuple
 
 from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+
+
+class _TokenBucket:
+    """Continuously refilling token bucket.
+
+    Consumption may overdraw the bucket when a single acquisition is larger than
+    its capacity (e.g. one embedding request with more tokens than a second's
+    budget); later acquisitions then wait until the debt is refilled.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.level = capacity
+        self._updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self.level = min(self.capacity, self.level + elapsed * self.rate_per_second)
+        self._updated_at = now
+
+    def seconds_until(self, amount: float) -> float:
+        needed = min(amount, self.capacity) - self.level
+        if needed <= 0:
+            return 0.0
+        return needed / self.rate_per_second
+
+    def consume(self, amount: float) -> None:
+        self.level -= amount
+
+    def resize(self, rate_per_second: float, capacity: float) -> None:
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.level = min(self.level, capacity)
 
 
 class BaseRateLimiter:
     """Base class for per-pod singleton rate limiters.
 
-    Implements sliding window rate limiting with async-safe locks.
-    Shared across all converter instances in the pod.
+    Implements token-bucket rate limiting with two budgets:
+    - Requests (refilled at the per-pod RPS share)
+    - Tokens (refilled at the per-pod TPM share, if GLOBAL_TPM_LIMIT is set)
+
+    Waiters are queued FIFO and woken by a single timer when the head of the
+    queue can be served (no polling). The provider limits are split across the
+    sync worker pods that are currently alive, as registered in Redis; if Redis
+    is unavailable the split falls back to DEFAULT_NUM_PODS.
+
+    Shared across all converter/embedder instances in the pod.
     """
 
     # Subclasses must define these class attributes
-    RATE_LIMIT_PER_POD_RPS: float = NotImplemented  # Requests per second per pod
-    RATE_LIMIT_WINDOW_SECONDS: float = 1.0  # Sliding window size
+    GLOBAL_RPS_LIMIT: float = NotImplemented  # Provider request limit across all pods
+    GLOBAL_TPM_LIMIT: Optional[float] = None  # Provider token limit across all pods (optional)
+    SAFETY_FACTOR: float = 0.9  # Stay below the provider cap
+    BURST_SECONDS: float = 1.0  # Request bucket capacity, in seconds of refill
     MAX_WAIT_FOR_SLOT_SECONDS: float = 30.0  # Max wait time
-    POLL_INTERVAL_SECONDS: float = 0.1  # Poll interval
+
+    # Cross-pod coordination
+    REDIS_KEY_NAME: str = NotImplemented  # e.g. "openai" -> rate_limiter:openai:pods
+    DEFAULT_NUM_PODS: int = 6  # Fallback split when Redis coordination is unavailable
+    POD_HEARTBEAT_SECONDS: float = 10.0  # How often this pod re-registers
+    POD_EXPIRY_SECONDS: float = 30.0  # Pods not seen for this long are not counted
 
     _instance: Optional["BaseRateLimiter"] = None
 
@@ -34,51 +87,188 @@ class BaseRateLimiter:
         if self._initialized:
             return
 
-        # Sliding window tracking
-        self._request_times: list[float] = []
-        self._lock = asyncio.Lock()
+        self._num_pods = self.DEFAULT_NUM_PODS
+        self._pod_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._last_heartbeat = 0.0
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+        self._request_bucket = _TokenBucket(*self._request_budget())
+        self._token_bucket = _TokenBucket(*self._token_budget()) if self.GLOBAL_TPM_LIMIT else None
+
+        # FIFO waiters: (future, tokens) woken by a single timer handle
+        self._waiters: Deque[Tuple[asyncio.Future, int]] = deque()
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._initialized = True
 
         # Log initialization (subclass should provide details)
         self._log_initialization()
 
+    # ------------------------------------------------------------------------------------
+    # Budgets
+    # ------------------------------------------------------------------------------------
+
+    @property
+    def rate_limit_per_pod_rps(self) -> float:
+        """Current per-pod request rate (global limit split across live pods)."""
+        return self.GLOBAL_RPS_LIMIT * self.SAFETY_FACTOR / self._num_pods
+
+    @property
+    def rate_limit_per_pod_tpm(self) -> Optional[float]:
+        """Current per-pod token rate per minute, if token budgeting is enabled."""
+        if not self.GLOBAL_TPM_LIMIT:
+            return None
+        return self.GLOBAL_TPM_LIMIT * self.SAFETY_FACTOR / self._num_pods
+
+    def _request_budget(self) -> Tuple[float, float]:
+        rps = self.rate_limit_per_pod_rps
+        return rps, max(1.0, rps * self.BURST_SECONDS)
+
+    def _token_budget(self) -> Tuple[float, float]:
+        # Providers meter tokens per minute, so allow up to a minute of burst
+        tpm = self.rate_limit_per_pod_tpm
+        return tpm / 60.0, tpm
+
     def _log_initialization(self):
         """Log rate limiter initialization. Override in subclasses for custom messages."""
         logger.debug(
-            f"{self.__class__.__name__} initialized: {self.RATE_LIMIT_PER_POD_RPS:.1f} RPS per pod"
+            f"{self.__class__.__name__} initialized: {self.rate_limit_per_pod_rps:.1f} RPS per pod"
         )
 
-    async def acquire(self):
-        """Acquire a rate limit slot (blocks until available).
+    # ------------------------------------------------------------------------------------
+    # Acquisition
+    # ------------------------------------------------------------------------------------
+
+    async def acquire(self, tokens: int = 0):
+        """Acquire a request slot and `tokens` tokens (blocks until available).
 
-        Uses sliding window algorithm to enforce rate limit.
-        All instances in this pod share this limiter.
+        Waiters are served in FIFO order. All instances in this pod share this limiter.
+
+        Args:
+            tokens: Number of provider tokens this request will consume (0 = requests only)
 
         Raises:
             TimeoutError: If can't acquire slot within MAX_WAIT_FOR_SLOT_SECONDS
         """
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        self._bind_loop(loop)
+        self._maybe_heartbeat(loop)
+
+        now = time.monotonic()
+        self._refill(now)
+        if not self._waiters and self._can_serve(tokens):
+            self._consume(tokens)
+            return
+
+        future = loop.create_future()
+        self._waiters.append((future, tokens))
+        self._schedule_wakeup()
+
+        try:
+            await asyncio.wait_for(future, timeout=self.MAX_WAIT_FOR_SLOT_SECONDS)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Failed to acquire {self.__class__.__name__} rate limit slot within "
+                f"{self.MAX_WAIT_FOR_SLOT_SECONDS}s"
+            )
+
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Reset waiter state if the singleton is used from a new event loop."""
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._waiters.clear()
+        self._wakeup_handle = None
+        self._heartbeat_task = None
+
+    def _refill(self, now: float) -> None:
+        self._request_bucket.refill(now)
+        if self._token_bucket:
+            self._token_bucket.refill(now)
+
+    def _can_serve(self, tokens: int) -> bool:
+        if self._request_bucket.seconds_until(1) > 0:
+            return False
+        if self._token_bucket and tokens and self._token_bucket.seconds_until(tokens) > 0:
+            return False
+        return True
+
+    def _consume(self, tokens: int) -> None:
+        self._request_bucket.consume(1)
+        if self._token_bucket and tokens:
+            self._token_bucket.consume(tokens)
+
+    def _seconds_until_serviceable(self, tokens: int) -> float:
+        wait = self._request_bucket.seconds_until(1)
+        if self._token_bucket and tokens:
+            wait = max(wait, self._token_bucket.seconds_until(tokens))
+        return wait
+
+    def _schedule_wakeup(self) -> None:
+        if self._wakeup_handle is not None or not self._waiters:
+            return
+        _, tokens = self._waiters[0]
+        delay = self._seconds_until_serviceable(tokens)
+        self._wakeup_handle = self._loop.call_later(delay, self._drain)
+
+    def _drain(self) -> None:
+        """Serve queued waiters in FIFO order while budget allows."""
+        self._wakeup_handle = None
+        self._refill(time.monotonic())
+
+        while self._waiters:
+            future, tokens = self._waiters[0]
+            if future.done():
+                # Timed out or cancelled - drop without consuming budget
+                self._waiters.popleft()
+                continue
+            if not self._can_serve(tokens):
+                break
+            self._waiters.popleft()
+            self._consume(tokens)
+            future.set_result(None)
+
+        self._schedule_wakeup()
+
+    # ------------------------------------------------------------------------------------
+    # Cross-pod coordination
+    # ------------------------------------------------------------------------------------
+
+    def _maybe_heartbeat(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Refresh the live-pod count in the background (never blocks acquire)."""
+        now = time.monotonic()
+        if now - self._last_heartbeat < self.POD_HEARTBEAT_SECONDS:
+            return
+        if self._heartbeat_task is not None and not self._heartbeat_task.done():
+            return
+        self._last_heartbeat = now
+        self._heartbeat_task = loop.create_task(self._heartbeat())
 
-        while True:
+    async def _heartbeat(self) -> None:
+        """Register this pod in Redis and re-split the provider limits across live pods."""
+        key = f"rate_limiter:{self.REDIS_KEY_NAME}:pods"
+        try:
             now = time.time()
+            pipe = redis_client.client.pipeline(transaction=True)
+            pipe.zadd(key, {self._pod_id: now})
+            pipe.zremrangebyscore(key, 0, now - self.POD_EXPIRY_SECONDS)
+            pipe.zcard(key)
+            pipe.expire(key, int(self.POD_EXPIRY_SECONDS * 2))
+            results = await pipe.execute()
+            num_pods = max(1, int(results[2]))
+        except Exception as e:
+            logger.debug(
+                f"{self.__class__.__name__} pod coordination unavailable, "
+                f"assuming {self.DEFAULT_NUM_PODS} pods: {e}"
+            )
+            num_pods = self.DEFAULT_NUM_PODS
 
-            # Timeout check
-            if now - start_time > self.MAX_WAIT_FOR_SLOT_SECONDS:
-                raise TimeoutError(
-                    f"Failed to acquire {self.__class__.__name__} rate limit slot within "
-                    f"{self.MAX_WAIT_FOR_SLOT_SECONDS}s"
-                )
-
-            async with self._lock:
-                # Remove requests outside sliding window
-                cutoff = now - self.RATE_LIMIT_WINDOW_SECONDS
-                self._request_times = [t for t in self._request_times if t > cutoff]
-
-                # Check if slot available
-                if len(self._request_times) < self.RATE_LIMIT_PER_POD_RPS:
-                    # Slot available - claim it
-                    self._request_times.append(now)
-                    return
-
-            # At limit - wait and retry
-            await asyncio.sleep(self.POLL_INTERVAL_SECONDS)
+        if num_pods != self._num_pods:
+            self._num_pods = num_pods
+            self._request_bucket.resize(*self._request_budget())
+            if self._token_bucket:
+                self._token_bucket.resize(*self._token_budget())
+            logger.debug(
+                f"{self.__class__.__name__} rebalanced for {num_pods} pods: "
+                f"{self.rate_limit_per_pod_rps:.1f} RPS per pod"
+            )
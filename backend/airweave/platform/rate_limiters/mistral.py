@@ -11,11 +11,11 @@ class MistralRateLimiter(BaseRateLimiter):
     """Per-pod rate limiter for Mistral API.
 
     Singleton per pod (Python process) that limits Mistral API requests.
-    Assumes 6 sync worker pods, each gets ~3 RPS (24 / 6 = 4, conservative: 3).
+    The workspace limit is split across the live sync worker pods.
 
     Features:
-    - Sliding window rate limiting
-    - Async-safe with locks
+    - Token-bucket rate limiting with FIFO waiters (no polling)
+    - Async-safe (single event loop, timer-driven wakeups)
     - Shared across all syncs in the pod
     """
 
@@ -24,18 +24,17 @@ class MistralRateLimiter(BaseRateLimiter):
     # Mistral workspace limits
     MISTRAL_WORKSPACE_RPS = 24  # Mistral API workspace limit
 
-    # Deployment configuration
-    NUM_SYNC_WORKER_PODS = 6  # Number of K8s sync worker pods
+    GLOBAL_RPS_LIMIT = MISTRAL_WORKSPACE_RPS
+    # OCR traffic is file/batch-job calls, so only requests are budgeted (no TPM)
+    GLOBAL_TPM_LIMIT = None
+    SAFETY_FACTOR = 0.75  # Conservative: 24 RPS workspace limit shared with other services
 
-    # Per-pod rate limit (conservative)
-    RATE_LIMIT_PER_POD_RPS = 3.0  # RPS per pod (24 / 6 = 4, use 3 for safety)
-
-    # Sliding window configuration
-    RATE_LIMIT_WINDOW_SECONDS = 1.0  # 1 second sliding window
+    # Cross-pod split (live pods from Redis, DEFAULT_NUM_PODS as fallback)
+    REDIS_KEY_NAME = "mistral"
+    DEFAULT_NUM_PODS = 6
 
     # Acquisition timeout
     MAX_WAIT_FOR_SLOT_SECONDS = 30.0  # Max wait for rate limit slot
-    POLL_INTERVAL_SECONDS = 0.1  # Check availability every 100ms
 
     # ==========================================================================
 
@@ -44,7 +43,6 @@ class MistralRateLimiter(BaseRateLimiter):
     def _log_initialization(self):
         """Log Mistral-specific initialization message."""
         logger.debug(
-            f"Mistral rate limiter initialized: {self.RATE_LIMIT_PER_POD_RPS} RPS per pod "
-            f"({self.NUM_SYNC_WORKER_PODS} pods × {self.RATE_LIMIT_PER_POD_RPS} RPS = "
-            f"{self.NUM_SYNC_WORKER_PODS * self.RATE_LIMIT_PER_POD_RPS} RPS total)"
+            f"Mistral rate limiter initialized: {self.rate_limit_per_pod_rps:.1f} RPS per pod "
+            f"(assuming {self._num_pods} pods until pod coordination reports the live count)"
         )
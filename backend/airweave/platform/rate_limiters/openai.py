@@ -10,26 +10,25 @@ from ._base import BaseRateLimiter
 class OpenAIRateLimiter(BaseRateLimiter):
     """Per-pod rate limiter for OpenAI API.
 
-    Singleton shared across all CodeConverter instances in pod.
-    Based on gpt-5-nano limits: 10,000 RPM.
+    Singleton shared across all OpenAI callers in pod (DenseEmbedder, CodeConverter).
+    Budgets both requests (RPM) and tokens (TPM); callers pass the request's token
+    count to acquire() so large embedding batches are paced by token budget.
     """
 
     # ==================== CONFIGURATION (Class Attributes) ====================
 
-    # OpenAI rate limits (gpt-5-nano)
+    # OpenAI rate limits (organization-wide)
     OPENAI_RPM_LIMIT = 10_000  # Requests per minute
+    OPENAI_TPM_LIMIT = 5_000_000  # Tokens per minute (text-embedding-3-large)
 
-    # Deployment configuration
-    NUM_SYNC_WORKER_PODS = 6  # Number of K8s sync worker pods
+    GLOBAL_RPS_LIMIT = OPENAI_RPM_LIMIT / 60
+    GLOBAL_TPM_LIMIT = OPENAI_TPM_LIMIT
 
-    # Per-pod rate limit (conservative)
-    RATE_LIMIT_PER_POD_RPM = 1500  # RPM per pod (10k / 6 ≈ 1666, use 1500)
-    RATE_LIMIT_PER_POD_RPS = RATE_LIMIT_PER_POD_RPM / 60  # = 25 RPS
+    # Cross-pod split (live pods from Redis, DEFAULT_NUM_PODS as fallback)
+    REDIS_KEY_NAME = "openai"
+    DEFAULT_NUM_PODS = 6
 
-    # Sliding window configuration
-    RATE_LIMIT_WINDOW_SECONDS = 1.0  # 1 second window
     MAX_WAIT_FOR_SLOT_SECONDS = 30.0  # Max wait time
-    POLL_INTERVAL_SECONDS = 0.1  # Poll every 100ms
 
     # ==========================================================================
 
@@ -38,7 +37,7 @@ class OpenAIRateLimiter(BaseRateLimiter):
     def _log_initialization(self):
         """Log OpenAI-specific initialization message."""
         logger.debug(
-            f"OpenAI rate limiter initialized: {self.RATE_LIMIT_PER_POD_RPS:.1f} RPS per pod "
-            f"({self.NUM_SYNC_WORKER_PODS} pods × {self.RATE_LIMIT_PER_POD_RPS:.1f} = "
-            f"{self.NUM_SYNC_WORKER_PODS * self.RATE_LIMIT_PER_POD_RPS:.1f} RPS total)"
+            f"OpenAI rate limiter initialized: {self.rate_limit_per_pod_rps:.1f} RPS, "
+            f"{self.rate_limit_per_pod_tpm:,.0f} TPM per pod (assuming {self._num_pods} pods "
+            f"until pod coordination reports the live count)"
         )
@@ -1,16 +1,34 @@
-"""Async helper utilities for improved performance."""
+"""Async helper utilities for improved performance.
+
+Two shared executors back the sync pipeline:
+- a thread pool for blocking I/O and light work (`run_in_thread_pool`)
+- a process pool for CPU-bound work that holds the GIL, such as chunking, BM25
+  embedding and local file conversion (`run_in_process_pool`)
+
+Process pool jobs must be picklable module-level functions that take and return
+plain data (strings, bytes, lists, dicts). Models used by a job are loaded lazily
+by each worker process and stay loaded for the lifetime of the pool.
+"""
 
 import asyncio
+import multiprocessing
 import os
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, TypeVar
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, TypeVar
 
 from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.sync.exceptions import EntityProcessingError
 
 # Shared thread pool for CPU-bound operations
 _cpu_executor = None
 _cpu_executor_lock = asyncio.Lock()
 
+# Shared process pool for GIL-bound operations (None until first use or when disabled)
+_process_executor: Optional[ProcessPoolExecutor] = None
+_process_executor_lock = asyncio.Lock()
+
 T = TypeVar("T")
 
 
@@ -47,3 +65,57 @@ async def run_in_thread_pool(func: Callable[..., T], *args, **kwargs) -> T:
         return await loop.run_in_executor(executor, func, *args)
     else:
         return await loop.run_in_executor(executor, func, *args)
+
+
+async def get_process_executor() -> Optional[ProcessPoolExecutor]:
+    """Get or create the shared process pool (None when disabled by settings)."""
+    global _process_executor
+
+    if not settings.SYNC_PROCESS_POOL_ENABLED:
+        return None
+
+    async with _process_executor_lock:
+        if _process_executor is None:
+            max_workers = settings.SYNC_PROCESS_POOL_SIZE or os.cpu_count() or 1
+
+            # Spawn (not fork): the parent runs an event loop and many threads
+            _process_executor = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Started CPU process pool with {max_workers} workers")
+
+    return _process_executor
+
+
+async def _discard_process_executor(executor: ProcessPoolExecutor) -> None:
+    """Forget a broken process pool so the next job starts a fresh one."""
+    global _process_executor
+
+    async with _process_executor_lock:
+        if _process_executor is executor:
+            _process_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_process_pool(func: Callable[..., T], *args) -> T:
+    """Run a CPU-bound, picklable module-level function in the shared process pool.
+
+    Falls back to the thread pool when the process pool is disabled.
+
+    Raises:
+        EntityProcessingError: If the pool broke while running the job (e.g. a worker
+            was OOM-killed on a huge document). The job is not retried in this process,
+            where the same input could take down every sync on the pod; the next call
+            starts a new pool.
+    """
+    executor = await get_process_executor()
+    if executor is None:
+        return await run_in_thread_pool(func, *args)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(executor, func, *args)
+    except BrokenProcessPool as e:
+        logger.warning(f"CPU process pool broke while running {func.__name__}: {e}")
+        await _discard_process_executor(executor)
+        raise EntityProcessingError(f"CPU worker process died while running {func.__name__}")
@@ -0,0 +1,140 @@
+"""Compact tracking of entity IDs encountered during a sync.
+
+The entity pipeline needs to know whether an (entity type, entity_id) pair was already
+seen in the current sync, for every entity the source yields. Keeping a Python
+``set[str]`` per type costs ~100 bytes per ID, which dominates worker memory on syncs
+with tens of millions of rows.
+
+By default IDs are stored as 128-bit BLAKE2b digests in sorted numpy ``S16`` runs
+(16 bytes per ID). New IDs go into a small buffer that is frozen into a sorted run when
+full; runs of similar size are merged so there are O(log n) runs to binary-search.
+Merges of large runs take a noticeable amount of CPU, so they are done by compact() in
+the thread pool (numpy releases the GIL while sorting) instead of on the event loop.
+With 128-bit digests a false "already seen" is astronomically unlikely (~1e-24 at
+10^7 IDs); set SYNC_ENCOUNTERED_IDS_EXACT to keep exact strings instead.
+"""
+
+import hashlib
+from typing import Dict, List, Set
+
+import numpy as np
+
+from airweave.platform.sync.async_helpers import run_in_thread_pool
+
+
+def _merge_runs(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Merge two sorted runs (runs in the thread pool).
+
+    Timsort detects the two presorted halves, so this is a linear merge in C.
+    """
+    merged = np.concatenate((first, second))
+    merged.sort(kind="stable")
+    return merged
+
+
+class _HashedIds:
+    """Set of 128-bit ID digests: a small mutable buffer plus sorted, merged runs."""
+
+    BUFFER_SIZE = 4096
+
+    def __init__(self):
+        self._buffer: Set[bytes] = set()
+        self._runs: List[np.ndarray] = []
+        self._count = 0
+        self._compacting = False
+
+    @staticmethod
+    def _digest(entity_id: str) -> bytes:
+        # numpy "S" items drop trailing NUL bytes when read back; strip them up front so
+        # keys compare equal to run items (still unique, since digests are fixed-length)
+        return hashlib.blake2b(entity_id.encode("utf-8"), digest_size=16).digest().rstrip(b"\0")
+
+    @staticmethod
+    def _in_run(run: np.ndarray, key: bytes) -> bool:
+        i = run.searchsorted(key)
+        return i < len(run) and run[i] == key
+
+    def add(self, entity_id: str) -> bool:
+        key = self._digest(entity_id)
+        if key in self._buffer or any(self._in_run(run, key) for run in self._runs):
+            return False
+
+        self._buffer.add(key)
+        self._count += 1
+        if len(self._buffer) >= self.BUFFER_SIZE:
+            self._runs.append(np.sort(np.array(list(self._buffer), dtype="S16")))
+            self._buffer = set()
+        return True
+
+    def _next_merge(self) -> int:
+        """Index i of the newest adjacent pair of runs to merge (-1 if none).
+
+        Runs are merged while the earlier one is not larger than the later one, so run
+        sizes roughly double and each ID is re-merged O(log n) times.
+        """
+        for i in range(len(self._runs) - 2, -1, -1):
+            if len(self._runs[i]) <= len(self._runs[i + 1]):
+                return i
+        return -1
+
+    async def compact(self) -> None:
+        # Lookups keep using the unmerged runs until the merged one replaces them; add()
+        # only appends, so the pair stays adjacent while the merge runs
+        if self._compacting:
+            return
+        self._compacting = True
+        try:
+            while (i := self._next_merge()) >= 0:
+                first, second = self._runs[i], self._runs[i + 1]
+                merged = await run_in_thread_pool(_merge_runs, first, second)
+                i = next(j for j, run in enumerate(self._runs) if run is first)
+                self._runs[i : i + 2] = [merged]
+        finally:
+            self._compacting = False
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class EncounteredEntityIds:
+    """Per-entity-type record of entity IDs seen during a sync.
+
+    Usage:
+        encountered = EncounteredEntityIds()
+        if encountered.add(entity.__class__.__name__, entity.entity_id):
+            ...  # first time this (type, id) is seen in the sync
+        await encountered.compact()  # once per batch, off the event loop
+        progress_counts = encountered.counts()
+    """
+
+    def __init__(self, exact: bool = False):
+        """Initialize the store.
+
+        Args:
+            exact: Keep exact ID strings instead of 128-bit digests
+        """
+        self.exact = exact
+        self._by_type: Dict[str, "Set[str] | _HashedIds"] = {}
+
+    def add(self, entity_type: str, entity_id: str) -> bool:
+        """Record an entity ID; return False if it was already encountered for this type."""
+        ids = self._by_type.get(entity_type)
+        if ids is None:
+            ids = self._by_type[entity_type] = set() if self.exact else _HashedIds()
+
+        if isinstance(ids, set):
+            if entity_id in ids:
+                return False
+            ids.add(entity_id)
+            return True
+        return ids.add(entity_id)
+
+    async def compact(self) -> None:
+        """Merge sorted runs in the thread pool so lookups stay O(log n) run searches."""
+        for ids in list(self._by_type.values()):
+            if isinstance(ids, _HashedIds):
+                await ids.compact()
+
+    def counts(self) -> Dict[str, int]:
+        """Number of distinct entity IDs encountered, by entity type."""
+        return {entity_type: len(ids) for entity_type, ids in self._by_type.items()}
@@ -3,28 +3,67 @@
 import asyncio
 import hashlib
 import json
+import logging
 import os
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import aiofiles
 
 from airweave import crud, models
+from airweave.core.config import settings
 from airweave.db.session import get_db_context
+from airweave.platform.destinations._base import BaseDestination
 from airweave.platform.entities._base import BaseEntity, CodeFileEntity, FileEntity
+from airweave.platform.sync.async_helpers import run_in_thread_pool
 from airweave.platform.sync.context import SyncContext
+from airweave.platform.sync.encountered_ids import EncounteredEntityIds
 from airweave.platform.sync.exceptions import EntityProcessingError, SyncFailureError
 from airweave.platform.sync.file_types import SUPPORTED_FILE_EXTENSIONS
+from airweave.platform.sync.pipeline_stages import StagedPipeline, StageSpec
+
+
+class _StagedBatch:
+    """A micro-batch of INSERT/UPDATE entities moving through the pipeline stages."""
+
+    __slots__ = ("partitions", "entities", "chunk_entities", "sync_context")
+
+    def __init__(
+        self,
+        partitions: Dict[str, Any],
+        entities: List[BaseEntity],
+        sync_context: SyncContext,
+    ):
+        self.partitions = partitions
+        self.entities = entities
+        self.chunk_entities: List[BaseEntity] = []
+        self.sync_context = sync_context
 
 
 class EntityPipeline:
     """Pipeline for processing entities with stateful tracking across sync lifecycle."""
 
+    # Destination writes: attempts per destination before the batch fails
+    DESTINATION_WRITE_MAX_ATTEMPTS = 3
+    DESTINATION_WRITE_RETRY_BASE_DELAY = 0.5  # seconds, doubled per attempt
+
+    # Orphan cleanup: outdated rows deleted (and removed from destinations) per page
+    ORPHAN_CLEANUP_BATCH_SIZE = 1000
+
+    # Pipelined stages: workers per stage and batches allowed to wait in front of each
+    CONVERT_STAGE_CONCURRENCY = 32  # file conversion is mostly I/O (OCR, downloads)
+    CHUNK_STAGE_CONCURRENCY = 8  # chunkers run in the shared thread pool
+    EMBED_STAGE_CONCURRENCY = 4
+    EMBED_STAGE_MAX_CHUNKS = 1000  # chunks coalesced from queued batches per embed call
+    PERSIST_STAGE_CONCURRENCY = 16
+    STAGE_QUEUE_SIZE = 16
+
     def __init__(self):
         """Initialize pipeline with empty entity tracking."""
-        self._entity_ids_encountered_by_type: Dict[str, Set[str]] = {}
+        self._encountered_ids = EncounteredEntityIds(exact=settings.SYNC_ENCOUNTERED_IDS_EXACT)
+        self._stages: Optional[StagedPipeline] = None
         self._entities_printed_count: int = 0
 
     # ------------------------------------------------------------------------------------
@@ -32,14 +71,39 @@ class EntityPipeline:
     # ------------------------------------------------------------------------------------
 
     async def cleanup_orphaned_entities(self, sync_context: SyncContext) -> None:
-        """Remove entities from database/destinations that were not encountered during sync."""
+        """Remove entities from database/destinations that were not encountered during sync.
+
+        Every entity the source yields is stamped with the current sync_job_id (see
+        _mark_encountered), so orphans are exactly the rows of this sync with another
+        job id. They are deleted server-side in keyset-paginated pages; each page is
+        removed from destinations before its DB delete commits, so memory and per-step
+        time stay bounded regardless of collection size.
+        """
         try:
-            orphaned = await self._identify_orphaned_entities(sync_context)
+            after_id: Optional[UUID] = None
+            while True:
+                async with get_db_context() as db:
+                    orphaned = await crud.entity.bulk_remove_outdated(
+                        db,
+                        sync_id=sync_context.sync.id,
+                        sync_job_id=sync_context.sync_job.id,
+                        organization_id=sync_context.ctx.organization.id,
+                        limit=self.ORPHAN_CLEANUP_BATCH_SIZE,
+                        after_id=after_id,
+                    )
+                    if not orphaned:
+                        return
 
-            if not orphaned:
-                return
+                    # Rolled back with the DB delete if destinations fail
+                    await self._remove_orphaned_entities(orphaned, sync_context)
+                    await db.commit()
+
+                await sync_context.progress.increment("deleted", len(orphaned))
+                await self._update_entity_state_tracker(orphaned, sync_context)
 
-            await self._remove_orphaned_entities(orphaned, sync_context)
+                if len(orphaned) < self.ORPHAN_CLEANUP_BATCH_SIZE:
+                    return
+                after_id = orphaned[-1].id
 
         except asyncio.CancelledError:
             raise
@@ -47,39 +111,21 @@ class EntityPipeline:
             sync_context.logger.error(f"💥 Cleanup failed: {str(e)}", exc_info=True)
             raise
 
-    async def _identify_orphaned_entities(self, sync_context: SyncContext) -> List[models.Entity]:
-        """Fetch stored entities and filter to those not encountered during sync."""
-        async with get_db_context() as db:
-            stored_entities = await crud.entity.get_by_sync_id(db=db, sync_id=sync_context.sync.id)
-
-        if not stored_entities:
-            return []
-
-        encountered_ids = set().union(*self._entity_ids_encountered_by_type.values())
-        return [e for e in stored_entities if e.entity_id not in encountered_ids]
-
     async def _remove_orphaned_entities(
-        self, orphaned_entities: List[models.Entity], sync_context: SyncContext
+        self, orphaned_entities: List[Any], sync_context: SyncContext
     ) -> None:
-        """Remove orphaned entities from destinations and database, update trackers."""
+        """Remove a page of orphaned entities (and all their chunks) from destinations."""
         entity_ids = [e.entity_id for e in orphaned_entities]
-        db_ids = [e.id for e in orphaned_entities]
 
         # Delete all chunks for these parent entities (using bulk_delete_by_parent_ids)
-        for destination in sync_context.destinations:
-            await destination.bulk_delete_by_parent_ids(entity_ids, sync_context.sync.id)
-
-        async with get_db_context() as db:
-            await crud.entity.bulk_remove(db=db, ids=db_ids, ctx=sync_context.ctx)
-            await db.commit()
-
-        await sync_context.progress.increment("deleted", len(orphaned_entities))
-
-        # Update entity state tracker (already has the right logic)
-        await self._update_entity_state_tracker(orphaned_entities, sync_context)
+        await self._run_on_destinations(
+            "orphan delete",
+            lambda dest: dest.bulk_delete_by_parent_ids(entity_ids, sync_context.sync.id),
+            sync_context,
+        )
 
     async def _update_entity_state_tracker(
-        self, orphaned_entities: List[models.Entity], sync_context: SyncContext
+        self, orphaned_entities: List[Any], sync_context: SyncContext
     ) -> None:
         """Update entity state tracker with deletion counts by entity definition."""
         if not getattr(sync_context, "entity_state_tracker", None):
@@ -127,6 +173,8 @@ class EntityPipeline:
             sync_context.logger.debug("All entities in batch were duplicates, skipping processing")
             return
 
+        await self._mark_encountered(unique_entities, sync_context)
+
         await self._enrich_early_metadata(unique_entities, sync_context)
 
         await self.compute_hashes_for_batch(unique_entities, sync_context)
@@ -153,38 +201,107 @@ class EntityPipeline:
             await self._update_progress(partitions, sync_context)
             return
 
-        await self._build_textual_representations(entities_to_process, sync_context)
-
-        for entity in entities_to_process:
-            if not hasattr(entity, "textual_representation") or not entity.textual_representation:
-                raise SyncFailureError(
-                    f"PROGRAMMING ERROR: Entity {entity.__class__.__name__}[{entity.entity_id}] "
-                    f"has no textual_representation after _build_textual_representations(). "
-                    f"This should never happen - failed entities should be removed from the list."
-                )
-
-        # Chunk entities (entity multiplication: 1 entity → N chunk entities)
-        # entities_to_process may be empty if all failed conversion (handled in method)
-        if not entities_to_process:
-            sync_context.logger.debug("No entities to chunk - all failed conversion")
-            return
+        # Convert -> chunk -> embed -> persist run as pipelined stages shared by all batches
+        # of this sync; returns once this batch has been persisted (or raises its error)
+        await self._get_stages(sync_context).submit(
+            _StagedBatch(partitions, entities_to_process, sync_context)
+        )
 
-        chunk_entities = await self._chunk_entities(entities_to_process, sync_context)
+    # ------------------------------------------------------------------------------------
+    # Pipelined stages
+    # ------------------------------------------------------------------------------------
 
-        # Embed chunk entities (sets vectors field)
-        await self._embed_entities(chunk_entities, sync_context)
+    def _get_stages(self, sync_context: SyncContext) -> StagedPipeline:
+        """Create the stage workers on first use (one staged pipeline per sync)."""
+        if self._stages is None:
+            self._stages = StagedPipeline(
+                [
+                    StageSpec(
+                        "convert",
+                        self._convert_stage,
+                        concurrency=self.CONVERT_STAGE_CONCURRENCY,
+                        queue_size=self.STAGE_QUEUE_SIZE,
+                    ),
+                    StageSpec(
+                        "chunk",
+                        self._chunk_stage,
+                        concurrency=self.CHUNK_STAGE_CONCURRENCY,
+                        queue_size=self.STAGE_QUEUE_SIZE,
+                    ),
+                    StageSpec(
+                        "embed",
+                        self._embed_stage,
+                        concurrency=self.EMBED_STAGE_CONCURRENCY,
+                        queue_size=self.STAGE_QUEUE_SIZE,
+                        max_batch_weight=self.EMBED_STAGE_MAX_CHUNKS,
+                        weight=lambda batch: len(batch.chunk_entities),
+                    ),
+                    StageSpec(
+                        "persist",
+                        self._persist_stage,
+                        concurrency=self.PERSIST_STAGE_CONCURRENCY,
+                        queue_size=self.STAGE_QUEUE_SIZE,
+                    ),
+                ],
+                logger=sync_context.logger,
+            )
+        return self._stages
+
+    async def shutdown(self) -> None:
+        """Stop the stage workers (called once the sync is done processing entities)."""
+        if self._stages is not None:
+            await self._stages.shutdown()
+            self._stages = None
+
+    async def _convert_stage(self, batches: List["_StagedBatch"]) -> List["_StagedBatch"]:
+        """Build textual representations; batches whose entities all failed stop here."""
+        forwarded = []
+        for batch in batches:
+            await self._build_textual_representations(batch.entities, batch.sync_context)
+
+            for entity in batch.entities:
+                if not getattr(entity, "textual_representation", None):
+                    raise SyncFailureError(
+                        f"PROGRAMMING ERROR: Entity {entity.__class__.__name__}"
+                        f"[{entity.entity_id}] has no textual_representation after "
+                        f"_build_textual_representations(). This should never happen - "
+                        f"failed entities should be removed from the list."
+                    )
 
-        # Persist to destinations (COMMIT POINT)
-        await self._persist_to_destinations(chunk_entities, partitions, sync_context)
+            if not batch.entities:
+                batch.sync_context.logger.debug("No entities to chunk - all failed conversion")
+                continue
+            forwarded.append(batch)
+        return forwarded
+
+    async def _chunk_stage(self, batches: List["_StagedBatch"]) -> List["_StagedBatch"]:
+        """Chunk entities (entity multiplication: 1 entity → N chunk entities)."""
+        for batch in batches:
+            batch.chunk_entities = await self._chunk_entities(batch.entities, batch.sync_context)
+        return batches
+
+    async def _embed_stage(self, batches: List["_StagedBatch"]) -> List["_StagedBatch"]:
+        """Embed the chunks of all coalesced batches together (full-size API requests)."""
+        chunk_entities = [chunk for batch in batches for chunk in batch.chunk_entities]
+        await self._embed_entities(chunk_entities, batches[0].sync_context)
+        return batches
+
+    async def _persist_stage(self, batches: List["_StagedBatch"]) -> List["_StagedBatch"]:
+        """Persist to destinations (COMMIT POINT), then the database, then progress."""
+        for batch in batches:
+            sync_context = batch.sync_context
+            await self._persist_to_destinations(
+                batch.chunk_entities, batch.partitions, sync_context
+            )
 
-        # Persist to database (only after destination success)
-        await self._persist_to_database(partitions, sync_context)
+            # Persist to database (only after destination success)
+            await self._persist_to_database(batch.partitions, sync_context)
 
-        # Update progress
-        await self._update_progress(partitions, sync_context)
+            await self._update_progress(batch.partitions, sync_context)
 
-        # Progressive cleanup: delete temp files after successful processing
-        await self._cleanup_processed_files(partitions, sync_context)
+            # Progressive cleanup: delete temp files after successful processing
+            await self._cleanup_processed_files(batch.partitions, sync_context)
+        return batches
 
     # ------------------------------------------------------------------------------------
     # Deduplication
@@ -200,20 +317,20 @@ class EntityPipeline:
         for entity in entities:
             # Track by entity type to allow same IDs across different types
             entity_type = entity.__class__.__name__
-            self._entity_ids_encountered_by_type.setdefault(entity_type, set())
 
-            # Check if we've already seen this entity ID for this type
-            if entity.entity_id in self._entity_ids_encountered_by_type[entity_type]:
+            # Check if we've already seen this entity ID for this type (marks it if not)
+            if not self._encountered_ids.add(entity_type, entity.entity_id):
                 skipped_count += 1
                 sync_context.logger.debug(
                     f"Skipping duplicate entity: {entity_type}[{entity.entity_id}]"
                 )
                 continue
 
-            # Mark as encountered and add to unique list
-            self._entity_ids_encountered_by_type[entity_type].add(entity.entity_id)
             unique_entities.append(entity)
 
+        # Merge the sorted ID runs frozen by this batch off the event loop
+        await self._encountered_ids.compact()
+
         # Update progress with skip count
         if skipped_count > 0:
             await sync_context.progress.increment("skipped", skipped_count)
@@ -223,11 +340,60 @@ class EntityPipeline:
 
         # Update entity encounter tracking for orphan detection
         await sync_context.progress.update_entities_encountered_count(
-            self._entity_ids_encountered_by_type
+            self._encountered_ids.counts()
         )
 
         return unique_entities
 
+    @staticmethod
+    def _orphan_cleanup_may_run(sync_context: SyncContext) -> bool:
+        """Whether this sync can end with orphan cleanup (see SyncOrchestrator).
+
+        Cleanup is skipped only for incremental syncs: continuous sources with cursor
+        data that are not forced into a full sync. Cursor data present now is still
+        present at the end, so a False here is final.
+        """
+        cursor = getattr(sync_context, "cursor", None)
+        has_cursor_data = bool(cursor and cursor.cursor_data)
+        supports_continuous = getattr(sync_context.source, "_supports_continuous", False)
+        return (
+            getattr(sync_context, "force_full_sync", False)
+            or not has_cursor_data
+            or not supports_continuous
+        )
+
+    async def _mark_encountered(
+        self, entities: List[BaseEntity], sync_context: SyncContext
+    ) -> None:
+        """Stamp stored rows of encountered entities with the current sync job.
+
+        Runs before hashing and conversion so entities that later fail processing are
+        still considered encountered and survive orphan cleanup. Skipped on incremental
+        syncs, where cleanup never runs.
+        """
+        if not entities or not self._orphan_cleanup_may_run(sync_context):
+            return
+
+        entity_ids = [entity.entity_id for entity in entities]
+
+        async def _stamp():
+            async with get_db_context() as db:
+                await crud.entity.bulk_update_sync_job_id(
+                    db,
+                    sync_id=sync_context.sync.id,
+                    entity_ids=entity_ids,
+                    sync_job_id=sync_context.sync_job.id,
+                )
+                await db.commit()
+
+        try:
+            await self._with_deadlock_retry(_stamp, sync_context)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            sync_context.logger.error(f"Failed to mark encountered entities: {e}")
+            raise SyncFailureError(f"Failed to mark encountered entities: {e}")
+
     # ------------------------------------------------------------------------------------
     # Early Metadata Enrichment
     # ------------------------------------------------------------------------------------
@@ -563,11 +729,11 @@ class EntityPipeline:
         sync_context.logger.debug(
             f"Deleting {len(parent_ids_to_delete)} entities from destinations"
         )
-        for dest in sync_context.destinations:
-            try:
-                await dest.bulk_delete_by_parent_ids(parent_ids_to_delete, sync_context.sync.id)
-            except Exception as e:
-                raise SyncFailureError(f"Destination delete failed: {e}")
+        await self._run_on_destinations(
+            "delete",
+            lambda dest: dest.bulk_delete_by_parent_ids(parent_ids_to_delete, sync_context.sync.id),
+            sync_context,
+        )
 
         # Delete from database
         existing_map = partitions["existing_map"]
@@ -717,10 +883,10 @@ class EntityPipeline:
 
         # Map extensions to converter modules
         converter_map = {
-            # Mistral OCR - Documents
-            ".pdf": converters.mistral_converter,
-            ".docx": converters.mistral_converter,
-            ".pptx": converters.mistral_converter,
+            # Documents - local text layer, Mistral OCR only for pages that need it
+            ".pdf": converters.text_layer_converter,
+            ".docx": converters.text_layer_converter,
+            ".pptx": converters.text_layer_converter,
             # Mistral OCR - Images
             ".jpg": converters.mistral_converter,
             ".jpeg": converters.mistral_converter,
@@ -810,56 +976,83 @@ class EntityPipeline:
                     continue
 
         # Step 3: Batch convert each partition and append to entities
-        # Process in smaller sub-batches for progressive completion (especially for Mistral)
+        # Process in smaller sub-batches for progressive completion (especially for Mistral).
+        # OCR-backed sub-batches run concurrently: Mistral OCR coalesces them (with
+        # sub-batches from other workers and syncs) into shared batch jobs instead of one
+        # job each. Other converters gain nothing from overlap and run one at a time.
+        from airweave.platform import converters
+
         CONVERTER_BATCH_SIZE = 10  # Max files per converter batch (prevents waterfall delay)
+        coalesced_converters = (converters.mistral_converter, converters.text_layer_converter)
 
-        for converter, file_entities in converter_groups.items():
-            # Split into sub-batches to avoid blocking on large Mistral uploads
-            for i in range(0, len(file_entities), CONVERTER_BATCH_SIZE):
-                sub_batch = file_entities[i : i + CONVERTER_BATCH_SIZE]
-                file_paths = [e.local_path for e in sub_batch]
+        async def _convert_sub_batch(converter, sub_batch: List[BaseEntity]) -> None:
+            file_paths = [e.local_path for e in sub_batch]
 
-                try:
-                    # Batch convert returns Dict[file_path, text_content]
-                    results = await converter.convert_batch(file_paths)
-
-                    # Append content to each entity's textual_representation
-                    # Track entities that fail (None results)
-                    for entity in sub_batch:
-                        text_content = results.get(entity.local_path)
-
-                        if not text_content:
-                            sync_context.logger.warning(
-                                f"Conversion returned no content for "
-                                f"{entity.__class__.__name__}[{entity.entity_id}] "
-                                f"at {entity.local_path} - entity will be skipped"
-                            )
-                            # Mark for removal - don't process this entity further
-                            failed_entities.append(entity)
-                            continue
+            try:
+                # Batch convert returns Dict[file_path, text_content]
+                results = await converter.convert_batch(file_paths)
 
-                        # Append content section
-                        entity.textual_representation += f"\n\n# Content\n\n{text_content}"
+                # Append content to each entity's textual_representation
+                # Track entities that fail (None results)
+                for entity in sub_batch:
+                    text_content = results.get(entity.local_path)
 
-                except SyncFailureError:
-                    # Infrastructure failure from converter - propagate to fail entire sync
-                    raise
-                except Exception as e:
-                    # Unexpected errors - mark entire sub-batch as failed but continue
-                    converter_name = converter.__class__.__name__
-                    sync_context.logger.error(
-                        f"Batch conversion failed for {converter_name} sub-batch: {e}",
-                        exc_info=True,
-                    )
-                    # Mark all entities in this sub-batch as failed
-                    failed_entities.extend(sub_batch)
-                    # Log each entity being skipped
-                    for entity in sub_batch:
+                    if not text_content:
                         sync_context.logger.warning(
-                            f"Skipping {entity.__class__.__name__}[{entity.entity_id}] "
-                            f"due to batch failure"
+                            f"Conversion returned no content for "
+                            f"{entity.__class__.__name__}[{entity.entity_id}] "
+                            f"at {entity.local_path} - entity will be skipped"
                         )
-                    # Don't raise - continue with other sub-batches/converters
+                        # Mark for removal - don't process this entity further
+                        failed_entities.append(entity)
+                        continue
+
+                    # Append content section
+                    entity.textual_representation += f"\n\n# Content\n\n{text_content}"
+
+            except SyncFailureError:
+                # Infrastructure failure from converter - propagate to fail entire sync
+                raise
+            except Exception as e:
+                # Unexpected errors - mark entire sub-batch as failed but continue
+                converter_name = converter.__class__.__name__
+                sync_context.logger.error(
+                    f"Batch conversion failed for {converter_name} sub-batch: {e}",
+                    exc_info=True,
+                )
+                # Mark all entities in this sub-batch as failed
+                failed_entities.extend(sub_batch)
+                # Log each entity being skipped
+                for entity in sub_batch:
+                    sync_context.logger.warning(
+                        f"Skipping {entity.__class__.__name__}[{entity.entity_id}] "
+                        f"due to batch failure"
+                    )
+                # Don't raise - continue with other sub-batches/converters
+
+        for converter, file_entities in converter_groups.items():
+            sub_batches = [
+                file_entities[i : i + CONVERTER_BATCH_SIZE]
+                for i in range(0, len(file_entities), CONVERTER_BATCH_SIZE)
+            ]
+            if converter not in coalesced_converters:
+                for sub_batch in sub_batches:
+                    await _convert_sub_batch(converter, sub_batch)
+                continue
+
+            tasks = [
+                asyncio.create_task(_convert_sub_batch(converter, sub_batch))
+                for sub_batch in sub_batches
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Sync is failing: stop sibling uploads/OCR instead of leaving them running,
+                # and let their cleanup (temp files, Mistral uploads) finish first
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
 
         # Remove failed entities from the entities list and mark as skipped
         # This cleanup ALWAYS runs now since we don't raise exceptions above
@@ -903,8 +1096,6 @@ class EntityPipeline:
                 failed_entities.append(entity)
                 continue
 
-            original_entity_id = entity.entity_id
-
             # Create one new entity per chunk
             for chunk_idx, chunk in enumerate(chunks):
                 if not chunk["text"] or not chunk["text"].strip():
@@ -914,18 +1105,13 @@ class EntityPipeline:
                     failed_entities.append(entity)
                     break
 
-                chunk_entity = entity.model_copy(deep=True)
-                chunk_entity.textual_representation = chunk["text"]
-
-                # Set unique chunk entity_id
-                chunk_entity.entity_id = f"{original_entity_id}__chunk_{chunk_idx}"
-
-                # Set system metadata
-                if chunk_entity.airweave_system_metadata is None:
+                if entity.airweave_system_metadata is None:
                     raise SyncFailureError(f"No metadata for {entity.entity_id}")
 
-                chunk_entity.airweave_system_metadata.chunk_index = chunk_idx
-                chunk_entity.airweave_system_metadata.original_entity_id = original_entity_id
+                # Shallow chunk: shares the parent's fields, only text/id/metadata are new
+                chunk_entity = entity.create_chunk(
+                    chunk_idx, chunk["text"], token_count=chunk.get("token_count")
+                )
 
                 chunk_entities.append(chunk_entity)
 
@@ -952,59 +1138,60 @@ class EntityPipeline:
 
     async def _filter_unsupported_code_languages(
         self, entities: List[BaseEntity], sync_context: SyncContext
-    ) -> Tuple[List[BaseEntity], List[BaseEntity]]:
+    ) -> Tuple[List[BaseEntity], List[Optional[str]], List[BaseEntity]]:
         """Filter code entities to find those with unsupported tree-sitter languages.
 
-        Uses Magika to detect language from textual_representation, then validates
-        tree-sitter support.
+        Uses the process-wide CodeLanguageDetector: the file extension is tried first,
+        then Magika on textual_representation. Tree-sitter support is validated with
+        cached parser lookups.
 
         Returns:
-            Tuple of (supported_entities, unsupported_entities)
+            Tuple of (supported_entities, languages, unsupported_entities), where
+            languages[i] is the detected language of supported_entities[i] (None if
+            detection is unavailable and the chunker should detect it)
         """
         code_entities = [e for e in entities if isinstance(e, CodeFileEntity)]
         if not code_entities:
-            return entities, []
+            return entities, [None] * len(entities), []
+
+        from airweave.platform.chunkers.language_detection import CodeLanguageDetector
 
+        detector = CodeLanguageDetector()
         try:
-            from magika import Magika
-            from tree_sitter_language_pack import get_parser
+            # Model inference is blocking; keep it off the event loop
+            languages = await run_in_thread_pool(
+                detector.detect_batch,
+                [e.textual_representation for e in code_entities],
+                [getattr(e, "path_in_repo", None) or e.name for e in code_entities],
+            )
         except ImportError:
             sync_context.logger.warning(
                 "Magika or tree-sitter not available - cannot validate language support"
             )
-            return entities, []
+            return entities, [None] * len(entities), []
 
-        magika = Magika()
         supported = []
+        supported_languages: List[Optional[str]] = []
         unsupported = []
 
-        for entity in code_entities:
-            try:
-                # Detect language from raw code (same as Chonkie)
-                text_bytes = entity.textual_representation.encode("utf-8")
-                result = magika.identify_bytes(text_bytes)
-                detected_lang = result.output.label.lower()
-
-                # Try to get parser to validate support
-                try:
-                    get_parser(detected_lang)
-                    supported.append(entity)
-                    sync_context.logger.debug(
-                        f"Language {detected_lang} supported for {entity.name}"
-                    )
-                except LookupError:
-                    unsupported.append(entity)
-                    sync_context.logger.warning(
-                        f"Tree-sitter does not support language '{detected_lang}' "
-                        f"for {entity.name} - skipping entity"
-                    )
-            except Exception as e:
+        for entity, detected_lang in zip(code_entities, languages, strict=True):
+            if detected_lang is None:
                 sync_context.logger.warning(
-                    f"Language detection failed for {entity.entity_id}: {e} - skipping"
+                    f"Language detection failed for {entity.entity_id} - skipping"
                 )
                 unsupported.append(entity)
+            elif detector.is_supported(detected_lang):
+                supported.append(entity)
+                supported_languages.append(detected_lang)
+                sync_context.logger.debug(f"Language {detected_lang} supported for {entity.name}")
+            else:
+                unsupported.append(entity)
+                sync_context.logger.warning(
+                    f"Tree-sitter does not support language '{detected_lang}' "
+                    f"for {entity.name} - skipping entity"
+                )
 
-        return supported, unsupported
+        return supported, supported_languages, unsupported
 
     async def _chunk_code_entities(
         self, entities: List[BaseEntity], sync_context: SyncContext
@@ -1013,9 +1200,11 @@ class EntityPipeline:
         from airweave.platform.chunkers.code import CodeChunker
 
         # Filter out entities with unsupported languages
-        supported_entities, unsupported_entities = await self._filter_unsupported_code_languages(
-            entities, sync_context
-        )
+        (
+            supported_entities,
+            languages,
+            unsupported_entities,
+        ) = await self._filter_unsupported_code_languages(entities, sync_context)
 
         # Skip unsupported entities
         if unsupported_entities:
@@ -1037,7 +1226,8 @@ class EntityPipeline:
         )
 
         try:
-            chunk_lists = await chunker.chunk_batch(texts)
+            # Pass detected languages through so Chonkie does not re-detect them
+            chunk_lists = await chunker.chunk_batch(texts, languages=languages)
         except SyncFailureError:
             raise
         except Exception as e:
@@ -1112,20 +1302,18 @@ class EntityPipeline:
             )
             all_chunk_entities.extend(textual_chunk_entities)
 
-        # Log statistics
-        if all_chunk_entities:
-            import tiktoken
-
-            tokenizer = tiktoken.get_encoding("cl100k_base")
+        # Log statistics (from the chunkers' token counts; skipped unless debug logging)
+        if all_chunk_entities and sync_context.logger.isEnabledFor(logging.DEBUG):
             token_counts = [
-                len(tokenizer.encode(chunk_entity.textual_representation))
+                chunk_entity.chunk_token_count
                 for chunk_entity in all_chunk_entities
+                if chunk_entity.chunk_token_count is not None
             ]
-
-            sync_context.logger.debug(
-                f"Chunk statistics: min={min(token_counts)}, max={max(token_counts)}, "
-                f"avg={sum(token_counts) / len(token_counts):.1f} tokens"
-            )
+            if token_counts:
+                sync_context.logger.debug(
+                    f"Chunk statistics: min={min(token_counts)}, max={max(token_counts)}, "
+                    f"avg={sum(token_counts) / len(token_counts):.1f} tokens"
+                )
 
         sync_context.logger.debug(
             f"Entity multiplication: {len(entities)} → {len(all_chunk_entities)} chunk entities"
@@ -1161,16 +1349,26 @@ class EntityPipeline:
         dense_texts = [e.textual_representation for e in chunk_entities]
 
         # Prepare sparse texts (JSON stringify entire entity excluding metadata)
+        # Parent fields are serialized once per parent and shared across its chunks
         sparse_texts = []
+        parent_payloads: Dict[int, Dict[str, Any]] = {}
         for entity in chunk_entities:
-            entity_dict = entity.model_dump(mode="json", exclude={"airweave_system_metadata"})
+            entity_dict = entity.to_payload(
+                parent_payloads, exclude_none=False, include_system_metadata=False
+            )
             sparse_texts.append(json.dumps(entity_dict, sort_keys=True))
 
         # Compute dense embeddings (always required)
         from airweave.platform.embedders import DenseEmbedder
 
         dense_embedder = DenseEmbedder()
-        dense_embeddings = await dense_embedder.embed_many(dense_texts, sync_context)
+        # Reuse the chunkers' token counts for request packing (None → embedder counts)
+        token_counts = [e.chunk_token_count for e in chunk_entities]
+        dense_embeddings = await dense_embedder.embed_many(
+            dense_texts,
+            sync_context,
+            token_counts=None if None in token_counts else token_counts,
+        )
 
         # Compute sparse embeddings (only if destination supports keyword index)
         sparse_embeddings = None
@@ -1230,27 +1428,108 @@ class EntityPipeline:
         if partitions["updates"]:
             parent_ids_to_clear.extend([e.entity_id for e in partitions["updates"]])
 
-        # Clear old chunks for updates
         if parent_ids_to_clear:
             sync_context.logger.debug(
                 f"Clearing {len(parent_ids_to_clear)} updated entities from destinations"
             )
-            for dest in sync_context.destinations:
-                try:
-                    await dest.bulk_delete_by_parent_ids(parent_ids_to_clear, sync_context.sync.id)
-                except Exception as e:
-                    raise SyncFailureError(f"Destination clear failed: {e}")
-
-        # Insert new chunks
         sync_context.logger.debug(f"Inserting {len(chunk_entities)} chunk entities to destinations")
-        for dest in sync_context.destinations:
-            try:
-                await dest.bulk_insert(chunk_entities)
-            except Exception as e:
-                raise SyncFailureError(f"Destination insert failed: {e}")
+
+        # Per destination: clear old chunks for updates, then insert new chunks.
+        # Destinations are written concurrently; both steps are idempotent (deterministic
+        # point IDs), so a failed destination can safely be retried as a unit.
+        async def _write(dest: BaseDestination) -> None:
+            if parent_ids_to_clear:
+                await dest.bulk_delete_by_parent_ids(parent_ids_to_clear, sync_context.sync.id)
+            await dest.bulk_insert(chunk_entities)
+
+        await self._run_on_destinations("insert", _write, sync_context)
 
         sync_context.logger.debug("Destination persistence complete (commit point)")
 
+    async def _run_on_destinations(
+        self,
+        operation: str,
+        write: Callable[[BaseDestination], Awaitable[None]],
+        sync_context: SyncContext,
+    ) -> None:
+        """Run a write on all destinations concurrently (COMMIT RULE: all must succeed).
+
+        Each destination's outcome is tracked separately. Destinations that fail are
+        retried with backoff (writes are idempotent); destinations that already succeeded
+        are not re-run. If any destination still fails, the batch fails with
+        SyncFailureError - Postgres is only updated after this succeeds, so the affected
+        entities are re-processed (compensated) by the next sync.
+
+        Args:
+            operation: Operation name for logging/errors (e.g. "insert", "delete")
+            write: Coroutine factory performing the write on one destination
+            sync_context: Sync context with destinations and logger
+
+        Raises:
+            SyncFailureError: If any destination fails after all attempts
+        """
+        pending = list(sync_context.destinations)
+        errors: Dict[str, BaseException] = {}
+
+        for attempt in range(1, self.DESTINATION_WRITE_MAX_ATTEMPTS + 1):
+            results = await asyncio.gather(
+                *[write(dest) for dest in pending], return_exceptions=True
+            )
+
+            failed = []
+            errors = {}
+            for dest, result in zip(pending, results, strict=True):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                if isinstance(result, BaseException):
+                    failed.append(dest)
+                    errors[dest.__class__.__name__] = result
+
+            if not failed:
+                return
+
+            if attempt < self.DESTINATION_WRITE_MAX_ATTEMPTS:
+                wait_time = self.DESTINATION_WRITE_RETRY_BASE_DELAY * (2 ** (attempt - 1))
+                sync_context.logger.warning(
+                    f"Destination {operation} failed for {list(errors)} "
+                    f"({len(pending) - len(failed)}/{len(pending)} succeeded), retrying failed "
+                    f"destinations in {wait_time}s (attempt {attempt}/"
+                    f"{self.DESTINATION_WRITE_MAX_ATTEMPTS}): {errors}"
+                )
+                await asyncio.sleep(wait_time)
+            pending = failed
+
+        raise SyncFailureError(
+            f"Destination {operation} failed for {list(errors)}: "
+            + "; ".join(f"{name}: {error}" for name, error in errors.items())
+        )
+
+    async def _with_deadlock_retry(
+        self,
+        operation: Callable[[], Awaitable[Any]],
+        sync_context: SyncContext,
+        max_retries: int = 3,
+    ) -> Any:
+        """Run a DB operation, retrying with backoff when Postgres reports a deadlock."""
+        from sqlalchemy.exc import DBAPIError
+
+        for attempt in range(max_retries + 1):
+            try:
+                return await operation()
+            except DBAPIError as e:
+                error_msg = str(e).lower()
+                is_deadlock = "deadlock detected" in error_msg
+
+                if is_deadlock and attempt < max_retries:
+                    wait_time = 0.1 * (2**attempt)
+                    sync_context.logger.warning(
+                        f"Deadlock detected, retrying in {wait_time}s "
+                        f"(attempt {attempt + 1}/{max_retries})"
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise
+
     async def _persist_to_database(  # noqa: C901
         self,
         partitions: Dict[str, Any],
@@ -1260,8 +1539,6 @@ class EntityPipeline:
 
         Deletes handled separately in _handle_deletes().
         """
-        from sqlalchemy.exc import DBAPIError
-
         from airweave import crud, schemas
         from airweave.db.session import get_db_context
 
@@ -1272,25 +1549,6 @@ class EntityPipeline:
         if not inserts and not updates:
             return
 
-        # Retry wrapper for deadlock handling
-        async def _with_deadlock_retry(operation, max_retries=3):
-            for attempt in range(max_retries + 1):
-                try:
-                    return await operation()
-                except DBAPIError as e:
-                    error_msg = str(e).lower()
-                    is_deadlock = "deadlock detected" in error_msg
-
-                    if is_deadlock and attempt < max_retries:
-                        wait_time = 0.1 * (2**attempt)
-                        sync_context.logger.warning(
-                            f"Deadlock detected, retrying in {wait_time}s "
-                            f"(attempt {attempt + 1}/{max_retries})"
-                        )
-                        await asyncio.sleep(wait_time)
-                        continue
-                    raise
-
         async def _execute_db_operations():  # noqa: C901
             async with get_db_context() as db:
                 # Handle INSERTs
@@ -1360,14 +1618,16 @@ class EntityPipeline:
                         update_pairs.append((db_id, new_hash))
 
                     if update_pairs:
-                        await crud.entity.bulk_update_hash(db, rows=update_pairs)
+                        await crud.entity.bulk_update_hash(
+                            db, rows=update_pairs, sync_job_id=sync_context.sync_job.id
+                        )
                         sync_context.logger.debug(f"Updated {len(update_pairs)} hashes")
 
                 # Commit the transaction
                 await db.commit()
 
         # Execute with deadlock retry
-        await _with_deadlock_retry(_execute_db_operations)
+        await self._with_deadlock_retry(_execute_db_operations, sync_context)
 
         # Update entity state tracker for real-time UI updates via pubsub
         if hasattr(sync_context, "entity_state_tracker") and sync_context.entity_state_tracker:
@@ -7,7 +7,7 @@ from airweave import schemas
 from airweave.analytics import business_events
 from airweave.core.datetime_utils import utc_now_naive
 from airweave.core.exceptions import PaymentRequiredException, UsageLimitExceededException
-from airweave.core.guard_rail_service import ActionType
+from airweave.core.guard_rail_service import ActionType, QuotaLease
 from airweave.core.shared_models import SyncJobStatus
 from airweave.core.sync_cursor_service import sync_cursor_service
 from airweave.core.sync_job_service import sync_job_service
@@ -18,6 +18,7 @@ from airweave.platform.sync.exceptions import EntityProcessingError, SyncFailure
 from airweave.platform.sync.stream import AsyncSourceStream
 from airweave.platform.sync.worker_pool import AsyncWorkerPool
 from airweave.platform.utils.error_utils import get_error_message
+from airweave.search.temporal_bounds import temporal_bounds_cache
 
 
 class SyncOrchestrator:
@@ -80,9 +81,20 @@ class SyncOrchestrator:
             final_status = SyncJobStatus.FAILED
             raise
         finally:
+            # Always stop the entity pipeline's stage workers
+            try:
+                await self.entity_pipeline.shutdown()
+            except Exception as shutdown_error:
+                self.sync_context.logger.error(
+                    f"Failed to stop entity pipeline stages: {shutdown_error}", exc_info=True
+                )
+
             # Always finalize progress and trackers with error message if available
             await self._finalize_progress_and_trackers(final_status, error_message)
 
+            # Data may have been written even if the job failed: drop cached search bounds
+            await temporal_bounds_cache.invalidate(self.sync_context.collection.id)
+
             # Always flush guard rail usage to prevent data loss
             try:
                 self.sync_context.logger.info("Flushing guard rail usage data...")
@@ -134,6 +146,9 @@ class SyncOrchestrator:
         stream_error: Optional[Exception] = None
         pending_tasks: set[asyncio.Task] = set()
 
+        # Entity quota is checked in leased blocks, not with a guard rail round trip per entity
+        entity_quota = QuotaLease(self.sync_context.guard_rail, ActionType.ENTITIES)
+
         # Micro-batch aggregation state
         batch_buffer: list = []
         flush_deadline: Optional[float] = None  # event-loop time when we must flush
@@ -142,7 +157,7 @@ class SyncOrchestrator:
             # Use the pre-created stream (already started in _start_sync)
             async for entity in self.stream.get_entities():
                 try:
-                    await self.sync_context.guard_rail.is_allowed(ActionType.ENTITIES)
+                    await entity_quota.consume()
                 except (UsageLimitExceededException, PaymentRequiredException) as guard_error:
                     self.sync_context.logger.error(
                         f"Guard rail check failed: {type(guard_error).__name__}: {str(guard_error)}"
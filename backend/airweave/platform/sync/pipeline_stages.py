@@ -0,0 +1,215 @@
+"""Staged execution for the entity pipeline.
+
+Micro-batches flow through a fixed sequence of stages (e.g. convert -> chunk -> embed ->
+persist) connected by bounded queues. Each stage runs its own pool of workers, so CPU
+work (chunking in the thread pool) and network work (embedding, destination and DB
+writes) of different batches overlap, and a slow stage applies backpressure upstream
+instead of letting work pile up in memory.
+
+A stage may coalesce several queued batches into a single handler call (up to a weight
+budget, e.g. number of chunks) - this lets the embed stage fill full-size API requests
+from many small entity batches.
+
+Callers submit a batch and await its completion, so errors surface to the submitting
+task exactly as if the stages had been awaited inline.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from airweave.core.logging import ContextualLogger
+
+
+@dataclass
+class StageSpec:
+    """Configuration of one pipeline stage.
+
+    Attributes:
+        name: Stage name (for logs and stats)
+        handler: Processes a list of payloads; returns the payloads to forward to the next
+            stage (payloads not returned are complete)
+        concurrency: Number of workers running the handler concurrently
+        queue_size: Max payloads waiting for this stage before upstream blocks
+        max_batch_weight: Coalesce queued payloads until their combined weight reaches this
+        weight: Weight of a payload (defaults to 1 per payload)
+    """
+
+    name: str
+    handler: Callable[[List[Any]], Awaitable[List[Any]]]
+    concurrency: int = 1
+    queue_size: int = 8
+    max_batch_weight: int = 1
+    weight: Callable[[Any], int] = field(default=lambda payload: 1)
+
+
+@dataclass
+class StageStats:
+    """Counters for one stage, used to spot the bottleneck."""
+
+    handled: int = 0  # payloads processed
+    calls: int = 0  # handler invocations (< handled when coalescing)
+    busy_seconds: float = 0.0  # time spent inside the handler, summed over workers
+    blocked_seconds: float = 0.0  # time spent waiting to enqueue into this stage
+
+
+class _Job:
+    __slots__ = ("payload", "future")
+
+    def __init__(self, payload: Any, future: asyncio.Future):
+        self.payload = payload
+        self.future = future
+
+
+class StagedPipeline:
+    """Runs payloads through stages connected by bounded queues.
+
+    Usage:
+        pipeline = StagedPipeline([StageSpec("convert", convert, concurrency=4), ...], logger)
+        await pipeline.submit(payload)  # returns when the payload left the last stage
+        await pipeline.shutdown()
+    """
+
+    def __init__(self, stages: List[StageSpec], logger: ContextualLogger):
+        """Initialize the pipeline (workers start on first submit)."""
+        if not stages:
+            raise ValueError("StagedPipeline requires at least one stage")
+        self.stages = stages
+        self.logger = logger
+        self.stats: Dict[str, StageStats] = {stage.name: StageStats() for stage in stages}
+
+        self._queues: List[asyncio.Queue] = []
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._workers:
+            if self._loop is not loop:
+                raise RuntimeError("StagedPipeline cannot be shared across event loops")
+            return
+
+        self._loop = loop
+        self._queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        for index, stage in enumerate(self.stages):
+            for worker in range(stage.concurrency):
+                self._workers.append(
+                    loop.create_task(
+                        self._run_worker(index), name=f"pipeline-{stage.name}-{worker}"
+                    )
+                )
+
+    async def submit(self, payload: Any) -> None:
+        """Submit a payload and wait until it has left the last stage.
+
+        Raises:
+            Exception: Whatever a stage handler raised for this payload
+        """
+        self._ensure_started()
+        job = _Job(payload, self._loop.create_future())
+        await self._enqueue(0, job)
+        await job.future
+
+    async def _enqueue(self, index: int, job: _Job) -> None:
+        queue = self._queues[index]
+        if not queue.full():
+            queue.put_nowait(job)
+            return
+
+        # Downstream is saturated: wait (backpressure) and account for it
+        start = time.monotonic()
+        await queue.put(job)
+        self.stats[self.stages[index].name].blocked_seconds += time.monotonic() - start
+
+    async def _take(self, index: int) -> List[_Job]:
+        """Take one job, then coalesce already-queued jobs up to the stage's weight budget."""
+        stage = self.stages[index]
+        queue = self._queues[index]
+
+        jobs = [await queue.get()]
+        weight = stage.weight(jobs[0].payload)
+        while weight < stage.max_batch_weight and not queue.empty():
+            job = queue.get_nowait()
+            jobs.append(job)
+            weight += stage.weight(job.payload)
+
+        # Drop jobs whose submitter was cancelled meanwhile
+        return [job for job in jobs if not job.future.done()]
+
+    async def _run_worker(self, index: int) -> None:
+        is_last = index == len(self.stages) - 1
+        while True:
+            jobs = await self._take(index)
+            if not jobs:
+                continue
+
+            forwarded = await self._handle(index, jobs)
+            if forwarded is None:
+                continue
+
+            forwarded_ids = {id(payload) for payload in forwarded}
+            for job in jobs:
+                if job.future.done():
+                    continue
+                if is_last or id(job.payload) not in forwarded_ids:
+                    job.future.set_result(None)
+                else:
+                    await self._enqueue(index + 1, job)
+
+    async def _handle(self, index: int, jobs: List[_Job]) -> Optional[List[Any]]:
+        """Run the stage handler; on error fail the jobs' futures and return None."""
+        stage = self.stages[index]
+        stats = self.stats[stage.name]
+        start = time.monotonic()
+        try:
+            return await stage.handler([job.payload for job in jobs])
+        except asyncio.CancelledError:
+            for job in jobs:
+                if not job.future.done():
+                    job.future.cancel()
+            raise
+        except Exception as e:
+            for job in jobs:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            return None
+        finally:
+            stats.calls += 1
+            stats.handled += len(jobs)
+            stats.busy_seconds += time.monotonic() - start
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Payloads currently waiting for each stage."""
+        return {
+            stage.name: queue.qsize()
+            for stage, queue in zip(self.stages, self._queues, strict=True)
+        }
+
+    def log_stats(self) -> None:
+        """Log per-stage counters (busy time vs time upstream spent blocked on the stage)."""
+        parts = []
+        for name, stats in self.stats.items():
+            parts.append(
+                f"{name}: {stats.handled} batches in {stats.calls} calls, "
+                f"busy {stats.busy_seconds:.1f}s, backpressure {stats.blocked_seconds:.1f}s"
+            )
+        self.logger.info("Pipeline stage stats - " + "; ".join(parts))
+
+    async def shutdown(self) -> None:
+        """Stop all stage workers and fail any payloads still queued."""
+        if not self._workers:
+            return
+
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        for queue in self._queues:
+            while not queue.empty():
+                job = queue.get_nowait()
+                if not job.future.done():
+                    job.future.cancel()
+
+        self.log_stats()
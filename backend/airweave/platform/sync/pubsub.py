@@ -127,15 +127,10 @@ class SyncProgress:
         """Convert progress to a dictionary."""
         return self.stats.model_dump()
 
-    async def update_entities_encountered_count(
-        self, entities_encountered: dict[str, set[str]]
-    ) -> None:
-        """Update the entities encountered tracking."""
+    async def update_entities_encountered_count(self, entities_encountered: dict[str, int]) -> None:
+        """Update the entities encountered tracking (distinct entity IDs per type)."""
         async with self._lock:  # Synchronize this as well
-            self.stats.entities_encountered = {
-                entity_type: len(entity_ids)
-                for entity_type, entity_ids in entities_encountered.items()
-            }
+            self.stats.entities_encountered = dict(entities_encountered)
 
     async def _log_status_update(self, total_ops: int) -> None:
         """Log a periodic status update.
@@ -1,7 +1,7 @@
 """Search schemas for Airweave's search API."""
 
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 from qdrant_client.http.models import Filter as QdrantFilter
@@ -15,6 +15,13 @@ class RetrievalStrategy(str, Enum):
     KEYWORD = "keyword"
 
 
+class FusionStrategy(str, Enum):
+    """Strategies for fusing multi-query (and hybrid) candidate lists."""
+
+    RRF = "rrf"
+    DBSF = "dbsf"
+
+
 class SearchRequest(BaseModel):
     """Search request schema."""
 
@@ -29,6 +36,25 @@ class SearchRequest(BaseModel):
     offset: Optional[int] = Field(default=None, description="Number of results to skip")
     limit: Optional[int] = Field(default=None, description="Maximum number of results to return")
 
+    fusion_strategy: Optional[FusionStrategy] = Field(
+        default=None,
+        description=(
+            "How candidates of the query variations are fused: reciprocal rank fusion (rrf) "
+            "or distribution-based score fusion (dbsf)"
+        ),
+    )
+    prefetch_limit: Optional[int] = Field(
+        default=None,
+        description=(
+            "Candidates fetched per query variation and index before fusion; "
+            "higher improves recall at the cost of latency"
+        ),
+    )
+    hnsw_ef: Optional[int] = Field(
+        default=None,
+        description="HNSW ef for neural search; higher improves recall at the cost of latency",
+    )
+
     temporal_relevance: Optional[float] = Field(
         default=None,
         description=(
@@ -40,6 +66,20 @@ class SearchRequest(BaseModel):
     expand_query: Optional[bool] = Field(
         default=None, description="Generate a few query variations to improve recall"
     )
+    speculative_expansion: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Search with the original query while query variations are being generated, "
+            "then merge in the results of the variations"
+        ),
+    )
+    expansion_latency_budget_ms: Optional[int] = Field(
+        default=None,
+        description=(
+            "Milliseconds query expansion may take (including searching the variations); "
+            "expansion results that miss the deadline are skipped"
+        ),
+    )
     interpret_filters: Optional[bool] = Field(
         default=None, description="Extract structured filters from natural-language query"
     )
@@ -54,6 +94,21 @@ class SearchRequest(BaseModel):
         default=None, description="Generate a natural-language answer to the query"
     )
 
+    project_payloads: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Fetch only IDs, scores and a few fields for candidate results; payloads are "
+            "loaded for the returned results only"
+        ),
+    )
+    hydrate_fields: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Payload fields loaded for the returned results when project_payloads is enabled "
+            "(all fields if omitted)"
+        ),
+    )
+
 
 class SearchDefaults(BaseModel):
     """Default values for search parameters loaded from YAML."""
@@ -61,11 +116,17 @@ class SearchDefaults(BaseModel):
     retrieval_strategy: RetrievalStrategy
     offset: int
     limit: int
+    fusion_strategy: FusionStrategy
+    prefetch_limit: Optional[int]
+    hnsw_ef: Optional[int]
     temporal_relevance: float
     expand_query: bool
+    speculative_expansion: bool
+    expansion_latency_budget_ms: Optional[int]
     interpret_filters: bool
     rerank: bool
     generate_answer: bool
+    project_payloads: bool
 
 
 class SearchResponse(BaseModel):
@@ -11,8 +11,10 @@ if TYPE_CHECKING:
     from airweave.search.emitter import EventEmitter
     from airweave.search.operations import (
         EmbedQuery,
+        ExpansionRetrieval,
         FederatedSearch,
         GenerateAnswer,
+        PayloadHydration,
         QueryExpansion,
         QueryInterpretation,
         Reranking,
@@ -46,6 +48,10 @@ class SearchContext(BaseModel):
     user_filter: Optional[UserFilter] = Field()
     temporal_relevance: Optional[TemporalRelevance] = Field()
     retrieval: Optional[Retrieval] = Field()
+    # Only set for speculative searches (expanded queries are searched after Retrieval)
+    expansion_retrieval: Optional[ExpansionRetrieval] = Field(default=None)
     federated_search: Optional[FederatedSearch] = Field()
     reranking: Optional[Reranking] = Field()
+    # Only set when payloads are projected (final results are hydrated before answering)
+    payload_hydration: Optional[PayloadHydration] = Field(default=None)
     generate_answer: Optional[GenerateAnswer] = Field()
@@ -1,11 +1,31 @@
 """Event emitter for streaming search events."""
 
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from airweave.core.pubsub import core_pubsub
 
 
+class EventBuffer:
+    """Holds events emitted by one concurrently running operation.
+
+    The orchestrator runs independent operations in parallel but publishes their
+    events in execution order: an operation's events are buffered until every
+    operation before it has finished, after which the buffer is released and
+    further events stream live.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unreleased buffer."""
+        self.events: List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]] = []
+        self.released = False
+
+
+# Buffer of the operation running in the current task (None: publish directly)
+_active_buffer: ContextVar[Optional[EventBuffer]] = ContextVar("search_event_buffer", default=None)
+
+
 class EventEmitter:
     """Event emitter for search operations.
 
@@ -44,6 +64,36 @@ class EventEmitter:
         if not self.stream:
             return
 
+        buffer = _active_buffer.get()
+        if buffer is not None and not buffer.released:
+            buffer.events.append((event_type, data, op_name))
+            return
+
+        await self._publish(event_type, data, op_name)
+
+    def buffer_events(self, buffer: EventBuffer) -> None:
+        """Hold events emitted from the current task in `buffer` until it is released.
+
+        Must be called inside the task whose events should be held (context
+        variables are copied into tasks when they are created). Events emitted into
+        an already released buffer are published directly.
+        """
+        _active_buffer.set(buffer)
+
+    async def release(self, buffer: EventBuffer) -> None:
+        """Publish the buffered events in order and switch the buffer to live mode."""
+        index = 0
+        # Events may still be appended while we await publishing
+        while index < len(buffer.events):
+            await self._publish(*buffer.events[index])
+            index += 1
+        buffer.released = True
+        buffer.events.clear()
+
+    async def _publish(
+        self, event_type: str, data: Optional[Dict[str, Any]], op_name: Optional[str]
+    ) -> None:
+        """Assign sequence numbers and publish one event."""
         # Increment sequences
         self._global_sequence += 1
         op_seq = None
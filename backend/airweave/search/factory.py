@@ -20,8 +20,10 @@ from airweave.search.emitter import EventEmitter
 from airweave.search.helpers import search_helpers
 from airweave.search.operations import (
     EmbedQuery,
+    ExpansionRetrieval,
     FederatedSearch,
     GenerateAnswer,
+    PayloadHydration,
     QueryExpansion,
     QueryInterpretation,
     Reranking,
@@ -29,6 +31,7 @@ from airweave.search.operations import (
     TemporalRelevance,
     UserFilter,
 )
+from airweave.search.profile import CollectionSearchProfile, search_profiles
 from airweave.search.providers._base import BaseProvider
 from airweave.search.providers.cerebras import CerebrasProvider
 from airweave.search.providers.cohere import CohereProvider
@@ -70,11 +73,11 @@ class SearchFactory:
         # Apply defaults and validate parameters
         params = self._apply_defaults_and_validate(search_request)
 
-        # Get collection sources
-        collection = await crud.collection.get(db, id=collection_id, ctx=ctx)
-        federated_sources = await self.get_federated_sources(db, collection, ctx)
+        # Get collection sources (cached profile; the collection was validated by the caller)
+        profile = await search_profiles.get(db, readable_collection_id, ctx)
+        federated_sources = await self.get_federated_sources(db, profile, ctx)
         has_federated_sources = bool(federated_sources)
-        has_vector_sources = await self._has_vector_sources(db, collection, ctx)
+        has_vector_sources = profile.has_vector_sources
 
         self._log_source_modes(ctx, federated_sources, has_vector_sources)
 
@@ -96,7 +99,7 @@ class SearchFactory:
         if params["temporal_weight"] > 0 and has_vector_sources:
             try:
                 temporal_supporting_sources = await self._get_temporal_supporting_sources(
-                    db, collection, ctx, emitter
+                    profile, ctx, emitter
                 )
             except Exception as e:
                 # If we can't determine source support, raise the error
@@ -112,6 +115,7 @@ class SearchFactory:
             has_vector_sources,
             search_request,
             temporal_supporting_sources,
+            profile.filterable_fields,
         )
 
         search_context = SearchContext(
@@ -150,11 +154,39 @@ class SearchFactory:
         if limit < 1:
             raise HTTPException(status_code=422, detail="limit must be >= 1")
 
+        fusion_strategy = (
+            search_request.fusion_strategy
+            if search_request.fusion_strategy is not None
+            else defaults.fusion_strategy
+        )
+        prefetch_limit = (
+            search_request.prefetch_limit
+            if search_request.prefetch_limit is not None
+            else defaults.prefetch_limit
+        )
+        hnsw_ef = search_request.hnsw_ef if search_request.hnsw_ef is not None else defaults.hnsw_ef
+        if prefetch_limit is not None and prefetch_limit < 1:
+            raise HTTPException(status_code=422, detail="prefetch_limit must be >= 1")
+        if hnsw_ef is not None and hnsw_ef < 1:
+            raise HTTPException(status_code=422, detail="hnsw_ef must be >= 1")
+
         expand_query = (
             search_request.expand_query
             if search_request.expand_query is not None
             else defaults.expand_query
         )
+        speculative_expansion = (
+            search_request.speculative_expansion
+            if search_request.speculative_expansion is not None
+            else defaults.speculative_expansion
+        )
+        expansion_latency_budget_ms = (
+            search_request.expansion_latency_budget_ms
+            if search_request.expansion_latency_budget_ms is not None
+            else defaults.expansion_latency_budget_ms
+        )
+        if expansion_latency_budget_ms is not None and expansion_latency_budget_ms < 1:
+            raise HTTPException(status_code=422, detail="expansion_latency_budget_ms must be >= 1")
         interpret_filters = (
             search_request.interpret_filters
             if search_request.interpret_filters is not None
@@ -166,6 +198,11 @@ class SearchFactory:
             if search_request.generate_answer is not None
             else defaults.generate_answer
         )
+        project_payloads = (
+            search_request.project_payloads
+            if search_request.project_payloads is not None
+            else defaults.project_payloads
+        )
         temporal_weight = (
             search_request.temporal_relevance
             if search_request.temporal_relevance is not None
@@ -181,10 +218,17 @@ class SearchFactory:
             "retrieval_strategy": retrieval_strategy,
             "offset": offset,
             "limit": limit,
+            "fusion_strategy": fusion_strategy,
+            "prefetch_limit": prefetch_limit,
+            "hnsw_ef": hnsw_ef,
             "expand_query": expand_query,
+            # Speculation only applies when there is an expansion to overlap with
+            "speculative_expansion": expand_query and speculative_expansion,
+            "expansion_latency_budget_ms": expansion_latency_budget_ms,
             "interpret_filters": interpret_filters,
             "rerank": rerank,
             "generate_answer": generate_answer,
+            "project_payloads": project_payloads,
             "temporal_weight": temporal_weight,
         }
 
@@ -253,6 +297,7 @@ class SearchFactory:
         has_vector_sources: bool,
         search_request: SearchRequest,
         temporal_supporting_sources: Optional[List[str]] = None,
+        filterable_fields: Optional[Dict[str, Dict[str, str]]] = None,
     ) -> Dict[str, Any]:
         """Build operation instances for the search context.
 
@@ -268,13 +313,25 @@ class SearchFactory:
                 - Non-empty list: Filter to these sources (some don't support temporal)
                 - Empty list: Skip operation (no sources support temporal)
                 - None: No filtering needed (temporal disabled or not checked)
+            filterable_fields: Field catalog per source from the collection's search profile
         """
+        speculative = params["speculative_expansion"] and has_vector_sources
+        project_payloads = params["project_payloads"] and has_vector_sources
         return {
             "query_expansion": (
-                QueryExpansion(providers=providers["expansion"]) if params["expand_query"] else None
+                QueryExpansion(
+                    providers=providers["expansion"],
+                    latency_budget_ms=params["expansion_latency_budget_ms"],
+                )
+                if params["expand_query"]
+                else None
             ),
             "query_interpretation": (
-                QueryInterpretation(providers=providers["interpretation"])
+                QueryInterpretation(
+                    providers=providers["interpretation"],
+                    filterable_fields=filterable_fields or {},
+                    speculative=speculative,
+                )
                 if (params["interpret_filters"] and has_vector_sources)
                 else None
             ),
@@ -282,6 +339,7 @@ class SearchFactory:
                 EmbedQuery(
                     strategy=params["retrieval_strategy"],
                     provider=providers["embed"],  # Single provider - embeddings must be consistent
+                    speculative=speculative,
                 )
                 if has_vector_sources
                 else None
@@ -308,10 +366,27 @@ class SearchFactory:
                     strategy=params["retrieval_strategy"],
                     offset=params["offset"],
                     limit=params["limit"],
+                    fusion_strategy=params["fusion_strategy"],
+                    prefetch_limit=params["prefetch_limit"],
+                    hnsw_ef=params["hnsw_ef"],
+                    project_payloads=project_payloads,
                 )
                 if has_vector_sources
                 else None
             ),
+            "expansion_retrieval": (
+                ExpansionRetrieval(
+                    strategy=params["retrieval_strategy"],
+                    offset=params["offset"],
+                    limit=params["limit"],
+                    fusion_strategy=params["fusion_strategy"],
+                    prefetch_limit=params["prefetch_limit"],
+                    hnsw_ef=params["hnsw_ef"],
+                    project_payloads=project_payloads,
+                )
+                if speculative
+                else None
+            ),
             "federated_search": (
                 FederatedSearch(
                     sources=federated_sources,
@@ -322,6 +397,9 @@ class SearchFactory:
                 else None
             ),
             "reranking": (Reranking(providers=providers["rerank"]) if params["rerank"] else None),
+            "payload_hydration": (
+                PayloadHydration(fields=search_request.hydrate_fields) if project_payloads else None
+            ),
             "generate_answer": (
                 GenerateAnswer(providers=providers["answer"]) if params["generate_answer"] else None
             ),
@@ -348,9 +426,11 @@ class SearchFactory:
             f"limit={params['limit']}, "
             f"temporal_weight={params['temporal_weight']}, \n"
             f"expand_query={params['expand_query']}, \n"
+            f"speculative_expansion={params['speculative_expansion']}, \n"
             f"interpret_filters={params['interpret_filters']}, \n"
             f"rerank={params['rerank']}, \n"
             f"generate_answer={params['generate_answer']}, \n"
+            f"project_payloads={params['project_payloads']}, \n"
         )
 
     def _get_available_api_keys(self) -> Dict[str, Optional[str]]:
@@ -497,36 +577,13 @@ class SearchFactory:
             f"[SearchFactory] Initialized {len(provider_list)} provider(s) for {operation_name}"
         )
 
-    async def _has_vector_sources(self, db: AsyncSession, collection, ctx: ApiContext) -> bool:
-        """Return True if collection has any non-federated (vector-backed) sources."""
-        try:
-            source_connections = await crud.source_connection.get_for_collection(
-                db, readable_collection_id=collection.readable_id, ctx=ctx
-            )
-            if not source_connections:
-                return False
-
-            for source_connection in source_connections:
-                source_model = await crud.source.get_by_short_name(db, source_connection.short_name)
-                if not source_model:
-                    raise ValueError(f"Source model not found for {source_connection.short_name}")
-                source_class = resource_locator.get_source(source_model)
-                if not getattr(source_class, "_federated_search", False):
-                    return True
-            return False
-        except Exception:
-            raise ValueError(
-                f"Error getting vector sources for collection {collection.readable_id}"
-            )
-
     async def _get_temporal_supporting_sources(
-        self, db: AsyncSession, collection, ctx: ApiContext, emitter: EventEmitter
+        self, profile: CollectionSearchProfile, ctx: ApiContext, emitter: EventEmitter
     ) -> List[str]:
         """Get list of source short_names that support temporal relevance.
 
         Args:
-            db: Database session
-            collection: Collection object
+            profile: Search profile of the collection
             ctx: API context
             emitter: Event emitter for skip notices
 
@@ -537,29 +594,13 @@ class SearchFactory:
         Raises:
             ValueError: If source connections or models cannot be retrieved
         """
-        source_connections = await crud.source_connection.get_for_collection(
-            db, readable_collection_id=collection.readable_id, ctx=ctx
-        )
-        if not source_connections:
-            raise ValueError(f"No source connections found for collection {collection.readable_id}")
-
-        supporting_sources = []
-        non_supporting_sources = []
-
-        for source_connection in source_connections:
-            source_model = await crud.source.get_by_short_name(db, source_connection.short_name)
-            if not source_model:
-                raise ValueError(
-                    f"Source model not found for short_name={source_connection.short_name}"
-                )
-
-            # Check if source supports temporal relevance
-            supports_temporal = getattr(source_model, "supports_temporal_relevance", True)
+        if not profile.source_short_names:
+            raise ValueError(
+                f"No source connections found for collection {profile.readable_collection_id}"
+            )
 
-            if supports_temporal:
-                supporting_sources.append(source_connection.short_name)
-            else:
-                non_supporting_sources.append(source_connection.short_name)
+        supporting_sources = list(profile.temporal_supporting_sources)
+        non_supporting_sources = list(profile.temporal_non_supporting_sources)
 
         # Log the results
         if supporting_sources:
@@ -709,28 +750,33 @@ class SearchFactory:
         return RerankModelConfig(**model_dict)
 
     async def get_federated_sources(
-        self, db: AsyncSession, collection, ctx: ApiContext
+        self, db: AsyncSession, profile: CollectionSearchProfile, ctx: ApiContext
     ) -> List[BaseSource]:
         """Get instantiated federated sources for a collection.
 
+        Only collections whose profile lists federated sources touch the database;
+        instances are created per request since they carry live credentials.
+
         Args:
             db: Database session
-            collection: Collection object
+            profile: Search profile of the collection
             ctx: API context
 
         Returns:
             List of instantiated source objects that support federated search
         """
+        if not profile.federated_sources:
+            return []
+
         try:
             source_connections = await crud.source_connection.get_for_collection(
-                db, readable_collection_id=collection.readable_id, ctx=ctx
+                db, readable_collection_id=profile.readable_collection_id, ctx=ctx
             )
 
-            if not source_connections:
-                return []
-
             federated_sources = []
             for source_connection in source_connections:
+                if source_connection.short_name not in profile.federated_sources:
+                    continue
                 source_instance = await self._try_instantiate_federated_source(
                     db, source_connection, ctx
                 )
@@ -771,6 +817,12 @@ class SearchFactory:
             # Configure source instance
             if hasattr(source_instance, "set_logger"):
                 source_instance.set_logger(ctx.logger)
+            # Connection scope (also keys the federated keyword result cache)
+            if hasattr(source_instance, "set_sync_identifiers"):
+                source_instance.set_sync_identifiers(
+                    organization_id=str(ctx.organization.id),
+                    source_connection_id=str(source_connection.id),
+                )
 
             # Setup token manager if needed
             if source_model.oauth_type and isinstance(credentials_data["decrypted"], dict):
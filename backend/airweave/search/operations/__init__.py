@@ -1,6 +1,8 @@
 from .embed_query import EmbedQuery
+from .expansion_retrieval import ExpansionRetrieval
 from .federated_search import FederatedSearch
 from .generate_answer import GenerateAnswer
+from .payload_hydration import PayloadHydration
 from .query_expansion import QueryExpansion
 from .query_interpretation import QueryInterpretation
 from .reranking import Reranking
@@ -10,8 +12,10 @@ from .user_filter import UserFilter
 
 __all__ = [
     "EmbedQuery",
+    "ExpansionRetrieval",
     "FederatedSearch",
     "GenerateAnswer",
+    "PayloadHydration",
     "QueryExpansion",
     "QueryInterpretation",
     "Reranking",
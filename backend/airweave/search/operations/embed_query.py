@@ -3,12 +3,18 @@
 Converts text queries into vector embeddings for similarity search.
 Generates dense neural embeddings and/or sparse BM25 embeddings based on
 the retrieval strategy (hybrid, neural, or keyword).
+
+Query vectors are cached per (embedding model, normalized query text) in a
+process-wide LRU backed by Redis, so repeated queries and deterministic
+expansions skip the provider round trip.
 """
 
-from typing import Any, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from airweave.api.context import ApiContext
+from airweave.core.config import settings
 from airweave.platform.embedders import SparseEmbedder
+from airweave.platform.embedders.cache import EmbeddingCache, SparseEmbeddingCache
 from airweave.schemas.search import RetrievalStrategy
 from airweave.search.context import SearchContext
 from airweave.search.providers._base import BaseProvider
@@ -16,17 +22,43 @@ from airweave.search.providers._base import BaseProvider
 from ._base import SearchOperation
 
 
+def _create_query_cache(cache_class: type, namespace: str) -> Optional[EmbeddingCache]:
+    """Create a process-wide query embedding cache (None when disabled)."""
+    if not settings.QUERY_EMBEDDING_CACHE_ENABLED:
+        return None
+    return cache_class(
+        namespace=namespace,
+        max_local_entries=settings.QUERY_EMBEDDING_CACHE_LOCAL_MAX_ENTRIES,
+        ttl_seconds=settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+    )
+
+
 class EmbedQuery(SearchOperation):
     """Generate vector embeddings for queries."""
 
-    def __init__(self, strategy: RetrievalStrategy, provider: BaseProvider) -> None:
-        """Initialize with retrieval strategy and provider."""
+    # Shared by all searches in the process
+    DENSE_CACHE: Optional[EmbeddingCache] = _create_query_cache(EmbeddingCache, "query_dense")
+    SPARSE_CACHE: Optional[EmbeddingCache] = _create_query_cache(
+        SparseEmbeddingCache, "query_sparse"
+    )
+
+    def __init__(
+        self, strategy: RetrievalStrategy, provider: BaseProvider, speculative: bool = False
+    ) -> None:
+        """Initialize with retrieval strategy and provider.
+
+        Args:
+            strategy: Retrieval strategy (decides dense and/or sparse embeddings)
+            provider: Embedding provider
+            speculative: Embed only the original query, without waiting for expansion
+        """
         self.strategy = strategy
         self.provider = provider
+        self.speculative = speculative
 
     def depends_on(self) -> List[str]:
-        """Depends on query expansion to get all queries to embed."""
-        return ["QueryExpansion"]
+        """Depends on query expansion to get all queries to embed (unless speculative)."""
+        return [] if self.speculative else ["QueryExpansion"]
 
     async def execute(
         self,
@@ -46,20 +78,8 @@ class EmbedQuery(SearchOperation):
 
         # Determine queries to embed (expanded + original, or just original)
         queries = self._get_queries_to_embed(context, state)
-
-        # Generate dense embeddings if needed
-        # Note: Token validation is handled by the provider in its embed() method
-        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.NEURAL):
-            dense_embeddings = await self._generate_dense_embeddings(queries, ctx)
-        else:
-            # Keyword-only doesn't need dense embeddings
-            dense_embeddings = None
-
-        # Generate sparse BM25 embeddings if needed
-        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.KEYWORD):
-            sparse_embeddings = await self._generate_sparse_embeddings(queries, ctx)
-        else:
-            sparse_embeddings = None
+        cache_metrics: Dict[str, int] = {}
+        dense_embeddings, sparse_embeddings = await self.embed(queries, ctx, cache_metrics)
 
         # Write to state - embeddings are REQUIRED, never write None
         if dense_embeddings is None and sparse_embeddings is None:
@@ -77,24 +97,118 @@ class EmbedQuery(SearchOperation):
             has_dense=dense_embeddings is not None,
             has_sparse=sparse_embeddings is not None,
             strategy=self.strategy.value,
+            **cache_metrics,
         )
 
         # Emit embedding done with stats
         await self._emit_embedding_done(dense_embeddings, sparse_embeddings, context.emitter)
 
+    async def embed(
+        self, queries: List[str], ctx: ApiContext, cache_metrics: Dict[str, int]
+    ) -> Tuple[Optional[List[List[float]]], Optional[List]]:
+        """Embed normalized queries for the retrieval strategy.
+
+        Also used by ExpansionRetrieval to embed expanded queries after the fact.
+
+        Returns:
+            Tuple of (dense embeddings, sparse embeddings); unused kinds are None
+        """
+        # Generate dense embeddings if needed
+        # Note: Token validation is handled by the provider in its embed() method
+        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.NEURAL):
+            dense_embeddings = await self._embed_with_cache(
+                self.DENSE_CACHE,
+                self._dense_cache_model(),
+                queries,
+                lambda texts: self._generate_dense_embeddings(texts, ctx),
+                "dense",
+                cache_metrics,
+            )
+        else:
+            # Keyword-only doesn't need dense embeddings
+            dense_embeddings = None
+
+        # Generate sparse BM25 embeddings if needed
+        if self.strategy in (RetrievalStrategy.HYBRID, RetrievalStrategy.KEYWORD):
+            sparse_embeddings = await self._embed_with_cache(
+                self.SPARSE_CACHE,
+                SparseEmbedder.MODEL_NAME,
+                queries,
+                lambda texts: self._generate_sparse_embeddings(texts, ctx),
+                "sparse",
+                cache_metrics,
+            )
+        else:
+            sparse_embeddings = None
+
+        return dense_embeddings, sparse_embeddings
+
     def _get_queries_to_embed(self, context: SearchContext, state: dict[str, Any]) -> List[str]:
-        """Get all queries to embed (original + expanded)."""
+        """Get all queries to embed (original + expanded), whitespace-normalized."""
         queries = [context.query]
 
-        # Add expanded queries if available
-        expanded = state.get("expanded_queries", [])
+        # Add expanded queries if available (speculative searches embed them later)
+        expanded = [] if self.speculative else state.get("expanded_queries", [])
         if expanded:
             queries.extend(expanded)
 
         if not queries:
             raise ValueError("No queries to embed")
 
-        return queries
+        return self.normalize_queries(queries)
+
+    @staticmethod
+    def normalize_queries(queries: List[str]) -> List[str]:
+        """Whitespace-normalize queries.
+
+        Equivalent queries then share cache entries (and get identical vectors).
+        """
+        return [" ".join(query.split()) for query in queries]
+
+    def _dense_cache_model(self) -> Optional[str]:
+        """Model component of dense cache keys (provider + model name)."""
+        embedding_model = self.provider.model_spec.embedding_model
+        if not embedding_model:
+            return None
+        return f"{self.provider.__class__.__name__}:{embedding_model.name}"
+
+    async def _embed_with_cache(
+        self,
+        cache: Optional[EmbeddingCache],
+        model: Optional[str],
+        queries: List[str],
+        embed: Callable[[List[str]], Awaitable[List]],
+        kind: str,
+        cache_metrics: Dict[str, int],
+    ) -> List:
+        """Serve query vectors from the cache and embed only the distinct misses.
+
+        Args:
+            cache: Query embedding cache, or None if caching is disabled
+            model: Cache key model component, or None to bypass the cache
+            queries: Normalized queries to embed
+            embed: Embeds a list of texts (used for cache misses)
+            kind: Vector kind for metric names ("dense" or "sparse")
+            cache_metrics: Receives {kind}_cache_hits / {kind}_cache_misses
+
+        Returns:
+            One vector per query, in order
+        """
+        if cache is None or model is None:
+            return await embed(queries)
+
+        cached = await cache.get_many(model, queries)
+        missing = list(dict.fromkeys(q for i, q in enumerate(queries) if i not in cached))
+
+        fresh: Dict[str, Any] = {}
+        if missing:
+            vectors = await embed(missing)
+            fresh = dict(zip(missing, vectors, strict=True))
+            await cache.set_many(model, missing, vectors)
+
+        cache_metrics[f"{kind}_cache_hits"] = len(cached)
+        cache_metrics[f"{kind}_cache_misses"] = len(queries) - len(cached)
+        return [cached[i] if i in cached else fresh[q] for i, q in enumerate(queries)]
 
     async def _generate_dense_embeddings(
         self, queries: List[str], ctx: ApiContext
@@ -0,0 +1,124 @@
+"""Expansion retrieval operation.
+
+Completes speculative searches: Retrieval searches with the original query while
+QueryExpansion is still generating variations, and this operation then embeds and
+searches the variations and merges their results into the original ones. Results
+that miss the expansion latency budget are skipped, keeping the original results.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from airweave.api.context import ApiContext
+from airweave.platform.destinations.qdrant import QdrantDestination
+from airweave.search.context import SearchContext
+
+from .embed_query import EmbedQuery
+from .retrieval import Retrieval
+
+
+class ExpansionRetrieval(Retrieval):
+    """Search expanded queries and merge them into speculative retrieval results."""
+
+    # Per-query scores stay comparable with the original query's scores for the merge
+    SERVER_SIDE_FUSION = False
+
+    def depends_on(self) -> List[str]:
+        """Depends on the expansions and on the original-query results to merge into."""
+        return ["QueryExpansion", "Retrieval"]
+
+    async def execute(
+        self,
+        context: SearchContext,
+        state: dict[str, Any],
+        ctx: ApiContext,
+    ) -> None:
+        """Search expanded queries and merge with the original-query candidates."""
+        expanded_queries = state.get("expanded_queries") or []
+        if not expanded_queries:
+            ctx.logger.debug("[ExpansionRetrieval] No expanded queries, keeping results")
+            self._report_metrics(state, expanded_queries=0, merged=False)
+            return
+
+        deadline = state.get("expansion_deadline")
+        timeout = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+
+        try:
+            expanded_results = await asyncio.wait_for(
+                self._search_expanded_queries(expanded_queries, context, state, ctx),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            ctx.logger.warning(
+                "[ExpansionRetrieval] Expanded query search missed the latency budget, "
+                "keeping original query results"
+            )
+            self._report_metrics(
+                state, expanded_queries=len(expanded_queries), merged=False, budget_exceeded=True
+            )
+            await context.emitter.emit(
+                "expansion_results_skipped",
+                {"reason": "latency_budget_exceeded"},
+                op_name=self.__class__.__name__,
+            )
+            return
+
+        # Same dedup as bulk retrieval: keep the best score per document
+        candidates = state.get("retrieval_candidates", [])
+        merged = self._deduplicate_results(candidates + expanded_results)
+
+        has_reranking = context.reranking is not None
+        state["retrieval_candidates"] = merged
+        state["results"] = merged if has_reranking else self._apply_pagination(merged)
+
+        ctx.logger.debug(
+            f"[ExpansionRetrieval] Merged {len(candidates)} original + "
+            f"{len(expanded_results)} expanded = {len(merged)} unique candidates"
+        )
+
+        self._report_metrics(
+            state,
+            expanded_queries=len(expanded_queries),
+            merged=True,
+            original_count=len(candidates),
+            expanded_count=len(expanded_results),
+            merged_count=len(merged),
+        )
+
+        await context.emitter.emit(
+            "expansion_results_merged",
+            {"expanded_count": len(expanded_results), "merged_count": len(merged)},
+            op_name=self.__class__.__name__,
+        )
+
+    async def _search_expanded_queries(
+        self,
+        expanded_queries: List[str],
+        context: SearchContext,
+        state: dict[str, Any],
+        ctx: ApiContext,
+    ) -> List[Dict]:
+        """Embed the expanded queries and bulk search them with the same filter and decay."""
+        if context.embed_query is None:
+            raise RuntimeError("ExpansionRetrieval requires the EmbedQuery operation")
+
+        queries = EmbedQuery.normalize_queries(expanded_queries)
+        dense_embeddings, sparse_embeddings = await context.embed_query.embed(queries, ctx, {})
+
+        destination = await QdrantDestination.create(
+            collection_id=context.collection_id,
+            vector_size=context.vector_size,
+            logger=ctx.logger,
+        )
+
+        return await self._execute_bulk_search(
+            destination,
+            dense_embeddings,
+            sparse_embeddings,
+            state.get("filter"),
+            state.get("decay_config"),
+            self._get_search_method(),
+            context.reranking is not None,
+            ctx,
+        )
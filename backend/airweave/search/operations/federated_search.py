@@ -3,10 +3,15 @@
 Executes searches against federated sources (e.g., Slack) that don't sync data
 but provide search APIs. Results are retrieved at query time, scored, and merged
 with vector database results using Reciprocal Rank Fusion (RRF).
+
+All (source, keyword) searches run concurrently under a per-request cap. Each
+source has a deadline after which its unfinished keyword searches are dropped
+(partial results), and keyword results are cached briefly per source connection.
 """
 
 import asyncio
-from typing import Any, Dict, List, Tuple
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -33,6 +38,32 @@ class QueryKeywords(BaseModel):
     )
 
 
+class _KeywordResultCache:
+    """Short-lived in-process cache of federated keyword search results."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        """Initialize an empty cache."""
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, str, int], Tuple[float, List[Any]]] = {}
+
+    def get(self, key: Tuple[str, str, int]) -> Optional[List[Any]]:
+        """Return cached entities, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        return entry[1]
+
+    def set(self, key: Tuple[str, str, int], entities: List[Any]) -> None:
+        """Store entities, evicting the oldest entry when full."""
+        if len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic(), entities)
+
+
 class FederatedSearch(SearchOperation):
     """Execute federated search and merge with vector results using RRF."""
 
@@ -43,8 +74,14 @@ class FederatedSearch(SearchOperation):
     # across query variations (1.5 = fetch 50% more to account for ~33% duplication)
     DEDUP_MULTIPLIER = 1.5
 
-    # Rate limit delay between sequential queries (seconds)
-    RATE_LIMIT_DELAY_SECONDS = 0.1
+    # Max concurrent search API calls per request (across all sources and keywords)
+    MAX_CONCURRENT_SEARCHES = 10
+
+    # Per-source deadline; keyword searches still running afterwards are dropped
+    SOURCE_TIMEOUT_SECONDS = 8.0
+
+    # Keyword results cached per (source connection, keyword, limit), shared by requests
+    RESULT_CACHE = _KeywordResultCache(ttl_seconds=60.0, max_entries=2048)
 
     def __init__(
         self, sources: List[BaseSource], limit: int, providers: List[BaseProvider]
@@ -78,7 +115,7 @@ class FederatedSearch(SearchOperation):
 
     def depends_on(self) -> List[str]:
         """Depends on Retrieval to have vector results for merging."""
-        return ["QueryExpansion", "Retrieval"]
+        return ["QueryExpansion", "Retrieval", "ExpansionRetrieval"]
 
     async def execute(
         self,
@@ -99,7 +136,7 @@ class FederatedSearch(SearchOperation):
 
         all_queries = [context.query] + state.get("expanded_queries", [])
 
-        keywords_to_search = await self._extract_keywords_from_queries(all_queries, ctx)
+        keywords_to_search = await self._extract_keywords_from_queries(all_queries, state, ctx)
 
         ctx.logger.debug(
             f"[FederatedSearch] Extracted {len(keywords_to_search)} unique keywords: "
@@ -118,74 +155,7 @@ class FederatedSearch(SearchOperation):
             op_name=self.__class__.__name__,
         )
 
-        all_results: List[Dict] = []
-
-        for source in self.sources:
-            source_name = source.__class__.__name__
-            ctx.logger.debug(f"[FederatedSearch] Searching {source_name}")
-
-            try:
-                # Emit per-source start
-                await context.emitter.emit(
-                    "federated_source_start",
-                    {"source": source_name, "num_keywords": len(keywords_to_search)},
-                    op_name=self.__class__.__name__,
-                )
-
-                # Distribute limit across keywords with padding for deduplication
-                per_keyword_limit = max(
-                    1, int((self.limit * self.DEDUP_MULTIPLIER) // len(keywords_to_search))
-                )
-
-                ctx.logger.debug(
-                    f"[FederatedSearch] Distributing limit: {self.limit} requested, "
-                    f"{per_keyword_limit} per keyword "
-                    f"({len(keywords_to_search)} keywords, {self.DEDUP_MULTIPLIER}x padding)"
-                )
-
-                # Execute searches concurrently
-                keyword_results_lists = await asyncio.gather(
-                    *[
-                        self._search_single_keyword(
-                            source,
-                            keyword,
-                            per_keyword_limit,
-                            source_name,
-                            idx,
-                            len(keywords_to_search),
-                            ctx,
-                        )
-                        for idx, keyword in enumerate(keywords_to_search)
-                    ],
-                    return_exceptions=True,
-                )
-
-                # Deduplicate and collect results
-                source_results = self._dedup_and_convert_results(
-                    keyword_results_lists=keyword_results_lists,
-                    source_name=source_name,
-                    keywords=keywords_to_search,
-                    ctx=ctx,
-                )
-                entity_count = len(source_results)
-                all_results.extend(source_results)
-
-                # Emit per-source done
-                await context.emitter.emit(
-                    "federated_source_done",
-                    {"source": source_name, "result_count": entity_count},
-                    op_name=self.__class__.__name__,
-                )
-
-            except Exception as e:
-                ctx.logger.error(f"[FederatedSearch] Error searching {source_name}: {e}")
-                # Emit error event but continue with other sources
-                await context.emitter.emit(
-                    "federated_source_error",
-                    {"source": source_name, "error": str(e)},
-                    op_name=self.__class__.__name__,
-                )
-                raise ValueError(f"Error searching {source_name} at query time: {e}")
+        all_results, search_stats = await self._search_sources(keywords_to_search, context, ctx)
 
         ctx.logger.debug(f"[FederatedSearch] Retrieved {len(all_results)} federated results")
 
@@ -233,6 +203,7 @@ class FederatedSearch(SearchOperation):
             vector_count=len(vector_results),
             merged_count=len(final_results),
             enabled=True,
+            **search_stats,
         )
 
         # Emit federated search done
@@ -247,12 +218,13 @@ class FederatedSearch(SearchOperation):
         )
 
     async def _extract_keywords_from_queries(
-        self, queries: List[str], ctx: ApiContext
+        self, queries: List[str], state: dict[str, Any], ctx: ApiContext
     ) -> List[str]:
         """Extract keywords from all query variations using a single LLM call.
 
         Args:
             queries: List of query strings (original + expansions)
+            state: Shared state (for provider usage tracking)
             ctx: API context for logging
 
         Returns:
@@ -309,6 +281,119 @@ class FederatedSearch(SearchOperation):
         except Exception as e:
             raise ValueError(f"Failed to extract keywords from queries: {e}")
 
+    async def _search_sources(
+        self, keywords: List[str], context: SearchContext, ctx: ApiContext
+    ) -> Tuple[List[Dict], Dict[str, int]]:
+        """Search all sources concurrently and collect results in source order.
+
+        Events are emitted in source order (all starts, then per-source done/error)
+        so the stream stays deterministic.
+
+        Returns:
+            Tuple of (results in vector DB format, stats for metrics)
+
+        Raises:
+            ValueError: If a source search fails (timeouts only drop results)
+        """
+        op_name = self.__class__.__name__
+        for source in self.sources:
+            await context.emitter.emit(
+                "federated_source_start",
+                {"source": source.__class__.__name__, "num_keywords": len(keywords)},
+                op_name=op_name,
+            )
+
+        # Distribute limit across keywords with padding for deduplication
+        per_keyword_limit = max(1, int((self.limit * self.DEDUP_MULTIPLIER) // len(keywords)))
+        ctx.logger.debug(
+            f"[FederatedSearch] Distributing limit: {self.limit} requested, "
+            f"{per_keyword_limit} per keyword "
+            f"({len(keywords)} keywords, {self.DEDUP_MULTIPLIER}x padding)"
+        )
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SEARCHES)
+        stats = {"keyword_searches_timed_out": 0, "keyword_cache_hits": 0}
+        source_outcomes = await asyncio.gather(
+            *[
+                self._search_source(source, keywords, per_keyword_limit, semaphore, stats, ctx)
+                for source in self.sources
+            ],
+            return_exceptions=True,
+        )
+
+        all_results: List[Dict] = []
+        for source, outcome in zip(self.sources, source_outcomes, strict=True):
+            source_name = source.__class__.__name__
+            if isinstance(outcome, Exception):
+                ctx.logger.error(f"[FederatedSearch] Error searching {source_name}: {outcome}")
+                await context.emitter.emit(
+                    "federated_source_error",
+                    {"source": source_name, "error": str(outcome)},
+                    op_name=op_name,
+                )
+                raise ValueError(f"Error searching {source_name} at query time: {outcome}")
+
+            all_results.extend(outcome)
+            await context.emitter.emit(
+                "federated_source_done",
+                {"source": source_name, "result_count": len(outcome)},
+                op_name=op_name,
+            )
+
+        return all_results, stats
+
+    async def _search_source(
+        self,
+        source: BaseSource,
+        keywords: List[str],
+        per_keyword_limit: int,
+        semaphore: asyncio.Semaphore,
+        stats: Dict[str, int],
+        ctx: ApiContext,
+    ) -> List[Dict]:
+        """Search one source with all keywords, keeping what finishes before the deadline."""
+        source_name = source.__class__.__name__
+        tasks = [
+            asyncio.create_task(
+                self._search_single_keyword(
+                    source,
+                    keyword,
+                    per_keyword_limit,
+                    source_name,
+                    idx,
+                    len(keywords),
+                    semaphore,
+                    stats,
+                    ctx,
+                )
+            )
+            for idx, keyword in enumerate(keywords)
+        ]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=self.SOURCE_TIMEOUT_SECONDS)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            stats["keyword_searches_timed_out"] += len(pending)
+            ctx.logger.warning(
+                f"[FederatedSearch] {source_name}: {len(pending)}/{len(keywords)} keyword "
+                f"searches exceeded {self.SOURCE_TIMEOUT_SECONDS}s, using partial results"
+            )
+
+        keyword_results_lists = [
+            [] if task in pending else (task.exception() or task.result()) for task in tasks
+        ]
+        return self._dedup_and_convert_results(
+            keyword_results_lists=keyword_results_lists,
+            source_name=source_name,
+            keywords=keywords,
+            ctx=ctx,
+        )
+
     async def _search_single_keyword(
         self,
         source: BaseSource,
@@ -317,6 +402,8 @@ class FederatedSearch(SearchOperation):
         source_name: str,
         keyword_idx: int,
         total_keywords: int,
+        semaphore: asyncio.Semaphore,
+        stats: Dict[str, int],
         ctx: ApiContext,
     ) -> List[Any]:
         """Search with a single keyword and return entities.
@@ -328,18 +415,33 @@ class FederatedSearch(SearchOperation):
             source_name: Name of the source (for logging)
             keyword_idx: Index of this keyword (for logging)
             total_keywords: Total number of keywords (for logging)
+            semaphore: Per-request cap on concurrent search API calls
+            stats: Request stats (cache hits are counted here)
             ctx: API context for logging
 
         Returns:
             List of entities from the search
         """
+        # Only connection-scoped sources are cached (results depend on credentials)
+        source_connection_id = getattr(source, "_source_connection_id", None)
+        cache_key = (str(source_connection_id), keyword, limit)
+        if source_connection_id:
+            cached = self.RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                stats["keyword_cache_hits"] += 1
+                return cached
+
         ctx.logger.debug(
             f"[FederatedSearch] {source_name} keyword "
             f"{keyword_idx + 1}/{total_keywords}: '{keyword}'"
         )
 
         # Direct await - no async iteration needed
-        entities = await source.search(keyword, limit=limit)
+        async with semaphore:
+            entities = await source.search(keyword, limit=limit)
+
+        if source_connection_id:
+            self.RESULT_CACHE.set(cache_key, entities)
 
         ctx.logger.debug(
             f"[FederatedSearch] Keyword {keyword_idx + 1} fetched {len(entities)} results"
@@ -33,7 +33,13 @@ class GenerateAnswer(SearchOperation):
 
     def depends_on(self) -> List[str]:
         """Depends on Retrieval, FederatedSearch (if enabled), and Reranking to have all results."""
-        return ["Retrieval", "FederatedSearch", "Reranking"]
+        return [
+            "Retrieval",
+            "ExpansionRetrieval",
+            "FederatedSearch",
+            "Reranking",
+            "PayloadHydration",
+        ]
 
     async def execute(
         self,
@@ -0,0 +1,82 @@
+"""Payload hydration operation.
+
+Completes payload projection: Retrieval fetches only a small payload field set for
+every candidate, and this operation loads the remaining payload (all fields, or the
+requested ones) for the final results only, in a single Qdrant retrieve call.
+Federated results already carry their full payloads and are left untouched.
+"""
+
+from typing import Any, List, Optional
+
+from airweave.api.context import ApiContext
+from airweave.platform.destinations.qdrant import QdrantDestination
+from airweave.search.context import SearchContext
+
+from ._base import SearchOperation
+
+
+class PayloadHydration(SearchOperation):
+    """Load payloads for the final (projected) vector search results."""
+
+    def __init__(self, fields: Optional[List[str]] = None) -> None:
+        """Initialize with the payload fields to load.
+
+        Args:
+            fields: Payload fields to load for the final results (None = all fields)
+        """
+        self.fields = fields
+
+    def depends_on(self) -> List[str]:
+        """Depends on every operation that selects or reorders the final results."""
+        return ["Retrieval", "ExpansionRetrieval", "FederatedSearch", "Reranking"]
+
+    async def execute(
+        self,
+        context: SearchContext,
+        state: dict[str, Any],
+        ctx: ApiContext,
+    ) -> None:
+        """Merge stored payloads into the final vector search results."""
+        results = state.get("results") or []
+        to_hydrate = [r for r in results if r.get("source_type") != "federated"]
+        if not to_hydrate:
+            return
+
+        fields = self._fields_to_load(context)
+        destination = await QdrantDestination.create(
+            collection_id=context.collection_id,
+            vector_size=context.vector_size,
+            logger=ctx.logger,
+        )
+        payloads = await destination.retrieve_payloads(
+            [str(r["id"]) for r in to_hydrate], with_payload=fields or True
+        )
+
+        missing = 0
+        for result in to_hydrate:
+            payload = payloads.get(str(result["id"]))
+            if payload is None:
+                missing += 1
+                continue
+            result["payload"] = {**(result.get("payload") or {}), **payload}
+
+        if missing:
+            ctx.logger.warning(
+                f"[PayloadHydration] {missing} results no longer exist in Qdrant, "
+                "returning their projected payloads"
+            )
+
+        self._report_metrics(
+            state,
+            hydrated_count=len(to_hydrate) - missing,
+            missing_count=missing,
+            fields=fields or "all",
+        )
+
+    def _fields_to_load(self, context: SearchContext) -> Optional[List[str]]:
+        """Requested fields, plus the text answer generation reads."""
+        if self.fields is None:
+            return None
+        if context.generate_answer is not None and "textual_representation" not in self.fields:
+            return self.fields + ["textual_representation"]
+        return self.fields
@@ -3,9 +3,15 @@
 Expands the user's query into multiple variations to improve recall.
 Uses LLM to generate semantic alternatives that might match relevant documents
 using different terminology while preserving the original search intent.
+
+With a latency budget, expansion is skipped (no variations) when the LLM call
+misses the deadline. The deadline is also stored in state so ExpansionRetrieval
+can drop speculative expansion results that arrive too late.
 """
 
-from typing import Any, List
+import asyncio
+import time
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -44,15 +50,19 @@ class QueryExpansion(SearchOperation):
     # Number of query expansion alternatives to generate
     NUMBER_OF_EXPANSIONS = _NUMBER_OF_EXPANSIONS
 
-    def __init__(self, providers: List[BaseProvider]) -> None:
+    def __init__(
+        self, providers: List[BaseProvider], latency_budget_ms: Optional[int] = None
+    ) -> None:
         """Initialize with list of LLM providers in preference order.
 
         Args:
             providers: List of LLM providers for structured output with fallback support
+            latency_budget_ms: Optional deadline for expansion, measured from its start
         """
         if not providers:
             raise ValueError("QueryExpansion requires at least one provider")
         self.providers = providers
+        self.latency_budget_ms = latency_budget_ms
 
     def depends_on(self) -> List[str]:
         """No dependencies - runs first if enabled."""
@@ -69,6 +79,11 @@ class QueryExpansion(SearchOperation):
 
         query = context.query
 
+        timeout = None
+        if self.latency_budget_ms is not None:
+            timeout = self.latency_budget_ms / 1000
+            state["expansion_deadline"] = time.monotonic() + timeout
+
         # Build prompts
         system_prompt = QUERY_EXPANSION_SYSTEM_PROMPT.format(
             number_of_expansions=self.NUMBER_OF_EXPANSIONS
@@ -87,13 +102,32 @@ class QueryExpansion(SearchOperation):
             self._validate_query_length_for_provider(query, provider, ctx)
             return await provider.structured_output(messages, QueryExpansions)
 
-        result = await self._execute_with_provider_fallback(
-            providers=self.providers,
-            operation_call=call_provider,
-            operation_name="QueryExpansion",
-            ctx=ctx,
-            state=state,
-        )
+        try:
+            result = await asyncio.wait_for(
+                self._execute_with_provider_fallback(
+                    providers=self.providers,
+                    operation_call=call_provider,
+                    operation_name="QueryExpansion",
+                    ctx=ctx,
+                    state=state,
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            ctx.logger.warning(
+                f"[QueryExpansion] Expansion exceeded {self.latency_budget_ms}ms budget, "
+                "searching with the original query only"
+            )
+            state["expanded_queries"] = []
+            self._report_metrics(
+                state, expansions_generated=0, has_expansions=False, budget_exceeded=True
+            )
+            await context.emitter.emit(
+                "expansion_skipped",
+                {"reason": "latency_budget_exceeded", "budget_ms": self.latency_budget_ms},
+                op_name=self.__class__.__name__,
+            )
+            return
 
         # Validate and deduplicate alternatives
         alternatives = result.alternatives or []
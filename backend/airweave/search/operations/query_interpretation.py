@@ -8,9 +8,7 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
-from airweave import crud
 from airweave.api.context import ApiContext
-from airweave.db.session import get_db_context
 from airweave.search.context import SearchContext
 from airweave.search.prompts import QUERY_INTERPRETATION_SYSTEM_PROMPT
 from airweave.search.providers._base import BaseProvider
@@ -88,19 +86,29 @@ class QueryInterpretation(SearchOperation):
         "updated_at": "Entity last update timestamp (ISO8601 datetime)",
     }
 
-    def __init__(self, providers: List[BaseProvider]) -> None:
+    def __init__(
+        self,
+        providers: List[BaseProvider],
+        filterable_fields: Dict[str, Dict[str, str]],
+        speculative: bool = False,
+    ) -> None:
         """Initialize with list of LLM providers in preference order.
 
         Args:
             providers: List of LLM providers for structured output with fallback support
+            filterable_fields: Field catalog per source short_name, from the collection's
+                search profile
+            speculative: Interpret only the original query, without waiting for expansion
         """
         if not providers:
             raise ValueError("QueryInterpretation requires at least one provider")
         self.providers = providers
+        self.filterable_fields = filterable_fields
+        self.speculative = speculative
 
     def depends_on(self) -> List[str]:
-        """Depends on query expansion to get all query variations."""
-        return ["QueryExpansion"]
+        """Depends on query expansion to get all query variations (unless speculative)."""
+        return [] if self.speculative else ["QueryExpansion"]
 
     async def execute(
         self,
@@ -112,7 +120,8 @@ class QueryInterpretation(SearchOperation):
         ctx.logger.debug("[QueryInterpretation] Extracting filters from query")
 
         query = context.query
-        expanded_queries = state.get("expanded_queries", [])
+        # Speculative searches interpret the original query without waiting for expansion
+        expanded_queries = [] if self.speculative else state.get("expanded_queries", [])
 
         # Emit interpretation start
         await context.emitter.emit(
@@ -122,7 +131,7 @@ class QueryInterpretation(SearchOperation):
         )
 
         # Discover available fields for this collection
-        available_fields = await self._discover_fields(context.readable_collection_id, ctx)
+        available_fields = self._discover_fields(context.readable_collection_id)
 
         # Build prompts
         system_prompt = self._build_system_prompt(available_fields)
@@ -216,102 +225,33 @@ class QueryInterpretation(SearchOperation):
             op_name=self.__class__.__name__,
         )
 
-    async def _discover_fields(
-        self, collection_id: str, ctx: ApiContext
-    ) -> Dict[str, Dict[str, str]]:
-        """Discover available fields from collection's entity definitions."""
-        from airweave import schemas
-        from airweave.platform.locator import resource_locator
-
+    def _discover_fields(self, collection_id: str) -> Dict[str, Dict[str, str]]:
+        """Assemble available fields from the collection's cached field catalog."""
         fields = {}
-
-        async with get_db_context() as db:
-            # Get source connections for this collection
-            source_connections = await crud.source_connection.get_for_collection(
-                db, readable_collection_id=collection_id, ctx=ctx
-            )
-
-            if not source_connections:
-                raise ValueError(f"No source connections found for collection {collection_id}")
-
-            # Get unique short_names to avoid duplicate field discovery
-            unique_short_names = {conn.short_name for conn in source_connections}
-
-            # Get fields for each unique source
-            for short_name in unique_short_names:
-                # Skip PostgreSQL - doesn't support query interpretation
-                if short_name == "postgresql":
-                    continue
-
-                source = await crud.source.get_by_short_name(db, short_name=short_name)
-                if not source:
-                    continue
-
-                source_fields = await self._get_source_fields(db, source, resource_locator, schemas)
-
-                if not source_fields:
-                    raise ValueError(
-                        f"No fields discovered for source '{short_name}'. "
-                        f"Cannot perform query interpretation."
-                    )
-
-                # Store using just the short_name as the key so LLM uses correct value
-                # Add display name in a special comment field for clarity
-                fields[short_name] = source_fields
+        for short_name, source_fields in self.filterable_fields.items():
+            if not source_fields:
+                raise ValueError(
+                    f"No fields discovered for source '{short_name}'. "
+                    f"Cannot perform query interpretation."
+                )
+
+            # Store using just the short_name as the key so LLM uses correct value
+            fields[short_name] = {
+                **source_fields,
+                # System metadata fields from class constant
+                **self.NESTED_SYSTEM_FIELDS,
+                # Entity-level timestamp fields (not nested)
+                **self.ENTITY_TIMESTAMP_FIELDS,
+            }
 
         if not fields:
             raise ValueError(
-                "No valid sources found for query interpretation. "
+                f"No valid sources found for query interpretation in {collection_id}. "
                 "PostgreSQL sources do not support query interpretation."
             )
 
         return fields
 
-    async def _get_source_fields(
-        self, db: Any, source: Any, resource_locator: Any, schemas: Any
-    ) -> Dict[str, str]:
-        """Get fields for a specific source from its entity definitions."""
-        entity_defs = await crud.entity_definition.get_multi_by_source_short_name(
-            db, source_short_name=source.short_name
-        )
-
-        if not entity_defs:
-            return {}
-
-        all_fields = {}
-
-        for entity_def in entity_defs:
-            # Convert to schema and get entity class
-            entity_schema = schemas.EntityDefinition.model_validate(
-                entity_def, from_attributes=True
-            )
-            entity_class = resource_locator.get_entity_definition(entity_schema)
-
-            # Extract all fields from entity class for filtering
-            if hasattr(entity_class, "model_fields"):
-                for field_name, field_info in entity_class.model_fields.items():
-                    if field_name.startswith("_") or field_name == "airweave_system_metadata":
-                        continue
-
-                    # Get description from field
-                    description = getattr(field_info, "description", None)
-
-                    # Check json_schema_extra for description (used by AirweaveField)
-                    if not description and hasattr(field_info, "json_schema_extra"):
-                        extra = field_info.json_schema_extra
-                        if isinstance(extra, dict):
-                            description = extra.get("description")
-
-                    all_fields[field_name] = description or f"{field_name} field"
-
-        # Add system metadata fields from class constant
-        all_fields.update(self.NESTED_SYSTEM_FIELDS)
-
-        # Add entity-level timestamp fields (not nested)
-        all_fields.update(self.ENTITY_TIMESTAMP_FIELDS)
-
-        return all_fields
-
     def _build_system_prompt(self, available_fields: Dict[str, Dict[str, str]]) -> str:
         """Build system prompt with available fields."""
         # Format available fields
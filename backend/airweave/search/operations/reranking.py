@@ -35,7 +35,7 @@ class Reranking(SearchOperation):
 
     def depends_on(self) -> List[str]:
         """Depends on Retrieval and FederatedSearch (if enabled) to have all results merged."""
-        return ["Retrieval", "FederatedSearch"]
+        return ["Retrieval", "ExpansionRetrieval", "FederatedSearch"]
 
     async def execute(
         self,
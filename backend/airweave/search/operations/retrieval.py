@@ -3,13 +3,19 @@
 Performs the actual vector similarity search against Qdrant using embeddings,
 filters, and optional temporal decay. This is the core search operation that
 queries the vector database.
+
+Multiple query embeddings (original + expansions) are fused by Qdrant in a single
+Query API request instead of one search per query.
+
+With payload projection, candidates carry only a small payload field set; the
+PayloadHydration operation loads the remaining payload for the final results.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from airweave.api.context import ApiContext
 from airweave.platform.destinations.qdrant import QdrantDestination
-from airweave.schemas.search import RetrievalStrategy
+from airweave.schemas.search import FusionStrategy, RetrievalStrategy
 from airweave.search.context import SearchContext
 
 from ._base import SearchOperation
@@ -20,11 +26,40 @@ class Retrieval(SearchOperation):
 
     RERANK_PREFETCH_MULTIPLIER = 2.0  # Fetch 2x more candidates for reranking
 
-    def __init__(self, strategy: RetrievalStrategy, offset: int, limit: int) -> None:
-        """Initialize with retrieval configuration."""
+    # Fuse bulk searches in Qdrant (one ranked list) instead of per-query searches
+    SERVER_SIDE_FUSION = True
+
+    # Payload fields fetched for candidates when payloads are projected
+    CANDIDATE_PAYLOAD_FIELDS = ["entity_id", "name", "airweave_system_metadata.source_name"]
+
+    def __init__(
+        self,
+        strategy: RetrievalStrategy,
+        offset: int,
+        limit: int,
+        fusion_strategy: FusionStrategy = FusionStrategy.RRF,
+        prefetch_limit: Optional[int] = None,
+        hnsw_ef: Optional[int] = None,
+        project_payloads: bool = False,
+    ) -> None:
+        """Initialize with retrieval configuration.
+
+        Args:
+            strategy: Retrieval strategy (hybrid, neural or keyword)
+            offset: Number of results to skip
+            limit: Maximum number of results to return
+            fusion_strategy: How Qdrant fuses the candidates of multiple queries
+            prefetch_limit: Candidates per query and index before fusion (None = default)
+            hnsw_ef: HNSW ef for dense searches (None = collection default)
+            project_payloads: Fetch only CANDIDATE_PAYLOAD_FIELDS (hydrated later)
+        """
         self.strategy = strategy
         self.offset = offset
         self.limit = limit
+        self.fusion_strategy = fusion_strategy
+        self.prefetch_limit = prefetch_limit
+        self.hnsw_ef = hnsw_ef
+        self.project_payloads = project_payloads
 
     def depends_on(self) -> List[str]:
         """Depends on operations that provide embeddings, filter, and decay config."""
@@ -112,6 +147,8 @@ class Retrieval(SearchOperation):
         # Write to state
         ctx.logger.debug(f"[Retrieval] results: {final_count}")
         state["results"] = final_results
+        # Unpaginated candidates, merged with expanded query results by ExpansionRetrieval
+        state["retrieval_candidates"] = raw_results
 
         # Report metrics for analytics
         fetch_limit = self._calculate_fetch_limit(has_reranking, include_offset=True)
@@ -127,6 +164,11 @@ class Retrieval(SearchOperation):
             actual_fetch_limit=fetch_limit,
             embeddings_used=num_embeddings,
             was_bulk_search=is_bulk,
+            server_side_fusion=is_bulk and self.SERVER_SIDE_FUSION,
+            fusion_strategy=self.fusion_strategy.value,
+            prefetch_limit=self.prefetch_limit,
+            hnsw_ef=self.hnsw_ef,
+            project_payloads=self.project_payloads,
         )
 
         # Emit vector search done with stats
@@ -161,6 +203,15 @@ class Retrieval(SearchOperation):
         }
         return mapping[self.strategy]
 
+    def _payload_selector(self, has_reranking: bool) -> bool | List[str]:
+        """Payload to fetch per candidate: everything, or the projected field set."""
+        if not self.project_payloads:
+            return True
+        if has_reranking:
+            # The reranker reads the text of every candidate
+            return self.CANDIDATE_PAYLOAD_FIELDS + ["textual_representation"]
+        return self.CANDIDATE_PAYLOAD_FIELDS
+
     def _calculate_fetch_limit(self, has_reranking: bool, include_offset: bool) -> int:
         """Calculate how many results to fetch from Qdrant."""
         base_limit = self.limit
@@ -197,11 +248,13 @@ class Retrieval(SearchOperation):
             query_vector=query_vector,
             limit=fetch_limit,
             offset=0,  # Always fetch from beginning
-            with_payload=True,
+            with_payload=self._payload_selector(has_reranking),
             filter=filter_dict,
             sparse_vector=sparse_vector,
             search_method=search_method,
             decay_config=decay_config,
+            prefetch_limit=self.prefetch_limit,
+            hnsw_ef=self.hnsw_ef,
         )
 
         if not isinstance(results, list):
@@ -220,7 +273,10 @@ class Retrieval(SearchOperation):
         has_reranking: bool,
         ctx: ApiContext,
     ) -> List[Dict]:
-        """Execute bulk search - returns deduplicated results."""
+        """Execute bulk search - returns deduplicated results.
+
+        With server-side fusion Qdrant already returns one fused list of unique points.
+        """
         # Calculate limit (include offset since we apply it after deduplication)
         fetch_limit = self._calculate_fetch_limit(has_reranking, include_offset=True)
         ctx.logger.debug(f"[Retrieval] Fetch limit: {fetch_limit}")
@@ -231,11 +287,14 @@ class Retrieval(SearchOperation):
         results = await destination.bulk_search(
             query_vectors=dense_embeddings or [],
             limit=fetch_limit,
-            with_payload=True,
+            with_payload=self._payload_selector(has_reranking),
             filter_conditions=filter_conditions,
             sparse_vectors=sparse_embeddings,
             search_method=search_method,
             decay_config=decay_config,
+            fusion=self.fusion_strategy.value if self.SERVER_SIDE_FUSION else None,
+            prefetch_limit=self.prefetch_limit,
+            hnsw_ef=self.hnsw_ef,
         )
 
         if not isinstance(results, list):
@@ -3,6 +3,9 @@
 Computes dynamic time-based decay configuration by analyzing the actual
 time range of the (optionally filtered) collection. This enables recency-aware
 ranking that respects the dataset's time distribution.
+
+Bounds of unfiltered searches are cached per collection and source set (see
+airweave.search.temporal_bounds); filtered searches scroll Qdrant live.
 """
 
 from datetime import datetime, timezone
@@ -13,6 +16,7 @@ from qdrant_client.http import models as rest
 
 from airweave.api.context import ApiContext
 from airweave.search.context import SearchContext
+from airweave.search.temporal_bounds import TimestampBounds, temporal_bounds_cache
 
 from ._base import SearchOperation
 
@@ -83,68 +87,9 @@ class TemporalRelevance(SearchOperation):
 
         # Get filter from state if available (respects filtered timespan)
         filter_dict = state.get("filter")
-        qdrant_filter = self._convert_to_qdrant_filter(filter_dict)
-
-        # Inject tenant filter for multi-tenant isolation
-        tenant_condition = rest.FieldCondition(
-            key="airweave_collection_id",
-            match=rest.MatchValue(value=str(context.collection_id)),
-        )
-
-        # CRITICAL: Filter to only documents with updated_at field
-        # This prevents Qdrant decay formula errors on documents without timestamps
-        # IsEmpty matches: field doesn't exist OR is null OR is []
-        # We use must_not to require: field exists AND has a value
-        has_timestamp_condition = rest.IsEmptyCondition(
-            is_empty=rest.PayloadField(key=self.DATETIME_FIELD)
-        )
+        bounds = await self._get_bounds(context, filter_dict, state, ctx)
 
-        # Build must conditions list
-        must_conditions = [tenant_condition]
-
-        # Add source filter if we're restricting to temporal-supporting sources
-        if self.supporting_sources is not None:
-            source_condition = rest.FieldCondition(
-                key="airweave_system_metadata.source_name",
-                match=rest.MatchAny(any=self.supporting_sources),
-            )
-            must_conditions.append(source_condition)
-            ctx.logger.info(
-                f"[TemporalRelevance] Filtering to {len(self.supporting_sources)} "
-                f"temporal-supporting source(s): {self.supporting_sources}"
-            )
-
-        if qdrant_filter:
-            # Merge with existing filter
-            if not qdrant_filter.must:
-                qdrant_filter.must = []
-            qdrant_filter.must.extend(must_conditions)
-            # Ensure documents have the timestamp field for decay calculation
-            if not qdrant_filter.must_not:
-                qdrant_filter.must_not = []
-            qdrant_filter.must_not.append(has_timestamp_condition)
-        else:
-            # Create new filter with tenant, source, and timestamp requirements
-            qdrant_filter = rest.Filter(must=must_conditions, must_not=[has_timestamp_condition])
-
-        ctx.logger.debug(
-            f"[TemporalRelevance] Applied tenant filter: collection_id={context.collection_id}"
-        )
-
-        # Connect to Qdrant (runtime import to avoid circular dependency)
-        from airweave.platform.destinations.qdrant import QdrantDestination
-
-        destination = await QdrantDestination.create(
-            collection_id=context.collection_id,
-            vector_size=context.vector_size,
-            logger=ctx.logger,
-        )
-
-        # First, check if the filtered search space has any documents
-        document_count = await self._count_filtered_documents(destination, qdrant_filter)
-        ctx.logger.debug(f"[TemporalRelevance] Filtered document count: {document_count}")
-
-        if document_count == 0:
+        if not bounds.has_documents:
             await context.emitter.emit(
                 "recency_skipped",
                 {"reason": "no_documents_in_filtered_space"},
@@ -153,8 +98,7 @@ class TemporalRelevance(SearchOperation):
             ctx.logger.warning("[TemporalRelevance] No documents found in filtered search space. ")
             return
 
-        # Get oldest and newest timestamps
-        oldest, newest = await self._get_min_max_timestamps(destination, qdrant_filter)
+        oldest, newest = bounds.oldest, bounds.newest
         ctx.logger.debug(f"[TemporalRelevance] Oldest timestamp: {oldest}")
         ctx.logger.debug(f"[TemporalRelevance] Newest timestamp: {newest}")
 
@@ -165,8 +109,8 @@ class TemporalRelevance(SearchOperation):
                 op_name=self.__class__.__name__,
             )
             ctx.logger.warning(
-                f"[TemporalRelevance] Could not find valid timestamps in "
-                f"{document_count} documents. Skipping temporal relevance calculation."
+                "[TemporalRelevance] Could not find valid timestamps in the filtered "
+                "documents. Skipping temporal relevance calculation."
             )
             # Don't fail - just skip temporal relevance
             return
@@ -228,6 +172,110 @@ class TemporalRelevance(SearchOperation):
             "for decay calculation"
         )
 
+    async def _get_bounds(
+        self,
+        context: SearchContext,
+        filter_dict: Optional[dict],
+        state: dict[str, Any],
+        ctx: ApiContext,
+    ) -> TimestampBounds:
+        """Get timestamp bounds, from cache when the search space is unfiltered."""
+        # Unfiltered bounds only change when a sync writes data
+        cacheable = not filter_dict
+        bounds = None
+        if cacheable:
+            bounds = await temporal_bounds_cache.get(context.collection_id, self.supporting_sources)
+        self._report_metrics(state, bounds_cached=bounds is not None)
+        if bounds is not None:
+            ctx.logger.debug("[TemporalRelevance] Using cached timestamp bounds")
+            return bounds
+
+        qdrant_filter = self._build_scroll_filter(context, filter_dict, ctx)
+        bounds = await self._compute_bounds(context, qdrant_filter, ctx)
+        if cacheable:
+            await temporal_bounds_cache.set(context.collection_id, self.supporting_sources, bounds)
+        return bounds
+
+    def _build_scroll_filter(
+        self, context: SearchContext, filter_dict: Optional[dict], ctx: ApiContext
+    ) -> rest.Filter:
+        """Build the Qdrant filter for the (tenant, source, timestamped) search space."""
+        qdrant_filter = self._convert_to_qdrant_filter(filter_dict)
+
+        # Inject tenant filter for multi-tenant isolation
+        tenant_condition = rest.FieldCondition(
+            key="airweave_collection_id",
+            match=rest.MatchValue(value=str(context.collection_id)),
+        )
+
+        # CRITICAL: Filter to only documents with updated_at field
+        # This prevents Qdrant decay formula errors on documents without timestamps
+        # IsEmpty matches: field doesn't exist OR is null OR is []
+        # We use must_not to require: field exists AND has a value
+        has_timestamp_condition = rest.IsEmptyCondition(
+            is_empty=rest.PayloadField(key=self.DATETIME_FIELD)
+        )
+
+        # Build must conditions list
+        must_conditions = [tenant_condition]
+
+        # Add source filter if we're restricting to temporal-supporting sources
+        if self.supporting_sources is not None:
+            source_condition = rest.FieldCondition(
+                key="airweave_system_metadata.source_name",
+                match=rest.MatchAny(any=self.supporting_sources),
+            )
+            must_conditions.append(source_condition)
+            ctx.logger.info(
+                f"[TemporalRelevance] Filtering to {len(self.supporting_sources)} "
+                f"temporal-supporting source(s): {self.supporting_sources}"
+            )
+
+        if qdrant_filter:
+            # Merge with existing filter
+            if not qdrant_filter.must:
+                qdrant_filter.must = []
+            qdrant_filter.must.extend(must_conditions)
+            # Ensure documents have the timestamp field for decay calculation
+            if not qdrant_filter.must_not:
+                qdrant_filter.must_not = []
+            qdrant_filter.must_not.append(has_timestamp_condition)
+        else:
+            # Create new filter with tenant, source, and timestamp requirements
+            qdrant_filter = rest.Filter(must=must_conditions, must_not=[has_timestamp_condition])
+
+        ctx.logger.debug(
+            f"[TemporalRelevance] Applied tenant filter: collection_id={context.collection_id}"
+        )
+
+        return qdrant_filter
+
+    async def _compute_bounds(
+        self,
+        context: SearchContext,
+        qdrant_filter: rest.Filter,
+        ctx: ApiContext,
+    ) -> TimestampBounds:
+        """Find the timestamp bounds of the filtered space with live Qdrant scrolls."""
+        # Connect to Qdrant (runtime import to avoid circular dependency)
+        from airweave.platform.destinations.qdrant import QdrantDestination
+
+        destination = await QdrantDestination.create(
+            collection_id=context.collection_id,
+            vector_size=context.vector_size,
+            logger=ctx.logger,
+        )
+
+        # First, check if the filtered search space has any documents
+        document_count = await self._count_filtered_documents(destination, qdrant_filter)
+        ctx.logger.debug(f"[TemporalRelevance] Filtered document count: {document_count}")
+        if document_count == 0:
+            return TimestampBounds(has_documents=False)
+
+        # Get oldest and newest timestamps
+        oldest, newest = await self._get_min_max_timestamps(destination, qdrant_filter)
+        return TimestampBounds(has_documents=True, oldest=oldest, newest=newest)
+
     def _build_filter_excluding_null_timestamps(self, filter_dict: Optional[dict]) -> dict:
         """Build filter that excludes documents without updated_at field.
 
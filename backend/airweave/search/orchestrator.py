@@ -3,17 +3,20 @@
 The orchestrator is responsible for:
 1. Extracting enabled operations from the search context
 2. Determining execution order based on dependencies
-3. Executing operations sequentially, passing state between them
-4. Using the emitter from context for streaming updates
+3. Executing operations as a DAG: each operation starts as soon as the
+   operations it depends on have finished, passing state between them
+4. Using the emitter from context for streaming updates, in execution order
 5. Automatically capturing timing metrics for each operation
 """
 
+import asyncio
 import time
-from typing import Any, List, Set
+from typing import Any, Dict, List, Set
 
 from airweave.api.context import ApiContext
 from airweave.schemas.search import SearchResponse
 from airweave.search.context import SearchContext
+from airweave.search.emitter import EventBuffer
 from airweave.search.operations._base import SearchOperation
 
 
@@ -21,7 +24,14 @@ class SearchOrchestrator:
     """Orchestrates search operation execution.
 
     The orchestrator uses topological sort to determine execution order
-    based on declared dependencies, then executes operations sequentially.
+    based on declared dependencies, then starts every operation as soon as
+    its enabled dependencies are done (e.g. QueryInterpretation and EmbedQuery
+    both run right after QueryExpansion).
+
+    Operations only share the state dict; concurrently running operations write
+    disjoint keys. Streaming events stay deterministic: events of an operation
+    are published only after all operations before it in the topological order
+    have finished, so the stream looks the same as with sequential execution.
     """
 
     async def run(
@@ -56,46 +66,97 @@ class SearchOrchestrator:
         # Resolve execution order
         execution_order = self._resolve_execution_order(context, ctx)
 
-        # Execute operations in order with automatic timing
+        # Execute operations as a DAG with automatic timing
+        await self._execute_dag(execution_order, context, state, ctx)
+
+        # Emit results event
+        await emitter.emit("results", {"results": state.get("results", [])})
+
+        # Emit done event
+        await emitter.emit("done", {"request_id": context.request_id})
+
+        response = SearchResponse(results=state.get("results"), completion=state.get("completion"))
+        return response, state
+
+    async def _execute_dag(
+        self,
+        execution_order: List[SearchOperation],
+        context: SearchContext,
+        state: dict[str, Any],
+        ctx: ApiContext,
+    ) -> None:
+        """Run operations concurrently, each once its enabled dependencies completed.
+
+        Tasks are awaited (and their event buffers released) in topological order,
+        so errors surface in the same order as with sequential execution.
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        buffers: Dict[str, EventBuffer] = {}
         for operation in execution_order:
             op_name = operation.__class__.__name__
+            dependencies = [tasks[dep] for dep in operation.depends_on() if dep in tasks]
+            buffers[op_name] = EventBuffer()
+            tasks[op_name] = asyncio.create_task(
+                self._run_operation(operation, dependencies, buffers[op_name], context, state, ctx),
+                name=f"search-op-{op_name}",
+            )
+
+        try:
+            for op_name, task in tasks.items():
+                # All earlier operations are done: publish this one's events and go live
+                await context.emitter.release(buffers[op_name])
+                await task
+        finally:
+            # On failure (or cancellation of the search) stop the remaining operations and
+            # retrieve their outcomes so no task exception goes unobserved
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    async def _run_operation(
+        self,
+        operation: SearchOperation,
+        dependencies: List[asyncio.Task],
+        buffer: EventBuffer,
+        context: SearchContext,
+        state: dict[str, Any],
+        ctx: ApiContext,
+    ) -> None:
+        """Wait for dependencies, then execute one operation with timing and events."""
+        op_name = operation.__class__.__name__
+        emitter = context.emitter
 
-            # Emit operator_start
-            await emitter.emit("operator_start", {"name": op_name}, op_name=op_name)
+        # A failed dependency propagates here without emitting events for this operation
+        for dependency in dependencies:
+            await dependency
 
-            try:
-                # Capture start time
-                start_time = time.monotonic()
+        emitter.buffer_events(buffer)
 
-                # Execute operation (emitter is now in context)
-                await operation.execute(context, state, ctx)
+        # Emit operator_start
+        await emitter.emit("operator_start", {"name": op_name}, op_name=op_name)
 
-                # Capture end time and calculate duration
-                duration_ms = (time.monotonic() - start_time) * 1000
+        try:
+            # Capture start time
+            start_time = time.monotonic()
 
-                # Store timing metric automatically
-                if op_name not in state["_operation_metrics"]:
-                    state["_operation_metrics"][op_name] = {}
-                state["_operation_metrics"][op_name]["duration_ms"] = duration_ms
+            # Execute operation (emitter is now in context)
+            await operation.execute(context, state, ctx)
 
-                # Emit operator_end
-                await emitter.emit("operator_end", {"name": op_name}, op_name=op_name)
+            # Capture end time and calculate duration
+            duration_ms = (time.monotonic() - start_time) * 1000
 
-            except Exception as e:
-                # Emit error event
-                await emitter.emit(
-                    "error", {"operation": op_name, "message": str(e)}, op_name=op_name
-                )
-                raise
+            # Store timing metric automatically
+            if op_name not in state["_operation_metrics"]:
+                state["_operation_metrics"][op_name] = {}
+            state["_operation_metrics"][op_name]["duration_ms"] = duration_ms
 
-        # Emit results event
-        await emitter.emit("results", {"results": state.get("results", [])})
+            # Emit operator_end
+            await emitter.emit("operator_end", {"name": op_name}, op_name=op_name)
 
-        # Emit done event
-        await emitter.emit("done", {"request_id": context.request_id})
-
-        response = SearchResponse(results=state.get("results"), completion=state.get("completion"))
-        return response, state
+        except Exception as e:
+            # Emit error event
+            await emitter.emit("error", {"operation": op_name, "message": str(e)}, op_name=op_name)
+            raise
 
     def _resolve_execution_order(
         self, context: SearchContext, ctx: ApiContext
@@ -136,8 +197,8 @@ class SearchOrchestrator:
             visited.add(op_name)
             ordered.append(operation)
 
-        # Visit each operation
-        for op_name in enabled_names:
+        # Visit each operation (in declaration order, so the order is deterministic)
+        for op_name in op_map:
             visit(op_name)
 
         # Log execution order
@@ -157,8 +218,10 @@ class SearchOrchestrator:
                 context.user_filter,
                 context.temporal_relevance,
                 context.retrieval,
+                context.expansion_retrieval,
                 context.federated_search,
                 context.reranking,
+                context.payload_hydration,
                 context.generate_answer,
             ]
             if op is not None
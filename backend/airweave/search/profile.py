@@ -0,0 +1,205 @@
+"""Per-collection search profile.
+
+Every search request needs to know which sources of a collection are vector-backed or
+federated and which support temporal relevance, and query interpretation needs the
+filterable field catalog of those sources. Computing this takes the source connections,
+the source rows and entity-class introspection, but it only changes when source
+connections are added or removed.
+
+Profiles are cached in-process and in Redis (shared across API workers). Each entry is
+stamped with a per-collection generation counter kept in Redis; invalidate() bumps the
+counter, so every worker rebuilds on its next lookup after its short local TTL.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave import crud, schemas
+from airweave.api.context import ApiContext
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+from airweave.models.source import Source
+from airweave.platform.locator import resource_locator
+
+
+class CollectionSearchProfile(BaseModel):
+    """Source capabilities and filterable fields of a collection."""
+
+    readable_collection_id: str
+    generation: int = 0
+    source_short_names: List[str] = Field(default_factory=list)
+    vector_sources: List[str] = Field(default_factory=list)
+    federated_sources: List[str] = Field(default_factory=list)
+    temporal_supporting_sources: List[str] = Field(default_factory=list)
+    temporal_non_supporting_sources: List[str] = Field(default_factory=list)
+    # source short_name -> {field name: description}; excludes sources without interpretation
+    filterable_fields: Dict[str, Dict[str, str]] = Field(default_factory=dict)
+
+    @property
+    def has_vector_sources(self) -> bool:
+        """Whether the collection has any non-federated (vector-backed) sources."""
+        return bool(self.vector_sources)
+
+
+class SearchProfileService:
+    """Builds and caches collection search profiles."""
+
+    KEY_PREFIX = "search:profile"
+    GENERATION_KEY_PREFIX = "search:profile:gen"
+    REDIS_TTL = 3600
+    LOCAL_TTL = 15.0
+    MAX_LOCAL_ENTRIES = 1024
+
+    # Sources that do not support query interpretation
+    NON_INTERPRETABLE_SOURCES = {"postgresql"}
+
+    def __init__(self) -> None:
+        """Initialize an empty local cache."""
+        self._local: Dict[str, Tuple[float, CollectionSearchProfile]] = {}
+
+    def _cache_key(self, organization_id: UUID, readable_collection_id: str) -> str:
+        return f"{organization_id}:{readable_collection_id}"
+
+    async def get(
+        self, db: AsyncSession, readable_collection_id: str, ctx: ApiContext
+    ) -> CollectionSearchProfile:
+        """Return the search profile of a collection, building it on a cache miss.
+
+        Raises:
+            ValueError: If a source of the collection has no source model
+        """
+        key = self._cache_key(ctx.organization.id, readable_collection_id)
+
+        cached = self._local.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.LOCAL_TTL:
+            return cached[1]
+
+        generation, profile = await self._read_redis(key)
+        if profile is None or profile.generation != generation:
+            profile = await self._build(db, readable_collection_id, generation, ctx)
+            await self._write_redis(key, profile)
+
+        if len(self._local) >= self.MAX_LOCAL_ENTRIES:
+            self._local.pop(next(iter(self._local)))
+        self._local[key] = (time.monotonic(), profile)
+        return profile
+
+    async def invalidate(self, organization_id: UUID, readable_collection_id: str) -> None:
+        """Invalidate a collection's profile after its source connections changed."""
+        key = self._cache_key(organization_id, readable_collection_id)
+        self._local.pop(key, None)
+        try:
+            await redis_client.client.incr(f"{self.GENERATION_KEY_PREFIX}:{key}")
+            await redis_client.client.delete(f"{self.KEY_PREFIX}:{key}")
+        except Exception as e:
+            logger.warning(f"Error invalidating search profile for {readable_collection_id}: {e}")
+
+    async def _read_redis(self, key: str) -> Tuple[int, Optional[CollectionSearchProfile]]:
+        """Read the current generation and cached profile in one round trip."""
+        try:
+            raw_profile, raw_generation = await redis_client.client.mget(
+                f"{self.KEY_PREFIX}:{key}", f"{self.GENERATION_KEY_PREFIX}:{key}"
+            )
+        except Exception as e:
+            logger.error(f"Error reading search profile from cache: {e}. Falling back to DB.")
+            return 0, None
+
+        generation = int(raw_generation) if raw_generation else 0
+        if not raw_profile:
+            return generation, None
+        return generation, CollectionSearchProfile.model_validate_json(raw_profile)
+
+    async def _write_redis(self, key: str, profile: CollectionSearchProfile) -> None:
+        try:
+            await redis_client.client.setex(
+                f"{self.KEY_PREFIX}:{key}", self.REDIS_TTL, profile.model_dump_json()
+            )
+        except Exception as e:
+            logger.warning(f"Error caching search profile: {e}. Request will continue.")
+
+    async def _build(
+        self, db: AsyncSession, readable_collection_id: str, generation: int, ctx: ApiContext
+    ) -> CollectionSearchProfile:
+        """Compute the profile with one query per table instead of one per source."""
+        source_connections = await crud.source_connection.get_for_collection(
+            db, readable_collection_id=readable_collection_id, ctx=ctx
+        )
+        short_names = sorted({conn.short_name for conn in source_connections})
+        profile = CollectionSearchProfile(
+            readable_collection_id=readable_collection_id,
+            generation=generation,
+            source_short_names=short_names,
+        )
+        if not short_names:
+            return profile
+
+        result = await db.execute(select(Source).where(Source.short_name.in_(short_names)))
+        source_models = {source.short_name: source for source in result.unique().scalars()}
+
+        for short_name in short_names:
+            source_model = source_models.get(short_name)
+            if not source_model:
+                raise ValueError(f"Source model not found for short_name={short_name}")
+
+            source_class = resource_locator.get_source(source_model)
+            if getattr(source_class, "_federated_search", False):
+                profile.federated_sources.append(short_name)
+            else:
+                profile.vector_sources.append(short_name)
+
+            if getattr(source_model, "supports_temporal_relevance", True):
+                profile.temporal_supporting_sources.append(short_name)
+            else:
+                profile.temporal_non_supporting_sources.append(short_name)
+
+            if short_name not in self.NON_INTERPRETABLE_SOURCES:
+                profile.filterable_fields[short_name] = await self._get_source_fields(
+                    db, short_name
+                )
+
+        ctx.logger.debug(
+            f"[SearchProfile] Built profile for {readable_collection_id}: "
+            f"vector={profile.vector_sources}, federated={profile.federated_sources}"
+        )
+        return profile
+
+    async def _get_source_fields(self, db: AsyncSession, short_name: str) -> Dict[str, str]:
+        """Get filterable fields of a source from its entity definitions."""
+        entity_defs = await crud.entity_definition.get_multi_by_source_short_name(
+            db, source_short_name=short_name
+        )
+
+        all_fields = {}
+        for entity_def in entity_defs:
+            # Convert to schema and get entity class
+            entity_schema = schemas.EntityDefinition.model_validate(
+                entity_def, from_attributes=True
+            )
+            entity_class = resource_locator.get_entity_definition(entity_schema)
+
+            # Extract all fields from entity class for filtering
+            if hasattr(entity_class, "model_fields"):
+                for field_name, field_info in entity_class.model_fields.items():
+                    if field_name.startswith("_") or field_name == "airweave_system_metadata":
+                        continue
+
+                    # Get description from field
+                    description = getattr(field_info, "description", None)
+
+                    # Check json_schema_extra for description (used by AirweaveField)
+                    if not description and hasattr(field_info, "json_schema_extra"):
+                        extra = field_info.json_schema_extra
+                        if isinstance(extra, dict):
+                            description = extra.get("description")
+
+                    all_fields[field_name] = description or f"{field_name} field"
+
+        return all_fields
+
+
+search_profiles = SearchProfileService()
@@ -0,0 +1,91 @@
+"""Cached per-collection timestamp bounds for temporal relevance.
+
+Recency-weighted search needs the oldest and newest `updated_at` in the searched
+space, which costs three Qdrant scrolls over the shared multi-tenant collection.
+Without a query filter the bounds only depend on the collection and the set of
+temporal-supporting sources, and only change when a sync writes data.
+
+Bounds are kept in one Redis hash per collection (field = source set). The sync
+orchestrator invalidates the hash when a sync job ends; entries also expire after
+MAX_AGE_SECONDS to bound staleness while a long sync is still writing.
+"""
+
+import time
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+
+
+class TimestampBounds(BaseModel):
+    """Oldest/newest timestamps of a collection's searchable documents."""
+
+    has_documents: bool
+    oldest: Optional[datetime] = None
+    newest: Optional[datetime] = None
+    cached_at: float = 0.0
+
+
+class TemporalBoundsCache:
+    """Redis-backed cache of timestamp bounds per (collection, source set)."""
+
+    KEY_PREFIX = "search:time_bounds"
+    MAX_AGE_SECONDS = 600
+    KEY_TTL_SECONDS = 3600
+
+    def _key(self, collection_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}:{collection_id}"
+
+    @staticmethod
+    def _field(supporting_sources: Optional[List[str]]) -> str:
+        return "*" if supporting_sources is None else ",".join(sorted(supporting_sources))
+
+    async def get(
+        self, collection_id: UUID, supporting_sources: Optional[List[str]]
+    ) -> Optional[TimestampBounds]:
+        """Return cached bounds, or None on a miss (or any cache error)."""
+        try:
+            raw = await redis_client.client.hget(
+                self._key(collection_id), self._field(supporting_sources)
+            )
+            if not raw:
+                return None
+            bounds = TimestampBounds.model_validate_json(raw)
+        except Exception as e:
+            logger.warning(f"Error reading timestamp bounds from cache: {e}")
+            return None
+
+        if time.time() - bounds.cached_at > self.MAX_AGE_SECONDS:
+            return None
+        return bounds
+
+    async def set(
+        self,
+        collection_id: UUID,
+        supporting_sources: Optional[List[str]],
+        bounds: TimestampBounds,
+    ) -> None:
+        """Store bounds computed from a live scroll."""
+        bounds.cached_at = time.time()
+        key = self._key(collection_id)
+        try:
+            pipe = redis_client.client.pipeline(transaction=False)
+            pipe.hset(key, self._field(supporting_sources), bounds.model_dump_json())
+            pipe.expire(key, self.KEY_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error caching timestamp bounds: {e}. Request will continue.")
+
+    async def invalidate(self, collection_id: UUID) -> None:
+        """Drop all cached bounds of a collection (its data changed)."""
+        try:
+            await redis_client.client.delete(self._key(collection_id))
+        except Exception as e:
+            logger.warning(f"Error invalidating timestamp bounds for {collection_id}: {e}")
+
+
+temporal_bounds_cache = TemporalBoundsCache()
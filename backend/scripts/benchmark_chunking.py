@@ -0,0 +1,200 @@
+"""Benchmark: chunking large documents (safety net reconstruction and token counting).
+
+Measures, over a synthetic corpus of large documents:
+- safety net reconstruction: the former per-chunk scan over all oversized chunks
+  (O(chunks x oversized)) vs the keyed lookup used by the chunkers (O(chunks))
+- token counting: the former three cl100k_base passes per chunk (chunker recount,
+  pipeline statistics, embedder request packing) vs the single encode_batch pass
+  whose counts are now reused downstream
+- end-to-end SemanticChunker / CodeChunker batches (in-process, models load once)
+  unless --skip-models is given
+
+Usage (from backend/):
+    python scripts/benchmark_chunking.py [--docs 200] [--doc-tokens 40000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, List
+
+import tiktoken
+
+from airweave.platform.chunkers.code import CodeChunker
+from airweave.platform.chunkers.semantic import SemanticChunker
+
+MAX_TOKENS = SemanticChunker.MAX_TOKENS_PER_CHUNK
+WORDS = (
+    "sync entity vector search index chunk token payload source destination collection "
+    "query filter embedding cursor connector retrieval ranking qdrant postgres worker"
+).split()
+
+
+def build_corpus(docs: int, doc_tokens: int, seed: int = 7) -> List[str]:
+    """Large prose documents; every third one has a long run without sentence breaks."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(docs):
+        words = [rng.choice(WORDS) for _ in range(doc_tokens)]
+        if i % 3 == 0:
+            corpus.append(" ".join(words))
+        else:
+            sentences = [" ".join(words[j : j + 20]) + "." for j in range(0, len(words), 20)]
+            corpus.append(" ".join(sentences))
+    return corpus
+
+
+def build_code_corpus(docs: int, doc_tokens: int) -> List[str]:
+    """Large Python modules made of many small functions and one huge one."""
+    corpus = []
+    for i in range(docs):
+        small = "\n\n".join(
+            f"def handler_{i}_{j}(x):\n    return x * {j} + {i}\n" for j in range(doc_tokens // 40)
+        )
+        huge = "def huge():\n" + "".join(f"    v{j} = {j}\n" for j in range(doc_tokens // 4))
+        corpus.append(f"{small}\n\n{huge}")
+    return corpus
+
+
+def synthetic_results(docs: int, chunks_per_doc: int, oversized_every: int) -> List[List[Any]]:
+    """Chonkie-like chunk lists with a fixed fraction of oversized chunks."""
+    return [
+        [
+            SimpleNamespace(
+                text=f"{d}:{c}",
+                start_index=0,
+                end_index=0,
+                token_count=MAX_TOKENS + 1 if c % oversized_every == 0 else 100,
+            )
+            for c in range(chunks_per_doc)
+        ]
+        for d in range(docs)
+    ]
+
+
+def split_stub(texts: List[str]) -> List[List[Any]]:
+    """Stand-in fallback splitter (the splitter itself is not what is measured)."""
+    return [
+        [SimpleNamespace(text=t, start_index=0, end_index=0, token_count=MAX_TOKENS // 2)] * 2
+        for t in texts
+    ]
+
+
+def legacy_reconstruct(results: List[List[Any]]) -> List[List[dict]]:
+    """Previous reconstruction: scan every oversized entry for every chunk."""
+    oversized_texts, oversized_map = [], {}
+    for doc_idx, chunks in enumerate(results):
+        for chunk_idx, chunk in enumerate(chunks):
+            if chunk.token_count > MAX_TOKENS:
+                oversized_map[len(oversized_texts)] = (doc_idx, chunk_idx)
+                oversized_texts.append(chunk.text)
+    split_by_pos = dict(enumerate(split_stub(oversized_texts)))
+
+    final = []
+    for doc_idx, chunks in enumerate(results):
+        out = []
+        for chunk_idx, chunk in enumerate(chunks):
+            pos = next(
+                (p for p, (d, c) in oversized_map.items() if d == doc_idx and c == chunk_idx),
+                None,
+            )
+            for sub in split_by_pos[pos] if pos is not None else [chunk]:
+                out.append({"text": sub.text, "token_count": sub.token_count})
+        final.append(out)
+    return final
+
+
+def timed(fn: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    """Return (median seconds, last result) over `repeat` runs."""
+    durations, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), result
+
+
+def bench_reconstruction(repeat: int) -> None:
+    """Compare legacy and keyed safety net reconstruction."""
+    chunker = SemanticChunker()
+    chunker._token_chunker = SimpleNamespace(chunk_batch=split_stub)
+
+    print("Safety net reconstruction (median s):\n")
+    print(f"{'chunks':>8} {'oversized':>10} | {'legacy':>9} {'keyed':>9} | {'speedup':>7}")
+    print("-" * 54)
+    for docs, per_doc in [(50, 40), (200, 50), (500, 80)]:
+        results = synthetic_results(docs, per_doc, oversized_every=4)
+        oversized = sum(c.token_count > MAX_TOKENS for doc in results for c in doc)
+        legacy_s, legacy = timed(lambda r=results: legacy_reconstruct(r), repeat)
+        keyed_s, keyed = timed(lambda r=results: chunker._apply_safety_net_batched(r), repeat)
+        assert [[c["text"] for c in d] for d in legacy] == [[c["text"] for c in d] for d in keyed]
+        print(
+            f"{docs * per_doc:>8,} {oversized:>10,} | {legacy_s:>9.4f} {keyed_s:>9.4f} | "
+            f"{legacy_s / keyed_s:>6.1f}x"
+        )
+    print()
+
+
+def bench_token_counting(corpus: List[str], repeat: int) -> None:
+    """Compare three per-chunk encode passes with one batched pass."""
+    tokenizer = tiktoken.get_encoding("cl100k_base")
+    # Roughly SEMANTIC_CHUNK_SIZE-token chunks, as the semantic stage would produce
+    chunks = [doc[i : i + 8_000] for doc in corpus for i in range(0, len(doc), 8_000)]
+
+    def three_passes():
+        for _ in range(3):
+            counts = [len(tokenizer.encode(text)) for text in chunks]
+        return counts
+
+    def one_pass():
+        return [len(tokens) for tokens in tokenizer.encode_batch(chunks)]
+
+    legacy_s, legacy = timed(three_passes, repeat)
+    single_s, single = timed(one_pass, repeat)
+    assert legacy == single
+    print(f"Token counting over {len(chunks):,} chunks ({sum(single):,} tokens, median s):")
+    print(
+        f"  3 x encode: {legacy_s:.3f}   1 x encode_batch: {single_s:.3f}   "
+        f"speedup: {legacy_s / single_s:.1f}x\n"
+    )
+
+
+def bench_chunkers(corpus: List[str], code_corpus: List[str], repeat: int) -> None:
+    """End-to-end chunking of the corpora (first run loads the models)."""
+    for name, chunker, texts in [
+        ("SemanticChunker", SemanticChunker(), corpus),
+        ("CodeChunker", CodeChunker(), code_corpus),
+    ]:
+        chunker._ensure_chunkers()
+        seconds, results = timed(lambda c=chunker, t=texts: c._chunk_batch_sync(t), repeat)
+        chunks = sum(len(doc) for doc in results)
+        tokens = sum(c["token_count"] for doc in results for c in doc)
+        print(
+            f"{name}: {len(texts)} docs -> {chunks:,} chunks ({tokens:,} tokens) in "
+            f"{seconds:.2f}s ({tokens / seconds:,.0f} tokens/s)"
+        )
+
+
+def main(docs: int, doc_tokens: int, repeat: int, skip_models: bool) -> None:
+    """Build the corpora and print all benchmark tables."""
+    corpus = build_corpus(docs, doc_tokens)
+    code_corpus = build_code_corpus(max(1, docs // 4), doc_tokens)
+
+    bench_reconstruction(repeat)
+    bench_token_counting(corpus, repeat)
+    if not skip_models:
+        bench_chunkers(corpus, code_corpus, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200, help="documents in the corpus")
+    parser.add_argument("--doc-tokens", type=int, default=40_000, help="approx words per doc")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    parser.add_argument("--skip-models", action="store_true", help="skip Chonkie chunking")
+    args = parser.parse_args()
+    main(args.docs, args.doc_tokens, args.repeat, args.skip_models)
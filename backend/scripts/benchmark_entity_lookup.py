@@ -0,0 +1,161 @@
+"""Microbenchmark: composite-key entity lookup (OR chain vs unnest join).
+
+Compares the two query shapes used by crud.entity.bulk_get_by_entity_sync_and_definition:
+- legacy: WHERE sync_id = ? AND ((entity_id = ? AND entity_definition_id = ?) OR ...)
+- unnest: JOIN unnest(?::varchar[], ?::uuid[]) AS keys(...) ON ...
+
+Runs against a TEMP copy of the entity table (same indexes, no FKs), so it is safe to
+run against any dev database configured through the usual POSTGRES_* settings.
+
+Usage (from backend/):
+    python scripts/benchmark_entity_lookup.py [--rows 200000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import String, and_, bindparam, column, func, or_, select, table, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from airweave.db.session import async_engine
+
+BATCH_SIZES = [100, 500, 1_000, 5_000, 10_000]
+NUM_DEFINITIONS = 8
+
+bench_entity = table(
+    "bench_entity",
+    column("id", PG_UUID(as_uuid=True)),
+    column("sync_id", PG_UUID(as_uuid=True)),
+    column("entity_id", String),
+    column("entity_definition_id", PG_UUID(as_uuid=True)),
+    column("hash", String),
+)
+
+
+def build_or_query(sync_id, requests):
+    """Legacy statement: one OR branch per (entity_id, entity_definition_id)."""
+    conditions = [
+        and_(bench_entity.c.entity_id == eid, bench_entity.c.entity_definition_id == def_id)
+        for eid, def_id in requests
+    ]
+    return select(bench_entity).where(bench_entity.c.sync_id == sync_id, or_(*conditions))
+
+
+def build_unnest_query(sync_id, requests):
+    """New statement: join against unnest of two arrays."""
+    keys = (
+        func.unnest(
+            bindparam("entity_ids", [eid for eid, _ in requests], type_=ARRAY(String)),
+            bindparam(
+                "definition_ids",
+                [def_id for _, def_id in requests],
+                type_=ARRAY(PG_UUID(as_uuid=True)),
+            ),
+        )
+        .table_valued(
+            column("entity_id", String),
+            column("entity_definition_id", PG_UUID(as_uuid=True)),
+        )
+        .render_derived(name="keys")
+    )
+    return (
+        select(bench_entity)
+        .join(
+            keys,
+            and_(
+                bench_entity.c.entity_id == keys.c.entity_id,
+                bench_entity.c.entity_definition_id == keys.c.entity_definition_id,
+            ),
+        )
+        .where(bench_entity.c.sync_id == sync_id)
+    )
+
+
+async def seed(conn, sync_id, definition_ids, rows: int) -> list[tuple[str, uuid.UUID]]:
+    """Create and fill the temp table; return all (entity_id, definition_id) keys."""
+    await conn.execute(
+        text("CREATE TEMP TABLE bench_entity (LIKE entity INCLUDING DEFAULTS INCLUDING INDEXES)")
+    )
+    keys = [(f"entity-{i}", definition_ids[i % len(definition_ids)]) for i in range(rows)]
+    await conn.execute(
+        text(
+            "INSERT INTO bench_entity "
+            "(id, sync_id, sync_job_id, organization_id, entity_id, entity_definition_id, hash, "
+            " created_at, modified_at) "
+            "SELECT gen_random_uuid(), :sync_id, gen_random_uuid(), gen_random_uuid(), k.eid, "
+            " k.def_id, md5(k.eid), now(), now() "
+            "FROM unnest(CAST(:eids AS varchar[]), CAST(:def_ids AS uuid[])) AS k(eid, def_id)"
+        ),
+        {
+            "sync_id": sync_id,
+            "eids": [eid for eid, _ in keys],
+            "def_ids": [def_id for _, def_id in keys],
+        },
+    )
+    await conn.execute(text("ANALYZE bench_entity"))
+    return keys
+
+
+async def time_query(conn, stmt, repeat: int) -> tuple[float, float, int]:
+    """Return (median execute ms, median standalone compile ms, rows) over `repeat` runs.
+
+    Execute time includes SQLAlchemy's own (cached) compilation, as in production.
+    """
+    executes, compiles, rows = [], [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stmt.compile(dialect=conn.dialect)
+        compiles.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        result = await conn.execute(stmt)
+        rows = len(result.fetchall())
+        executes.append((time.perf_counter() - start) * 1000)
+    return statistics.median(executes), statistics.median(compiles), rows
+
+
+async def main(rows: int, repeat: int) -> None:
+    """Seed the temp table and print a latency table per batch size."""
+    sync_id = uuid.uuid4()
+    definition_ids = [uuid.uuid4() for _ in range(NUM_DEFINITIONS)]
+
+    async with async_engine.connect() as conn:
+        keys = await seed(conn, sync_id, definition_ids, rows)
+        step = max(1, len(keys) // max(BATCH_SIZES))
+
+        print(f"Seeded {rows:,} rows. Median of {repeat} runs (ms):\n")
+        print(
+            f"{'batch':>8} | {'OR exec':>10} {'OR compile':>11} | {'unnest exec':>12} "
+            f"{'unnest compile':>15} | {'speedup':>7}"
+        )
+        print("-" * 78)
+
+        for batch_size in BATCH_SIZES:
+            requests = keys[::step][:batch_size]
+            or_total, or_compile, or_rows = await time_query(
+                conn, build_or_query(sync_id, requests), repeat
+            )
+            un_total, un_compile, un_rows = await time_query(
+                conn, build_unnest_query(sync_id, requests), repeat
+            )
+            assert or_rows == un_rows == len(requests), (or_rows, un_rows, len(requests))
+            print(
+                f"{batch_size:>8,} | {or_total:>10.1f} {or_compile:>11.1f} | {un_total:>12.1f} "
+                f"{un_compile:>15.1f} | {or_total / un_total:>6.1f}x"
+            )
+
+        await conn.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000, help="rows to seed")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,74 @@
+"""Tests for guard rail quota leases.
+
+Tests that hot-loop checks are served from leased blocks, that billing status is cached,
+and that leases respect the usage limit.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.core.exceptions import UsageLimitExceededException
+from airweave.core.guard_rail_service import GuardRailService, QuotaLease
+from airweave.core.shared_models import ActionType
+from airweave.schemas.billing_period import BillingPeriodStatus
+from airweave.schemas.usage import UsageLimit
+
+
+@pytest.fixture
+def guard_rail():
+    """Guard rail for a billing-enabled org with 90 of 250 entities used."""
+    with patch("airweave.core.guard_rail_service.settings") as mock_settings:
+        mock_settings.LOCAL_DEVELOPMENT = False
+        service = GuardRailService(organization_id=uuid4(), logger=MagicMock())
+        service._has_billing = True
+        service._get_billing_status = AsyncMock(return_value=BillingPeriodStatus.ACTIVE)
+        service._get_usage = AsyncMock(return_value=MagicMock(entities=90))
+        service._infer_usage_limit = AsyncMock(return_value=UsageLimit(max_entities=250))
+        yield service
+
+
+@pytest.mark.asyncio
+async def test_lease_serves_a_block_with_one_check(guard_rail):
+    """Test that a block of units costs one billing/usage lookup."""
+    lease = QuotaLease(guard_rail, ActionType.ENTITIES, block_size=100)
+
+    for _ in range(100):
+        await lease.consume()
+
+    assert guard_rail._get_billing_status.await_count == 1
+    assert guard_rail._get_usage.await_count == 1
+    assert guard_rail.leased[ActionType.ENTITIES] == 100
+
+
+@pytest.mark.asyncio
+async def test_lease_is_capped_by_remaining_quota(guard_rail):
+    """Test that leases shrink near the limit and raise once it is reached."""
+    guard_rail._get_usage.return_value = MagicMock(entities=245)
+    lease = QuotaLease(guard_rail, ActionType.ENTITIES, block_size=100)
+
+    await lease.consume()
+    assert guard_rail.leased[ActionType.ENTITIES] == 5  # 250 limit - 245 used
+
+    # Usage reaches the limit (e.g. flushed by this or another sync)
+    guard_rail._get_usage.return_value = MagicMock(entities=250)
+    guard_rail.usage_fetched_at = None
+    for _ in range(4):
+        await lease.consume()  # rest of the current block needs no check
+    with pytest.raises(UsageLimitExceededException):
+        await lease.consume()
+
+    # Billing status stays cached across leases
+    assert guard_rail._get_billing_status.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_settles_outstanding_leases(guard_rail):
+    """Test that flush_all releases leased units."""
+    lease = QuotaLease(guard_rail, ActionType.ENTITIES, block_size=100)
+    await lease.consume()
+
+    await guard_rail.flush_all()
+
+    assert guard_rail.leased[ActionType.ENTITIES] == 0
@@ -0,0 +1,119 @@
+"""Tests for shallow chunk entities and parent-shared payload serialization."""
+
+from typing import Optional
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from airweave.platform.entities._base import AirweaveSystemMetadata, BaseEntity, Breadcrumb
+
+
+class DocumentEntity(BaseEntity):
+    """Entity with a large source field, like most API entities."""
+
+    content: str
+    url: Optional[str] = None
+
+
+@pytest.fixture
+def parent():
+    """Enriched parent entity ready for chunking."""
+    return DocumentEntity(
+        entity_id="doc-1",
+        breadcrumbs=[Breadcrumb(entity_id="space-1")],
+        name="Design doc",
+        content="x" * 10_000,
+        textual_representation="full document text",
+        airweave_system_metadata=AirweaveSystemMetadata(
+            source_name="notion", entity_type="DocumentEntity", sync_id=uuid4(), hash="abc"
+        ),
+    )
+
+
+def model_dump_payload(entity: BaseEntity, **kwargs) -> dict:
+    """Payload as produced by a plain model_dump (the pre-sharing behavior)."""
+    return entity.model_dump(
+        mode="json", exclude={"airweave_system_metadata": {"vectors"}}, **kwargs
+    )
+
+
+# ============================================================================
+# create_chunk
+# ============================================================================
+
+
+def test_create_chunk_shares_parent_fields(parent):
+    """Test that chunks reference the parent's values and own only chunk fields."""
+    chunk = parent.create_chunk(2, "chunk text", token_count=3)
+
+    assert isinstance(chunk, DocumentEntity)
+    assert chunk.entity_id == "doc-1__chunk_2"
+    assert chunk.textual_representation == "chunk text"
+    assert chunk.chunk_token_count == 3
+    # Shared by reference, not copied
+    assert chunk.breadcrumbs is parent.breadcrumbs
+    assert chunk.content is parent.content
+
+
+def test_create_chunk_copies_system_metadata(parent):
+    """Test that chunk metadata is independent of the parent's."""
+    chunk = parent.create_chunk(0, "chunk text")
+
+    assert chunk.airweave_system_metadata is not parent.airweave_system_metadata
+    assert chunk.airweave_system_metadata.chunk_index == 0
+    assert chunk.airweave_system_metadata.original_entity_id == "doc-1"
+    assert chunk.airweave_system_metadata.hash == "abc"
+    assert parent.airweave_system_metadata.chunk_index is None
+    assert parent.entity_id == "doc-1"
+
+
+# ============================================================================
+# to_payload
+# ============================================================================
+
+
+@pytest.mark.parametrize("exclude_none", [True, False])
+def test_chunk_payload_matches_model_dump(parent, exclude_none):
+    """Test that shared-parent serialization is identical to a full model_dump."""
+    chunk = parent.create_chunk(1, "chunk text")
+    chunk.airweave_system_metadata.vectors = [[0.1, 0.2]]
+
+    payload = chunk.to_payload({}, exclude_none=exclude_none)
+
+    assert payload == model_dump_payload(chunk, exclude_none=exclude_none)
+    assert "vectors" not in payload["airweave_system_metadata"]
+
+
+def test_chunk_payload_without_system_metadata(parent):
+    """Test that system metadata can be left out of the payload."""
+    chunk = parent.create_chunk(0, "chunk text")
+
+    payload = chunk.to_payload({}, exclude_none=False, include_system_metadata=False)
+
+    assert "airweave_system_metadata" not in payload
+    assert payload["textual_representation"] == "chunk text"
+    assert payload["url"] is None
+
+
+def test_parent_fields_serialized_once_per_parent(parent):
+    """Test that all chunks of a parent reuse one serialization of its fields."""
+    chunks = [parent.create_chunk(i, f"chunk {i}") for i in range(3)]
+    parent_payloads: dict = {}
+
+    with patch.object(
+        DocumentEntity, "model_dump", autospec=True, side_effect=BaseModel.model_dump
+    ) as dump:
+        payloads = [chunk.to_payload(parent_payloads) for chunk in chunks]
+
+    assert dump.call_count == 1
+    assert [p["entity_id"] for p in payloads] == [f"doc-1__chunk_{i}" for i in range(3)]
+    assert [p["textual_representation"] for p in payloads] == [f"chunk {i}" for i in range(3)]
+    # The cached parent fields are not mutated by the chunk overlays
+    assert set(parent_payloads[id(parent)]).isdisjoint(BaseEntity.CHUNK_FIELDS)
+
+
+def test_regular_entity_payload_matches_model_dump(parent):
+    """Test that non-chunk entities serialize exactly as model_dump."""
+    assert parent.to_payload() == model_dump_payload(parent, exclude_none=True)
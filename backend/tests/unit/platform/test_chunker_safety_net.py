@@ -0,0 +1,85 @@
+"""Tests for the chunkers' safety net reconstruction and token count reuse.
+
+Chonkie models are never loaded: the fallback splitters are replaced with stubs.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.platform.chunkers.code import CodeChunker
+from airweave.platform.chunkers.semantic import SemanticChunker
+
+MAX = SemanticChunker.MAX_TOKENS_PER_CHUNK
+
+
+def make_chunk(text: str, token_count: int):
+    """Chonkie-like chunk object."""
+    return SimpleNamespace(
+        text=text, start_index=0, end_index=len(text), token_count=token_count
+    )
+
+
+def split_in_two(texts):
+    """Stub splitter: every oversized text becomes two sub-chunks under the limit."""
+    return [[make_chunk(f"{t}/a", MAX // 2), make_chunk(f"{t}/b", MAX // 2)] for t in texts]
+
+
+@pytest.fixture(params=[SemanticChunker, CodeChunker])
+def chunker(request, monkeypatch):
+    """Chunker singleton with a stubbed fallback splitter (restored after the test)."""
+    instance = request.param()
+    splitter = MagicMock()
+    splitter.chunk_batch.side_effect = split_in_two
+    if isinstance(instance, SemanticChunker):
+        monkeypatch.setattr(instance, "_token_chunker", splitter)
+    else:
+        monkeypatch.setattr(instance, "_sentence_chunker", splitter)
+    return instance, splitter
+
+
+def test_oversized_chunks_replaced_in_place(chunker):
+    """Test that split sub-chunks replace the oversized chunk in document order."""
+    instance, splitter = chunker
+    results = [
+        [make_chunk("d0c0", 10), make_chunk("d0c1", MAX + 1), make_chunk("d0c2", 20)],
+        [make_chunk("d1c0", 30)],
+        [make_chunk("d2c0", MAX * 2)],
+    ]
+
+    final = instance._apply_safety_net_batched(results)
+
+    assert [[c["text"] for c in doc] for doc in final] == [
+        ["d0c0", "d0c1/a", "d0c1/b", "d0c2"],
+        ["d1c0"],
+        ["d2c0/a", "d2c0/b"],
+    ]
+    assert final[0][0]["token_count"] == 10
+    splitter.chunk_batch.assert_called_once_with(["d0c1", "d2c0"])
+
+
+def test_no_oversized_chunks_skip_splitter(chunker):
+    """Test that the splitter is not called when every chunk fits."""
+    instance, splitter = chunker
+    results = [[make_chunk("a", 1), make_chunk("b", 2)], []]
+
+    final = instance._apply_safety_net_batched(results)
+
+    assert [[c["text"] for c in doc] for doc in final] == [["a", "b"], []]
+    splitter.chunk_batch.assert_not_called()
+
+
+def test_semantic_recount_encodes_batch_once(monkeypatch):
+    """Test that semantic chunks are recounted with a single encode_batch call."""
+    instance = SemanticChunker()
+    tokenizer = MagicMock()
+    tokenizer.encode_batch.side_effect = lambda texts: [[0] * len(t) for t in texts]
+    monkeypatch.setattr(instance, "_tiktoken_tokenizer", tokenizer)
+    results = [[make_chunk("abc", 99), make_chunk("de", 99)], [make_chunk("f", 99)]]
+
+    instance._recount_tokens_with_tiktoken(results)
+
+    assert [[c.token_count for c in doc] for doc in results] == [[3, 2], [1]]
+    tokenizer.encode_batch.assert_called_once_with(["abc", "de", "f"])
+    tokenizer.encode.assert_not_called()
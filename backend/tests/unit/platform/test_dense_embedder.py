@@ -0,0 +1,120 @@
+"""Tests for DenseEmbedder request planning and concurrent dispatch.
+
+The OpenAI client is never created: the embedder is built without __init__ and
+_embed_batch is replaced with a stub.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.platform.embedders.openai import DenseEmbedder
+from airweave.platform.sync.exceptions import SyncFailureError
+
+MAX_TEXTS = DenseEmbedder.MAX_TEXTS_PER_REQUEST
+MAX_TOKENS = DenseEmbedder.MAX_TOKENS_PER_REQUEST
+
+
+@pytest.fixture
+def embedder():
+    """Embedder instance that bypasses the singleton and the OpenAI client."""
+    instance = object.__new__(DenseEmbedder)
+    instance._request_semaphore = asyncio.Semaphore(DenseEmbedder.MAX_CONCURRENT_REQUESTS)
+    return instance
+
+
+@pytest.fixture
+def sync_context():
+    """Minimal sync context with a logger."""
+    return SimpleNamespace(logger=MagicMock())
+
+
+# ============================================================================
+# Request planning
+# ============================================================================
+
+
+def test_plan_splits_on_text_limit(embedder):
+    """Test that requests hold at most MAX_TEXTS_PER_REQUEST texts."""
+    requests = embedder._plan_requests([10] * (2 * MAX_TEXTS + 50))
+
+    assert requests == [(0, MAX_TEXTS), (MAX_TEXTS, 2 * MAX_TEXTS), (2 * MAX_TEXTS, 450)]
+
+
+def test_plan_splits_on_token_limit(embedder):
+    """Test that requests never exceed MAX_TOKENS_PER_REQUEST tokens."""
+    counts = [MAX_TOKENS - 100, 100, 1, MAX_TOKENS // 2, MAX_TOKENS // 2 + 1]
+
+    requests = embedder._plan_requests(counts)
+
+    # Exactly at the limit still fits, one token over starts a new request
+    assert requests == [(0, 2), (2, 4), (4, 5)]
+    for start, end in requests:
+        assert sum(counts[start:end]) <= MAX_TOKENS
+
+
+def test_plan_covers_all_texts_in_order(embedder):
+    """Test that the planned slices are contiguous and cover every text."""
+    counts = [(i * 7919) % 8000 + 1 for i in range(1000)]
+
+    requests = embedder._plan_requests(counts)
+
+    assert requests[0][0] == 0 and requests[-1][1] == len(counts)
+    assert all(prev[1] == nxt[0] for prev, nxt in zip(requests, requests[1:]))
+    assert embedder._plan_requests([]) == []
+
+
+# ============================================================================
+# Concurrent dispatch
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_requests_run_concurrently_and_reassemble_in_order(embedder, sync_context):
+    """Test bounded concurrency and ordered results when requests finish out of order."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_embed_batch(batch, ctx, num_tokens=0):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later requests finish first
+        await asyncio.sleep(0.01 / (1 + int(batch[0])))
+        in_flight -= 1
+        return [[float(text)] for text in batch]
+
+    embedder._embed_batch = fake_embed_batch
+    texts = [str(i) for i in range(MAX_TEXTS * 8)]
+
+    embeddings = await embedder._embed_uncached(texts, sync_context, [1] * len(texts))
+
+    assert embeddings == [[float(i)] for i in range(len(texts))]
+    assert 1 < peak <= DenseEmbedder.MAX_CONCURRENT_REQUESTS
+
+
+@pytest.mark.asyncio
+async def test_failed_request_cancels_siblings(embedder, sync_context):
+    """Test that one failing request fails the batch and cancels the others."""
+    cancelled = []
+
+    async def fake_embed_batch(batch, ctx, num_tokens=0):
+        if batch[0] == "0":
+            raise SyncFailureError("OpenAI embedding failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(batch[0])
+            raise
+        return [[0.0] for _ in batch]
+
+    embedder._embed_batch = fake_embed_batch
+    texts = [str(i) for i in range(MAX_TEXTS * 3)]
+
+    with pytest.raises(SyncFailureError):
+        await embedder._embed_uncached(texts, sync_context, [1] * len(texts))
+    await asyncio.sleep(0)
+
+    assert sorted(cancelled) == sorted([str(MAX_TEXTS), str(2 * MAX_TEXTS)])
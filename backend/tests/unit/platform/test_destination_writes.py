@@ -0,0 +1,81 @@
+"""Tests for concurrent destination writes with per-destination retry."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.platform.sync.entity_pipeline import EntityPipeline
+from airweave.platform.sync.exceptions import SyncFailureError
+
+
+class PrimaryDestination:
+    """Destination stub that fails its first `failures` writes."""
+
+    def __init__(self, failures: int = 0):
+        """Create a destination that records every write attempt."""
+        self.failures = failures
+        self.attempts = 0
+
+    async def write(self) -> None:
+        """Fail until the configured number of failures has been used up."""
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise ConnectionError(f"{self.__class__.__name__} unavailable")
+
+
+class SecondaryDestination(PrimaryDestination):
+    """Second destination type (errors are reported per destination class)."""
+
+
+@pytest.fixture
+def pipeline():
+    """Pipeline without retry delays."""
+    instance = EntityPipeline()
+    instance.DESTINATION_WRITE_RETRY_BASE_DELAY = 0
+    return instance
+
+
+def make_context(*destinations):
+    """Sync context with the given destinations."""
+    return SimpleNamespace(destinations=list(destinations), logger=MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_all_destinations_written_once(pipeline):
+    """Test that healthy destinations are each written exactly once."""
+    primary, secondary = PrimaryDestination(), SecondaryDestination()
+
+    await pipeline._run_on_destinations(
+        "insert", lambda dest: dest.write(), make_context(primary, secondary)
+    )
+
+    assert (primary.attempts, secondary.attempts) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_only_failed_destinations_are_retried(pipeline):
+    """Test that a transient failure re-runs only the destination that failed."""
+    primary, secondary = PrimaryDestination(), SecondaryDestination(failures=2)
+    context = make_context(primary, secondary)
+
+    await pipeline._run_on_destinations("insert", lambda dest: dest.write(), context)
+
+    assert primary.attempts == 1
+    assert secondary.attempts == 3
+    assert context.logger.warning.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_persistent_failure_raises_sync_failure(pipeline):
+    """Test that a destination failing every attempt fails the batch, naming it."""
+    primary = PrimaryDestination()
+    secondary = SecondaryDestination(failures=pipeline.DESTINATION_WRITE_MAX_ATTEMPTS)
+
+    with pytest.raises(SyncFailureError, match="SecondaryDestination"):
+        await pipeline._run_on_destinations(
+            "delete", lambda dest: dest.write(), make_context(primary, secondary)
+        )
+
+    assert primary.attempts == 1
+    assert secondary.attempts == pipeline.DESTINATION_WRITE_MAX_ATTEMPTS
@@ -0,0 +1,123 @@
+"""Tests for the content-addressed embedding cache.
+
+Tests the local LRU tier, the Redis tier and graceful degradation on Redis errors.
+"""
+
+import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from fastembed import SparseEmbedding
+
+from airweave.platform.embedders.cache import EmbeddingCache, SparseEmbeddingCache
+
+MODEL = "text-embedding-3-large"
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client with a pipeline."""
+    with patch("airweave.platform.embedders.cache.redis_client") as mock:
+        mock.client = MagicMock()
+        mock.client.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        mock.client.pipeline.return_value = pipe
+        yield mock
+
+
+@pytest.fixture
+def cache():
+    """Create a cache with a small local tier and Redis enabled."""
+    return EmbeddingCache(namespace="dense", max_local_entries=2, ttl_seconds=60, use_redis=True)
+
+
+# ============================================================================
+# Keys and Encoding
+# ============================================================================
+
+
+def test_key_is_content_addressed(cache):
+    """Test that keys depend on model and text content only."""
+    assert cache.make_key(MODEL, "hello") == cache.make_key(MODEL, "hello")
+    assert cache.make_key(MODEL, "hello") != cache.make_key(MODEL, "hello!")
+    assert cache.make_key(MODEL, "hello") != cache.make_key("other-model", "hello")
+    assert cache.make_key(MODEL, "hello").startswith(f"embedding:dense:{MODEL}:")
+
+
+def test_encode_decode_roundtrip():
+    """Test that float32 packing round-trips vectors."""
+    vector = [0.5, -1.25, 3.0]
+    assert EmbeddingCache.decode(EmbeddingCache.encode(vector)) == vector
+
+
+def test_sparse_encode_decode_roundtrip():
+    """Test that sparse (BM25) vectors round-trip exactly."""
+    vector = SparseEmbedding(
+        indices=np.array([3, 2**40, 7], dtype=np.int64), values=np.array([0.1, 1.7, 2.25])
+    )
+
+    decoded = SparseEmbeddingCache.decode(SparseEmbeddingCache.encode(vector))
+
+    assert decoded.indices.tolist() == vector.indices.tolist()
+    assert decoded.values.tolist() == vector.values.tolist()
+
+
+# ============================================================================
+# Cache Behavior
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_set_then_get_hits_local_tier(cache, mock_redis):
+    """Test that stored vectors are served locally without hitting Redis."""
+    await cache.set_many(MODEL, ["a", "b"], [[1.0, 2.0], [3.0, 4.0]])
+
+    found = await cache.get_many(MODEL, ["b", "missing", "a"])
+
+    assert found == {0: [3.0, 4.0], 2: [1.0, 2.0]}
+    assert cache.hits == 2
+    assert cache.misses == 1
+    mock_redis.client.pipeline.return_value.setex.assert_any_call(
+        cache.make_key(MODEL, "a"), 60, base64.b64encode(EmbeddingCache.encode([1.0, 2.0])).decode()
+    )
+    # Only the local miss goes to Redis
+    mock_redis.client.mget.assert_awaited_once_with([cache.make_key(MODEL, "missing")])
+
+
+@pytest.mark.asyncio
+async def test_local_tier_evicts_least_recently_used(cache, mock_redis):
+    """Test that the local tier is bounded by max_local_entries."""
+    await cache.set_many(MODEL, ["a", "b"], [[1.0], [2.0]])
+    await cache.get_many(MODEL, ["a"])  # touch "a" so "b" is the LRU entry
+    await cache.set_many(MODEL, ["c"], [[3.0]])
+
+    assert cache.make_key(MODEL, "b") not in cache._local
+    assert cache.make_key(MODEL, "a") in cache._local
+    assert cache.make_key(MODEL, "c") in cache._local
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_populates_local_tier(cache, mock_redis):
+    """Test that vectors found in Redis are promoted into the local tier."""
+    encoded = base64.b64encode(EmbeddingCache.encode([7.0, 8.0])).decode()
+    mock_redis.client.mget = AsyncMock(return_value=[encoded])
+
+    found = await cache.get_many(MODEL, ["remote"])
+
+    assert found == {0: [7.0, 8.0]}
+    assert cache.make_key(MODEL, "remote") in cache._local
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_treated_as_misses(cache, mock_redis):
+    """Test that Redis failures never propagate."""
+    mock_redis.client.mget = AsyncMock(side_effect=Exception("Redis down"))
+    mock_redis.client.pipeline.return_value.execute = AsyncMock(side_effect=Exception("Redis down"))
+
+    await cache.set_many(MODEL, ["x"], [[1.0]])
+    found = await cache.get_many(MODEL, ["y"])
+
+    assert found == {}
+    assert cache.misses == 1
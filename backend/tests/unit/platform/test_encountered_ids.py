@@ -0,0 +1,61 @@
+"""Tests for compact encountered entity ID tracking."""
+
+import numpy as np
+import pytest
+
+from airweave.platform.sync.encountered_ids import EncounteredEntityIds, _HashedIds, _merge_runs
+
+
+@pytest.fixture(autouse=True)
+def small_buffer(monkeypatch):
+    """Force frequent buffer freezes and run merges."""
+    monkeypatch.setattr(_HashedIds, "BUFFER_SIZE", 8)
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_duplicates_are_detected_per_type(exact):
+    """Test that IDs are deduplicated within a type but not across types."""
+    encountered = EncounteredEntityIds(exact=exact)
+
+    assert encountered.add("Page", "a")
+    assert not encountered.add("Page", "a")
+    assert encountered.add("Comment", "a")
+    assert encountered.counts() == {"Page": 1, "Comment": 1}
+
+
+@pytest.mark.asyncio
+async def test_membership_survives_run_merges():
+    """Test that IDs stay encountered after being frozen and merged into sorted runs."""
+    encountered = EncounteredEntityIds()
+    ids = [f"row-{i}" for i in range(1000)]
+
+    for start in range(0, len(ids), 100):
+        assert all(encountered.add("Row", entity_id) for entity_id in ids[start : start + 100])
+        await encountered.compact()
+    assert not any(encountered.add("Row", entity_id) for entity_id in ids)
+    assert encountered.counts() == {"Row": 1000}
+
+    runs = encountered._by_type["Row"]._runs
+    assert len(runs) <= 10  # O(log n) runs
+    for run in runs:
+        assert (run[:-1] < run[1:]).all()
+
+
+def test_digests_with_trailing_nul_bytes_are_found():
+    """Test keys that numpy's S16 dtype pads with NUL bytes still match run items."""
+    keys = [b"\x01" * 15 + b"\0", b"\x01" * 15, b"\x01" * 14 + b"\0\x02", b"\xff" * 16]
+    stripped = [key.rstrip(b"\0") for key in keys]
+    run = np.sort(np.array(stripped, dtype="S16"))
+
+    assert all(_HashedIds._in_run(run, key) for key in stripped)
+    assert not _HashedIds._in_run(run, b"\x01" * 13)
+
+
+def test_run_merge_keeps_keys_sorted():
+    """Test that merging two sorted runs yields one sorted run with every key."""
+    first = np.sort(np.array([b"\x05", b"\x01\x09", b"\x03\x01", b"\x07"], dtype="S16"))
+    second = np.sort(np.array([b"\x02", b"\x01\x07", b"\x03", b"\x09\x04"], dtype="S16"))
+
+    merged = _merge_runs(first, second)
+
+    assert merged.tolist() == sorted(first.tolist() + second.tolist())
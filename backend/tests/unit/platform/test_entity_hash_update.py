@@ -0,0 +1,65 @@
+"""Tests for the set-based entity hash update."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from airweave import crud
+
+JOB_ID = UUID("00000000-0000-0000-0000-00000000000f")
+ID_A = UUID("00000000-0000-0000-0000-00000000000a")
+ID_B = UUID("00000000-0000-0000-0000-00000000000b")
+ID_C = UUID("00000000-0000-0000-0000-00000000000c")
+
+
+@pytest.fixture
+def db():
+    """Async session stub that records executed statements."""
+    session = MagicMock()
+    session.execute = AsyncMock()
+    return session
+
+
+def compile_statement(db):
+    """Compile the single executed statement for PostgreSQL."""
+    db.execute.assert_awaited_once()
+    return db.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+
+
+@pytest.mark.asyncio
+async def test_single_update_joined_against_unnest(db):
+    """Test that the whole batch is one UPDATE ... FROM unnest(ids, hashes)."""
+    await crud.entity.bulk_update_hash(
+        db, rows=[(ID_B, "hash-b"), (ID_A, "hash-a")], sync_job_id=JOB_ID
+    )
+
+    compiled = compile_statement(db)
+    sql = str(compiled)
+    assert sql.startswith("UPDATE entity SET")
+    assert "FROM unnest(" in sql
+    assert "new_values" in sql
+    assert compiled.params["sync_job_id"] == JOB_ID
+
+
+@pytest.mark.asyncio
+async def test_rows_are_deduplicated_and_sorted_by_primary_key(db):
+    """Test lock ordering by primary key and last-hash-wins for duplicate ids."""
+    await crud.entity.bulk_update_hash(
+        db,
+        rows=[(ID_C, "old-c"), (ID_A, "hash-a"), (ID_B, "hash-b"), (ID_C, "new-c")],
+        sync_job_id=JOB_ID,
+    )
+
+    compiled = compile_statement(db)
+    assert compiled.params["ids"] == [ID_A, ID_B, ID_C]
+    assert compiled.params["hashes"] == ["hash-a", "hash-b", "new-c"]
+
+
+@pytest.mark.asyncio
+async def test_empty_rows_skip_the_database(db):
+    """Test that an empty batch issues no statement."""
+    await crud.entity.bulk_update_hash(db, rows=[], sync_job_id=JOB_ID)
+
+    db.execute.assert_not_called()
@@ -0,0 +1,118 @@
+"""Tests for converter sub-batch scheduling in the entity pipeline."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform import converters
+from airweave.platform.entities._base import Breadcrumb, FileEntity
+from airweave.platform.sync.entity_pipeline import EntityPipeline
+from airweave.platform.sync.exceptions import SyncFailureError
+
+
+class StubConverter:
+    """Converter that tracks concurrency and can fail or hang on given files."""
+
+    def __init__(self, fail_on=None, hang_on=None):
+        """Create a converter; `fail_on`/`hang_on` are file paths."""
+        self.fail_on = fail_on
+        self.hang_on = hang_on
+        self.in_flight = 0
+        self.peak = 0
+        self.cancelled = []
+
+    async def convert_batch(self, file_paths):
+        """Convert after yielding, so concurrent sub-batches overlap."""
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_on in file_paths:
+                raise SyncFailureError("Mistral infrastructure failure: timeout")
+            if self.hang_on in file_paths:
+                await asyncio.sleep(10)
+            return {path: f"text of {path}" for path in file_paths}
+        except asyncio.CancelledError:
+            self.cancelled.append(file_paths[0])
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+def make_files(count):
+    """File entities with distinct local paths."""
+    return [
+        FileEntity(
+            entity_id=f"file-{i}",
+            breadcrumbs=[Breadcrumb(entity_id="folder")],
+            name=f"file-{i}.pdf",
+            url=f"https://example.com/{i}",
+            size=1,
+            file_type="pdf",
+            local_path=f"/tmp/file-{i}.pdf",
+        )
+        for i in range(count)
+    ]
+
+
+def make_context():
+    """Sync context with the fields used by conversion."""
+    return SimpleNamespace(
+        source=SimpleNamespace(_short_name="stub"),
+        logger=MagicMock(),
+        progress=SimpleNamespace(increment=AsyncMock()),
+    )
+
+
+async def convert(converter, entities, coalesced=True):
+    """Run textual representation building with every file routed to `converter`."""
+    pipeline = EntityPipeline()
+    patches = [
+        patch.object(pipeline, "_build_metadata_section", return_value="metadata"),
+        patch.object(pipeline, "_determine_converter_for_file", return_value=converter),
+    ]
+    if coalesced:
+        patches.append(patch.object(converters, "text_layer_converter", converter))
+    for p in patches:
+        p.start()
+    try:
+        await pipeline._build_textual_representations(entities, make_context())
+    finally:
+        for p in reversed(patches):
+            p.stop()
+
+
+@pytest.mark.asyncio
+async def test_ocr_sub_batches_run_concurrently():
+    """Test that OCR-backed sub-batches overlap so Mistral can coalesce them."""
+    converter = StubConverter()
+    entities = make_files(30)
+
+    await convert(converter, entities)
+
+    assert converter.peak == 3
+    assert all(e.textual_representation.endswith(f"text of {e.local_path}") for e in entities)
+
+
+@pytest.mark.asyncio
+async def test_other_converters_run_sub_batches_one_at_a_time():
+    """Test that local converters keep sequential sub-batches."""
+    converter = StubConverter()
+
+    await convert(converter, make_files(30), coalesced=False)
+
+    assert converter.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_failure_cancels_sibling_sub_batches():
+    """Test that a failing sub-batch stops the others instead of leaving them running."""
+    converter = StubConverter(fail_on="/tmp/file-0.pdf", hang_on="/tmp/file-10.pdf")
+
+    with pytest.raises(SyncFailureError):
+        await asyncio.wait_for(convert(converter, make_files(20)), timeout=2)
+
+    assert converter.cancelled == ["/tmp/file-10.pdf"]
+    assert converter.in_flight == 0
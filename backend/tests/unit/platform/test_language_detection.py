@@ -0,0 +1,83 @@
+"""Tests for the process-wide code language detector.
+
+Magika and tree-sitter-language-pack are replaced with fakes.
+"""
+
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from airweave.platform.chunkers.language_detection import CodeLanguageDetector
+
+SUPPORTED = {"python", "typescript", "go"}
+
+
+@pytest.fixture
+def get_parser():
+    """Fake tree_sitter_language_pack.get_parser supporting a few languages."""
+
+    def _get_parser(language):
+        if language not in SUPPORTED:
+            raise LookupError(language)
+        return f"parser:{language}"
+
+    fake = MagicMock(side_effect=_get_parser)
+    module = ModuleType("tree_sitter_language_pack")
+    module.get_parser = fake
+    with patch.dict(sys.modules, {"tree_sitter_language_pack": module}):
+        yield fake
+
+
+@pytest.fixture
+def detector(get_parser):
+    """Fresh detector with a fake Magika model."""
+    CodeLanguageDetector._instance = None
+    instance = CodeLanguageDetector()
+    instance._magika = MagicMock()
+    instance._magika.identify_bytes.return_value = SimpleNamespace(
+        output=SimpleNamespace(label="Go")
+    )
+    yield instance
+    CodeLanguageDetector._instance = None
+
+
+def test_singleton():
+    """Test that the detector is shared within the process."""
+    assert CodeLanguageDetector() is CodeLanguageDetector()
+
+
+def test_extension_fast_path_skips_magika(detector):
+    """Test that a known, supported extension is used without ML detection."""
+    assert detector.detect("def f(): pass", "src/app.py") == "python"
+    assert detector.detect("let x = 1", "web/App.TS") == "typescript"
+    detector._magika.identify_bytes.assert_not_called()
+
+
+def test_unknown_extension_falls_back_to_magika(detector):
+    """Test that unknown or unsupported extensions use Magika's label."""
+    assert detector.detect("package main", "main.unknownext") == "go"
+    # Ruby maps to a tree-sitter name, but the (fake) pack does not support it
+    assert detector.detect("package main", "script.rb") == "go"
+    assert detector.detect("package main") == "go"
+    assert detector._magika.identify_bytes.call_count == 3
+
+
+def test_parser_lookups_are_cached(detector, get_parser):
+    """Test that each language's parser (or miss) is resolved once."""
+    for _ in range(3):
+        assert detector.is_supported("python")
+        assert not detector.is_supported("cobol")
+
+    assert detector.get_parser("python") == "parser:python"
+    assert get_parser.call_count == 2
+
+
+def test_detect_batch_isolates_failures(detector):
+    """Test that a failed detection yields None without failing the batch."""
+    detector._magika.identify_bytes.side_effect = [RuntimeError("boom")]
+
+    languages = detector.detect_batch(["x = 1", "???"], ["a.py", "b.bin"])
+
+    assert languages == ["python", None]
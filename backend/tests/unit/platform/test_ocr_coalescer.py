@@ -0,0 +1,198 @@
+"""Tests for Mistral OCR job coalescing and the OCR result cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.converters.mistral_converter import OCR_MODEL, MistralConverter
+from airweave.platform.converters.ocr_cache import OcrResultCache, hash_file
+from airweave.platform.converters.ocr_coalescer import OcrJobCoalescer
+
+MODEL = "mistral-ocr-latest"
+
+
+def make_runner(fail: bool = False):
+    """Batch runner stub that records each job's upload keys."""
+    jobs = []
+
+    async def run_batch(upload_map):
+        jobs.append(sorted(upload_map))
+        await asyncio.sleep(0)
+        if fail:
+            raise RuntimeError("job failed")
+        return {key: f"md:{key}" for key in upload_map}
+
+    return run_batch, jobs
+
+
+# ============================================================================
+# Coalescer
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_share_one_job():
+    """Test that documents submitted within the window go into a single job."""
+    run_batch, jobs = make_runner()
+    coalescer = OcrJobCoalescer(run_batch, window_seconds=0.05, max_documents=100)
+
+    first, second = await asyncio.gather(
+        coalescer.submit({"a": {}, "b": {}}), coalescer.submit({"c": {}})
+    )
+
+    assert jobs == [["a", "b", "c"]]
+    assert first == {"a": "md:a", "b": "md:b"}
+    assert second == {"c": "md:c"}
+
+
+@pytest.mark.asyncio
+async def test_full_batch_submits_before_window():
+    """Test that reaching max_documents submits without waiting for the deadline."""
+    run_batch, jobs = make_runner()
+    coalescer = OcrJobCoalescer(run_batch, window_seconds=60, max_documents=2)
+
+    results = await asyncio.wait_for(coalescer.submit({"a": {}, "b": {}, "c": {}}), timeout=1)
+
+    assert jobs == [["a", "b"], ["c"]]
+    assert results == {"a": "md:a", "b": "md:b", "c": "md:c"}
+
+
+@pytest.mark.asyncio
+async def test_job_failure_propagates_to_single_caller():
+    """Test that a failed job with one caller's documents fails that caller directly."""
+    run_batch, jobs = make_runner(fail=True)
+    coalescer = OcrJobCoalescer(run_batch, window_seconds=0.01, max_documents=100)
+
+    with pytest.raises(RuntimeError, match="job failed"):
+        await coalescer.submit({"a": {}, "b": {}})
+
+    assert jobs == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_shared_job_failure_is_isolated_per_caller():
+    """Test that a failed shared job is rerun per caller, so only the bad caller fails."""
+    jobs = []
+
+    async def run_batch(upload_map):
+        jobs.append(sorted(upload_map))
+        await asyncio.sleep(0)
+        if "bad" in upload_map:
+            raise RuntimeError("Failed to submit Mistral batch job")
+        return {key: f"md:{key}" for key in upload_map}
+
+    coalescer = OcrJobCoalescer(run_batch, window_seconds=0.05, max_documents=100)
+
+    good, bad, other = await asyncio.gather(
+        coalescer.submit({"a": {}, "b": {}}),
+        coalescer.submit({"bad": {}}),
+        coalescer.submit({"c": {}}),
+        return_exceptions=True,
+    )
+
+    assert jobs[0] == ["a", "b", "bad", "c"]
+    assert sorted(jobs[1:]) == [["a", "b"], ["bad"], ["c"]]
+    assert good == {"a": "md:a", "b": "md:b"}
+    assert other == {"c": "md:c"}
+    assert isinstance(bad, RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_empty_submission_skips_job():
+    """Test that nothing is queued for an empty upload map."""
+    run_batch, jobs = make_runner()
+    coalescer = OcrJobCoalescer(run_batch, window_seconds=0.01, max_documents=100)
+
+    assert await coalescer.submit({}) == {}
+    assert jobs == []
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+
+def test_hash_file_is_content_addressed(tmp_path):
+    """Test that identical bytes hash identically regardless of path."""
+    first, second, other = tmp_path / "a.pdf", tmp_path / "b.pdf", tmp_path / "c.pdf"
+    first.write_bytes(b"%PDF-1.7 same")
+    second.write_bytes(b"%PDF-1.7 same")
+    other.write_bytes(b"%PDF-1.7 different")
+
+    assert hash_file(str(first)) == hash_file(str(second)) != hash_file(str(other))
+    assert hash_file(str(tmp_path / "missing.pdf")) is None
+
+
+def test_encode_decode_roundtrip():
+    """Test that compressed markdown round-trips."""
+    markdown = "# Title\n\nBody with ünïcode " * 50
+    assert OcrResultCache.decode(OcrResultCache.encode(markdown)) == markdown
+
+
+@pytest.mark.asyncio
+async def test_local_tier_hit_and_redis_fallback():
+    """Test local hits, Redis hits (promoted to local) and misses."""
+    cache = OcrResultCache(max_local_entries=10, ttl_seconds=60, use_redis=True)
+    cache._local_set(cache.make_key(MODEL, "h1"), "one")
+
+    with patch("airweave.platform.converters.ocr_cache.redis_client") as mock_redis:
+        mock_redis.client = MagicMock()
+        mock_redis.client.mget = AsyncMock(return_value=[OcrResultCache.encode("two"), None])
+
+        found = await cache.get_many(MODEL, ["h1", "h2", "h3", "h1"])
+
+    assert found == {"h1": "one", "h2": "two"}
+    mock_redis.client.mget.assert_awaited_once_with(
+        [cache.make_key(MODEL, "h2"), cache.make_key(MODEL, "h3")]
+    )
+    assert cache._local_get(cache.make_key(MODEL, "h2")) == "two"
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_misses():
+    """Test that a failing Redis tier degrades to a miss."""
+    cache = OcrResultCache(max_local_entries=10, ttl_seconds=60, use_redis=True)
+
+    with patch("airweave.platform.converters.ocr_cache.redis_client") as mock_redis:
+        mock_redis.client = MagicMock()
+        mock_redis.client.mget = AsyncMock(side_effect=ConnectionError("down"))
+
+        assert await cache.get_many(MODEL, ["h1"]) == {}
+
+
+# ============================================================================
+# Converter
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_convert_batch_dedupes_and_serves_cache(tmp_path):
+    """Test that identical files are OCR'd once and cached files skip OCR."""
+    same_a, same_b = tmp_path / "a.pdf", tmp_path / "b.pdf"
+    cached_file, missing = tmp_path / "c.pdf", tmp_path / "gone.pdf"
+    same_a.write_bytes(b"%PDF-1.7 same")
+    same_b.write_bytes(b"%PDF-1.7 same")
+    cached_file.write_bytes(b"%PDF-1.7 cached")
+
+    converter = MistralConverter()
+    converter._cache = OcrResultCache(max_local_entries=10, ttl_seconds=60, use_redis=False)
+    await converter._cache.set_many(OCR_MODEL, {hash_file(str(cached_file)): "md:cached"})
+    convert = AsyncMock(side_effect=lambda paths: {path: f"md:{path}" for path in paths})
+    paths = [str(same_a), str(same_b), str(cached_file), str(missing)]
+
+    with (
+        patch.object(converter, "_ensure_mistral_client"),
+        patch.object(converter, "_convert_uncached", convert),
+    ):
+        results = await converter.convert_batch(paths)
+
+    convert.assert_awaited_once_with([str(same_a), str(missing)])
+    assert results == {
+        str(same_a): f"md:{same_a}",
+        str(same_b): f"md:{same_a}",
+        str(cached_file): "md:cached",
+        str(missing): f"md:{missing}",
+    }
+    assert converter._inflight == {}
@@ -0,0 +1,235 @@
+"""Tests for keyset-paginated orphan cleanup."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from airweave import crud
+from airweave.platform.sync import entity_pipeline as pipeline_module
+from airweave.platform.sync.entity_pipeline import EntityPipeline
+from airweave.platform.sync.exceptions import SyncFailureError
+
+SYNC_ID = UUID("00000000-0000-0000-0000-000000000001")
+JOB_ID = UUID("00000000-0000-0000-0000-000000000002")
+ORG_ID = UUID("00000000-0000-0000-0000-000000000003")
+
+
+def row(n: int):
+    """Deleted entity row as returned by bulk_remove_outdated."""
+    return SimpleNamespace(
+        id=UUID(int=n), entity_id=f"entity-{n}", entity_definition_id=UUID(int=1000)
+    )
+
+
+class Destination:
+    """Destination stub recording parent ids deleted per call."""
+
+    def __init__(self, fail_on_call: int = 0):
+        """Create a destination that fails on the given (1-based) call, if any."""
+        self.deleted = []
+        self.fail_on_call = fail_on_call
+
+    async def bulk_delete_by_parent_ids(self, entity_ids, sync_id):
+        """Record a page delete (or fail)."""
+        if len(self.deleted) + 1 == self.fail_on_call:
+            raise ConnectionError("destination down")
+        self.deleted.append(list(entity_ids))
+
+
+@pytest.fixture
+def pipeline():
+    """Pipeline with small cleanup pages and no retry delays."""
+    instance = EntityPipeline()
+    instance.ORPHAN_CLEANUP_BATCH_SIZE = 2
+    instance.DESTINATION_WRITE_MAX_ATTEMPTS = 1
+    return instance
+
+
+def make_context(destination):
+    """Sync context for one sync job with a single destination."""
+    return SimpleNamespace(
+        sync=SimpleNamespace(id=SYNC_ID),
+        sync_job=SimpleNamespace(id=JOB_ID),
+        ctx=SimpleNamespace(organization=SimpleNamespace(id=ORG_ID)),
+        destinations=[destination],
+        progress=SimpleNamespace(increment=AsyncMock()),
+        entity_state_tracker=None,
+        logger=MagicMock(),
+    )
+
+
+@pytest.fixture
+def db():
+    """Session stub shared by every page's transaction."""
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.execute = AsyncMock()
+    return session
+
+
+def patch_pages(db, pages):
+    """Patch the DB session and bulk_remove_outdated to return the given pages."""
+
+    @asynccontextmanager
+    async def _db_context():
+        yield db
+
+    remove = AsyncMock(side_effect=pages)
+    return (
+        patch.object(pipeline_module, "get_db_context", _db_context),
+        patch.object(pipeline_module.crud.entity, "bulk_remove_outdated", remove),
+        remove,
+    )
+
+
+# ============================================================================
+# Cleanup loop
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_pages_are_walked_by_keyset(pipeline, db):
+    """Test that each page starts after the previous page's last id and commits."""
+    destination = Destination()
+    context = make_context(destination)
+    db_patch, remove_patch, remove = patch_pages(db, [[row(1), row(2)], [row(3), row(4)], [row(5)]])
+
+    with db_patch, remove_patch:
+        await pipeline.cleanup_orphaned_entities(context)
+
+    assert [call.kwargs["after_id"] for call in remove.await_args_list] == [
+        None,
+        UUID(int=2),
+        UUID(int=4),
+    ]
+    assert all(call.kwargs["limit"] == 2 for call in remove.await_args_list)
+    assert destination.deleted == [["entity-1", "entity-2"], ["entity-3", "entity-4"], ["entity-5"]]
+    assert db.commit.await_count == 3
+    assert [call.args for call in context.progress.increment.await_args_list] == [
+        ("deleted", 2),
+        ("deleted", 2),
+        ("deleted", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_full_last_page_stops_on_empty_page(pipeline, db):
+    """Test that a full final page is followed by one empty lookup and nothing else."""
+    destination = Destination()
+    db_patch, remove_patch, remove = patch_pages(db, [[row(1), row(2)], []])
+
+    with db_patch, remove_patch:
+        await pipeline.cleanup_orphaned_entities(make_context(destination))
+
+    assert remove.await_count == 2
+    assert destination.deleted == [["entity-1", "entity-2"]]
+    assert db.commit.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_destination_failure_leaves_page_uncommitted(pipeline, db):
+    """Test that a page whose destination delete fails is not committed."""
+    destination = Destination(fail_on_call=2)
+    db_patch, remove_patch, _ = patch_pages(db, [[row(1), row(2)], [row(3), row(4)]])
+
+    with db_patch, remove_patch, pytest.raises(SyncFailureError):
+        await pipeline.cleanup_orphaned_entities(make_context(destination))
+
+    assert destination.deleted == [["entity-1", "entity-2"]]
+    assert db.commit.await_count == 1
+
+
+# ============================================================================
+# Page statement
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_remove_outdated_deletes_one_locked_keyset_page(db):
+    """Test that a page is deleted server-side, ordered by id after the cursor."""
+    db.execute.return_value = MagicMock(all=MagicMock(return_value=[row(9), row(7)]))
+
+    deleted = await crud.entity.bulk_remove_outdated(
+        db,
+        sync_id=SYNC_ID,
+        sync_job_id=JOB_ID,
+        organization_id=ORG_ID,
+        limit=500,
+        after_id=UUID(int=5),
+    )
+
+    compiled = db.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    assert sql.startswith("DELETE FROM entity WHERE entity.id IN (SELECT entity.id")
+    assert "entity.sync_job_id != " in sql
+    assert "entity.id > " in sql
+    assert "ORDER BY entity.id" in sql
+    assert "FOR UPDATE" in sql
+    assert "RETURNING entity.id, entity.entity_id, entity.entity_definition_id" in sql
+    assert 500 in compiled.params.values()
+    assert [r.id for r in deleted] == [UUID(int=7), UUID(int=9)]
+
+
+# ============================================================================
+# Stamping encountered entities
+# ============================================================================
+
+
+def make_stamp_context(cursor_data=None, supports_continuous=True, force_full_sync=False):
+    """Sync context with cursor state deciding whether cleanup runs."""
+    return SimpleNamespace(
+        sync=SimpleNamespace(id=SYNC_ID),
+        sync_job=SimpleNamespace(id=JOB_ID),
+        cursor=SimpleNamespace(cursor_data=cursor_data),
+        source=SimpleNamespace(_supports_continuous=supports_continuous),
+        force_full_sync=force_full_sync,
+        entity_map={},
+        logger=MagicMock(),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "context, stamped",
+    [
+        (make_stamp_context(), True),  # First sync
+        (make_stamp_context({"since": 1}, supports_continuous=False), True),
+        (make_stamp_context({"since": 1}, force_full_sync=True), True),
+        (make_stamp_context({"since": 1}), False),  # Incremental: cleanup never runs
+    ],
+)
+async def test_encountered_entities_are_stamped_by_entity_id(pipeline, db, context, stamped):
+    """Test stamping covers every entity (even unmapped classes) and skips incremental syncs."""
+    entities = [SimpleNamespace(entity_id="b"), SimpleNamespace(entity_id="a")]
+    db_patch, _, _ = patch_pages(db, [])
+    stamp = AsyncMock()
+
+    with db_patch, patch.object(pipeline_module.crud.entity, "bulk_update_sync_job_id", stamp):
+        await pipeline._mark_encountered(entities, context)
+
+    if stamped:
+        stamp.assert_awaited_once_with(
+            db, sync_id=SYNC_ID, entity_ids=["b", "a"], sync_job_id=JOB_ID
+        )
+    else:
+        stamp.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stamp_matches_rows_on_entity_id_only(db):
+    """Test that rows with NULL or remapped definitions are stamped too."""
+    await crud.entity.bulk_update_sync_job_id(
+        db, sync_id=SYNC_ID, entity_ids=["b", "a", "b"], sync_job_id=JOB_ID
+    )
+
+    compiled = db.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    assert sql.startswith("UPDATE entity SET sync_job_id=")
+    assert "entity.entity_id = ANY (" in sql
+    assert "entity_definition_id" not in sql
+    assert "entity.sync_job_id != " in sql
+    assert compiled.params["entity_ids"] == ["a", "b"]
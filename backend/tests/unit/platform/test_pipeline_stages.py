@@ -0,0 +1,99 @@
+"""Tests for staged (pipelined) execution of entity batches."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from airweave.platform.sync.pipeline_stages import StagedPipeline, StageSpec
+
+
+class Batch:
+    """Minimal payload with a chunk count."""
+
+    def __init__(self, name: str, chunks: int = 1):
+        """Create a payload that records the stages it passed."""
+        self.name = name
+        self.chunks = chunks
+        self.trace = []
+
+
+@pytest.mark.asyncio
+async def test_payloads_flow_through_all_stages_in_order():
+    """Test that every payload passes each stage and submit returns afterwards."""
+
+    def stage(name):
+        async def handler(batches):
+            for batch in batches:
+                batch.trace.append(name)
+            return batches
+
+        return handler
+
+    pipeline = StagedPipeline(
+        [StageSpec("a", stage("a"), concurrency=2), StageSpec("b", stage("b"))],
+        logger=MagicMock(),
+    )
+    batches = [Batch(str(i)) for i in range(5)]
+
+    await asyncio.gather(*[pipeline.submit(batch) for batch in batches])
+    await pipeline.shutdown()
+
+    assert all(batch.trace == ["a", "b"] for batch in batches)
+    assert pipeline.stats["a"].handled == 5
+
+
+@pytest.mark.asyncio
+async def test_queued_payloads_are_coalesced_up_to_weight():
+    """Test that a stage coalesces queued payloads into one handler call."""
+    release = asyncio.Event()
+    calls = []
+
+    async def gate(batches):
+        await release.wait()
+        return batches
+
+    async def embed(batches):
+        calls.append([batch.name for batch in batches])
+        return batches
+
+    pipeline = StagedPipeline(
+        [
+            StageSpec("gate", gate, concurrency=4),
+            StageSpec("embed", embed, max_batch_weight=10, weight=lambda batch: batch.chunks),
+        ],
+        logger=MagicMock(),
+    )
+    submits = [asyncio.create_task(pipeline.submit(Batch(str(i), chunks=4))) for i in range(4)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*submits)
+    await pipeline.shutdown()
+
+    assert sum(len(call) for call in calls) == 4
+    assert max(len(call) for call in calls) == 3  # 3 x 4 chunks reaches the budget of 10
+
+
+@pytest.mark.asyncio
+async def test_errors_surface_to_submitter_and_dropped_payloads_complete():
+    """Test that handler errors propagate and non-forwarded payloads finish early."""
+
+    async def first(batches):
+        if batches[0].name == "bad":
+            raise ValueError("boom")
+        return [batch for batch in batches if batch.name != "skip"]
+
+    async def second(batches):
+        for batch in batches:
+            batch.trace.append("second")
+        return batches
+
+    pipeline = StagedPipeline([StageSpec("first", first), StageSpec("second", second)], MagicMock())
+    skipped = Batch("skip")
+
+    with pytest.raises(ValueError, match="boom"):
+        await pipeline.submit(Batch("bad"))
+    await pipeline.submit(skipped)
+    await pipeline.shutdown()
+
+    assert skipped.trace == []
@@ -0,0 +1,55 @@
+"""Tests for the CPU process pool in async_helpers."""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.core.config import settings
+from airweave.platform.sync import async_helpers
+from airweave.platform.sync.exceptions import EntityProcessingError
+
+
+@pytest.fixture
+def process_pool(monkeypatch):
+    """Enable a small process pool and shut it down afterwards."""
+    monkeypatch.setattr(settings, "SYNC_PROCESS_POOL_ENABLED", True)
+    monkeypatch.setattr(settings, "SYNC_PROCESS_POOL_SIZE", 1)
+    yield
+    if async_helpers._process_executor is not None:
+        async_helpers._process_executor.shutdown(wait=True)
+        async_helpers._process_executor = None
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_a_worker_process(process_pool):
+    """Test that jobs run outside the event loop's process."""
+    assert await async_helpers.run_in_process_pool(os.getpid) != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_disabled_pool_falls_back_to_threads(monkeypatch):
+    """Test that jobs run in-process when the process pool is disabled."""
+    monkeypatch.setattr(settings, "SYNC_PROCESS_POOL_ENABLED", False)
+
+    assert await async_helpers.run_in_process_pool(os.getpid) == os.getpid()
+    assert async_helpers._process_executor is None
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_fails_the_call_and_is_replaced(process_pool):
+    """Test that a broken pool fails the job (not re-run in-process) and is discarded."""
+    broken = MagicMock(submit=MagicMock(side_effect=BrokenProcessPool("worker died")))
+    async_helpers._process_executor = broken
+
+    with patch.object(async_helpers, "run_in_thread_pool", AsyncMock()) as thread_pool:
+        with pytest.raises(EntityProcessingError):
+            await async_helpers.run_in_process_pool(os.getpid)
+
+    thread_pool.assert_not_called()
+    assert async_helpers._process_executor is None
+    broken.shutdown.assert_called_once()
+
+    # The next job gets a fresh pool
+    assert await async_helpers.run_in_process_pool(os.getpid) != os.getpid()
@@ -0,0 +1,138 @@
+"""Tests for the process-wide Qdrant client registry."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from qdrant_client.http.exceptions import ResponseHandlingException
+
+from airweave.platform.destinations import qdrant as qdrant_module
+from airweave.platform.destinations.qdrant import QdrantDestination
+from airweave.platform.destinations.qdrant_registry import QdrantClientRegistry
+
+
+@pytest.fixture
+def mock_client_cls():
+    """Patch AsyncQdrantClient with a mock whose ping succeeds."""
+    with patch("airweave.platform.destinations.qdrant_registry.AsyncQdrantClient") as cls:
+        cls.side_effect = lambda **kwargs: MagicMock(get_collections=AsyncMock(), close=AsyncMock())
+        yield cls
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_per_url_and_key(mock_client_cls):
+    """Test that one client is created and pinged per (url, api_key)."""
+    registry = QdrantClientRegistry()
+
+    first = await registry.get_client("http://qdrant:6333", "key")
+    second = await registry.get_client("http://qdrant:6333", "key")
+    other = await registry.get_client("http://qdrant:6333", "other-key")
+
+    assert first is second
+    assert other is not first
+    assert mock_client_cls.call_count == 2
+    first.get_collections.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_rebuilds_client_and_forgets_collections(mock_client_cls):
+    """Test that an unhealthy client is replaced along with its cached collections."""
+    registry = QdrantClientRegistry()
+    first = await registry.get_client("http://qdrant:6333", None)
+    registry.remember_collection("http://qdrant:6333", None, "vectors")
+    assert registry.collection_known("http://qdrant:6333", None, "vectors")
+
+    registry.invalidate("http://qdrant:6333", None, first)
+    second = await registry.get_client("http://qdrant:6333", None)
+
+    assert second is not first
+    assert not registry.collection_known("http://qdrant:6333", None, "vectors")
+
+    # Other callers may still be using the dropped client, so it is never closed
+    await asyncio.sleep(0)
+    first.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stale_invalidate_keeps_replacement_client(mock_client_cls):
+    """Test that a late report about a replaced client does not evict its successor."""
+    registry = QdrantClientRegistry()
+    first = await registry.get_client("http://qdrant:6333", None)
+    registry.invalidate("http://qdrant:6333", None, first)
+    second = await registry.get_client("http://qdrant:6333", None)
+
+    registry.invalidate("http://qdrant:6333", None, first)
+
+    assert await registry.get_client("http://qdrant:6333", None) is second
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error, evicted",
+    [
+        (ResponseHandlingException(httpx.ConnectError("refused")), True),
+        (ResponseHandlingException(httpx.ConnectTimeout("timed out")), True),
+        (ResponseHandlingException(httpx.ReadTimeout("timed out")), False),
+        (ValueError("bad filter"), False),
+    ],
+)
+async def test_destination_evicts_only_on_connect_errors(mock_client_cls, error, evicted):
+    """Test that read timeouts on a shared client do not evict it for everyone."""
+    registry = QdrantClientRegistry()
+    destination = QdrantDestination()
+    destination.set_logger(MagicMock())
+    destination.url = "http://qdrant:6333"
+
+    with patch.object(qdrant_module, "qdrant_client_registry", registry):
+        await destination.ensure_client_readiness()
+        failing = destination.client
+        failing.collection_exists = AsyncMock(side_effect=error)
+
+        with pytest.raises(type(error)):
+            await destination.collection_exists("vectors")
+
+        # The next call fetches the registry's current client rather than reusing its own
+        await destination.ensure_client_readiness()
+
+    assert (destination.client is not failing) == evicted
+    failing.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_ping_is_not_cached(mock_client_cls):
+    """Test that a client whose ping fails is closed and not pooled."""
+    client = MagicMock(
+        get_collections=AsyncMock(side_effect=ConnectionError("refused")), close=AsyncMock()
+    )
+    mock_client_cls.side_effect = lambda **kwargs: client
+    registry = QdrantClientRegistry()
+
+    with pytest.raises(ConnectionError):
+        await registry.get_client("http://qdrant:6333", None)
+
+    assert registry._clients == {}
+    await asyncio.sleep(0)
+    client.close.assert_awaited_once()
+
+
+def test_clients_and_locks_are_per_event_loop(mock_client_cls):
+    """Test that each loop gets its own client without evicting the other loop's."""
+    registry = QdrantClientRegistry()
+    first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first = first_loop.run_until_complete(registry.get_client("http://qdrant:6333", None))
+        second = second_loop.run_until_complete(registry.get_client("http://qdrant:6333", None))
+        again = first_loop.run_until_complete(registry.get_client("http://qdrant:6333", None))
+    finally:
+        first_loop.close()
+
+    assert second is not first
+    assert again is first
+    assert mock_client_cls.call_count == 2
+    first.close.assert_not_called()
+
+    # Entries of closed loops are pruned when a new client is created
+    second_loop.run_until_complete(registry.get_client("http://other:6333", None))
+    second_loop.close()
+    assert all(loop is second_loop for _, loop in registry._locks)
@@ -0,0 +1,68 @@
+"""Tests for server-side multi-query fusion in QdrantDestination.bulk_search."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from qdrant_client.http import models as rest
+
+from airweave.platform.destinations.qdrant import KEYWORD_VECTOR_NAME, QdrantDestination
+
+
+def make_destination():
+    """QdrantDestination with a mocked client that supports keyword search."""
+    destination = QdrantDestination()
+    destination.collection_id = uuid4()
+    destination.collection_name = "vectors"
+    destination.set_logger(MagicMock())
+    destination.ensure_client_readiness = AsyncMock()
+    destination.get_vector_config_names = AsyncMock(return_value=["", KEYWORD_VECTOR_NAME])
+    point = SimpleNamespace(id="p1", score=0.5, payload={"entity_id": "e1"})
+    destination.client = MagicMock(
+        query_batch_points=AsyncMock(return_value=[SimpleNamespace(points=[point])])
+    )
+    return destination
+
+
+SPARSE = {"indices": [1, 2], "values": [0.5, 0.5]}
+
+
+@pytest.mark.asyncio
+async def test_fused_bulk_search_sends_one_request_with_all_prefetches():
+    """Test that every query's dense and sparse vectors become prefetches of one request."""
+    destination = make_destination()
+
+    results = await destination.bulk_search(
+        query_vectors=[[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+        limit=10,
+        sparse_vectors=[SPARSE, SPARSE, SPARSE],
+        search_method="hybrid",
+        fusion="dbsf",
+        prefetch_limit=50,
+        hnsw_ef=128,
+    )
+
+    requests = destination.client.query_batch_points.await_args.kwargs["requests"]
+    assert len(requests) == 1
+    request = requests[0]
+    assert request.query.fusion == rest.Fusion.DBSF
+    assert len(request.prefetch) == 6
+    assert {p.limit for p in request.prefetch} == {50}
+    assert [p.params.hnsw_ef for p in request.prefetch if p.params] == [128, 128, 128]
+    assert request.limit == 10
+    assert results == [{"id": "p1", "score": 0.5, "payload": {"entity_id": "e1"}}]
+
+
+@pytest.mark.asyncio
+async def test_fused_bulk_search_requires_a_shared_filter():
+    """Test that per-query filters cannot be fused into one request."""
+    destination = make_destination()
+
+    with pytest.raises(ValueError):
+        await destination.bulk_search(
+            query_vectors=[[0.1], [0.2]],
+            filter_conditions=[{"must": []}, None],
+            search_method="neural",
+            fusion="rrf",
+        )
@@ -0,0 +1,186 @@
+"""Tests for the local text-layer converter with selective OCR fallback.
+
+Local extraction (process pool) and the OCR converter are replaced with stubs.
+"""
+
+import importlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import PyPDF2
+import pytest
+
+from airweave.platform.converters.text_layer_converter import (
+    MIN_TEXT_CHARS_PER_PAGE,
+    TextLayerConverter,
+    _extract_pdf,
+    _merge_segments,
+    _needs_ocr,
+)
+
+# The converters package exports an instance under the same name as this module
+module = importlib.import_module("airweave.platform.converters.text_layer_converter")
+
+BODY = "Lorem ipsum dolor sit amet. " * 10
+
+
+def extraction(segments, ocr_files=(), whole=False, keep_text=False):
+    """Result shape of _extract_text_layer."""
+    return {
+        "segments": list(segments),
+        "ocr_files": list(ocr_files),
+        "ocr_whole_document": whole,
+        "keep_text": keep_text,
+    }
+
+
+@pytest.fixture
+def ocr():
+    """OCR converter stub returning markdown per path."""
+    converter = MagicMock()
+    converter.convert_batch = AsyncMock(
+        side_effect=lambda paths: {path: f"OCR({path})" for path in paths}
+    )
+    return converter
+
+
+def patch_extraction(results):
+    """Patch the process pool call with per-path extraction results (or exceptions)."""
+
+    async def _run(func, path):
+        result = results[path]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return patch.object(module, "run_in_process_pool", side_effect=_run)
+
+
+# ============================================================================
+# OCR detection
+# ============================================================================
+
+
+def test_needs_ocr_heuristics():
+    """Test the scanned / image-only page heuristics."""
+    assert not _needs_ocr(BODY, has_images=True)
+    assert not _needs_ocr("Short caption", has_images=False)
+    assert not _needs_ocr("", has_images=False)
+    assert _needs_ocr("", has_images=True)
+    assert _needs_ocr("x" * (MIN_TEXT_CHARS_PER_PAGE - 1), has_images=True)
+    # Unmapped glyphs: raw control / private-use codes and replacement characters
+    assert _needs_ocr("\x03\x11\x07 ab" * 20, has_images=False)
+    assert _needs_ocr("\ue012\ue0a4 abc" * 20, has_images=False)
+    assert _needs_ocr("\ufffd\ufffd abc" * 20, has_images=False)
+    assert not _needs_ocr("Übersicht – café, naïve “quotes” 日本語", has_images=False)
+
+
+def test_partial_page_files_are_removed_when_extraction_fails(tmp_path):
+    """Test that page PDFs written before a failure do not leak."""
+    source = tmp_path / "doc.pdf"
+    writer = PyPDF2.PdfWriter()
+    for _ in range(4):
+        writer.add_blank_page(width=72, height=72)
+    with open(source, "wb") as f:
+        writer.write(f)
+
+    written = []
+
+    def _write(data, suffix):
+        if written:
+            raise OSError("No space left on device")
+        path = tmp_path / f"page-{len(written)}{suffix}"
+        path.write_bytes(data)
+        written.append(path)
+        return str(path)
+
+    with (
+        patch.object(module, "_needs_ocr", side_effect=[True, True, False, False]),
+        patch.object(module, "_write_temp_file", side_effect=_write),
+        pytest.raises(OSError),
+    ):
+        _extract_pdf(str(source))
+
+    assert len(written) == 1
+    assert not written[0].exists()
+
+
+def test_merge_replaces_ocr_pages_in_order():
+    """Test that OCR output replaces its page and pages keep their order."""
+    merged = _merge_segments(
+        extraction(["page one", "", "page three"], ocr_files=[(1, "/tmp/p2.pdf")]),
+        {"/tmp/p2.pdf": "scanned page two"},
+    )
+    assert merged == "page one\n\nscanned page two\n\npage three"
+
+
+def test_merge_keeps_local_text_when_ocr_fails():
+    """Test that a failed OCR page falls back to its sparse local text."""
+    merged = _merge_segments(
+        extraction(["page one", "Fig. 1"], ocr_files=[(1, "/tmp/p2.pdf")]),
+        {"/tmp/p2.pdf": None},
+    )
+    assert merged == "page one\n\nFig. 1"
+
+
+def test_merge_appends_slide_image_text():
+    """Test that OCR'd slide pictures are appended to the slide's own text."""
+    merged = _merge_segments(
+        extraction(["Title", "Chart"], ocr_files=[(1, "/tmp/img.png")], keep_text=True),
+        {"/tmp/img.png": "Q3 revenue 12%"},
+    )
+    assert merged == "Title\n\nChart\n\nQ3 revenue 12%"
+
+
+# ============================================================================
+# Conversion
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_born_digital_documents_skip_ocr(ocr):
+    """Test that documents with a full text layer never reach the OCR converter."""
+    converter = TextLayerConverter(ocr_converter=ocr)
+
+    with patch_extraction({"a.pdf": extraction([BODY, BODY]), "b.docx": extraction([BODY])}):
+        results = await converter.convert_batch(["a.pdf", "b.docx"])
+
+    assert results == {"a.pdf": f"{BODY.strip()}\n\n{BODY.strip()}", "b.docx": BODY.strip()}
+    ocr.convert_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_only_scanned_pages_and_fallbacks_are_ocrd(ocr, tmp_path):
+    """Test that OCR gets scanned pages, whole-document fallbacks and failed extractions."""
+    page = tmp_path / "page.pdf"
+    page.write_bytes(b"%PDF")
+    converter = TextLayerConverter(ocr_converter=ocr)
+
+    with patch_extraction(
+        {
+            "mixed.pdf": extraction([BODY, ""], ocr_files=[(1, str(page))]),
+            "scan.pdf": extraction(["", ""], whole=True),
+            "broken.pptx": ValueError("corrupt"),
+        }
+    ):
+        results = await converter.convert_batch(["mixed.pdf", "scan.pdf", "broken.pptx"])
+
+    ocr.convert_batch.assert_awaited_once_with(["scan.pdf", "broken.pptx", str(page)])
+    assert results == {
+        "mixed.pdf": f"{BODY.strip()}\n\nOCR({page})",
+        "scan.pdf": "OCR(scan.pdf)",
+        "broken.pptx": "OCR(broken.pptx)",
+    }
+    # Temporary page files are removed after OCR
+    assert not page.exists()
+
+
+@pytest.mark.asyncio
+async def test_empty_result_is_none(ocr):
+    """Test that a document without content converts to None."""
+    ocr.convert_batch = AsyncMock(return_value={"scan.pdf": None})
+    converter = TextLayerConverter(ocr_converter=ocr)
+
+    with patch_extraction({"scan.pdf": extraction([""], whole=True)}):
+        results = await converter.convert_batch(["scan.pdf"])
+
+    assert results == {"scan.pdf": None}
@@ -0,0 +1,112 @@
+"""Tests for the token-bucket platform rate limiters.
+
+Covers request and token budgeting, FIFO wakeups and the cross-pod split.
+"""
+
+import asyncio
+import time
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.platform.rate_limiters._base import BaseRateLimiter
+
+
+class _FastLimiter(BaseRateLimiter):
+    """Small limiter for tests: 10 RPS, 600 TPM (10 tokens/s), single pod."""
+
+    GLOBAL_RPS_LIMIT = 10
+    GLOBAL_TPM_LIMIT = 600
+    SAFETY_FACTOR = 1.0
+    REDIS_KEY_NAME = "test"
+    DEFAULT_NUM_PODS = 1
+    MAX_WAIT_FOR_SLOT_SECONDS = 2.0
+
+    _instance: Optional["_FastLimiter"] = None
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis pipeline reporting a single live pod."""
+    with patch("airweave.platform.rate_limiters._base.redis_client") as mock:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, 0, 1, True])
+        mock.client.pipeline.return_value = pipe
+        yield mock
+
+
+@pytest.fixture
+def limiter(mock_redis):
+    """Fresh limiter instance per test (bypassing the pod singleton)."""
+    _FastLimiter._instance = None
+    yield _FastLimiter()
+    _FastLimiter._instance = None
+
+
+@pytest.mark.asyncio
+async def test_burst_within_capacity_is_immediate(limiter):
+    """Test that acquisitions within the bucket capacity don't wait."""
+    start = time.monotonic()
+    for _ in range(10):
+        await limiter.acquire()
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_requests_are_paced_by_refill_rate(limiter):
+    """Test that acquisitions beyond capacity wait for refill."""
+    for _ in range(10):
+        await limiter.acquire()
+
+    start = time.monotonic()
+    await limiter.acquire()
+    await limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_token_budget_overdraft_delays_next_request(limiter):
+    """Test that a large token request may overdraw, and later requests wait for the debt."""
+    await limiter.acquire(tokens=605)  # capacity is 600: allowed, bucket goes to -5
+
+    start = time.monotonic()
+    await limiter.acquire(tokens=5)  # needs 10 tokens of refill at 10 tokens/s
+    assert time.monotonic() - start >= 0.9
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_fifo(limiter):
+    """Test that queued waiters are woken in arrival order."""
+    for _ in range(10):
+        await limiter.acquire()
+
+    order = []
+
+    async def _acquire(i):
+        await limiter.acquire()
+        order.append(i)
+
+    await asyncio.gather(*[_acquire(i) for i in range(5)])
+    assert order == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_splits_limits_across_live_pods(limiter, mock_redis):
+    """Test that the per-pod share follows the live pod count from Redis."""
+    mock_redis.client.pipeline.return_value.execute = AsyncMock(return_value=[1, 0, 4, True])
+
+    await limiter._heartbeat()
+
+    assert limiter.rate_limit_per_pod_rps == pytest.approx(2.5)
+    assert limiter.rate_limit_per_pod_tpm == pytest.approx(150)
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_falls_back_to_default_pods_on_redis_error(limiter, mock_redis):
+    """Test that Redis failures fall back to DEFAULT_NUM_PODS."""
+    mock_redis.client.pipeline.return_value.execute = AsyncMock(side_effect=Exception("down"))
+
+    await limiter._heartbeat()
+
+    assert limiter.rate_limit_per_pod_rps == pytest.approx(10)
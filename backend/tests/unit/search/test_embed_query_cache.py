@@ -0,0 +1,47 @@
+"""Tests for the query embedding cache in EmbedQuery."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.platform.embedders.cache import EmbeddingCache
+from airweave.schemas.search import RetrievalStrategy
+from airweave.search.operations.embed_query import EmbedQuery
+
+
+@pytest.fixture
+def operation():
+    """EmbedQuery with a mocked provider and a fresh local-only dense cache."""
+    provider = MagicMock()
+    provider.model_spec.embedding_model.name = "text-embedding-3-small"
+    provider.embed = AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+    op = EmbedQuery(strategy=RetrievalStrategy.NEURAL, provider=provider)
+    op.DENSE_CACHE = EmbeddingCache(namespace="query_dense", max_local_entries=16, use_redis=False)
+    return op
+
+
+def make_context(query):
+    """Build a minimal search context."""
+    return SimpleNamespace(query=query, emitter=MagicMock(emit=AsyncMock()))
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_skip_the_provider(operation):
+    """Test that hits are served from cache and only distinct misses are embedded."""
+    state = {"expanded_queries": ["find  the   docs", "other query"]}
+    await operation.execute(make_context("find the docs"), state, MagicMock())
+
+    # The expansion normalizes to the original query: embedded once
+    operation.provider.embed.assert_awaited_once_with(["find the docs", "other query"])
+    assert state["dense_embeddings"] == [[13.0], [13.0], [11.0]]
+    metrics = state["_operation_metrics"]["EmbedQuery"]
+    assert (metrics["dense_cache_hits"], metrics["dense_cache_misses"]) == (0, 3)
+
+    state = {}
+    await operation.execute(make_context(" find the docs "), state, MagicMock())
+
+    assert operation.provider.embed.await_count == 1
+    assert state["dense_embeddings"] == [[13.0]]
+    metrics = state["_operation_metrics"]["EmbedQuery"]
+    assert (metrics["dense_cache_hits"], metrics["dense_cache_misses"]) == (1, 0)
@@ -0,0 +1,67 @@
+"""Tests for speculative retrieval merged by ExpansionRetrieval."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from airweave.schemas.search import RetrievalStrategy
+from airweave.search.operations.expansion_retrieval import ExpansionRetrieval
+
+
+def make_operation(expanded_results, delay=0.0):
+    """ExpansionRetrieval whose expanded-query search is mocked."""
+    operation = ExpansionRetrieval(strategy=RetrievalStrategy.HYBRID, offset=0, limit=2)
+
+    async def search(*args):
+        await asyncio.sleep(delay)
+        return expanded_results
+
+    operation._search_expanded_queries = search
+    return operation
+
+
+def make_context(reranking=None):
+    """Build a minimal search context."""
+    return SimpleNamespace(reranking=reranking, emitter=MagicMock(emit=AsyncMock()))
+
+
+def result(doc_id, score):
+    """Build a vector search result."""
+    return {"id": doc_id, "score": score, "payload": {}}
+
+
+@pytest.mark.asyncio
+async def test_expanded_results_are_merged_and_paginated():
+    """Test that expanded results are deduplicated into the original candidates."""
+    operation = make_operation([result("a", 0.9), result("c", 0.7)])
+    state = {
+        "expanded_queries": ["variant"],
+        "retrieval_candidates": [result("a", 0.5), result("b", 0.8)],
+    }
+
+    await operation.execute(make_context(), state, MagicMock())
+
+    assert [r["id"] for r in state["retrieval_candidates"]] == ["a", "b", "c"]
+    assert [r["id"] for r in state["results"]] == ["a", "b"]
+    assert state["results"][0]["score"] == 0.9
+
+
+@pytest.mark.asyncio
+async def test_results_missing_the_budget_are_skipped():
+    """Test that expanded results arriving after the deadline leave results untouched."""
+    operation = make_operation([result("c", 0.7)], delay=1.0)
+    original = [result("a", 0.5)]
+    state = {
+        "expanded_queries": ["variant"],
+        "expansion_deadline": time.monotonic() + 0.05,
+        "retrieval_candidates": original,
+        "results": original,
+    }
+
+    await operation.execute(make_context(), state, MagicMock())
+
+    assert state["results"] is original
+    assert state["_operation_metrics"]["ExpansionRetrieval"]["budget_exceeded"] is True
@@ -0,0 +1,127 @@
+"""Tests for concurrent federated source fan-out in FederatedSearch."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.platform.sources._base import BaseSource
+from airweave.search.factory import factory
+from airweave.search.operations.federated_search import FederatedSearch, _KeywordResultCache
+
+
+class FakeSource(BaseSource):
+    """Federated source whose search sleeps and echoes the keyword."""
+
+    _federated_search = True
+
+    def __init__(self, delay=0.0, slow_keywords=()):
+        """Create a source with a fixed search latency."""
+        super().__init__()
+        self.delay = delay
+        self.slow_keywords = set(slow_keywords)
+        self.calls = []
+
+    @classmethod
+    async def create(cls, access_token, config=None):
+        """Create the source as the search factory does."""
+        return cls()
+
+    async def search(self, keyword, limit):
+        """Record the call and return one entity for the keyword."""
+        self.calls.append(keyword)
+        await asyncio.sleep(10 if keyword in self.slow_keywords else self.delay)
+        return [SimpleNamespace(entity_id=f"{id(self)}-{keyword}", keyword=keyword)]
+
+
+def make_operation(sources):
+    """FederatedSearch with entity conversion stubbed out."""
+    operation = FederatedSearch(sources=sources, limit=10, providers=[MagicMock()])
+    operation.RESULT_CACHE = _KeywordResultCache(ttl_seconds=60.0, max_entries=16)
+    operation._entity_to_result = lambda entity, source_name, rank: {
+        "id": entity.entity_id,
+        "score": 0.0,
+        "payload": {"keyword": entity.keyword},
+    }
+    return operation
+
+
+def make_context():
+    """Build a minimal search context."""
+    return SimpleNamespace(emitter=MagicMock(emit=AsyncMock()))
+
+
+async def instantiate_via_factory():
+    """Create a FakeSource through the search factory's federated source path."""
+    source_connection = SimpleNamespace(id=uuid4(), short_name="fake", config_fields={})
+    ctx = SimpleNamespace(logger=MagicMock(), organization=SimpleNamespace(id=uuid4()))
+    credentials = {"access_token": "token", "decrypted": "token", "connection": None}
+
+    with (
+        patch(
+            "airweave.search.factory.crud.source.get_by_short_name",
+            AsyncMock(return_value=SimpleNamespace(oauth_type=None)),
+        ),
+        patch("airweave.search.factory.resource_locator.get_source", return_value=FakeSource),
+        patch.object(factory, "_get_source_credentials", AsyncMock(return_value=credentials)),
+    ):
+        source = await factory._try_instantiate_federated_source(
+            MagicMock(), source_connection, ctx
+        )
+    return source, source_connection
+
+
+@pytest.mark.asyncio
+async def test_sources_are_searched_concurrently():
+    """Test that latency is max(source) rather than sum(source)."""
+    sources = [FakeSource(0.2), FakeSource(0.2)]
+    operation = make_operation(sources)
+
+    start = time.monotonic()
+    results, _ = await operation._search_sources(["a", "b"], make_context(), MagicMock())
+
+    assert time.monotonic() - start < 0.35
+    assert len(results) == 4
+
+
+@pytest.mark.asyncio
+async def test_slow_keywords_degrade_to_partial_results():
+    """Test that keyword searches past the source deadline are dropped."""
+    source = FakeSource(0.0, slow_keywords={"slow"})
+    operation = make_operation([source])
+    operation.SOURCE_TIMEOUT_SECONDS = 0.1
+
+    results, stats = await operation._search_sources(["fast", "slow"], make_context(), MagicMock())
+
+    assert [r["payload"]["keyword"] for r in results] == ["fast"]
+    assert stats["keyword_searches_timed_out"] == 1
+
+
+@pytest.mark.asyncio
+async def test_keyword_results_are_cached_per_connection():
+    """Test that repeated keywords for a factory-created source skip the search API."""
+    source, source_connection = await instantiate_via_factory()
+    operation = make_operation([source])
+
+    await operation._search_sources(["a"], make_context(), MagicMock())
+    _, stats = await operation._search_sources(["a"], make_context(), MagicMock())
+
+    assert source._source_connection_id == str(source_connection.id)
+    assert source.calls == ["a"]
+    assert stats["keyword_cache_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sources_without_connection_scope_are_not_cached():
+    """Test that sources not scoped to a connection always hit the search API."""
+    source = FakeSource()
+    operation = make_operation([source])
+
+    await operation._search_sources(["a"], make_context(), MagicMock())
+    _, stats = await operation._search_sources(["a"], make_context(), MagicMock())
+
+    assert source.calls == ["a", "a"]
+    assert stats["keyword_cache_hits"] == 0
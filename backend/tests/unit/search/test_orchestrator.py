@@ -0,0 +1,130 @@
+"""Tests for DAG execution in the search orchestrator."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from airweave.search.emitter import EventEmitter
+from airweave.search.operations._base import SearchOperation
+from airweave.search.orchestrator import SearchOrchestrator
+
+
+def make_operation(name: str, depends_on: list, delay: float = 0.0, fail: bool = False):
+    """Create an operation class named `name` that sleeps and records its window."""
+
+    async def execute(self, context, state, ctx):
+        state.setdefault("windows", {})[name] = [time.monotonic(), None]
+        await context.emitter.emit("working", op_name=name)
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} failed")
+        state["windows"][name][1] = time.monotonic()
+        state["results"] = []
+
+    cls = type(
+        name,
+        (SearchOperation,),
+        {"depends_on": lambda self: depends_on, "execute": execute},
+    )
+    return cls()
+
+
+def make_context(**operations):
+    """Build a minimal search context with a streaming emitter."""
+    fields = [
+        "query_expansion",
+        "query_interpretation",
+        "embed_query",
+        "user_filter",
+        "temporal_relevance",
+        "retrieval",
+        "expansion_retrieval",
+        "federated_search",
+        "reranking",
+        "payload_hydration",
+        "generate_answer",
+    ]
+    return SimpleNamespace(
+        request_id="req",
+        query="q",
+        collection_id="col",
+        emitter=EventEmitter(request_id="req", stream=True),
+        **{field: operations.get(field) for field in fields},
+    )
+
+
+@pytest.fixture
+def published():
+    """Capture published events."""
+    with patch("airweave.search.emitter.core_pubsub") as pubsub:
+        pubsub.publish = AsyncMock()
+        yield pubsub.publish
+
+
+@pytest.mark.asyncio
+async def test_independent_operations_overlap_and_events_stay_ordered(published):
+    """Test that siblings run concurrently while the event stream stays sequential."""
+    context = make_context(
+        query_expansion=make_operation("QueryExpansion", []),
+        query_interpretation=make_operation("QueryInterpretation", ["QueryExpansion"], 0.2),
+        embed_query=make_operation("EmbedQuery", ["QueryExpansion"], 0.1),
+        retrieval=make_operation("Retrieval", ["QueryInterpretation", "EmbedQuery"]),
+    )
+
+    started = time.monotonic()
+    _, state = await SearchOrchestrator().run(MagicMock(), context)
+    elapsed = time.monotonic() - started
+
+    windows = state["windows"]
+    assert elapsed < 0.28  # sequential would take >= 0.3s
+    assert windows["EmbedQuery"][0] < windows["QueryInterpretation"][1]
+    assert windows["Retrieval"][0] >= windows["QueryInterpretation"][1]
+    assert set(state["_operation_metrics"]) == {
+        "QueryExpansion",
+        "QueryInterpretation",
+        "EmbedQuery",
+        "Retrieval",
+    }
+
+    events = [call.args[2] for call in published.await_args_list]
+    assert [event["seq"] for event in events] == list(range(1, len(events) + 1))
+    assert [(event["type"], event.get("op")) for event in events[1:-2]] == [
+        ("operator_start", "query_expansion"),
+        ("working", "query_expansion"),
+        ("operator_end", "query_expansion"),
+        ("operator_start", "query_interpretation"),
+        ("working", "query_interpretation"),
+        ("operator_end", "query_interpretation"),
+        ("operator_start", "embedding"),
+        ("working", "embedding"),
+        ("operator_end", "embedding"),
+        ("operator_start", "vector_search"),
+        ("working", "vector_search"),
+        ("operator_end", "vector_search"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_dependents_and_emits_single_error(published):
+    """Test that a failing operation raises and skips operations depending on it."""
+    context = make_context(
+        query_expansion=make_operation("QueryExpansion", []),
+        query_interpretation=make_operation(
+            "QueryInterpretation", ["QueryExpansion"], 0.01, fail=True
+        ),
+        embed_query=make_operation("EmbedQuery", ["QueryExpansion"], 5),
+        retrieval=make_operation("Retrieval", ["QueryInterpretation", "EmbedQuery"]),
+    )
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="QueryInterpretation failed"):
+        await SearchOrchestrator().run(MagicMock(), context)
+
+    assert time.monotonic() - started < 1  # EmbedQuery was cancelled, not awaited
+    events = [call.args[2] for call in published.await_args_list]
+    assert [event["type"] for event in events].count("error") == 1
+    assert events[-1]["type"] == "error"
+    assert not any(event.get("op") == "vector_search" for event in events)
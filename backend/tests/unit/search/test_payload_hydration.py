@@ -0,0 +1,79 @@
+"""Tests for hydrating projected payloads of final search results."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.schemas.search import RetrievalStrategy
+from airweave.search.operations.payload_hydration import PayloadHydration
+from airweave.search.operations.retrieval import Retrieval
+
+
+@pytest.fixture
+def destination():
+    """Patch QdrantDestination.create with a destination holding two stored payloads."""
+    stored = {
+        "p1": {"entity_id": "e1", "textual_representation": "one", "url": "u1"},
+        "p2": {"entity_id": "e2", "textual_representation": "two", "url": "u2"},
+    }
+    mock = MagicMock()
+    mock.retrieve_payloads = AsyncMock(
+        side_effect=lambda ids, with_payload: {i: stored[i] for i in ids if i in stored}
+    )
+    with patch(
+        "airweave.search.operations.payload_hydration.QdrantDestination.create",
+        AsyncMock(return_value=mock),
+    ):
+        yield mock
+
+
+def make_context(generate_answer=None):
+    """Build a minimal search context."""
+    return SimpleNamespace(collection_id=uuid4(), vector_size=3, generate_answer=generate_answer)
+
+
+@pytest.mark.asyncio
+async def test_final_results_are_hydrated(destination):
+    """Test that projected payloads are merged with stored payloads."""
+    state = {
+        "results": [
+            {"id": "p1", "score": 0.9, "payload": {"entity_id": "e1", "name": "One"}},
+            {"id": "f1", "score": 0.8, "payload": {"entity_id": "f1"}, "source_type": "federated"},
+        ]
+    }
+
+    await PayloadHydration().execute(make_context(), state, MagicMock())
+
+    assert state["results"][0]["payload"] == {
+        "entity_id": "e1",
+        "name": "One",
+        "textual_representation": "one",
+        "url": "u1",
+    }
+    assert state["results"][1]["payload"] == {"entity_id": "f1"}
+    destination.retrieve_payloads.assert_awaited_once_with(["p1"], with_payload=True)
+
+
+@pytest.mark.asyncio
+async def test_requested_fields_include_text_for_answers(destination):
+    """Test that answer generation always gets the textual representation."""
+    state = {"results": [{"id": "p2", "score": 0.9, "payload": {}}]}
+
+    await PayloadHydration(fields=["url"]).execute(
+        make_context(generate_answer=MagicMock()), state, MagicMock()
+    )
+
+    destination.retrieve_payloads.assert_awaited_once_with(
+        ["p2"], with_payload=["url", "textual_representation"]
+    )
+
+
+def test_retrieval_projects_candidate_payloads():
+    """Test the payload selector used for candidates."""
+    retrieval = Retrieval(RetrievalStrategy.HYBRID, offset=0, limit=10, project_payloads=True)
+
+    assert retrieval._payload_selector(has_reranking=False) == Retrieval.CANDIDATE_PAYLOAD_FIELDS
+    assert "textual_representation" in retrieval._payload_selector(has_reranking=True)
+    assert Retrieval(RetrievalStrategy.HYBRID, 0, 10)._payload_selector(False) is True
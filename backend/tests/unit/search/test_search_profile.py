@@ -0,0 +1,101 @@
+"""Tests for cached collection search profiles."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.search.profile import SearchProfileService
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis commands the service uses."""
+
+    def __init__(self):
+        """Create an empty store."""
+        self.store = {}
+
+    async def mget(self, *keys):
+        """Get several keys."""
+        return [self.store.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        """Set a key (TTL ignored)."""
+        self.store[key] = value
+
+    async def incr(self, key):
+        """Increment a counter."""
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+
+    async def delete(self, key):
+        """Delete a key."""
+        self.store.pop(key, None)
+
+
+class FederatedSource:
+    """Source class flagged for federated search."""
+
+    _federated_search = True
+
+
+@pytest.fixture
+def env():
+    """Patch crud, the resource locator and Redis with in-memory fakes."""
+    sources = {
+        "slack": SimpleNamespace(short_name="slack", supports_temporal_relevance=False),
+        "notion": SimpleNamespace(short_name="notion", supports_temporal_relevance=True),
+    }
+    connections = [SimpleNamespace(short_name="slack"), SimpleNamespace(short_name="notion")]
+
+    db = MagicMock()
+    db.execute = AsyncMock(
+        side_effect=lambda query: MagicMock(
+            unique=lambda: MagicMock(scalars=lambda: list(sources.values()))
+        )
+    )
+    redis = FakeRedis()
+    with (
+        patch("airweave.search.profile.crud") as crud,
+        patch("airweave.search.profile.resource_locator") as locator,
+        patch("airweave.search.profile.redis_client", MagicMock(client=redis)),
+    ):
+        crud.source_connection.get_for_collection = AsyncMock(return_value=connections)
+        crud.entity_definition.get_multi_by_source_short_name = AsyncMock(return_value=[])
+        locator.get_source.side_effect = lambda model: (
+            FederatedSource if model.short_name == "slack" else object
+        )
+        ctx = MagicMock(organization=MagicMock(id=uuid4()))
+        yield SimpleNamespace(db=db, ctx=ctx, crud=crud, redis=redis, connections=connections)
+
+
+@pytest.mark.asyncio
+async def test_profile_is_built_once_and_classifies_sources(env):
+    """Test that the profile is computed once and shared via Redis."""
+    profile = await SearchProfileService().get(env.db, "col", env.ctx)
+    again = await SearchProfileService().get(env.db, "col", env.ctx)  # fresh process
+
+    assert profile.federated_sources == ["slack"]
+    assert profile.vector_sources == ["notion"]
+    assert profile.temporal_supporting_sources == ["notion"]
+    assert set(profile.filterable_fields) == {"notion", "slack"}
+    assert again == profile
+    assert env.crud.source_connection.get_for_collection.await_count == 1
+    assert env.db.execute.await_count == 1  # one query for all source models
+
+
+@pytest.mark.asyncio
+async def test_invalidate_rebuilds_in_all_workers(env):
+    """Test that invalidation bumps the generation so other workers rebuild."""
+    worker_a, worker_b = SearchProfileService(), SearchProfileService()
+    await worker_a.get(env.db, "col", env.ctx)
+    worker_b.LOCAL_TTL = 0  # local entry expired
+
+    env.connections.pop(0)
+    await worker_a.invalidate(env.ctx.organization.id, "col")
+    profile_a = await worker_a.get(env.db, "col", env.ctx)
+    profile_b = await worker_b.get(env.db, "col", env.ctx)
+
+    assert profile_a.source_short_names == profile_b.source_short_names == ["notion"]
+    assert profile_b.generation == 1
+    assert env.crud.source_connection.get_for_collection.await_count == 2
@@ -0,0 +1,70 @@
+"""Tests for cached timestamp bounds in TemporalRelevance."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from airweave.search.operations.temporal_relevance import TemporalRelevance
+from airweave.search.temporal_bounds import TimestampBounds
+
+BOUNDS = TimestampBounds(
+    has_documents=True,
+    oldest=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    newest=datetime(2025, 1, 1, tzinfo=timezone.utc),
+)
+
+
+@pytest.fixture
+def cache():
+    """Patch the bounds cache with an in-memory dict."""
+    store = {}
+    with patch("airweave.search.operations.temporal_relevance.temporal_bounds_cache") as mock:
+        mock.get = AsyncMock(side_effect=lambda cid, sources: store.get((cid, str(sources))))
+        mock.set = AsyncMock(
+            side_effect=lambda cid, sources, bounds: store.update({(cid, str(sources)): bounds})
+        )
+        yield mock
+
+
+def make_operation():
+    """TemporalRelevance whose live Qdrant scroll is mocked."""
+    operation = TemporalRelevance(weight=0.5, supporting_sources=["notion"])
+    operation._compute_bounds = AsyncMock(return_value=BOUNDS.model_copy())
+    return operation
+
+
+def make_context(collection_id):
+    """Build a minimal search context."""
+    return SimpleNamespace(collection_id=collection_id, emitter=MagicMock(emit=AsyncMock()))
+
+
+@pytest.mark.asyncio
+async def test_unfiltered_bounds_are_served_from_cache(cache):
+    """Test that the second unfiltered search skips the Qdrant scrolls."""
+    context = make_context(uuid4())
+    first, second = make_operation(), make_operation()
+
+    await first.execute(context, {}, MagicMock())
+    state = {}
+    await second.execute(context, state, MagicMock())
+
+    first._compute_bounds.assert_awaited_once()
+    second._compute_bounds.assert_not_awaited()
+    assert state["decay_config"].target_datetime == BOUNDS.newest
+    assert state["_operation_metrics"]["TemporalRelevance"]["bounds_cached"] is True
+
+
+@pytest.mark.asyncio
+async def test_filtered_searches_scroll_live(cache):
+    """Test that a query filter bypasses the cache."""
+    operation = make_operation()
+    state = {"filter": {"must": [{"key": "source_name", "match": {"value": "notion"}}]}}
+
+    await operation.execute(make_context(uuid4()), state, MagicMock())
+
+    operation._compute_bounds.assert_awaited_once()
+    cache.get.assert_not_awaited()
+    cache.set.assert_not_awaited()